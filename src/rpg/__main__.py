@@ -80,6 +80,7 @@ def _use_window_shell() -> bool:
 
 def main():
     window_backend = None
+    game_service = None
     try:
         _apply_console_colour_defaults()
         apply_display_mode()
@@ -118,6 +119,11 @@ def main():
             print("Hint: verify MySQL connectivity or set RPG_DB_ALLOW_INMEMORY_FALLBACK=1.")
         _print_help_surface()
     finally:
+        if game_service is not None:
+            try:
+                game_service.close()
+            except Exception:
+                pass
         if window_backend is not None:
             try:
                 window_backend.stop()
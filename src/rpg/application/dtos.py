@@ -64,6 +64,9 @@ class CharacterSheetView:
     class_levels_line: str = ""
     pressure_summary: str = ""
     pressure_lines: List[str] = field(default_factory=list)
+    armor_class: int = 0
+    attack_bonus: int = 0
+    spell_attack_bonus: int = 0
 
 
 @dataclass
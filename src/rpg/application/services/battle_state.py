@@ -0,0 +1,122 @@
+"""Column-oriented per-side state for party battles.
+
+``fight_party_turn_based`` used to rebuild living lists, re-derive every
+combatant's lane from names/tags/classes and re-scan both rosters for each
+action.  A ``BattleState`` is built once per fight: each side keeps its actors
+alongside parallel columns for the static data (lane, lowercase name).
+
+Only static data is columnar.  HP is written by about thirty sites in
+``CombatService`` (attacks, spells, hazards, lair actions and feature hooks
+shared with single fights), so a mirrored HP column would be stale whenever one
+write skipped it.  It is read from the actors instead.  Status masks already
+live in one ``CombatantState.active`` int per actor, so a second column would
+only copy them.  The range band is a property of the scene, not of the
+combatants.
+
+Target pools, lowest-HP picks and area-effect selection use the cached columns
+and keep the original list order and tie-breaks, so seeded fights resolve
+identically.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, List, Sequence
+
+VANGUARD = 0
+REARGUARD = 1
+
+
+def _hp(actor) -> int:
+    return int(getattr(actor, "hp_current", 0) or 0)
+
+
+def _living(actors: list) -> list:
+    return [actor for actor in actors if int(getattr(actor, "hp_current", 0) or 0) > 0]
+
+
+class BattleSide:
+    __slots__ = ("actors", "lanes", "name_keys")
+
+    def __init__(self, actors: Sequence, lane_of: Callable[[object], str]) -> None:
+        self.actors = list(actors)
+        self.lanes = bytes(VANGUARD if lane_of(actor) == "vanguard" else REARGUARD for actor in self.actors)
+        self.name_keys = [str(getattr(actor, "name", "")).lower() for actor in self.actors]
+
+    def living(self) -> list:
+        return _living(self.actors)
+
+    def any_living(self) -> bool:
+        return any(int(getattr(actor, "hp_current", 0) or 0) > 0 for actor in self.actors)
+
+    def living_in_lane(self, lane: int) -> List[int]:
+        lanes = self.lanes
+        return [index for index, actor in enumerate(self.actors) if lanes[index] == lane and _hp(actor) > 0]
+
+
+class BattleState:
+    """Both sides of one party fight; lanes are resolved once at construction."""
+
+    __slots__ = ("allies", "enemies", "_slots")
+
+    def __init__(self, allies: Sequence, enemies: Sequence, lane_of: Callable[[object], str]) -> None:
+        self.allies = BattleSide(allies, lane_of)
+        self.enemies = BattleSide(enemies, lane_of)
+        self._slots: dict[int, tuple[BattleSide, int]] = {}
+        for side in (self.allies, self.enemies):
+            for index, actor in enumerate(side.actors):
+                self._slots[id(actor)] = (side, index)
+
+    def knows(self, actor) -> bool:
+        return id(actor) in self._slots
+
+    def lane(self, actor) -> str:
+        side, index = self._slots[id(actor)]
+        return "vanguard" if side.lanes[index] == VANGUARD else "rearguard"
+
+    def is_melee(self, actor) -> bool:
+        side, index = self._slots[id(actor)]
+        return side.lanes[index] == VANGUARD
+
+    def target_pool(self, *, attacker, opponents: list, action: str) -> list:
+        """Same selection as ``CombatService._combat_target_pool`` using the cached lanes."""
+        if not opponents:
+            return []
+        if str(action or "").strip().lower() != "attack" or not self.is_melee(attacker):
+            return list(opponents)
+        slots = self._slots
+        vanguard = [row for row in opponents if slots[id(row)][0].lanes[slots[id(row)][1]] == VANGUARD]
+        return vanguard or list(opponents)
+
+    def lowest_hp(self, targets: Iterable):
+        """First target with the lowest ``(hp_current, hp_max, name)`` key, as ``min`` would pick."""
+        slots = self._slots
+        best = None
+        best_key = None
+        for row in targets:
+            side, index = slots[id(row)]
+            key = (_hp(row), int(getattr(row, "hp_max", 0) or 0), side.name_keys[index])
+            if best_key is None or key < best_key:
+                best, best_key = row, key
+        if best_key is None:
+            raise ValueError("lowest_hp() arg is an empty sequence")
+        return best
+
+    def has_living_vanguard(self, rows: Iterable, *, excluding=None) -> bool:
+        slots = self._slots
+        for row in rows:
+            if row is excluding or _hp(row) <= 0:
+                continue
+            side, index = slots[id(row)]
+            if side.lanes[index] == VANGUARD:
+                return True
+        return False
+
+    def living_vanguard(self) -> list:
+        """Living vanguard actors of both sides in roster order (allies first) for area effects."""
+        allies, enemies = self.allies, self.enemies
+        return [allies.actors[index] for index in allies.living_in_lane(VANGUARD)] + [
+            enemies.actors[index] for index in enemies.living_in_lane(VANGUARD)
+        ]
+
+    def living_all(self) -> list:
+        return _living(self.allies.actors) + _living(self.enemies.actors)
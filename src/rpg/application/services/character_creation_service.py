@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-import json
 import random
-from pathlib import Path
 from typing import Dict, List
 
 from rpg.application.dtos import CharacterClassDetailView
 from rpg.application.mappers.character_creation_mapper import to_character_class_detail_view
 from rpg.application.services.balance_tables import DIFFICULTY_PRESET_PROFILES, normalize_hardcore_toggles
+from rpg.application.spells.spell_catalog import SpellCatalog
 from rpg.domain.models.character import CharacterAlignment
 from rpg.domain.models.character_class import CharacterClass
 from rpg.domain.models.class_subclass import ClassSubclass
 from rpg.domain.models.character_options import Background, DifficultyPreset, Race, Subrace
 from rpg.domain.repositories import CharacterRepository, ClassRepository, FeatureRepository, LocationRepository
 from rpg.domain.services.character_factory import ABILITY_ALIASES, create_new_character
+from rpg.domain.services.dice import roll_dice_batch
 from rpg.domain.services.subclass_catalog import resolve_subclass, subclasses_for_class
 from rpg.domain.services.subclass_progression import subclass_tier_levels_for_class
 
@@ -130,7 +130,6 @@ class CharacterCreationService:
             "granted_spells": [],
         },
     }
-    _UNIFIED_SPELLS_CACHE: list[dict[str, object]] | None = None
     _BACKGROUND_EXTRA_CHOICES: dict[str, dict[str, object]] = {
         "temple envoy": {
             "tool_choices": 1,
@@ -580,33 +579,6 @@ class CharacterCreationService:
             "gold_spec": "",
         }
 
-    @classmethod
-    def _load_unified_spells_rows(cls) -> list[dict[str, object]]:
-        if cls._UNIFIED_SPELLS_CACHE is not None:
-            return list(cls._UNIFIED_SPELLS_CACHE)
-        path = Path(__file__).resolve().parents[4] / "data" / "spells" / "unified_spells.json"
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            cls._UNIFIED_SPELLS_CACHE = []
-            return []
-        spells = payload.get("spells") if isinstance(payload, dict) else []
-        if not isinstance(spells, list):
-            cls._UNIFIED_SPELLS_CACHE = []
-            return []
-        rows: list[dict[str, object]] = []
-        for row in spells:
-            if isinstance(row, dict):
-                rows.append(dict(row))
-        cls._UNIFIED_SPELLS_CACHE = rows
-        return list(rows)
-
-    @staticmethod
-    def _row_classes(row: dict[str, object]) -> set[str]:
-        raw = str(row.get("classes", "") or "")
-        parts = [part.strip().lower() for part in raw.replace(";", ",").split(",") if part.strip()]
-        return set(parts)
-
     def list_starting_spell_options(
         self,
         class_slug: str,
@@ -619,21 +591,14 @@ class CharacterCreationService:
         race_profile = self.race_spellcasting_grants(race_name, subrace_name)
 
         class_name = class_key.replace("_", " ").strip().title()
-        rows = self._load_unified_spells_rows()
         cantrip_pool: list[str] = []
         spell_pool: list[str] = []
         seen_cantrips: set[str] = set()
         seen_spells: set[str] = set()
-        for row in rows:
-            if class_name.lower() not in self._row_classes(row):
-                continue
-            spell_name = str(row.get("name", "") or "").strip()
+        for row in SpellCatalog.reference_for_class(class_name):
+            spell_name, level = row.name, row.level_int
             if not spell_name:
                 continue
-            try:
-                level = int(row.get("level_int", 0) or 0)
-            except Exception:
-                level = 0
             key = spell_name.lower()
             if level <= 0 and key not in seen_cantrips:
                 seen_cantrips.add(key)
@@ -644,16 +609,10 @@ class CharacterCreationService:
 
         bonus_class = str(race_profile.get("bonus_cantrip_class", "") or "").strip().replace("_", " ").title()
         if bonus_class:
-            for row in rows:
-                if bonus_class.lower() not in self._row_classes(row):
-                    continue
-                spell_name = str(row.get("name", "") or "").strip()
+            for row in SpellCatalog.reference_for_class(bonus_class):
+                spell_name, level = row.name, row.level_int
                 if not spell_name:
                     continue
-                try:
-                    level = int(row.get("level_int", 0) or 0)
-                except Exception:
-                    level = 0
                 key = spell_name.lower()
                 if level <= 0 and key not in seen_cantrips:
                     seen_cantrips.add(key)
@@ -1060,7 +1019,7 @@ class CharacterCreationService:
 
     @staticmethod
     def _roll_4d6_drop_lowest(rng: random.Random) -> int:
-        rolls = sorted([rng.randint(1, 6) for _ in range(4)], reverse=True)
+        rolls = sorted(roll_dice_batch(4, 6, rng), reverse=True)
         return sum(rolls[:3])
 
     def suggest_generated_name(
@@ -0,0 +1,266 @@
+"""Combat AI policy: cached combatant profiles and precomputed tactical tables.
+
+``CombatService`` asks its policy how enemies and AI-controlled companions
+behave instead of re-deriving it every turn.  Each combatant is classified once
+into a ``CombatAiProfile`` (intent, boss, lane, preferred terrain, healing
+spell), cached by the fields the classification reads.  Tactical choices come
+from per-intent rule tables of ``(condition, roll threshold, action)`` rows
+evaluated against a single d100 roll, in the same order the hand-written
+checks used, so seeded fights are unchanged.  Both caches are filled under a
+lock, so one policy can serve fights on several threads.
+
+Subclass ``CombatAiPolicy`` and pass it as ``CombatService(ai_policy=...)`` (or
+to ``simulate_encounter``) to try alternate behaviour in simulations.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from rpg.application.spells.spell_definitions import is_healing_spell_slug, slugify_spell_name
+from rpg.domain.models.character import Character
+from rpg.domain.services.spellcasting import available_slot_levels
+
+# Tactical conditions the service evaluates for a rule row.
+COVERED_RETREAT = "covered_retreat"
+WOUNDED_THREATENED = "wounded_threatened"
+CAN_AMBUSH = "can_ambush"
+CAN_GRAPPLE = "can_grapple"
+CAN_SHOVE = "can_shove"
+CAN_SLIP_AWAY = "can_slip_away"
+
+TacticalRule = Tuple[str, int, str]
+
+_MAX_PROFILES = 4096
+
+
+@dataclass(frozen=True)
+class CombatAiProfile:
+    intent: str
+    kind: str
+    is_boss: bool
+    lane: str
+    preferred_terrains: FrozenSet[str] = frozenset()
+    healing_spell: Optional[str] = None
+
+    def terrain_bias(self, terrain: str) -> float:
+        return 0.1 if terrain in self.preferred_terrains else 0.0
+
+
+class CombatAiPolicy:
+    """Default behaviour; every decision matches the original per-turn derivation."""
+
+    INTENT_BY_KIND: Dict[str, str] = {
+        "beast": "aggressive",
+        "undead": "brute",
+        "humanoid": "cautious",
+        "fiend": "ambusher",
+        "construct": "brute",
+        "dragon": "aggressive",
+    }
+    PREFERRED_TERRAINS: Dict[str, FrozenSet[str]] = {
+        "brute": frozenset({"cramped"}),
+        "skirmisher": frozenset({"open"}),
+        "ambusher": frozenset({"open"}),
+        "cautious": frozenset({"difficult"}),
+    }
+    BACKLINE_CLASSES: Tuple[str, ...] = ("wizard", "sorcerer", "warlock", "bard")
+    BACKLINE_NAME_KEYWORDS: Tuple[str, ...] = ("archer", "shaman", "mage", "warlock", "witch", "priest", "acolyte")
+    BOSS_NAME_KEYWORDS: Tuple[str, ...] = ("dragon", "tyrant", "lord", "queen", "king", "ancient", "demon", "lich", "boss")
+
+    def __init__(self) -> None:
+        self._profiles: Dict[tuple, CombatAiProfile] = {}
+        self._tables: Dict[str, Tuple[TacticalRule, ...]] = {}
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Caches are rebuilt in worker processes rather than pickled.
+        state = dict(self.__dict__)
+        state["_profiles"] = {}
+        state["_tables"] = {}
+        state.pop("_cache_lock", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    # -- classification -------------------------------------------------
+
+    def profile(self, actor) -> CombatAiProfile:
+        key = self._profile_key(actor)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self.classify(actor)
+            with self._cache_lock:
+                if len(self._profiles) >= _MAX_PROFILES:
+                    self._profiles.clear()
+                profile = self._profiles.setdefault(key, profile)
+        return profile
+
+    @staticmethod
+    def _profile_key(actor) -> tuple:
+        if isinstance(actor, Character):
+            flags = getattr(actor, "flags", None)
+            forced_lane = flags.get("combat_lane") if isinstance(flags, dict) else None
+            return (
+                "character",
+                getattr(actor, "class_name", None),
+                str(forced_lane or ""),
+                tuple(str(name or "") for name in list(getattr(actor, "known_spells", []) or [])),
+            )
+        tags = getattr(actor, "tags", None)
+        return (
+            "entity",
+            getattr(actor, "kind", None),
+            getattr(actor, "name", None),
+            getattr(actor, "level", None),
+            getattr(actor, "hp_max", getattr(actor, "hp", None)),
+            tuple(str(tag) for tag in tags) if isinstance(tags, list) else None,
+        )
+
+    def classify(self, actor) -> CombatAiProfile:
+        if isinstance(actor, Character):
+            return CombatAiProfile(
+                intent="aggressive",
+                kind="character",
+                is_boss=False,
+                lane=self._character_lane(actor),
+                healing_spell=self._healing_spell(actor),
+            )
+        intent = self.intent_for_kind(getattr(actor, "kind", ""))
+        return CombatAiProfile(
+            intent=intent,
+            kind=(getattr(actor, "kind", "") or "").lower(),
+            is_boss=self._is_boss(actor),
+            lane=self._entity_lane(actor),
+            preferred_terrains=self.PREFERRED_TERRAINS.get(intent, frozenset()),
+        )
+
+    def intent_for_kind(self, kind: str) -> str:
+        return self.INTENT_BY_KIND.get((kind or "").lower(), "aggressive")
+
+    def _character_lane(self, actor: Character) -> str:
+        flags = getattr(actor, "flags", None)
+        if isinstance(flags, dict):
+            forced = str(flags.get("combat_lane", "") or "").strip().lower()
+            if forced in {"vanguard", "rearguard"}:
+                return forced
+        class_slug = str(getattr(actor, "class_name", "") or "").strip().lower()
+        return "rearguard" if class_slug in self.BACKLINE_CLASSES else "vanguard"
+
+    def _entity_lane(self, actor) -> str:
+        tags = getattr(actor, "tags", None)
+        if isinstance(tags, list):
+            normalized = {str(item or "").strip().lower() for item in tags}
+            if "lane:rearguard" in normalized:
+                return "rearguard"
+            if "lane:vanguard" in normalized:
+                return "vanguard"
+        name_key = str(getattr(actor, "name", "") or "").strip().lower()
+        if any(keyword in name_key for keyword in self.BACKLINE_NAME_KEYWORDS):
+            return "rearguard"
+        return "vanguard"
+
+    def _is_boss(self, actor) -> bool:
+        level = int(getattr(actor, "level", 1) or 1)
+        hp_max = int(getattr(actor, "hp_max", getattr(actor, "hp", 1)) or 1)
+        if level >= 10 or hp_max >= 80:
+            return True
+        name_key = str(getattr(actor, "name", "") or "").strip().lower()
+        return any(keyword in name_key for keyword in self.BOSS_NAME_KEYWORDS)
+
+    @staticmethod
+    def _healing_spell(actor: Character) -> Optional[str]:
+        for name in list(getattr(actor, "known_spells", []) or []):
+            slug = slugify_spell_name(str(name or ""))
+            if is_healing_spell_slug(slug):
+                return slug
+        return None
+
+    # -- decisions --------------------------------------------------------
+
+    def select_enemy_action(self, intent: str, foe, round_no: int, terrain: str = "open") -> tuple[str, Optional[str]]:
+        """Return (action, advantage_for_attack) for a single-opponent fight."""
+        hp_max = getattr(foe, "hp_max", getattr(foe, "hp", 1)) or 1
+        hp_pct = (foe.hp_current or hp_max) / hp_max
+
+        if hp_pct <= 0.25:
+            if intent in {"cautious", "skirmisher"}:
+                return "flee", None
+            if intent == "aggressive":
+                return "reckless", "advantage"
+        if hp_pct <= 0.5 and intent == "cautious":
+            return "attack", "disadvantage"  # more defensive strikes
+
+        if intent == "ambusher":
+            return "attack", "advantage" if round_no == 1 else None
+        if intent == "skirmisher":
+            terrain_bias = 0.1 if terrain in self.PREFERRED_TERRAINS.get(intent, frozenset()) else 0.0
+            if hp_pct < 0.5 - terrain_bias:
+                return "flee", None
+        # brute and aggressive default
+        return "attack", None
+
+    def tactical_table(self, intent: str) -> Tuple[TacticalRule, ...]:
+        table = self._tables.get(intent)
+        if table is None:
+            table = self.build_tactical_table(intent)
+            with self._cache_lock:
+                table = self._tables.setdefault(intent, table)
+        return table
+
+    def build_tactical_table(self, intent: str) -> Tuple[TacticalRule, ...]:
+        """Ordered rules for one intent; the first row whose condition holds and whose threshold the roll meets wins."""
+        rows: list[TacticalRule] = [(COVERED_RETREAT, 100, "disengage")]
+        if intent in {"cautious", "skirmisher", "ambusher"}:
+            rows.append((WOUNDED_THREATENED, 50, "disengage"))
+        if intent == "ambusher":
+            rows.append((CAN_AMBUSH, 45, "hide"))
+        if intent in {"brute", "aggressive"}:
+            rows.append((CAN_GRAPPLE, 35, "grapple"))
+        if intent in {"cautious", "skirmisher"}:
+            rows.append((CAN_SHOVE, 30, "shove"))
+            rows.append((CAN_SLIP_AWAY, 30, "hide"))
+        return tuple(rows)
+
+    def select_tactical_action(self, intent: str, roll: int, holds: Callable[[str], bool]) -> Optional[str]:
+        for condition, threshold, action in self.tactical_table(intent):
+            if roll <= threshold and holds(condition):
+                return action
+        return None
+
+    def evaluate_party_action(self, actor, living_allies: list, living_enemies: list, round_no: int, scene_ctx: dict):
+        """Default choice for an AI-driven party member (ally or enemy side)."""
+        if not isinstance(actor, Character):
+            hp_max = max(1, int(getattr(actor, "hp_max", getattr(actor, "hp_current", 1)) or 1))
+            hp_now = int(getattr(actor, "hp_current", hp_max) or hp_max)
+            if hp_now <= max(1, hp_max // 4) and len(living_enemies) < len(living_allies):
+                return "flee"
+            return "attack"
+
+        healing_slug = self.profile(actor).healing_spell
+        if healing_slug and bool(available_slot_levels(actor, min_level=1)):
+            critical_ally = next(
+                (
+                    row
+                    for row in sorted(living_allies, key=lambda unit: int(getattr(unit, "hp_current", 0) or 0))
+                    if int(getattr(row, "hp_current", 0) or 0) <= max(1, int(getattr(row, "hp_max", 1) or 1) // 4)
+                ),
+                None,
+            )
+            if critical_ally is not None:
+                return ("Cast Spell", healing_slug)
+        return "Attack"
+
+
+_DEFAULT_POLICY: Optional[CombatAiPolicy] = None
+
+
+def default_combat_ai_policy() -> CombatAiPolicy:
+    global _DEFAULT_POLICY
+    if _DEFAULT_POLICY is None:
+        _DEFAULT_POLICY = CombatAiPolicy()
+    return _DEFAULT_POLICY
@@ -0,0 +1,121 @@
+"""Structured combat log events rendered to text on demand.
+
+High-volume combat lines (attack rolls, hits, misses, round headers, status
+changes) are recorded as an event code plus the actor names and integer payload
+instead of a formatted string.  ``CombatLogEntry.text`` renders the template the
+first time something reads it, so batch simulation and filtered verbosity never
+pay for formatting.  Free-form lines still use ``CombatEventCode.TEXT``.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Dict, Iterable, List, Tuple
+
+VERBOSITY_RANK: Dict[str, int] = {"compact": 0, "normal": 1, "debug": 2}
+
+
+class CombatEventCode(IntEnum):
+    TEXT = 0
+    ROUND_START = 1
+    ATTACK_ROLL = 2
+    ATTACK_ROLL_ADVANTAGE = 3
+    ATTACK_ROLL_DISADVANTAGE = 4
+    ATTACK_TOTAL = 5
+    ATTACK_MISS = 6
+    ATTACK_HIT = 7
+    ENEMY_MISSES_PLAYER = 8
+    ENEMY_HITS_PLAYER = 9
+    PLAYER_DEALS_DAMAGE = 10
+    STATUS_APPLIED = 11
+    STATUS_EXPIRED = 12
+
+
+_TEMPLATES: Dict[int, str] = {
+    CombatEventCode.ROUND_START: "-- Round {v[0]} --",
+    CombatEventCode.ATTACK_ROLL: "{n[0]} rolls {v[0]}.",
+    CombatEventCode.ATTACK_ROLL_ADVANTAGE: "{n[0]} rolls {v[0]} and {v[1]} (advantage).",
+    CombatEventCode.ATTACK_ROLL_DISADVANTAGE: "{n[0]} rolls {v[0]} and {v[1]} (disadvantage).",
+    CombatEventCode.ATTACK_TOTAL: "Attack total: {v[0]} + {v[1]} (atk) + {v[2]} (prof) + {v[3]} (ability) = {v[4]} vs AC {v[5]}.",
+    CombatEventCode.ATTACK_MISS: "{n[0]} misses {n[1]}.",
+    CombatEventCode.ATTACK_HIT: "{n[0]} hits {n[1]} for {v[0]} damage ({v[1]}/{v[2]}).",
+    CombatEventCode.ENEMY_MISSES_PLAYER: "{n[0]} misses you.",
+    CombatEventCode.ENEMY_HITS_PLAYER: "{n[0]} hits you for {v[0]} damage ({v[1]}/{v[2]}).",
+    CombatEventCode.PLAYER_DEALS_DAMAGE: "You deal {v[0]} damage to {n[0]} ({v[1]}/{v[2]}).",
+    CombatEventCode.STATUS_APPLIED: "{n[0]}: {n[1]} is now {n[2]} ({v[0]} rounds).",
+    CombatEventCode.STATUS_EXPIRED: "{n[0]} is no longer {n[1]}.",
+}
+
+
+def render_event(code: int, names: Tuple[str, ...], values: Tuple[int, ...]) -> str:
+    template = _TEMPLATES.get(int(code))
+    if template is None:
+        return " ".join(names)
+    return template.format(n=names, v=values)
+
+
+class CombatLogEntry:
+    """One combat log line; structured entries render their text on first access."""
+
+    __slots__ = ("code", "names", "values", "level", "_text")
+
+    def __init__(
+        self,
+        text: str | None = None,
+        *,
+        code: int = CombatEventCode.TEXT,
+        names: Tuple[str, ...] = (),
+        values: Tuple[int, ...] = (),
+        level: int = 0,
+    ) -> None:
+        self.code = int(code)
+        self.names = names
+        self.values = values
+        self.level = level
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        text = self._text
+        if text is None:
+            if self.code == CombatEventCode.TEXT:
+                text = self.names[0] if self.names else ""
+            else:
+                text = render_event(self.code, self.names, self.values)
+            self._text = text
+        return text
+
+    def event(self) -> Tuple[int, int, Tuple[str, ...], Tuple[int, ...]]:
+        """Return ``(code, level, names, values)``; plain text lines carry the text as their only name."""
+        if self.code == CombatEventCode.TEXT:
+            return (self.code, self.level, (self.text,), ())
+        return (self.code, self.level, tuple(self.names), tuple(int(value) for value in self.values))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CombatLogEntry):
+            return NotImplemented
+        return self.text == other.text
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CombatLogEntry(text={self.text!r})"
+
+    def __getstate__(self):
+        return (self.code, self.names, self.values, self.level, self._text)
+
+    def __setstate__(self, state) -> None:
+        self.code, self.names, self.values, self.level, self._text = state
+
+
+def entry_from_event(code: int, level: int, names: Iterable[str], values: Iterable[int]) -> CombatLogEntry:
+    names = tuple(names)
+    if int(code) == CombatEventCode.TEXT:
+        return CombatLogEntry(names[0] if names else "", level=level)
+    return CombatLogEntry(code=code, names=names, values=tuple(values), level=level)
+
+
+def render_log(entries: Iterable[CombatLogEntry], verbosity: str = "debug") -> List[str]:
+    """Render the entries visible at ``verbosity``."""
+    rank = VERBOSITY_RANK.get(verbosity, 0)
+    return [entry.text for entry in entries if entry.level <= rank]
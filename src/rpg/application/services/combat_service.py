@@ -1,10 +1,35 @@
 import random
 import copy
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, replace
-from typing import Callable, Dict, List, Optional, Tuple
-
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from rpg.application.services.combatant_state import (
+    combatant_state,
+    find_status_slot,
+    publish_combatant_state,
+    release_combatant_state,
+    status_key,
+    status_mask,
+    status_slot,
+)
+from rpg.application.services.battle_state import BattleState
+from rpg.application.services.combat_ai_policy import (
+    CAN_AMBUSH,
+    CAN_GRAPPLE,
+    CAN_SHOVE,
+    CAN_SLIP_AWAY,
+    COVERED_RETREAT,
+    WOUNDED_THREATENED,
+    CombatAiPolicy,
+    default_combat_ai_policy,
+)
+from rpg.application.services.combat_events import VERBOSITY_RANK, CombatEventCode, CombatLogEntry
+from rpg.application.services.derived_stats_cache import DerivedStatsCache
 from rpg.application.services.feature_effect_registry import (
     ConditionEffect,
+    FeatureDispatchTable,
     FeatureEffectContext,
     default_feature_effect_registry,
 )
@@ -13,14 +38,11 @@ from rpg.domain.models.character import Character
 from rpg.domain.models.entity import Entity
 from rpg.domain.models.feature import Feature
 from rpg.domain.models.stats import ability_modifier, ability_scores_from_mapping
+from rpg.domain.services.dice import compile_dice_expression, compile_die, roll_compiled, roll_dice_total
 from rpg.domain.services.spellcasting import available_slot_levels, consume_slot, normalize_slot_ledger, restore_slots
 from rpg.domain.repositories import FeatureRepository, SpellRepository
-from rpg.application.spells.spell_definitions import SPELL_DEFINITIONS
-
-
-@dataclass
-class CombatLogEntry:
-    text: str
+from rpg.application.spells.spell_catalog import combat_base_level, parse_spell_components, shared_spell_catalog
+from rpg.application.spells.spell_definitions import SPELL_DEFINITIONS, is_healing_spell_slug, slugify_spell_name as _slugify_spell_name
 
 
 @dataclass
@@ -39,6 +61,7 @@ class PartyCombatResult:
     log: List[CombatLogEntry]
     allies_won: bool
     fled: bool = False
+    rounds: int = 0
 
 
 PartyTargetSelection = int | tuple[str, int] | None
@@ -63,57 +86,20 @@ def proficiency_bonus(level: int) -> int:
     return 2
 
 
-def roll_die(spec: str, rng: random.Random | None = None) -> int:
-    rng = rng or random
-    if not spec or not isinstance(spec, str):
-        return 1
-    if spec.startswith("d"):
-        try:
-            sides = int(spec[1:])
-            return rng.randint(1, max(2, sides))
-        except ValueError:
-            return 1
-    try:
-        sides = int(spec)
-        return rng.randint(1, max(2, sides))
-    except ValueError:
-        return 1
+def roll_die(spec: str, rng: random.Random | None = None, count: int = 1) -> int:
+    sides = compile_die(spec)
+    if sides <= 0:
+        return max(0, int(count))
+    if count == 1:
+        return (rng or random).randint(1, sides)
+    return roll_dice_total(count, sides, rng=rng)
 
 
 def _roll_dice_expr(expr: str, ability_mod: int = 0, rng: random.Random | None = None) -> int:
-    rng = rng or random
     """Simple dice expression roller supporting NdX+M."""
     if not expr:
         return 0
-    expr = expr.lower().replace(" ", "")
-    total = 0
-    parts = expr.split("+")
-    for part in parts:
-        if "d" in part:
-            try:
-                num_str, die_str = part.split("d", 1)
-                num = int(num_str) if num_str else 1
-                sides = int(die_str) if die_str else 6
-                for _ in range(max(num, 1)):
-                    total += rng.randint(1, max(2, sides))
-            except Exception:
-                continue
-        elif part == "mod":
-            total += max(ability_mod, 0)
-        else:
-            try:
-                total += int(part)
-            except Exception:
-                continue
-    return max(total, 0)
-
-
-def _slugify_spell_name(name: str) -> str:
-    return (
-        "".join(ch if ch.isalnum() or ch == " " else "-" for ch in name.lower())
-        .replace(" ", "-")
-        .replace("--", "-")
-    )
+    return roll_compiled(compile_dice_expression(expr), ability_mod=ability_mod, rng=rng)
 
 
 class CombatService:
@@ -125,28 +111,6 @@ class CombatService:
         "far": "far",
     }
 
-    _BACKLINE_CLASSES: Tuple[str, ...] = ("wizard", "sorcerer", "warlock", "bard")
-    _BACKLINE_NAME_KEYWORDS: Tuple[str, ...] = (
-        "archer",
-        "shaman",
-        "mage",
-        "warlock",
-        "witch",
-        "priest",
-        "acolyte",
-    )
-    _BOSS_NAME_KEYWORDS: Tuple[str, ...] = (
-        "dragon",
-        "tyrant",
-        "lord",
-        "queen",
-        "king",
-        "ancient",
-        "demon",
-        "lich",
-        "boss",
-    )
-
     def __init__(
         self,
         spell_repo: Optional[SpellRepository] = None,
@@ -155,18 +119,62 @@ class CombatService:
         event_publisher: Optional[Callable[[object], None]] = None,
         feature_effect_registry=None,
         mechanical_flavour_builder: Optional[Callable[..., str]] = None,
+        derived_stats_cache: Optional[DerivedStatsCache] = None,
+        ai_policy: Optional[CombatAiPolicy] = None,
+        publish_feature_events: bool = True,
     ) -> None:
         self.spell_repo = spell_repo
         self.verbosity = verbosity  # compact | normal | debug
         self.feature_repo = feature_repo
         self.event_publisher = event_publisher
+        self.publish_feature_events = publish_feature_events  # batch simulations switch per-trigger events off
         self.feature_effect_registry = feature_effect_registry or default_feature_effect_registry()
         self.mechanical_flavour_builder = mechanical_flavour_builder
-        self.rng = random.Random()
+        self.derived_stats_cache = derived_stats_cache or DerivedStatsCache()
+        self.ai_policy = ai_policy or default_combat_ai_policy()
+        self._local = threading.local()
+
+    # Every thread sees its own ``rng``, so one service can resolve fights on
+    # several threads at once; ``seeded`` gives a single fight its own stream.
+    @property
+    def rng(self) -> random.Random:
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            rng = random.Random()
+            self._local.rng = rng
+        return rng
+
+    @rng.setter
+    def rng(self, value: random.Random) -> None:
+        self._local.rng = value
 
     def set_seed(self, seed: int) -> None:
         self.rng.seed(seed)
 
+    @contextmanager
+    def seeded(self, seed: int) -> Iterator[random.Random]:
+        """Resolve the enclosed fight with a fresh ``Random(seed)`` on this thread, then restore the previous one."""
+        previous = getattr(self._local, "rng", None)
+        rng = random.Random(seed)
+        self._local.rng = rng
+        try:
+            yield rng
+        finally:
+            self._local.rng = previous
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state["_local"] = None
+        state["_rng_state"] = self.rng.getstate()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        rng_state = state.pop("_rng_state", None)
+        self.__dict__.update(state)
+        self._local = threading.local()
+        if rng_state is not None:
+            self.rng.setstate(rng_state)
+
     _COMBAT_ITEM_ORDER: Tuple[str, ...] = (
         "Healing Potion",
         "Healing Herbs",
@@ -203,6 +211,7 @@ class CombatService:
         "paladin": "charisma",
     }
 
+    _WEAPON_DIE_CACHE: Dict[str, str] = {}
     _WEAPON_DIE_KEYWORDS: Dict[str, str] = {
         "greataxe": "d12",
         "greatsword": "d12",
@@ -266,6 +275,9 @@ class CombatService:
         "dodging": "Dodging",
         "disengaged": "Disengaged",
     }
+    _MOVEMENT_BLOCKING_MASK = status_mask(("stunned", "paralysed", "restrained", "grappled", "incapacitated", "petrified", "unconscious"))
+    _TURN_BLOCKING_MASK = status_mask(("stunned", "paralysed", "incapacitated", "petrified", "unconscious"))
+    _PRONE_SLOT = status_slot("prone")
     _COVER_BONUS_BY_LEVEL: Dict[str, int] = {
         "none": 0,
         "half": 2,
@@ -278,101 +290,39 @@ class CombatService:
         return ability_scores_from_mapping(attrs)
 
     def _actor_statuses(self, actor) -> List[Dict[str, int | str]]:
-        if isinstance(actor, Character):
-            flags = getattr(actor, "flags", None)
-            if not isinstance(flags, dict):
-                flags = {}
-                actor.flags = flags
-            raw = flags.setdefault("combat_statuses", [])
-            if not isinstance(raw, list):
-                raw = []
-                flags["combat_statuses"] = raw
-            return [row for row in raw if isinstance(row, dict) and str(row.get("id", "")).strip()]
-
-        raw = getattr(actor, "_combat_statuses", None)
-        if not isinstance(raw, list):
-            raw = []
-            setattr(actor, "_combat_statuses", raw)
-        return [row for row in raw if isinstance(row, dict) and str(row.get("id", "")).strip()]
+        return combatant_state(actor).status_rows()
 
     def _set_actor_statuses(self, actor, statuses: List[Dict[str, int | str]]) -> None:
-        normalized = [
-            {
-                "id": str(row.get("id", "")).strip().lower(),
-                "rounds": max(0, int(row.get("rounds", 0) or 0)),
-                "potency": max(1, int(row.get("potency", 1) or 1)),
-                "source_id": int(row.get("source_id", 0) or 0),
-                "source_name": str(row.get("source_name", "") or "").strip(),
-                "source_spell": str(row.get("source_spell", "") or "").strip().lower(),
-            }
-            for row in statuses
-            if str(row.get("id", "")).strip()
-        ]
-        if isinstance(actor, Character):
-            flags = getattr(actor, "flags", None)
-            if not isinstance(flags, dict):
-                flags = {}
-                actor.flags = flags
-            flags["combat_statuses"] = normalized
-            return
-        setattr(actor, "_combat_statuses", normalized)
+        combatant_state(actor).load_status_rows(statuses)
 
     def _has_status(self, actor, status_id: str) -> bool:
-        key = str(status_id or "").strip().lower()
-        return any(str(row.get("id", "")).strip().lower() == key and int(row.get("rounds", 0) or 0) > 0 for row in self._actor_statuses(actor))
+        return combatant_state(actor).has(find_status_slot(status_id))
 
     def _has_status_from_source(self, actor, status_id: str, source_actor) -> bool:
-        key = str(status_id or "").strip().lower()
+        state = combatant_state(actor)
+        slot = find_status_slot(status_id)
+        if not state.has(slot):
+            return False
         source_id = int(getattr(source_actor, "id", 0) or 0)
         source_name = str(getattr(source_actor, "name", "") or "").strip().lower()
-        for row in self._actor_statuses(actor):
-            row_key = str(row.get("id", "")).strip().lower()
-            rounds = int(row.get("rounds", 0) or 0)
-            if row_key != key or rounds <= 0:
-                continue
-            row_source_id = int(row.get("source_id", 0) or 0)
-            row_source_name = str(row.get("source_name", "") or "").strip().lower()
-            if source_id and row_source_id == source_id:
-                return True
-            if source_name and row_source_name and row_source_name == source_name:
-                return True
-        return False
+        if source_id and state.source_ids[slot] == source_id:
+            return True
+        row_source_name = state.source_names[slot].lower()
+        return bool(source_name and row_source_name and row_source_name == source_name)
 
     def _status_potency(self, actor, status_id: str) -> int:
-        key = str(status_id or "").strip().lower()
-        best = 0
-        for row in self._actor_statuses(actor):
-            row_key = str(row.get("id", "")).strip().lower()
-            rounds = int(row.get("rounds", 0) or 0)
-            if row_key != key or rounds <= 0:
-                continue
-            best = max(best, int(row.get("potency", 1) or 1))
-        return int(best)
+        return combatant_state(actor).potency_of(find_status_slot(status_id))
 
     def _exhaustion_level(self, actor) -> int:
         return int(self._status_potency(actor, "exhaustion") or 0)
 
     def _movement_blocked(self, actor) -> bool:
-        if (
-            self._has_status(actor, "stunned")
-            or self._has_status(actor, "paralysed")
-            or self._has_status(actor, "restrained")
-            or self._has_status(actor, "grappled")
-            or self._has_status(actor, "incapacitated")
-            or self._has_status(actor, "petrified")
-            or self._has_status(actor, "unconscious")
-        ):
+        if combatant_state(actor).active & self._MOVEMENT_BLOCKING_MASK:
             return True
         return self._exhaustion_level(actor) >= 5
 
     def _turn_blocked(self, actor) -> bool:
-        if (
-            self._has_status(actor, "stunned")
-            or self._has_status(actor, "paralysed")
-            or self._has_status(actor, "incapacitated")
-            or self._has_status(actor, "petrified")
-            or self._has_status(actor, "unconscious")
-        ):
+        if combatant_state(actor).active & self._TURN_BLOCKING_MASK:
             return True
         return self._exhaustion_level(actor) >= 6
 
@@ -505,70 +455,52 @@ class CombatService:
             return
         next_rounds = max(1, int(rounds or 1))
         next_potency = max(1, int(potency or 1))
-        statuses = self._actor_statuses(actor)
-        existing = next((row for row in statuses if str(row.get("id", "")).strip().lower() == key), None)
+        state = combatant_state(actor)
         source_id = int(getattr(source_actor, "id", 0) or 0)
         source_label = str(getattr(source_actor, "name", "") or "").strip() or str(source_name or "")
         source_spell_key = str(source_spell or "").strip().lower()
-        if existing is not None:
-            existing["rounds"] = max(int(existing.get("rounds", 0) or 0), next_rounds)
-            existing["potency"] = max(int(existing.get("potency", 1) or 1), next_potency)
-            if source_id:
-                existing["source_id"] = source_id
-            if source_label:
-                existing["source_name"] = source_label
-            if source_spell_key:
-                existing["source_spell"] = source_spell_key
-        else:
-            statuses.append(
-                {
-                    "id": key,
-                    "rounds": next_rounds,
-                    "potency": next_potency,
-                    "source_id": source_id,
-                    "source_name": source_label,
-                    "source_spell": source_spell_key,
-                }
+        added = state.apply(
+            status_slot(key),
+            rounds=next_rounds,
+            potency=next_potency,
+            source_id=source_id,
+            source_name=source_label,
+            source_spell=source_spell_key,
+        )
+        if not added:
+            return
+        self._emit(log, CombatEventCode.STATUS_APPLIED, (source_name, getattr(actor, "name", "Target"), self._STATUS_LABELS[key]), (next_rounds,), level="compact")
+        if key == "unconscious" and not state.has(self._PRONE_SLOT):
+            state.apply(
+                self._PRONE_SLOT,
+                rounds=next_rounds,
+                potency=1,
+                source_id=source_id,
+                source_name=source_label,
+                source_spell=source_spell_key,
             )
-            self._log(log, f"{source_name}: {getattr(actor, 'name', 'Target')} is now {self._STATUS_LABELS[key]} ({next_rounds} rounds).", level="compact")
-            if key == "unconscious" and not self._has_status(actor, "prone"):
-                statuses.append(
-                    {
-                        "id": "prone",
-                        "rounds": max(next_rounds, 1),
-                        "potency": 1,
-                        "source_id": source_id,
-                        "source_name": source_label,
-                        "source_spell": source_spell_key,
-                    }
-                )
-        self._set_actor_statuses(actor, statuses)
 
     def _status_attack_roll_shift(self, actor) -> int:
+        state = combatant_state(actor)
         shift = 0
-        for row in self._actor_statuses(actor):
-            key = str(row.get("id", "")).strip().lower()
-            rounds = int(row.get("rounds", 0) or 0)
-            potency = max(1, int(row.get("potency", 1) or 1))
-            if rounds <= 0:
-                continue
-            shift += int(self._STATUS_ATTACK_ROLL_SHIFT.get(key, 0)) * potency
+        for slot in state.order:
+            shift += int(self._STATUS_ATTACK_ROLL_SHIFT.get(status_key(slot), 0)) * state.potency[slot]
         return int(shift)
 
     def _apply_start_turn_statuses(self, actor, log: List[CombatLogEntry]) -> None:
-        statuses = self._actor_statuses(actor)
+        state = combatant_state(actor)
         hp_now = int(getattr(actor, "hp_current", 0) or 0)
+        if not state.order:
+            actor.hp_current = hp_now
+            return
         hp_max = int(getattr(actor, "hp_max", hp_now) or hp_now)
-        for row in statuses:
+        for slot in tuple(state.order):
             if hp_now <= 0:
                 break
-            key = str(row.get("id", "")).strip().lower()
-            rounds = int(row.get("rounds", 0) or 0)
-            potency = max(1, int(row.get("potency", 1) or 1))
-            if rounds <= 0:
-                continue
+            key = status_key(slot)
+            potency = state.potency[slot]
             if key == "burning":
-                damage = sum(roll_die("d4", rng=self.rng) for _ in range(potency))
+                damage = roll_die("d4", rng=self.rng, count=potency)
                 damage = self._modify_incoming_damage(actor, damage)
                 hp_now = max(0, hp_now - damage)
                 self._log(log, f"{getattr(actor, 'name', 'Target')} burns for {damage} damage ({hp_now}/{hp_max}).", level="compact")
@@ -594,100 +526,45 @@ class CombatService:
         actor.hp_current = hp_now
 
     def _tick_actor_statuses_end_turn(self, actor, log: List[CombatLogEntry]) -> None:
-        statuses = self._actor_statuses(actor)
-        remaining: List[Dict[str, int | str]] = []
-        for row in statuses:
-            key = str(row.get("id", "")).strip().lower()
-            rounds = int(row.get("rounds", 0) or 0)
-            potency = max(1, int(row.get("potency", 1) or 1))
-            if rounds <= 0:
-                continue
-            rounds -= 1
-            if rounds <= 0:
-                label = self._STATUS_LABELS.get(key, key.title())
-                self._log(log, f"{getattr(actor, 'name', 'Target')} is no longer {label}.", level="normal")
-                continue
-            remaining.append(
-                {
-                    "id": key,
-                    "rounds": rounds,
-                    "potency": potency,
-                    "source_id": int(row.get("source_id", 0) or 0),
-                    "source_name": str(row.get("source_name", "") or "").strip(),
-                }
-            )
-        self._set_actor_statuses(actor, remaining)
+        for slot in combatant_state(actor).tick_statuses():
+            key = status_key(slot)
+            label = self._STATUS_LABELS.get(key, key.title())
+            self._emit(log, CombatEventCode.STATUS_EXPIRED, (getattr(actor, "name", "Target"), label), level="normal")
 
     def _actor_tactical_tags(self, actor) -> Dict[str, int]:
-        if isinstance(actor, Character):
-            flags = getattr(actor, "flags", None)
-            if not isinstance(flags, dict):
-                return {}
-            payload = flags.get("combat_tactical_tags")
-        else:
-            payload = getattr(actor, "_combat_tactical_tags", None)
-        if not isinstance(payload, dict):
-            return {}
-
-        normalized: Dict[str, int] = {}
-        for key, value in payload.items():
-            slug = str(key or "").strip().lower()
-            rounds = int(value or 0)
-            if slug and rounds > 0:
-                normalized[slug] = rounds
-        return normalized
+        return dict(combatant_state(actor).tags)
 
     def _set_actor_tactical_tags(self, actor, tags: Dict[str, int]) -> None:
-        normalized: Dict[str, int] = {}
-        for key, value in tags.items():
-            slug = str(key or "").strip().lower()
-            rounds = int(value or 0)
-            if slug and rounds > 0:
-                normalized[slug] = rounds
-        if isinstance(actor, Character):
-            flags = getattr(actor, "flags", None)
-            if not isinstance(flags, dict):
-                return
-            if normalized:
-                flags["combat_tactical_tags"] = normalized
-            else:
-                flags.pop("combat_tactical_tags", None)
-            return
-        setattr(actor, "_combat_tactical_tags", normalized)
+        combatant_state(actor).load_tags(tags)
 
     def _add_tactical_tag(self, actor, *, tag: str, rounds: int) -> None:
         key = str(tag or "").strip().lower()
         if not key:
             return
-        next_rounds = max(1, int(rounds or 1))
-        tags = self._actor_tactical_tags(actor)
-        tags[key] = max(int(tags.get(key, 0) or 0), next_rounds)
-        self._set_actor_tactical_tags(actor, tags)
+        combatant_state(actor).add_tag(key, max(1, int(rounds or 1)))
 
     def _has_tactical_tag(self, actor, tag: str) -> bool:
-        key = str(tag or "").strip().lower()
-        return key in self._actor_tactical_tags(actor)
+        tags = combatant_state(actor).tags
+        return bool(tags) and str(tag or "").strip().lower() in tags
 
     def _consume_tactical_tag(self, actor, tag: str) -> bool:
-        key = str(tag or "").strip().lower()
-        tags = self._actor_tactical_tags(actor)
-        if key not in tags:
+        state = combatant_state(actor)
+        if not state.tags:
             return False
-        tags.pop(key, None)
-        self._set_actor_tactical_tags(actor, tags)
-        return True
+        return state.consume_tag(str(tag or "").strip().lower())
 
     def _tick_actor_tactical_tags_end_turn(self, actor) -> None:
-        tags = self._actor_tactical_tags(actor)
-        remaining: Dict[str, int] = {}
-        for key, rounds in tags.items():
-            next_rounds = int(rounds) - 1
-            if next_rounds > 0:
-                remaining[key] = next_rounds
-        self._set_actor_tactical_tags(actor, remaining)
+        combatant_state(actor).tick_tags()
 
     def _clear_actor_tactical_tags(self, actor) -> None:
-        self._set_actor_tactical_tags(actor, {})
+        combatant_state(actor).clear_tags()
+
+    @staticmethod
+    def _publish_combatants(*groups) -> None:
+        """Expose pending status/tag changes to callbacks that read the legacy flag payloads."""
+        for group in groups:
+            for actor in group:
+                publish_combatant_state(actor)
 
     def _actor_runtime_state(self, actor) -> Dict[str, object]:
         if isinstance(actor, Character):
@@ -811,27 +688,18 @@ class CombatService:
         spell_key = str(spell_slug or "").strip().lower()
         if not spell_key:
             return []
-        statuses = self._actor_statuses(target)
-        if not statuses:
+        state = combatant_state(target)
+        if not state.order:
             return []
 
         source_id = int(getattr(source_actor, "id", 0) or 0)
         source_name = str(getattr(source_actor, "name", "") or "").strip().lower()
-        kept: list[dict[str, int | str]] = []
         removed: list[str] = []
-        for row in statuses:
-            row_source_id = int(row.get("source_id", 0) or 0)
-            row_source_name = str(row.get("source_name", "") or "").strip().lower()
-            row_spell = str(row.get("source_spell", "") or "").strip().lower()
-            source_matches = (source_id > 0 and row_source_id == source_id) or (bool(source_name) and source_name == row_source_name)
-            spell_matches = row_spell == spell_key
-            if source_matches and spell_matches:
-                removed.append(str(row.get("id", "") or "effect").strip().lower())
-                continue
-            kept.append(row)
-
-        if len(kept) != len(statuses):
-            self._set_actor_statuses(target, kept)
+        for slot in tuple(state.order):
+            source_matches = (source_id > 0 and state.source_ids[slot] == source_id) or (bool(source_name) and source_name == state.source_names[slot].lower())
+            if source_matches and state.source_spells[slot] == spell_key:
+                removed.append(status_key(slot))
+                state.discard(slot)
         return removed
 
     def _clear_concentration_effects(self, *, actor, payload: Dict[str, object], log: List[CombatLogEntry]) -> None:
@@ -1128,23 +996,30 @@ class CombatService:
 
     def _weapon_die_from_name(self, item_name: str) -> str:
         lowered = str(item_name or "").lower()
-        for key, die in self._WEAPON_DIE_KEYWORDS.items():
-            if key in lowered:
-                return die
-        return "d6"
+        cached = self._WEAPON_DIE_CACHE.get(lowered)
+        if cached is not None:
+            return cached
+        die = next((die for key, die in self._WEAPON_DIE_KEYWORDS.items() if key in lowered), "d6")
+        if len(self._WEAPON_DIE_CACHE) >= 1024:
+            self._WEAPON_DIE_CACHE.clear()
+        self._WEAPON_DIE_CACHE[lowered] = die
+        return die
 
     def _character_features(self, player: Character) -> list[Feature]:
         if self.feature_repo is None or player.id is None:
             return []
         try:
-            return list(self.feature_repo.list_for_character(player.id))
+            return self.derived_stats_cache.features_for(player, self._load_character_features)
         except Exception:
             return []
 
+    def _load_character_features(self, player: Character) -> list[Feature]:
+        return list(self.feature_repo.list_for_character(player.id))
+
     def _resolve_feature_trigger(
         self,
         *,
-        features: list[Feature],
+        features: list[Feature] | FeatureDispatchTable,
         trigger_key: str,
         player: Character,
         enemy: Entity,
@@ -1153,6 +1028,12 @@ class CombatService:
         target_actor=None,
         log: Optional[List[CombatLogEntry]] = None,
     ) -> tuple[int, int, int]:
+        if not isinstance(features, FeatureDispatchTable):
+            features = self.feature_effect_registry.build_dispatch(features)
+        bound = features.for_trigger(str(trigger_key))
+        if not bound:
+            return 0, 0, 0
+
         initiative_bonus = 0
         attack_bonus = 0
         bonus_damage = 0
@@ -1163,10 +1044,8 @@ class CombatService:
             is_crit=is_crit,
         )
 
-        for feature in features:
-            if str(feature.trigger_key) != str(trigger_key):
-                continue
-            outcome = self.feature_effect_registry.apply(feature, context)
+        for feature, handler in bound:
+            outcome = handler(feature, context)
             added_initiative = int(outcome.initiative_bonus)
             added_attack = int(outcome.attack_bonus)
             added_damage = int(outcome.bonus_damage)
@@ -1208,7 +1087,7 @@ class CombatService:
         feature: Feature,
         round_number: int,
     ) -> None:
-        if self.event_publisher is None:
+        if self.event_publisher is None or not self.publish_feature_events:
             return
         if player.id is None:
             return
@@ -1229,6 +1108,13 @@ class CombatService:
 
     def derive_player_stats(self, player: Character) -> dict:
         """Derive combat stats from attributes, gear, and class; avoids drift."""
+        return self.derived_stats_cache.stats_for(player, self._compute_player_stats)
+
+    def invalidate_derived_stats(self, character_id: Optional[int] = None) -> None:
+        """Drop cached stats/features after equipment or progression changes."""
+        self.derived_stats_cache.invalidate(character_id)
+
+    def _compute_player_stats(self, player: Character) -> dict:
         weapon_die, weapon_mod = self._derive_weapon_profile(player)
         prof = proficiency_bonus(getattr(player, "level", 1))
         ac = self._derive_ac(player)
@@ -1246,16 +1132,7 @@ class CombatService:
         }
 
     def _intent_for_enemy(self, enemy: Entity) -> str:
-        kind = (getattr(enemy, "kind", "") or "").lower()
-        mapping = {
-            "beast": "aggressive",
-            "undead": "brute",
-            "humanoid": "cautious",
-            "fiend": "ambusher",
-            "construct": "brute",
-            "dragon": "aggressive",
-        }
-        return mapping.get(kind, "aggressive")
+        return self.ai_policy.profile(enemy).intent
 
     def _intent_flavour(self, intent: str) -> str:
         flavour = {
@@ -1268,11 +1145,22 @@ class CombatService:
         return flavour.get(intent, "The foe sizes you up.")
 
     def _log(self, log: List[CombatLogEntry], text: str, level: str = "compact") -> None:
-        order = {"compact": 0, "normal": 1, "debug": 2}
-        current = order.get(self.verbosity, 0)
-        needed = order.get(level, 0)
-        if current >= needed:
-            log.append(CombatLogEntry(text))
+        needed = VERBOSITY_RANK.get(level, 0)
+        if VERBOSITY_RANK.get(self.verbosity, 0) >= needed:
+            log.append(CombatLogEntry(text, level=needed))
+
+    def _emit(
+        self,
+        log: List[CombatLogEntry],
+        code: CombatEventCode,
+        names: tuple[str, ...],
+        values: tuple[int, ...] = (),
+        level: str = "compact",
+    ) -> None:
+        """Record a structured event; its text is only formatted when read."""
+        needed = VERBOSITY_RANK.get(level, 0)
+        if VERBOSITY_RANK.get(self.verbosity, 0) >= needed:
+            log.append(CombatLogEntry(code=code, names=names, values=values, level=needed))
 
     def _add_flavour(self, log: List[CombatLogEntry], tracker: dict, key: str, text: str, level: str = "normal") -> None:
         """Append a flavour line once per key to avoid text spam."""
@@ -1308,35 +1196,7 @@ class CombatService:
 
     def _select_enemy_action(self, intent: str, foe: Entity, round_no: int, terrain: str = "open") -> tuple[str, Optional[str]]:
         """Return (action, advantage_for_attack)."""
-        hp_max = getattr(foe, "hp_max", getattr(foe, "hp", 1)) or 1
-        hp_pct = (foe.hp_current or hp_max) / hp_max
-
-        terrain_bias = 0
-        if terrain == "cramped" and intent == "brute":
-            terrain_bias += 0.1
-        if terrain == "open" and intent in {"skirmisher", "ambusher"}:
-            terrain_bias += 0.1
-        if terrain == "difficult" and intent == "cautious":
-            terrain_bias += 0.1
-
-        if hp_pct <= 0.25:
-            if intent in {"cautious", "skirmisher"}:
-                return "flee", None
-            if intent == "aggressive":
-                return "reckless", "advantage"
-        if hp_pct <= 0.5 and intent == "cautious":
-            return "attack", "disadvantage"  # more defensive strikes
-
-        if intent == "ambusher":
-            return "attack", "advantage" if round_no == 1 else None
-        if intent == "brute":
-            return "attack", None
-        if intent == "skirmisher":
-            if hp_pct < 0.5 - terrain_bias:
-                return "flee", None
-            return "attack", None
-        # aggressive default
-        return "attack", None
+        return self.ai_policy.select_enemy_action(intent, foe, round_no, terrain)
 
     def _select_enemy_tactical_action(
         self,
@@ -1348,6 +1208,7 @@ class CombatService:
         distance: str,
         default_action: str,
         allies: Optional[list] = None,
+        battle: Optional[BattleState] = None,
     ) -> str:
         base = str(default_action or "attack").strip().lower()
         if base not in {"attack", "reckless"}:
@@ -1355,41 +1216,40 @@ class CombatService:
 
         intent_key = str(intent or "").strip().lower()
         roll = self.rng.randint(1, 100)
-        is_melee_actor = self._is_melee_actor(actor)
+        is_melee_actor = battle.is_melee(actor) if battle is not None else self._is_melee_actor(actor)
         engaged = self._is_melee_range(distance)
         can_hide = self._terrain_supports_hiding(terrain=str(terrain), distance=str(distance))
-        hp_max = max(1, int(getattr(actor, "hp_max", getattr(actor, "hp", 1)) or 1))
-        hp_now = int(getattr(actor, "hp_current", hp_max) or hp_max)
-        hp_ratio = float(hp_now) / float(hp_max)
         threatened = engaged and not self._movement_blocked(actor)
-        has_vanguard_support = True
-        if isinstance(allies, list):
-            has_vanguard_support = any(
-                row is not actor
-                and int(getattr(row, "hp_current", 0) or 0) > 0
-                and self._combat_lane(row) == "vanguard"
-                for row in allies
-            )
-
-        if threatened and not is_melee_actor and has_vanguard_support:
-            return "disengage"
-
-        if threatened and hp_ratio <= 0.45 and intent_key in {"cautious", "skirmisher", "ambusher"} and roll <= 50:
-            return "disengage"
-
-        if intent_key == "ambusher" and can_hide and not self._has_tactical_tag(actor, "hidden_strike") and roll <= 45:
-            return "hide"
 
-        if is_melee_actor and engaged:
-            if intent_key in {"brute", "aggressive"} and not self._has_status(target, "grappled") and roll <= 35:
-                return "grapple"
-            if intent_key in {"cautious", "skirmisher"} and not self._has_status(target, "prone") and roll <= 30:
-                return "shove"
-
-        if intent_key in {"cautious", "skirmisher"} and can_hide and not engaged and roll <= 30:
-            return "hide"
+        def holds(condition: str) -> bool:
+            if condition == COVERED_RETREAT:
+                if not threatened or is_melee_actor:
+                    return False
+                if not isinstance(allies, list):
+                    return True
+                if battle is not None:
+                    return battle.has_living_vanguard(allies, excluding=actor)
+                return any(
+                    row is not actor
+                    and int(getattr(row, "hp_current", 0) or 0) > 0
+                    and self._combat_lane(row) == "vanguard"
+                    for row in allies
+                )
+            if condition == WOUNDED_THREATENED:
+                hp_max = max(1, int(getattr(actor, "hp_max", getattr(actor, "hp", 1)) or 1))
+                hp_now = int(getattr(actor, "hp_current", hp_max) or hp_max)
+                return threatened and float(hp_now) / float(hp_max) <= 0.45
+            if condition == CAN_AMBUSH:
+                return can_hide and not self._has_tactical_tag(actor, "hidden_strike")
+            if condition == CAN_GRAPPLE:
+                return is_melee_actor and engaged and not self._has_status(target, "grappled")
+            if condition == CAN_SHOVE:
+                return is_melee_actor and engaged and not self._has_status(target, "prone")
+            if condition == CAN_SLIP_AWAY:
+                return can_hide and not engaged
+            return False
 
-        return base
+        return self.ai_policy.select_tactical_action(intent_key, roll, holds) or base
 
     def _roll_d20(self, advantage: Optional[str] = None) -> tuple[int, int, int]:
         """Return (roll, alt_roll, chosen) where alt_roll is 0 when unused."""
@@ -1415,17 +1275,17 @@ class CombatService:
         raw, alt, chosen = self._roll_d20(advantage)
         total = chosen + attack_bonus + proficiency + ability_bonus
         if advantage == "advantage":
-            self._log(log, f"{attacker_name} rolls {raw} and {alt} (advantage).", level="debug")
+            self._emit(log, CombatEventCode.ATTACK_ROLL_ADVANTAGE, (attacker_name,), (raw, alt), level="debug")
         elif advantage == "disadvantage":
-            self._log(log, f"{attacker_name} rolls {raw} and {alt} (disadvantage).", level="debug")
+            self._emit(log, CombatEventCode.ATTACK_ROLL_DISADVANTAGE, (attacker_name,), (raw, alt), level="debug")
         else:
-            self._log(log, f"{attacker_name} rolls {raw}.", level="debug")
+            self._emit(log, CombatEventCode.ATTACK_ROLL, (attacker_name,), (raw,), level="debug")
 
         is_crit = chosen == 20
         hit = is_crit or total >= target_ac
-        self._log(log, f"Attack total: {chosen} + {attack_bonus} (atk) + {proficiency} (prof) + {ability_bonus} (ability) = {total} vs AC {target_ac}.", level="debug")
+        self._emit(log, CombatEventCode.ATTACK_TOTAL, (), (chosen, attack_bonus, proficiency, ability_bonus, total, target_ac), level="debug")
         if not hit:
-            self._log(log, f"{attacker_name} misses {target_name}.", level="compact")
+            self._emit(log, CombatEventCode.ATTACK_MISS, (attacker_name, target_name), level="compact")
         return hit, is_crit, chosen, total
 
     def _deal_damage(
@@ -1436,9 +1296,7 @@ class CombatService:
         sneak_die: Optional[str],
         rage_bonus: int,
     ) -> int:
-        dmg_roll = roll_die(damage_die, rng=self.rng)
-        if is_crit:
-            dmg_roll += roll_die(damage_die, rng=self.rng)
+        dmg_roll = roll_die(damage_die, rng=self.rng, count=2 if is_crit else 1)
         if sneak_die:
             dmg_roll += roll_die(sneak_die, rng=self.rng)
         total = dmg_roll + max(ability_bonus, 0) + rage_bonus
@@ -1475,7 +1333,7 @@ class CombatService:
         mental_mod = derived["spell_mod"]
         prof = derived["proficiency"]
         player.armour_class = derived["ac"]
-        features = self._character_features(player)
+        features = self.feature_effect_registry.build_dispatch(self._character_features(player))
         sneak_available = player.class_name == "rogue"
         rage_available = player.class_name == "barbarian"
         rage_rounds = 0
@@ -1516,7 +1374,7 @@ class CombatService:
             self._sync_pair_tactical_state(player, foe, distance=str(distance))
             if player.class_name == "rogue":
                 sneak_available = True
-            self._log(log, f"-- Round {round_no} --", level="debug")
+            self._emit(log, CombatEventCode.ROUND_START, (), (round_no,), level="debug")
             self._apply_round_lair_action(
                 log=log,
                 round_no=round_no,
@@ -1571,6 +1429,7 @@ class CombatService:
                         options.insert(1, "Cast Spell")
                     if rage_available and rage_rounds <= 0:
                         options.insert(1, "Rage Attack")
+                    self._publish_combatants((player, foe))
                     choice = choose_action(options, player, foe, round_no, {"distance": distance, "terrain": terrain, "surprise": surprise})
                     action_payload = None
                     action = choice
@@ -1655,7 +1514,7 @@ class CombatService:
                             dmg += whetstone_bonus
                             dmg = self._modify_incoming_damage(foe, dmg)
                             foe.hp_current = max(0, foe.hp_current - dmg)
-                            self._log(log, f"You deal {dmg} damage to {foe.name} ({foe.hp_current}/{foe.hp_max}).", level="compact")
+                            self._emit(log, CombatEventCode.PLAYER_DEALS_DAMAGE, (foe.name,), (dmg, foe.hp_current, foe.hp_max), level="compact")
                             self._check_concentration_after_damage(target_actor=foe, source_actor=player, damage=dmg, log=log, round_no=round_no)
                             sneak_available = False
                             self._consume_tactical_tag(player, "hidden_strike")
@@ -1858,12 +1717,14 @@ class CombatService:
                             player.flags.pop("dodging", None)
                             player.flags.pop("temp_ac_bonus", None)
                             player.flags.pop("shield_rounds", None)
+                            release_combatant_state(player)
                             player.flags.pop("combat_statuses", None)
                             player.flags.pop("combat_tactical_tags", None)
                             player.flags.pop("combat_runtime_state", None)
                             if "rage_rounds" in player.flags:
                                 player.flags["rage_rounds"] = 0
                             self._clear_actor_tactical_tags(foe)
+                            release_combatant_state(foe)
                             player.hp_current = player_hp
                             player.alive = player_hp > 0
                             return CombatResult(player, foe, log, player_won=False, fled=True)
@@ -2029,14 +1890,14 @@ class CombatService:
                         )
                         dmg = self._modify_incoming_damage(player, dmg)
                         player_hp = max(0, player_hp - dmg)
-                        self._log(log, f"{foe.name} hits you for {dmg} damage ({player_hp}/{player.hp_max}).", level="compact")
+                        self._emit(log, CombatEventCode.ENEMY_HITS_PLAYER, (foe.name,), (dmg, player_hp, player.hp_max), level="compact")
                         player.hp_current = int(player_hp)
                         self._check_concentration_after_damage(target_actor=player, source_actor=foe, damage=dmg, log=log, round_no=round_no)
                         self._consume_tactical_tag(foe, "hidden_strike")
                         self._consume_tactical_tag(foe, "helped")
                         self._consume_tactical_tag(player, "exposed")
                     else:
-                        self._log(log, f"{foe.name} misses you.", level="compact")
+                        self._emit(log, CombatEventCode.ENEMY_MISSES_PLAYER, (foe.name,), level="compact")
                         self._consume_tactical_tag(foe, "hidden_strike")
                         self._consume_tactical_tag(foe, "helped")
                         self._consume_tactical_tag(player, "exposed")
@@ -2065,6 +1926,8 @@ class CombatService:
                 player.flags.pop("dodging", None)
                 player.flags.pop("temp_ac_bonus", None)
                 player.flags.pop("shield_rounds", None)
+                release_combatant_state(player)
+                release_combatant_state(foe)
                 player.flags.pop("combat_statuses", None)
                 player.flags.pop("combat_tactical_tags", None)
                 player.flags.pop("combat_runtime_state", None)
@@ -2084,12 +1947,14 @@ class CombatService:
         player.flags.pop("dodging", None)
         player.flags.pop("temp_ac_bonus", None)
         player.flags.pop("shield_rounds", None)
+        release_combatant_state(player)
         player.flags.pop("combat_statuses", None)
         player.flags.pop("combat_tactical_tags", None)
         player.flags.pop("combat_runtime_state", None)
         if "rage_rounds" in player.flags:
             player.flags["rage_rounds"] = 0
         self._clear_actor_tactical_tags(foe)
+        release_combatant_state(foe)
 
         if foe.hp_current <= 0:
             xp_gain = max(getattr(foe, "level", 1) * 5, 1)
@@ -2102,7 +1967,7 @@ class CombatService:
         self,
         allies: List[Character],
         enemies: List[Entity],
-        choose_action: Callable[[List[str], Character, Entity, int, dict], tuple[str, Optional[str]] | str],
+        choose_action: Optional[Callable[[List[str], Character, Entity, int, dict], tuple[str, Optional[str]] | str]],
         scene: Optional[dict] = None,
         choose_target: Optional[PartyTargetSelector] = None,
         evaluate_ai_action: Optional[Callable[[object, List[object], List[object], int, dict], tuple[str, Optional[str]] | str]] = None,
@@ -2146,7 +2011,8 @@ class CombatService:
         weather = str((scene or {}).get("weather", "") or "")
         surprise = (scene or {}).get("surprise")
         flanking_enabled = self._scene_flag_enabled(scene, "enable_flanking", default=False)
-        player_actor_id = int(getattr(active_allies[0], "id", 0) or 0)
+        # Without a player chooser every ally, including the lead, is AI-driven (headless simulations).
+        player_actor_id = int(getattr(active_allies[0], "id", 0) or 0) if choose_action is not None else None
 
         def _initiative_for_ally(actor: Character) -> int:
             scores = self._ability_scores(actor)
@@ -2183,10 +2049,11 @@ class CombatService:
 
         round_no = 1
         fled = False
-        while any(a.hp_current > 0 for a in active_allies) and any(e.hp_current > 0 for e in active_enemies):
+        battle = BattleState(active_allies, active_enemies, self._combat_lane)
+        while battle.allies.any_living() and battle.enemies.any_living():
             if round_no > 50:
                 break
-            self._log(log, f"-- Round {round_no} --", level="debug")
+            self._emit(log, CombatEventCode.ROUND_START, (), (round_no,), level="debug")
             self._apply_round_lair_action(
                 log=log,
                 round_no=round_no,
@@ -2194,6 +2061,7 @@ class CombatService:
                 allies=active_allies,
                 enemies=active_enemies,
                 scene=scene if isinstance(scene, dict) else None,
+                battle=battle,
             )
             round_engagements: dict[int, set[int]] = {}
 
@@ -2203,8 +2071,8 @@ class CombatService:
                 if int(getattr(actor, "hp_current", 0) or 0) <= 0:
                     continue
 
-                living_allies = [a for a in active_allies if int(getattr(a, "hp_current", 0) or 0) > 0]
-                living_enemies = [e for e in active_enemies if int(getattr(e, "hp_current", 0) or 0) > 0]
+                living_allies = battle.allies.living()
+                living_enemies = battle.enemies.living()
                 if not living_allies or not living_enemies:
                     break
 
@@ -2225,7 +2093,7 @@ class CombatService:
                         continue
                     is_player_actor = int(getattr(actor_character, "id", 0) or 0) == player_actor_id
                     if is_player_actor:
-                        preview_targets = self._combat_target_pool(attacker=actor_character, opponents=living_enemies, action="Attack")
+                        preview_targets = self._combat_target_pool(attacker=actor_character, opponents=living_enemies, action="Attack", battle=battle)
                         target = preview_targets[0] if preview_targets else living_enemies[0]
                         options = [
                             "Attack",
@@ -2242,9 +2110,11 @@ class CombatService:
                         has_magic = bool(available_slot_levels(actor_character, min_level=1)) or bool(getattr(actor_character, "cantrips", []))
                         if has_magic:
                             options.insert(1, "Cast Spell")
+                        self._publish_combatants(living_allies, living_enemies)
                         choice = choose_action(options, actor_character, target, round_no, {"distance": distance, "terrain": terrain, "surprise": surprise})
                     else:
                         if callable(evaluate_ai_action):
+                            self._publish_combatants(living_allies, living_enemies)
                             choice = evaluate_ai_action(actor_character, living_allies, living_enemies, round_no, {"distance": distance, "terrain": terrain, "surprise": surprise})
                         else:
                             choice = self._evaluate_ai_action(actor_character, living_allies, living_enemies, round_no, {"distance": distance, "terrain": terrain, "surprise": surprise})
@@ -2265,6 +2135,7 @@ class CombatService:
                             attacker=actor_character,
                             opponents=living_enemies,
                             action=str(action),
+                            battle=battle,
                         )
                     if not target_candidates:
                         target_candidates = living_allies if should_target_allies else living_enemies
@@ -2279,6 +2150,7 @@ class CombatService:
                         choose_target=choose_target,
                         should_target_allies=should_target_allies,
                         is_player_actor=is_player_actor,
+                        battle=battle,
                     )
                     target = target_candidates[target_index]
 
@@ -2477,7 +2349,7 @@ class CombatService:
 
                     derived = self.derive_player_stats(actor_character)
                     if not self._is_attack_viable_for_range(
-                        is_melee_attack=self._is_melee_actor(actor_character),
+                        is_melee_attack=battle.is_melee(actor_character),
                         distance=distance,
                     ):
                         self._log(log, f"{actor_character.name} cannot make a melee attack at {self._range_label(distance)} range.", level="compact")
@@ -2541,7 +2413,7 @@ class CombatService:
                             dmg += 2
                         dmg = self._modify_incoming_damage(target, dmg)
                         target.hp_current = max(0, int(getattr(target, "hp_current", 0) or 0) - dmg)
-                        self._log(log, f"{actor_character.name} hits {target.name} for {dmg} damage ({target.hp_current}/{target.hp_max}).", level="compact")
+                        self._emit(log, CombatEventCode.ATTACK_HIT, (actor_character.name, target.name), (dmg, target.hp_current, target.hp_max), level="compact")
                         self._check_concentration_after_damage(
                             target_actor=target,
                             source_actor=actor_character,
@@ -2570,18 +2442,19 @@ class CombatService:
                     self._tick_actor_statuses_end_turn(enemy_actor, log)
                     self._tick_actor_tactical_tags_end_turn(enemy_actor)
                     continue
-                targets = [a for a in active_allies if int(getattr(a, "hp_current", 0) or 0) > 0]
+                targets = battle.allies.living()
                 if not targets:
                     break
                 if callable(evaluate_ai_action):
+                    self._publish_combatants(living_enemies, living_allies)
                     enemy_choice = evaluate_ai_action(enemy_actor, living_enemies, living_allies, round_no, {"distance": distance, "terrain": terrain, "surprise": surprise})
                     enemy_action = enemy_choice[0] if isinstance(enemy_choice, tuple) else str(enemy_choice)
                 else:
                     enemy_action = str(self._evaluate_ai_action(enemy_actor, living_enemies, living_allies, round_no, {"distance": distance, "terrain": terrain, "surprise": surprise}))
-                target_pool = self._combat_target_pool(attacker=enemy_actor, opponents=targets, action=enemy_action)
+                target_pool = self._combat_target_pool(attacker=enemy_actor, opponents=targets, action=enemy_action, battle=battle)
                 if not target_pool:
                     target_pool = targets
-                target = self._lowest_hp_target(target_pool)
+                target = battle.lowest_hp(target_pool)
                 enemy_action = self._select_enemy_tactical_action(
                     intent=self._intent_for_enemy(enemy_actor),
                     actor=enemy_actor,
@@ -2590,13 +2463,14 @@ class CombatService:
                     distance=str(distance),
                     default_action=str(enemy_action),
                     allies=living_enemies,
+                    battle=battle,
                 )
                 if str(enemy_action).lower() == "flee":
                     enemy_actor.hp_current = 0
                     self._log(log, f"{enemy_actor.name} flees.", level="compact")
                     continue
 
-                enemy_is_melee = self._is_melee_actor(enemy_actor)
+                enemy_is_melee = battle.is_melee(enemy_actor)
                 if enemy_is_melee and not self._is_attack_viable_for_range(is_melee_attack=True, distance=distance):
                     next_band = self._step_toward_engagement(distance)
                     if next_band != distance:
@@ -2674,7 +2548,7 @@ class CombatService:
                     self._tick_actor_tactical_tags_end_turn(enemy_actor)
                     continue
 
-                target_ac = self._derive_ac(target)
+                target_ac = int(self.derive_player_stats(target)["ac"])
                 enemy_attack_shift = self._terrain_ranged_attack_shift(
                     terrain=terrain,
                     attacker=enemy_actor,
@@ -2718,7 +2592,7 @@ class CombatService:
                     )
                     dmg = self._modify_incoming_damage(target, dmg)
                     target.hp_current = max(0, int(getattr(target, "hp_current", 0) or 0) - dmg)
-                    self._log(log, f"{enemy_actor.name} hits {target.name} for {dmg} damage ({target.hp_current}/{target.hp_max}).", level="compact")
+                    self._emit(log, CombatEventCode.ATTACK_HIT, (enemy_actor.name, target.name), (dmg, target.hp_current, target.hp_max), level="compact")
                     self._check_concentration_after_damage(
                         target_actor=target,
                         source_actor=enemy_actor,
@@ -2727,7 +2601,7 @@ class CombatService:
                         round_no=round_no,
                     )
                 else:
-                    self._log(log, f"{enemy_actor.name} misses {target.name}.", level="compact")
+                    self._emit(log, CombatEventCode.ATTACK_MISS, (enemy_actor.name, target.name), level="compact")
                 self._consume_tactical_tag(enemy_actor, "hidden_strike")
                 self._consume_tactical_tag(enemy_actor, "helped")
                 self._consume_tactical_tag(target, "exposed")
@@ -2746,11 +2620,13 @@ class CombatService:
                 lead.xp = int(getattr(lead, "xp", 0) or 0) + int(xp_gain)
                 self._log(log, f"Party victory. {lead.name} gains +{xp_gain} XP.", level="compact")
         for ally in active_allies:
+            release_combatant_state(ally)
             if isinstance(getattr(ally, "flags", None), dict):
                 ally.flags.pop("combat_statuses", None)
                 ally.flags.pop("combat_tactical_tags", None)
                 ally.flags.pop("combat_runtime_state", None)
         for enemy in active_enemies:
+            release_combatant_state(enemy)
             try:
                 if hasattr(enemy, "_combat_statuses"):
                     delattr(enemy, "_combat_statuses")
@@ -2766,6 +2642,7 @@ class CombatService:
             log=log,
             allies_won=allies_won,
             fled=fled,
+            rounds=round_no if fled else round_no - 1,
         )
 
     def _select_party_target_index(
@@ -2781,12 +2658,14 @@ class CombatService:
         choose_target,
         should_target_allies: bool,
         is_player_actor: bool,
+        battle: Optional[BattleState] = None,
     ) -> int:
         if not target_candidates:
             return 0
 
         if callable(choose_target):
             if is_player_actor:
+                self._publish_combatants(allies, enemies)
                 try:
                     selected = choose_target(actor, allies, enemies, round_no, scene_ctx, action)
                 except TypeError:
@@ -2807,13 +2686,16 @@ class CombatService:
             if isinstance(selected, int) and 0 <= int(selected) < len(target_candidates):
                 return int(selected)
 
+        lowest_hp = battle.lowest_hp if battle is not None else self._lowest_hp_target
         if should_target_allies:
-            return int(target_candidates.index(self._lowest_hp_target(target_candidates)))
+            return int(target_candidates.index(lowest_hp(target_candidates)))
         if is_player_actor:
             return 0
-        return int(target_candidates.index(self._lowest_hp_target(target_candidates)))
+        return int(target_candidates.index(lowest_hp(target_candidates)))
 
-    def _combat_target_pool(self, *, attacker, opponents: list, action: str) -> list:
+    def _combat_target_pool(self, *, attacker, opponents: list, action: str, battle: Optional[BattleState] = None) -> list:
+        if battle is not None:
+            return battle.target_pool(attacker=attacker, opponents=opponents, action=action)
         if not opponents:
             return []
         normalized_action = str(action or "").strip().lower()
@@ -2892,35 +2774,17 @@ class CombatService:
         return any(keyword in armor for keyword in ("chain mail", "plate", "splint", "heavy"))
 
     def _combat_lane(self, actor) -> str:
-        if isinstance(actor, Character):
-            flags = getattr(actor, "flags", None)
-            if isinstance(flags, dict):
-                forced = str(flags.get("combat_lane", "") or "").strip().lower()
-                if forced in {"vanguard", "rearguard"}:
-                    return forced
-            class_slug = str(getattr(actor, "class_name", "") or "").strip().lower()
-            if class_slug in self._BACKLINE_CLASSES:
-                return "rearguard"
-            return "vanguard"
-
-        flags = getattr(actor, "tags", None)
-        if isinstance(flags, list):
-            normalized = {str(item or "").strip().lower() for item in flags}
-            if "lane:rearguard" in normalized:
-                return "rearguard"
-            if "lane:vanguard" in normalized:
-                return "vanguard"
-
-        name_key = str(getattr(actor, "name", "") or "").strip().lower()
-        if any(keyword in name_key for keyword in self._BACKLINE_NAME_KEYWORDS):
-            return "rearguard"
-        return "vanguard"
+        return self.ai_policy.profile(actor).lane
 
     def _is_melee_actor(self, actor) -> bool:
-        if isinstance(actor, Character):
-            return self._combat_lane(actor) == "vanguard"
         return self._combat_lane(actor) == "vanguard"
 
+    @staticmethod
+    def _living_combatants(allies: list, enemies: list, battle: Optional[BattleState] = None) -> list:
+        if battle is not None:
+            return battle.living_all()
+        return [row for row in list(allies) + list(enemies) if int(getattr(row, "hp_current", 0) or 0) > 0]
+
     @staticmethod
     def _lowest_hp_target(targets: list):
         return min(
@@ -2935,8 +2799,7 @@ class CombatService:
     @staticmethod
     def _is_healing_spell(spell_slug: str) -> bool:
         slug, _, _ = CombatService._decode_spell_action_payload(spell_slug)
-        definition = SPELL_DEFINITIONS.get(str(slug or "").strip().lower())
-        return bool(definition and str(getattr(definition, "damage_type", "")).lower() == "healing")
+        return is_healing_spell_slug(slug)
 
     @staticmethod
     def _decode_spell_action_payload(payload: Optional[str]) -> tuple[str, Optional[int], bool]:
@@ -2963,41 +2826,39 @@ class CombatService:
         ritual = str(values.get("ritual", "") or "").strip().lower() in {"1", "true", "yes", "y"}
         return slug, cast_level, ritual
 
+    _UPCAST_BONUS_DICE: Dict[str, Tuple[int, int]] = {
+        "burning-hands": (6, 0),
+        "cure-wounds": (8, 0),
+        "magic-missile": (4, 1),
+    }
+    _UPCAST_BONUS_DICE_CACHE: Dict[Tuple[str, int], str] = {}
+
     @staticmethod
     def _upcast_bonus_dice(*, slug: str, base_level: int, cast_level: int) -> str:
         if cast_level <= base_level:
             return ""
         delta = cast_level - base_level
         key = str(slug or "").strip().lower()
-        if key == "burning-hands":
-            return f"{delta}d6"
-        if key == "cure-wounds":
-            return f"{delta}d8"
-        if key == "magic-missile":
-            return f"{delta}d4+{delta}"
-        return ""
+        cache = CombatService._UPCAST_BONUS_DICE_CACHE
+        cached = cache.get((key, delta))
+        if cached is not None:
+            return cached
+        scaling = CombatService._UPCAST_BONUS_DICE.get(key)
+        if scaling is None:
+            expr = ""
+        else:
+            sides, flat_per_level = scaling
+            expr = f"{delta}d{sides}+{delta * flat_per_level}" if flat_per_level else f"{delta}d{sides}"
+        cache[(key, delta)] = expr
+        return expr
 
     @staticmethod
     def _spell_base_level(spell, slug: str) -> int:
-        if spell is not None:
-            try:
-                return max(0, int(getattr(spell, "level_int", 0) or 0))
-            except Exception:
-                return 0
-        cantrip_slugs = {"fire-bolt", "ray-of-frost", "sacred-flame", "eldritch-blast", "vicious-mockery"}
-        return 0 if str(slug or "").strip().lower() in cantrip_slugs else 1
+        return combat_base_level(spell, slug)
 
     @staticmethod
     def _spell_components(components: str | None) -> tuple[bool, bool, bool, str]:
-        raw = str(components or "")
-        token = raw.upper()
-        has_verbal = "V" in token
-        has_somatic = "S" in token
-        has_material = "M" in token
-        material_text = ""
-        if "(" in raw and ")" in raw:
-            material_text = raw[raw.find("(") + 1 : raw.rfind(")")].strip()
-        return has_verbal, has_somatic, has_material, material_text
+        return parse_spell_components(components)
 
     def _material_components_available(self, caster: Character, *, material_text: str) -> tuple[bool, str]:
         inventory = [str(item or "").strip() for item in list(getattr(caster, "inventory", []) or [])]
@@ -3027,44 +2888,11 @@ class CombatService:
         return False, "Missing material components (requires Arcane Focus or Component Pouch)."
 
     def _evaluate_ai_action(self, actor, allies: list, enemies: list, round_no: int, scene_ctx: dict):
-        _ = round_no
-        _ = scene_ctx
         living_allies = [row for row in allies if int(getattr(row, "hp_current", 0) or 0) > 0]
         living_enemies = [row for row in enemies if int(getattr(row, "hp_current", 0) or 0) > 0]
         if not living_allies or not living_enemies:
             return "Attack"
-
-        if not isinstance(actor, Character):
-            hp_max = max(1, int(getattr(actor, "hp_max", getattr(actor, "hp_current", 1)) or 1))
-            hp_now = int(getattr(actor, "hp_current", hp_max) or hp_max)
-            if hp_now <= max(1, hp_max // 4) and len(living_enemies) < len(living_allies):
-                return "flee"
-            return "attack"
-
-        is_character = isinstance(actor, Character)
-        if is_character:
-            known_spells = [str(name or "") for name in list(getattr(actor, "known_spells", []) or [])]
-            healing_slug = next(
-                (
-                    _slugify_spell_name(name)
-                    for name in known_spells
-                    if self._is_healing_spell(_slugify_spell_name(name))
-                ),
-                None,
-            )
-            if healing_slug and bool(available_slot_levels(actor, min_level=1)):
-                critical_ally = next(
-                    (
-                        row
-                        for row in sorted(living_allies, key=lambda unit: int(getattr(unit, "hp_current", 0) or 0))
-                        if int(getattr(row, "hp_current", 0) or 0) <= max(1, int(getattr(row, "hp_max", 1) or 1) // 4)
-                    ),
-                    None,
-                )
-                if critical_ally is not None:
-                    return ("Cast Spell", healing_slug)
-
-        return "Attack"
+        return self.ai_policy.evaluate_party_action(actor, living_allies, living_enemies, round_no, scene_ctx)
 
     @staticmethod
     def _combat_actor_key(actor) -> int:
@@ -3094,6 +2922,7 @@ class CombatService:
         allies: list[Character],
         enemies: list[Entity],
         scene: Optional[dict] = None,
+        battle: Optional[BattleState] = None,
     ) -> None:
         scene_payload = scene if isinstance(scene, dict) else {}
         hazard_state = scene_payload.setdefault("_hazard_state", {}) if isinstance(scene_payload, dict) else {}
@@ -3136,14 +2965,17 @@ class CombatService:
 
         if is_boss_lair_round:
             self._log(log, "Initiative 20 — Lair Action: The boss warps the battlefield!", level="compact")
-            impacted_allies = [row for row in list(allies) if int(getattr(row, "hp_current", 0) or 0) > 0]
+            if battle is not None:
+                impacted_allies = battle.allies.living()
+            else:
+                impacted_allies = [row for row in list(allies) if int(getattr(row, "hp_current", 0) or 0) > 0]
             for actor in impacted_allies:
                 save_mod = self._ability_scores(actor).dexterity_mod
                 save_roll = self._ability_check_roll(actor, save_mod, requires_sight=True)
                 if save_roll >= 13:
                     self._log(log, f"{actor.name} evades the lair pulse.", level="compact")
                     continue
-                damage = roll_die("d6", rng=self.rng) + roll_die("d6", rng=self.rng)
+                damage = roll_die("d6", rng=self.rng, count=2)
                 damage = self._modify_incoming_damage(actor, damage)
                 hp_now = int(getattr(actor, "hp_current", 0) or 0)
                 actor.hp_current = max(0, hp_now - damage)
@@ -3151,18 +2983,21 @@ class CombatService:
 
         if is_terrain_surge_round:
             self._log(log, "Initiative 20 — Lair Action: A violent terrain surge erupts across the vanguard!", level="compact")
-            impacted = [
-                row
-                for row in list(allies) + list(enemies)
-                if int(getattr(row, "hp_current", 0) or 0) > 0 and self._combat_lane(row) == "vanguard"
-            ]
+            if battle is not None:
+                impacted = battle.living_vanguard()
+            else:
+                impacted = [
+                    row
+                    for row in list(allies) + list(enemies)
+                    if int(getattr(row, "hp_current", 0) or 0) > 0 and self._combat_lane(row) == "vanguard"
+                ]
             for actor in impacted:
                 save_mod = self._ability_scores(actor).dexterity_mod if isinstance(actor, Character) else 0
                 save_roll = self._ability_check_roll(actor, int(save_mod), requires_sight=True)
                 if save_roll >= 12:
                     self._log(log, f"{actor.name} weathers the surge.", level="compact")
                     continue
-                damage = roll_die("d6", rng=self.rng) + roll_die("d6", rng=self.rng)
+                damage = roll_die("d6", rng=self.rng, count=2)
                 damage = self._modify_incoming_damage(actor, damage)
                 hp_now = int(getattr(actor, "hp_current", 0) or 0)
                 actor.hp_current = max(0, hp_now - damage)
@@ -3171,12 +3006,12 @@ class CombatService:
         if "spreading_fire" in hazard_flags:
             intensity = max(1, int(hazard_state.get("fire_intensity", 1) or 1))
             self._log(log, f"Hazard: Spreading fire intensifies (tier {intensity}).", level="compact")
-            for actor in [row for row in list(allies) + list(enemies) if int(getattr(row, "hp_current", 0) or 0) > 0]:
+            for actor in self._living_combatants(allies, enemies, battle):
                 save_mod = self._ability_scores(actor).dexterity_mod if isinstance(actor, Character) else 0
                 save_roll = self._ability_check_roll(actor, int(save_mod), requires_sight=True)
                 if save_roll >= 11 + min(4, intensity):
                     continue
-                damage = sum(roll_die("d4", rng=self.rng) for _ in range(min(4, intensity)))
+                damage = roll_die("d4", rng=self.rng, count=min(4, intensity))
                 damage = self._modify_incoming_damage(actor, damage)
                 hp_now = int(getattr(actor, "hp_current", 0) or 0)
                 actor.hp_current = max(0, hp_now - damage)
@@ -3193,7 +3028,7 @@ class CombatService:
         if "trapline" in hazard_flags and int(hazard_state.get("trap_cooldown", 0) or 0) <= 0:
             self._log(log, "Hazard: Hidden traps spring from the battlefield!", level="compact")
             hazard_state["trap_cooldown"] = 2
-            candidates = [row for row in list(allies) + list(enemies) if int(getattr(row, "hp_current", 0) or 0) > 0]
+            candidates = self._living_combatants(allies, enemies, battle)
             self.rng.shuffle(candidates)
             for actor in candidates[:2]:
                 save_mod = self._ability_scores(actor).dexterity_mod if isinstance(actor, Character) else 0
@@ -3216,12 +3051,7 @@ class CombatService:
                 self._log(log, f"{actor.name} is hit by a trap for {damage} ({actor.hp_current}/{getattr(actor, 'hp_max', hp_now)}).", level="compact")
 
     def _is_boss_enemy(self, enemy: Entity) -> bool:
-        level = int(getattr(enemy, "level", 1) or 1)
-        hp_max = int(getattr(enemy, "hp_max", getattr(enemy, "hp", 1)) or 1)
-        name_key = str(getattr(enemy, "name", "") or "").strip().lower()
-        if level >= 10 or hp_max >= 80:
-            return True
-        return any(keyword in name_key for keyword in self._BOSS_NAME_KEYWORDS)
+        return self.ai_policy.profile(enemy).is_boss
 
     def _resolve_spell_cast_party(
         self,
@@ -3247,16 +3077,15 @@ class CombatService:
             self._log(log, f"{target_slug} is not implemented in combat yet.", level="compact")
             return
 
-        spell = self.spell_repo.get_by_slug(target_slug) if self.spell_repo else None
-        level_int = self._spell_base_level(spell, str(target_slug))
+        record = shared_spell_catalog(self.spell_repo).get(str(target_slug))
+        level_int = record.combat_level
         cast_level = max(level_int, int(requested_level or level_int or 1)) if level_int > 0 else 0
 
         if ritual_requested:
             self._log(log, f"{caster.name} cannot perform ritual casting during combat.", level="compact")
             return
 
-        components = str(getattr(spell, "components", "") or "") if spell is not None else ""
-        has_verbal, _has_somatic, has_material, material_text = self._spell_components(components)
+        has_verbal, has_material, material_text = record.has_verbal, record.has_material, record.material_text
         if has_verbal and self._has_status(caster, "silenced"):
             self._log(log, f"{caster.name} cannot cast while silenced (verbal component blocked).", level="compact")
             return
@@ -3275,12 +3104,11 @@ class CombatService:
                 return
             self._log(log, f"{caster.name} expends a level {cast_level} spell slot.", level="compact")
 
-        if bool(getattr(definition, "concentration", False)):
-            spell_name = str(getattr(spell, "name", "") or "").strip() or str(target_slug).replace("-", " ").title()
+        if record.concentration:
             self._start_concentration(
                 caster=caster,
                 spell_slug=str(target_slug),
-                spell_name=spell_name,
+                spell_name=record.name,
                 targets=[target],
                 log=log,
             )
@@ -3384,7 +3212,7 @@ class CombatService:
 
         if selected_item == "Healing Potion":
             player.inventory.remove("Healing Potion")
-            heal = roll_die("d4", rng=self.rng) + roll_die("d4", rng=self.rng) + 2
+            heal = roll_die("d4", rng=self.rng, count=2) + 2
             player_hp = min(player.hp_max, player_hp + heal)
             self._log(log, f"You drink a potion and heal {heal} HP ({player_hp}/{player.hp_max}).", level="compact")
             return player_hp, whetstone_bonus
@@ -3453,16 +3281,15 @@ class CombatService:
             self._log(log, f"{target_slug} is not implemented in combat yet.", level="compact")
             return
 
-        spell = self.spell_repo.get_by_slug(target_slug) if self.spell_repo else None
-        level_int = self._spell_base_level(spell, str(target_slug))
+        record = shared_spell_catalog(self.spell_repo).get(str(target_slug))
+        level_int = record.combat_level
         cast_level = max(level_int, int(requested_level or level_int or 1)) if level_int > 0 else 0
 
         if ritual_requested:
             self._log(log, "You cannot perform ritual casting during combat.", level="compact")
             return
 
-        components = str(getattr(spell, "components", "") or "") if spell is not None else ""
-        has_verbal, _has_somatic, has_material, material_text = self._spell_components(components)
+        has_verbal, has_material, material_text = record.has_verbal, record.has_material, record.material_text
         if has_verbal and self._has_status(player, "silenced"):
             self._log(log, "You are silenced and cannot provide the verbal component.", level="compact")
             return
@@ -3481,12 +3308,11 @@ class CombatService:
                 return
             self._log(log, f"You expend a level {cast_level} spell slot.", level="compact")
 
-        if bool(getattr(definition, "concentration", False)):
-            spell_name = str(getattr(spell, "name", "") or "").strip() or str(target_slug).replace("-", " ").title()
+        if record.concentration:
             self._start_concentration(
                 caster=player,
                 spell_slug=str(target_slug),
-                spell_name=spell_name,
+                spell_name=record.name,
                 targets=[foe],
                 log=log,
             )
@@ -3571,7 +3397,7 @@ class CombatService:
         roll = self.rng.randint(1, 20)
         total = roll + player.attack_bonus
         if roll == 20:
-            dmg = roll_die(player.damage_die, rng=self.rng) + roll_die(player.damage_die, rng=self.rng)
+            dmg = roll_die(player.damage_die, rng=self.rng, count=2)
             dmg = max(int(dmg * getattr(player, "outgoing_damage_multiplier", 1.0)), 1)
             foe.hp_current = max(0, foe.hp_current - dmg)
             self._log(log, f"Critical hit! You roll a natural 20 and deal {dmg} damage ({foe.hp_current}/{foe.hp_max} HP left).", level="normal")
@@ -3587,7 +3413,7 @@ class CombatService:
         roll = self.rng.randint(1, 20)
         total = roll + foe.attack_bonus
         if roll == 20:
-            dmg = roll_die(foe.damage_die, rng=self.rng) + roll_die(foe.damage_die, rng=self.rng)
+            dmg = roll_die(foe.damage_die, rng=self.rng, count=2)
             dmg = max(int(dmg * getattr(player, "incoming_damage_multiplier", 1.0)), 1)
             player.hp_current = max(0, player.hp_current - dmg)
             self._log(log, f"Critical! The {foe.name} lands a brutal blow for {dmg} damage ({player.hp_current}/{player.hp_max} HP left).", level="normal")
@@ -0,0 +1,289 @@
+"""Slotted per-combatant runtime state for statuses and tactical tags.
+
+Combat used to rebuild ``flags["combat_statuses"]`` row dicts on every status
+check.  The first lookup in a fight now builds a ``CombatantState`` from those
+rows and keeps it on the actor: statuses live in per-slot arrays indexed by a
+process-wide status registry with an ``active`` bitmask, so checks are a bit
+test and end-of-turn ticks update the arrays in place.  The legacy flag/attribute
+payloads are only rewritten by ``publish_combatant_state`` — before callbacks
+that may read them and when the fight releases the actor.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List
+
+from rpg.domain.models.character import Character
+
+STATE_ATTR = "_combatant_state"
+
+_STATUS_SLOTS: Dict[str, int] = {}
+_STATUS_KEYS: List[str] = []
+_NO_SLOTS: tuple[int, ...] = ()
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _normalize_key(value) -> str:
+    return str(value or "").strip().lower()
+
+
+def status_slot(status_id: str) -> int:
+    """Return the registry slot for ``status_id``, registering it on first use."""
+    slot = _STATUS_SLOTS.get(status_id)
+    if slot is not None:
+        return slot
+    key = _normalize_key(status_id)
+    # Registration is rare; lock it so fights on other threads never share a slot for different statuses.
+    with _REGISTRY_LOCK:
+        slot = _STATUS_SLOTS.get(key)
+        if slot is None:
+            slot = len(_STATUS_KEYS)
+            _STATUS_KEYS.append(key)
+            _STATUS_SLOTS[key] = slot
+        if isinstance(status_id, str):
+            _STATUS_SLOTS[status_id] = slot
+    return slot
+
+
+def find_status_slot(status_id: str) -> int:
+    """Return the slot for an already registered status or ``-1``."""
+    slot = _STATUS_SLOTS.get(status_id)
+    if slot is not None:
+        return slot
+    slot = _STATUS_SLOTS.get(_normalize_key(status_id))
+    return -1 if slot is None else slot
+
+
+def status_key(slot: int) -> str:
+    return _STATUS_KEYS[slot]
+
+
+def status_mask(status_ids) -> int:
+    """Bitmask covering ``status_ids``; test it against ``CombatantState.active``."""
+    mask = 0
+    for status_id in status_ids:
+        mask |= 1 << status_slot(status_id)
+    return mask
+
+
+class CombatantState:
+    __slots__ = ("active", "order", "rounds", "potency", "source_ids", "source_names", "source_spells", "tags", "dirty")
+
+    def __init__(self) -> None:
+        width = len(_STATUS_KEYS)
+        self.active = 0
+        self.order: List[int] = []
+        self.rounds: List[int] = [0] * width
+        self.potency: List[int] = [0] * width
+        self.source_ids: List[int] = [0] * width
+        self.source_names: List[str] = [""] * width
+        self.source_spells: List[str] = [""] * width
+        self.tags: Dict[str, int] = {}
+        self.dirty = False
+
+    def _reserve(self, slot: int) -> None:
+        missing = slot + 1 - len(self.rounds)
+        if missing <= 0:
+            return
+        self.rounds.extend([0] * missing)
+        self.potency.extend([0] * missing)
+        self.source_ids.extend([0] * missing)
+        self.source_names.extend([""] * missing)
+        self.source_spells.extend([""] * missing)
+
+    def has(self, slot: int) -> bool:
+        return slot >= 0 and (self.active >> slot) & 1 == 1
+
+    def potency_of(self, slot: int) -> int:
+        return self.potency[slot] if self.has(slot) else 0
+
+    def apply(self, slot: int, *, rounds: int, potency: int, source_id: int = 0, source_name: str = "", source_spell: str = "") -> bool:
+        """Add or refresh a status; returns ``True`` when the status is new."""
+        self.dirty = True
+        if self.has(slot):
+            if rounds > self.rounds[slot]:
+                self.rounds[slot] = rounds
+            if potency > self.potency[slot]:
+                self.potency[slot] = potency
+            if source_id:
+                self.source_ids[slot] = source_id
+            if source_name:
+                self.source_names[slot] = source_name
+            if source_spell:
+                self.source_spells[slot] = source_spell
+            return False
+        self._reserve(slot)
+        self.active |= 1 << slot
+        self.order.append(slot)
+        self.rounds[slot] = rounds
+        self.potency[slot] = potency
+        self.source_ids[slot] = source_id
+        self.source_names[slot] = source_name
+        self.source_spells[slot] = source_spell
+        return True
+
+    def discard(self, slot: int) -> None:
+        if not self.has(slot):
+            return
+        self.active &= ~(1 << slot)
+        self.order.remove(slot)
+        self.dirty = True
+
+    def clear_statuses(self) -> None:
+        if self.order:
+            self.active = 0
+            self.order.clear()
+            self.dirty = True
+
+    def tick_statuses(self) -> tuple[int, ...] | List[int]:
+        """Count every active status down one round; returns the slots that expired, in order."""
+        if not self.order:
+            return _NO_SLOTS
+        rounds = self.rounds
+        spells = self.source_spells
+        expired: List[int] | None = None
+        for slot in self.order:
+            left = rounds[slot] - 1
+            rounds[slot] = left
+            # The legacy tick rebuilt each row without its source spell; keep
+            # dropping it so concentration only clears statuses that never ticked.
+            spells[slot] = ""
+            if left <= 0:
+                if expired is None:
+                    expired = []
+                expired.append(slot)
+        self.dirty = True
+        if expired is None:
+            return _NO_SLOTS
+        for slot in expired:
+            self.active &= ~(1 << slot)
+        self.order = [slot for slot in self.order if (self.active >> slot) & 1]
+        return expired
+
+    def add_tag(self, tag: str, rounds: int) -> None:
+        if rounds > self.tags.get(tag, 0):
+            self.tags[tag] = rounds
+            self.dirty = True
+
+    def consume_tag(self, tag: str) -> bool:
+        if self.tags.pop(tag, None) is None:
+            return False
+        self.dirty = True
+        return True
+
+    def tick_tags(self) -> None:
+        tags = self.tags
+        if not tags:
+            return
+        for key in list(tags):
+            left = tags[key] - 1
+            if left > 0:
+                tags[key] = left
+            else:
+                del tags[key]
+        self.dirty = True
+
+    def clear_tags(self) -> None:
+        if self.tags:
+            self.tags.clear()
+            self.dirty = True
+
+    def load_status_rows(self, rows) -> None:
+        self.clear_statuses()
+        if not isinstance(rows, list):
+            return
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            key = _normalize_key(row.get("id", ""))
+            rounds = int(row.get("rounds", 0) or 0)
+            if not key or rounds <= 0:
+                continue
+            self.apply(
+                status_slot(key),
+                rounds=rounds,
+                potency=max(1, int(row.get("potency", 1) or 1)),
+                source_id=int(row.get("source_id", 0) or 0),
+                source_name=str(row.get("source_name", "") or "").strip(),
+                source_spell=_normalize_key(row.get("source_spell", "")),
+            )
+
+    def load_tags(self, payload) -> None:
+        self.clear_tags()
+        if not isinstance(payload, dict):
+            return
+        for key, value in payload.items():
+            slug = _normalize_key(key)
+            rounds = int(value or 0)
+            if slug and rounds > 0:
+                self.tags[slug] = rounds
+        self.dirty = True
+
+    def status_rows(self) -> List[Dict[str, int | str]]:
+        """Return statuses in the legacy ``combat_statuses`` row format."""
+        return [
+            {
+                "id": _STATUS_KEYS[slot],
+                "rounds": self.rounds[slot],
+                "potency": self.potency[slot],
+                "source_id": self.source_ids[slot],
+                "source_name": self.source_names[slot],
+                "source_spell": self.source_spells[slot],
+            }
+            for slot in self.order
+        ]
+
+
+def combatant_state(actor) -> CombatantState:
+    """Return the actor's runtime state, building it from legacy flags on first use."""
+    state = getattr(actor, STATE_ATTR, None)
+    if state.__class__ is CombatantState:
+        return state
+    state = CombatantState()
+    if isinstance(actor, Character):
+        flags = getattr(actor, "flags", None)
+        if not isinstance(flags, dict):
+            flags = {}
+            actor.flags = flags
+        state.load_status_rows(flags.get("combat_statuses"))
+        state.load_tags(flags.get("combat_tactical_tags"))
+    else:
+        state.load_status_rows(getattr(actor, "_combat_statuses", None))
+        state.load_tags(getattr(actor, "_combat_tactical_tags", None))
+    state.dirty = False
+    setattr(actor, STATE_ATTR, state)
+    return state
+
+
+def publish_combatant_state(actor) -> None:
+    """Mirror pending status/tag changes into the legacy flag or attribute payloads."""
+    state = getattr(actor, STATE_ATTR, None)
+    if state.__class__ is not CombatantState or not state.dirty:
+        return
+    rows = state.status_rows()
+    tags = dict(state.tags)
+    if isinstance(actor, Character):
+        flags = getattr(actor, "flags", None)
+        if not isinstance(flags, dict):
+            flags = {}
+            actor.flags = flags
+        flags["combat_statuses"] = rows
+        if tags:
+            flags["combat_tactical_tags"] = tags
+        else:
+            flags.pop("combat_tactical_tags", None)
+    else:
+        setattr(actor, "_combat_statuses", rows)
+        setattr(actor, "_combat_tactical_tags", tags)
+    state.dirty = False
+
+
+def release_combatant_state(actor) -> None:
+    """Write the state back to the actor and detach it at the end of a fight."""
+    publish_combatant_state(actor)
+    if getattr(actor, STATE_ATTR, None).__class__ is CombatantState:
+        try:
+            delattr(actor, STATE_ATTR)
+        except AttributeError:
+            pass
@@ -0,0 +1,113 @@
+"""Derived player stats cached per character behind a gear/progression fingerprint.
+
+``CombatService.derive_player_stats`` rebuilds the weapon profile, AC and spell
+modifier from scratch and combat start re-reads the feature repository, while the
+same character is derived again for the combat HUD and the character sheet.  An
+entry here is reused while the character's fingerprint (level, class, attributes,
+equipment, attunement, carried gear, temporary AC) is unchanged; ``invalidate``
+drops a character explicitly after equipment or progression writes.  Lookups
+and stores take a lock, so one cache can back fights on several threads.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from rpg.domain.models.feature import Feature
+
+_MAX_CHARACTERS = 1024
+
+
+def stats_fingerprint(player) -> tuple:
+    """Every input ``derive_player_stats`` reads, in a cheaply comparable tuple."""
+    flags = getattr(player, "flags", None)
+    if not isinstance(flags, dict):
+        flags = {}
+    equipment = flags.get("equipment")
+    if isinstance(equipment, dict):
+        equipped = (equipment.get("weapon"), equipment.get("armor"), equipment.get("trinket"))
+    else:
+        equipped = (None, None, None)
+    attributes = getattr(player, "attributes", None)
+    attuned = flags.get("attuned_items")
+    return (
+        getattr(player, "level", 1),
+        getattr(player, "class_name", None),
+        tuple(attributes.items()) if isinstance(attributes, dict) else (),
+        equipped,
+        tuple(attuned) if isinstance(attuned, list) else (),
+        tuple(getattr(player, "inventory", None) or ()),
+        flags.get("temp_ac_bonus", 0),
+    )
+
+
+def features_fingerprint(player) -> tuple:
+    class_levels = getattr(player, "class_levels", None)
+    return (
+        getattr(player, "level", 1),
+        getattr(player, "class_name", None),
+        tuple(class_levels.items()) if isinstance(class_levels, dict) else (),
+    )
+
+
+class DerivedStatsCache:
+    """One derived-stats entry and one feature list per character id."""
+
+    def __init__(self) -> None:
+        self._stats: Dict[object, Tuple[tuple, dict]] = {}
+        self._features: Dict[object, Tuple[tuple, Tuple[Feature, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def stats_for(self, player, compute: Callable[[object], dict]) -> dict:
+        key = getattr(player, "id", None)
+        fingerprint = stats_fingerprint(player)
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+        stats = compute(player)
+        with self._lock:
+            if len(self._stats) >= _MAX_CHARACTERS:
+                self._stats.clear()
+            self._stats[key] = (fingerprint, dict(stats))
+        return stats
+
+    def features_for(self, player, load: Callable[[object], List[Feature]]) -> List[Feature]:
+        key = getattr(player, "id", None)
+        fingerprint = features_fingerprint(player)
+        with self._lock:
+            entry = self._features.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+        features = list(load(player))
+        with self._lock:
+            if len(self._features) >= _MAX_CHARACTERS:
+                self._features.clear()
+            self._features[key] = (fingerprint, tuple(features))
+        return features
+
+    def invalidate(self, character_id: int | None = None) -> None:
+        """Forget one character (or everything when ``character_id`` is ``None``)."""
+        with self._lock:
+            if character_id is None:
+                self._stats.clear()
+                self._features.clear()
+                return
+            self._stats.pop(character_id, None)
+            self._features.pop(character_id, None)
@@ -13,6 +13,8 @@ from rpg.domain.repositories import (
 )
 from rpg.domain.services.encounter_planner import EncounterPlanner
 from rpg.domain.services.encounter_planner import plan_biome_hazards
+from rpg.domain.services.encounter_tables import CompiledEncounterTable, EncounterTableCompiler
+from rpg.domain.services.weighted_sampling import ALIAS, LEGACY, sample_without_replacement, weighted_choice
 
 
 class EncounterService:
@@ -30,17 +32,39 @@ class EncounterService:
         self.definition_repo = definition_repo
         self.faction_repo = faction_repo
         self.planner = EncounterPlanner(entity_repo)
+        self.tables = EncounterTableCompiler(self.planner)
         self.rng_factory = rng_factory or (lambda seed: random.Random(seed))
 
+    def encounter_table(self, location_id: int, player_level: int, faction_bias: str | None = None) -> CompiledEncounterTable:
+        return self.tables.table_for(
+            entity_repo=self.entity_repo,
+            definition_repo=self.definition_repo,
+            location_id=location_id,
+            player_level=player_level,
+            faction_bias=faction_bias,
+            level_bounds=self._enemy_level_bounds(player_level),
+        )
+
+    def invalidate_encounter_tables(self, location_id: int | None = None) -> None:
+        """Drop compiled tables after definition edits that do not bump a repository revision."""
+        self.tables.invalidate(location_id)
+
     def _weighted_pick(
         self,
         pool: list[Entity],
         count: int,
         faction_bias: str | None,
         rng: random.Random,
+        sampling_mode: str = LEGACY,
     ) -> list[Entity]:
         if not pool:
             return []
+        if sampling_mode == ALIAS:
+            unique = list({entity.id: entity for entity in reversed(pool)}.values())[::-1]
+            weights = [2 if faction_bias and entity.faction_id == faction_bias else 1 for entity in unique]
+            if count <= 1:
+                return [weighted_choice(unique, weights, rng, ALIAS)]
+            return sample_without_replacement(unique, weights, count, rng)
         if count <= 1:
             if faction_bias:
                 weights = [2 if entity.faction_id == faction_bias else 1 for entity in pool]
@@ -100,8 +124,13 @@ class EncounterService:
         max_enemies: int = 1,
         location_biome: str | None = None,
         world_flags: dict[str, object] | None = None,
+        sampling_mode: str = LEGACY,
     ) -> EncounterPlan:
-        """Return a deterministic encounter plan for the given context."""
+        """Return a deterministic encounter plan for the given context.
+
+        ``sampling_mode`` comes from the world (see ``weighted_sampling``); the
+        default ``legacy`` keeps plans identical for existing seeded saves.
+        """
 
         seed = derive_seed(
             namespace="encounter.plan",
@@ -127,23 +156,14 @@ class EncounterService:
             max_hazards=2,
         )
 
+        table = self.encounter_table(location_id, player_level, faction_bias)
         if self.definition_repo:
-            definitions = self.definition_repo.list_for_location(location_id)
-            if not definitions:
-                definitions = self.definition_repo.list_global()
-            chosen, enemies = self.planner.plan_encounter(
-                definitions=definitions,
-                player_level=player_level,
-                location_id=location_id,
-                seed=seed,
-                faction_bias=faction_bias,
-                max_enemies=max_enemies,
+            chosen, enemies = self.planner.plan_from_table(
+                table, seed=seed, max_enemies=max_enemies, sampling_mode=sampling_mode
             )
             if enemies:
                 enemies = self._filter_enemy_band(enemies, player_level)
-                if not enemies:
-                    chosen = None
-                else:
+                if enemies:
                     return EncounterPlan(
                         enemies=enemies,
                         definition_id=chosen.id if chosen else None,
@@ -152,32 +172,22 @@ class EncounterService:
                         hazards=hazards,
                     )
 
-        by_location = self.entity_repo.list_by_location(location_id)
-        if by_location:
-            filtered_location_pool = self._filter_enemy_band(by_location, player_level)
-            if filtered_location_pool:
-                count = min(max(1, max_enemies), len(filtered_location_pool))
-                enemies = self._weighted_pick(filtered_location_pool, count, faction_bias, rng)
-                return EncounterPlan(
-                    enemies=enemies,
-                    faction_bias=faction_bias,
-                    source="location",
-                    hazards=hazards,
-                )
-
-        level_min, level_max = self._enemy_level_bounds(player_level)
-        candidates = getattr(self.entity_repo, "list_by_level_band", None)
-        if callable(candidates):
-            band = self.entity_repo.list_by_level_band(level_min, level_max)
-        else:
-            mid = (level_min + level_max) // 2
-            band = self.entity_repo.list_for_level(mid, tolerance=level_max - mid)
+        if table.location_pool:
+            count = min(max(1, max_enemies), len(table.location_pool))
+            enemies = self._weighted_pick(list(table.location_pool), count, faction_bias, rng, sampling_mode)
+            return EncounterPlan(
+                enemies=enemies,
+                faction_bias=faction_bias,
+                source="location",
+                hazards=hazards,
+            )
 
+        band = list(table.level_band_pool)
         if not band:
             return EncounterPlan(enemies=[], faction_bias=faction_bias, source="empty", hazards=hazards)
 
         count = min(max(1, max_enemies), len(band))
-        enemies = self._weighted_pick(band, count, faction_bias, rng)
+        enemies = self._weighted_pick(band, count, faction_bias, rng, sampling_mode)
         return EncounterPlan(enemies=enemies, faction_bias=faction_bias, source="level-band", hazards=hazards)
 
     def generate(
@@ -189,6 +199,7 @@ class EncounterService:
         max_enemies: int = 1,
         location_biome: str | None = None,
         world_flags: dict[str, object] | None = None,
+        sampling_mode: str = LEGACY,
     ) -> list[Entity]:
         """Return a small list of entities for an encounter, deterministic per turn."""
 
@@ -200,6 +211,7 @@ class EncounterService:
             max_enemies=max_enemies,
             location_biome=location_biome,
             world_flags=world_flags,
+            sampling_mode=sampling_mode,
         ).enemies
 
     def find_encounter(self, location_id: int, character_level: int) -> Optional[Entity]:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from rpg.domain.models.feature import Feature
 
@@ -42,19 +42,58 @@ class FeatureEffectRegistry:
             return
         self._handlers[key] = handler
 
-    def apply(self, feature: Feature, context: FeatureEffectContext) -> FeatureEffectOutcome:
-        key = str(feature.effect_kind or "").strip().lower()
+    def handler_for(self, effect_kind: str | None) -> Optional[FeatureEffectHandler]:
+        key = str(effect_kind or "").strip().lower()
         handler = self._handlers.get(key)
         if handler is None and key.startswith("condition_"):
-            return _condition_handler(feature, context)
+            return _condition_handler
         if handler is None and key.startswith("condition_self_"):
-            return _condition_self_handler(feature, context)
+            return _condition_self_handler
         if handler is None and key.startswith("condition_target_"):
-            return _condition_target_handler(feature, context)
+            return _condition_target_handler
+        return handler
+
+    def apply(self, feature: Feature, context: FeatureEffectContext) -> FeatureEffectOutcome:
+        handler = self.handler_for(feature.effect_kind)
         if handler is None:
             return FeatureEffectOutcome()
         return handler(feature, context)
 
+    def build_dispatch(self, features: Iterable[Feature]) -> "FeatureDispatchTable":
+        """Group ``features`` by trigger key with their handlers bound now; features without a handler are dropped."""
+        grouped: Dict[str, list[BoundFeatureEffect]] = {}
+        for feature in features:
+            handler = self.handler_for(feature.effect_kind)
+            if handler is None:
+                continue
+            grouped.setdefault(str(feature.trigger_key), []).append((feature, handler))
+        return FeatureDispatchTable({key: tuple(rows) for key, rows in grouped.items()})
+
+
+BoundFeatureEffect = Tuple[Feature, FeatureEffectHandler]
+
+
+class FeatureDispatchTable:
+    """Per-trigger feature handlers for one combatant, built once at combat start.
+
+    Handlers are bound when the table is built, so handlers registered later
+    apply from the next combat onwards.
+    """
+
+    __slots__ = ("_by_trigger",)
+
+    def __init__(self, by_trigger: Dict[str, Tuple[BoundFeatureEffect, ...]]) -> None:
+        self._by_trigger = by_trigger
+
+    def for_trigger(self, trigger_key: str) -> Tuple[BoundFeatureEffect, ...]:
+        return self._by_trigger.get(trigger_key, ())
+
+    def trigger_keys(self) -> Tuple[str, ...]:
+        return tuple(self._by_trigger)
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._by_trigger.values())
+
 
 def _bonus_damage_handler(feature: Feature, _context: FeatureEffectContext) -> FeatureEffectOutcome:
     return FeatureEffectOutcome(bonus_damage=int(feature.effect_value or 0))
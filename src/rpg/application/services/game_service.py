@@ -86,7 +86,10 @@ from rpg.application.services.world_progression import WorldProgression
 from rpg.application.services.encounter_flavour import random_intro
 from rpg.application.services.progression_service import ProgressionService
 from rpg.application.services.downtime_service import DowntimeService
+from rpg.application.spells.spell_catalog import shared_spell_catalog
+from rpg.domain.services.location_spatial_index import location_coordinates, within_radius
 from rpg.domain.services.spellcasting import available_slot_levels, consume_slot, normalize_slot_ledger, restore_slots
+from rpg.domain.services.weighted_sampling import LEGACY as SAMPLING_LEGACY, sampling_mode_for, weighted_choice
 from rpg.domain.services.guild_membership import (
     default_guild_membership_payload,
     evaluate_tier_promotion,
@@ -1100,6 +1103,7 @@ class GameService:
         encounter_intro_builder: Callable[[Entity], str] | None = None,
         mechanical_flavour_builder: Callable[..., str] | None = None,
         downtime_service: DowntimeService | None = None,
+        shutdown_hooks: list[Callable[[], None]] | None = None,
     ) -> None:
         from rpg.application.services.character_creation_service import CharacterCreationService
         from rpg.application.services.encounter_service import EncounterService
@@ -1130,6 +1134,7 @@ class GameService:
         self.encounter_intro_builder = encounter_intro_builder or random_intro
         self.mechanical_flavour_builder = mechanical_flavour_builder
         self.dialogue_service = dialogue_service or DialogueService()
+        self._shutdown_hooks = list(shutdown_hooks or [])
         self._snapshot_limit = 24
         self._snapshots: list[dict[str, object]] = []
         event_publisher = None
@@ -1175,6 +1180,15 @@ class GameService:
             if self.combat_service is not None and mechanical_flavour_builder is not None:
                 self.combat_service.mechanical_flavour_builder = mechanical_flavour_builder
 
+    def close(self) -> None:
+        """Run the shutdown hooks registered at bootstrap (e.g. closing pooled HTTP clients) once."""
+        hooks, self._shutdown_hooks = self._shutdown_hooks, []
+        for hook in hooks:
+            try:
+                hook()
+            except Exception:
+                pass
+
     @staticmethod
     def _world_flag_projection(world: World) -> dict[str, object]:
         if not isinstance(getattr(world, "flags", None), dict):
@@ -2283,6 +2297,7 @@ class GameService:
             max_enemies=effective_max_enemies,
             location_biome=str(getattr(location, "biome", "wilderness") or "wilderness"),
             world_flags=self._world_flag_projection(world),
+            sampling_mode=sampling_mode_for(getattr(world, "flags", None)),
         )
         self._apply_faction_encounter_package(
             plan,
@@ -2643,6 +2658,16 @@ class GameService:
         cls._REFERENCE_WORLD_DATASET_CACHE[cache_key] = dataset
         return dataset
 
+    @classmethod
+    def _clear_reference_world_dataset_cache(cls) -> None:
+        """Drop cached datasets and release the artifacts they keep mapped."""
+        cached = list(cls._REFERENCE_WORLD_DATASET_CACHE.values())
+        cls._REFERENCE_WORLD_DATASET_CACHE.clear()
+        for dataset in cached:
+            close = getattr(dataset, "close", None)
+            if close is not None:
+                close()
+
     @classmethod
     def _load_default_biome_severity_index(cls) -> dict[str, int]:
         project_root = Path(__file__).resolve().parents[4]
@@ -3342,6 +3367,7 @@ class GameService:
         if guild_summary:
             pressure_summary = f"{pressure_summary} | {guild_summary}" if pressure_summary else guild_summary
             pressure_lines = [*guild_lines, *list(pressure_lines or [])]
+        combat_stats = self.combat_player_stats_intent(character)
         return CharacterSheetView(
             character_id=int(character.id or 0),
             name=character.name,
@@ -3358,6 +3384,9 @@ class GameService:
             class_levels_line=class_levels_line,
             pressure_summary=pressure_summary,
             pressure_lines=pressure_lines,
+            armor_class=int(combat_stats.get("ac", getattr(character, "armour_class", 10)) or 0),
+            attack_bonus=int(combat_stats.get("attack_bonus", getattr(character, "attack_bonus", 0)) or 0),
+            spell_attack_bonus=int(combat_stats.get("spell_attack_bonus", 0) or 0),
         )
 
     def get_level_up_pending_intent(self, character_id: int) -> LevelUpPendingView | None:
@@ -3441,6 +3470,7 @@ class GameService:
                         operations.append(cast(Callable[[object], None], operation))
 
         self._set_progression_messages(character, level_messages)
+        self._invalidate_derived_stats(character.id)
 
         persisted = False
         if world is not None:
@@ -3591,13 +3621,11 @@ class GameService:
             if diplomacy_changed and self.world_repo:
                 self.world_repo.save(world)
         discovered = self._discovered_locations(character, current_location)
-        locations = self.location_repo.list_all()
+        locations = self._travel_candidate_locations(current_location)
         destinations: list[TravelDestinationView] = []
         for location in locations:
             if current_location_id is not None and location.id == current_location_id:
                 continue
-            if current_location is not None and not self._is_within_travel_radius(current_location, location):
-                continue
             location_type = "town" if self._is_town_location(location) else "wilderness"
             biome = str(getattr(location, "biome", "") or "unknown")
             recommended_level = getattr(location, "recommended_level", "?")
@@ -3776,12 +3804,23 @@ class GameService:
 
     @classmethod
     def _is_within_travel_radius(cls, source: Location, destination: Location) -> bool:
-        src_x = float(getattr(source, "x", 0.0) or 0.0)
-        src_y = float(getattr(source, "y", 0.0) or 0.0)
-        dst_x = float(getattr(destination, "x", 0.0) or 0.0)
-        dst_y = float(getattr(destination, "y", 0.0) or 0.0)
-        distance = math.sqrt((dst_x - src_x) ** 2 + (dst_y - src_y) ** 2)
-        return distance <= float(cls._TRAVEL_MAX_RADIUS)
+        src_x, src_y = location_coordinates(source)
+        return within_radius(src_x, src_y, destination, float(cls._TRAVEL_MAX_RADIUS))
+
+    def _travel_candidate_locations(self, current_location: Location | None) -> list[Location]:
+        if not self.location_repo:
+            return []
+        if current_location is None:
+            return list(self.location_repo.list_all())
+        radius_query = getattr(self.location_repo, "list_within_radius", None)
+        if not callable(radius_query):
+            return [
+                location
+                for location in self.location_repo.list_all()
+                if self._is_within_travel_radius(current_location, location)
+            ]
+        src_x, src_y = location_coordinates(current_location)
+        return list(radius_query(src_x, src_y, float(self._TRAVEL_MAX_RADIUS)))
 
     @staticmethod
     def _get_direction(source: Location | None, destination: Location) -> str:
@@ -3907,16 +3946,16 @@ class GameService:
         target_location = None
         current_location = self.location_repo.get(character.location_id) if self.location_repo and character.location_id is not None else None
         if self.location_repo:
-            locations = self.location_repo.list_all()
             if destination_id is not None:
                 reachable_ids = {
                     int(item.location_id)
                     for item in self.get_travel_destinations_intent(character_id)
                 }
-                target_location = next((item for item in locations if int(item.id) == int(destination_id)), None)
-                if target_location is None or int(destination_id) not in reachable_ids:
+                target_location = self.location_repo.get(int(destination_id)) if int(destination_id) in reachable_ids else None
+                if target_location is None:
                     return ActionResult(messages=["That destination is unavailable right now."], game_over=False)
             else:
+                locations = self.location_repo.list_all()
                 location = self.location_repo.get(character.location_id) if character.location_id is not None else None
                 current = self._current_location_type(character, location)
                 target = "wilderness" if current == "town" else "town"
@@ -4896,6 +4935,7 @@ class GameService:
         character.money -= selected.price
         character.inventory.append(selected.name)
         self.character_repo.save(character)
+        self._invalidate_derived_stats(character.id)
         return ActionResult(
             messages=[
                 f"Purchased {selected.name} for {selected.price} gold.",
@@ -4944,6 +4984,7 @@ class GameService:
 
         character.money = int(getattr(character, "money", 0)) + int(sale_price)
         self.character_repo.save(character)
+        self._invalidate_derived_stats(character.id)
 
         messages = [
             f"Sold {selected} for {sale_price} gold.",
@@ -5003,6 +5044,7 @@ class GameService:
             return ActionResult(messages=[attune_message], game_over=False)
 
         self.character_repo.save(character)
+        self._invalidate_derived_stats(character.id)
 
         if prior and prior != selected:
             messages = [f"Equipped {selected} in {slot} slot.", f"Replaced {prior}."]
@@ -5028,6 +5070,7 @@ class GameService:
         equipped.pop(slot, None)
         unattuned = self._unattune_item(character, str(current))
         self.character_repo.save(character)
+        self._invalidate_derived_stats(character.id)
         messages = [f"Unequipped {current} from {slot} slot."]
         if unattuned:
             messages.append(f"{current} is no longer attuned.")
@@ -5061,6 +5104,7 @@ class GameService:
         attuned.pop(old_idx)
         attuned.append(new_item)
         self.character_repo.save(character)
+        self._invalidate_derived_stats(character.id)
         return ActionResult(messages=[f"Attunement swapped: {old_item} -> {new_item}."], game_over=False)
 
     def drop_inventory_item_intent(self, character_id: int, item_name: str) -> ActionResult:
@@ -5083,6 +5127,7 @@ class GameService:
         unattuned = self._unattune_item(character, str(selected)) if before_count <= 1 else False
 
         self.character_repo.save(character)
+        self._invalidate_derived_stats(character.id)
 
         messages = [f"Dropped {selected}."]
         if unequipped_slot:
@@ -6651,6 +6696,10 @@ class GameService:
             return {}
         return self.combat_service.derive_player_stats(player)
 
+    def _invalidate_derived_stats(self, character_id: int | None) -> None:
+        if self.combat_service is not None:
+            self.combat_service.invalidate_derived_stats(character_id)
+
     def _scene_with_world_weather(self, player: Character, scene: Optional[dict]) -> dict:
         scene_ctx = dict(scene or {})
         location = self.location_repo.get(player.location_id) if self.location_repo and player.location_id is not None else None
@@ -6689,13 +6738,13 @@ class GameService:
                 "weather": scene_ctx.get("weather", "Unknown"),
             },
         )
-        self.combat_service.set_seed(seed)
-        return self.combat_service.fight_turn_based(
-            player,
-            enemy,
-            choose_action,
-            scene=scene_ctx,
-        )
+        with self.combat_service.seeded(seed):
+            return self.combat_service.fight_turn_based(
+                player,
+                enemy,
+                choose_action,
+                scene=scene_ctx,
+            )
 
     def combat_resolve_party_intent(
         self,
@@ -6741,15 +6790,15 @@ class GameService:
                 "weather": scene_ctx.get("weather", "Unknown"),
             },
         )
-        self.combat_service.set_seed(seed)
-        result = self.combat_service.fight_party_turn_based(
-            allies=party_allies,
-            enemies=working_enemies,
-            choose_action=choose_action,
-            choose_target=choose_target,
-            evaluate_ai_action=evaluate_ai_action,
-            scene=scene_ctx,
-        )
+        with self.combat_service.seeded(seed):
+            result = self.combat_service.fight_party_turn_based(
+                allies=party_allies,
+                enemies=working_enemies,
+                choose_action=choose_action,
+                choose_target=choose_target,
+                evaluate_ai_action=evaluate_ai_action,
+                scene=scene_ctx,
+            )
         if reinforcement_note:
             self._append_party_combat_log(result, reinforcement_note)
         self._persist_party_runtime_state(player, result.allies)
@@ -8170,17 +8219,18 @@ class GameService:
         options: list[SpellOptionView] = []
         normalize_slot_ledger(player)
         tower_allegiance = self._tower_allegiance(player)
+        catalog = shared_spell_catalog(self.spell_repo)
         for name in known:
             slug = "".join(
                 ch if ch.isalnum() or ch == " " else "-" for ch in name.lower()
             ).replace(" ", "-")
-            spell = self.spell_repo.get_by_slug(slug) if self.spell_repo else None
-            if tower_allegiance and not self._is_spell_allowed_for_tower(tower_allegiance=tower_allegiance, spell=spell, fallback_name=name):
+            record = catalog.get(slug)
+            if tower_allegiance and not self._is_spell_allowed_for_tower(tower_allegiance=tower_allegiance, spell=record.spell, fallback_name=name):
                 continue
-            level = spell.level_int if spell else 0
-            range_text = spell.range_text if spell else ""
-            components = str(getattr(spell, "components", "") or "") if spell else ""
-            ritual = bool(getattr(spell, "ritual", False)) if spell else False
+            level = record.level_int
+            range_text = record.range_text
+            components = record.components
+            ritual = record.ritual
             needs_slot = level > 0
             cast_levels = available_slot_levels(player, min_level=max(1, int(level))) if needs_slot else []
             playable = bool(cast_levels) if needs_slot else True
@@ -12210,7 +12260,7 @@ class GameService:
 
     def _run_encounter(self, character: Character, world, location: Optional[Location]) -> str:
         rng = random.Random(world.rng_seed + world.current_turn + character.location_id)
-        monster = self._pick_monster(character, location, rng)
+        monster = self._pick_monster(character, location, rng, sampling_mode_for(getattr(world, "flags", None)))
         if monster is None:
             return "The ruins are silent. Nothing happens."
 
@@ -12221,7 +12271,11 @@ class GameService:
         return self._resolve_combat(character, monster, rng, world, location)
 
     def _pick_monster(
-        self, character: Character, location: Optional[Location], rng: random.Random
+        self,
+        character: Character,
+        location: Optional[Location],
+        rng: random.Random,
+        sampling_mode: str = SAMPLING_LEGACY,
     ) -> Optional[Entity]:
         if not self.entity_repo:
             return None
@@ -12240,7 +12294,7 @@ class GameService:
 
             if weighted:
                 entities, weights = zip(*weighted)
-                return rng.choices(list(entities), weights=list(weights), k=1)[0]
+                return weighted_choice(list(entities), list(weights), rng, sampling_mode)
 
         location_id = character.location_id
         choices = self.entity_repo.list_by_location(int(location_id)) if location_id is not None else []
@@ -12272,7 +12326,6 @@ class GameService:
                     "terrain": str(getattr(location, "biome", "open") if location else "open"),
                 },
             )
-            combat_service.set_seed(seed)
             xp_before = int(getattr(character, "xp", 0) or 0)
 
             def _auto_choose_action(options: list[str], player_state: Character, _enemy: Entity, _round_no: int, _scene: dict):
@@ -12288,22 +12341,19 @@ class GameService:
                     return "Rage Attack"
                 return "Attack"
 
-            combat_result = combat_service.fight_turn_based(
-                character,
-                monster,
-                _auto_choose_action,
-                scene={
-                    "distance": "close",
-                    "terrain": str(getattr(location, "biome", "open") if location else "open"),
-                    "surprise": "none",
-                    "weather": str(
-                        self._world_immersion_state(
-                            world,
-                            biome_name=str(getattr(location, "biome", "") or ""),
-                        ).get("weather", "Unknown")
-                    ),
-                },
-            )
+            scene = {
+                "distance": "close",
+                "terrain": str(getattr(location, "biome", "open") if location else "open"),
+                "surprise": "none",
+                "weather": str(
+                    self._world_immersion_state(
+                        world,
+                        biome_name=str(getattr(location, "biome", "") or ""),
+                    ).get("weather", "Unknown")
+                ),
+            }
+            with combat_service.seeded(seed):
+                combat_result = combat_service.fight_turn_based(character, monster, _auto_choose_action, scene=scene)
 
             character.hp_current = int(getattr(combat_result.player, "hp_current", character.hp_current))
             character.alive = bool(getattr(combat_result.player, "alive", character.alive))
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Deque
+
+
+class FactionRelationshipGraph:
+    """Adjacency view over ``narrative.relationship_graph.faction_edges``.
+
+    The persisted flags stay the source of truth; this index mirrors them so the
+    director can read imbalance and the most hostile pair without rescanning.
+    """
+
+    __slots__ = (
+        "_node_index",
+        "_adjacency",
+        "_edge_slots",
+        "_edge_keys",
+        "_weights",
+        "_sorted_keys",
+        "_negative_counts",
+        "_max_negative",
+    )
+
+    def __init__(self) -> None:
+        self._node_index: dict[str, int] = {}
+        self._adjacency: list[dict[int, int]] = []
+        self._edge_slots: dict[str, int] = {}
+        self._edge_keys: list[str] = []
+        self._weights: list[int | None] = []
+        self._sorted_keys: list[str] | None = None
+        self._negative_counts: dict[int, int] = {}
+        self._max_negative = 0
+
+    def sync(self, edges: dict) -> None:
+        if len(edges) != len(self._edge_keys) or any(key not in self._edge_slots for key in edges):
+            self._rebuild(edges)
+            return
+        for key, raw_score in edges.items():
+            slot = self._edge_slots[key]
+            score = self._coerce(raw_score)
+            if score != self._weights[slot]:
+                self._set_slot(slot, score)
+
+    def set_weight(self, key: str, score: int) -> None:
+        slot = self._edge_slots.get(key)
+        if slot is None:
+            slot = self._add_edge(key)
+        self._set_slot(slot, int(score))
+
+    def weight(self, key: str) -> int:
+        slot = self._edge_slots.get(key)
+        if slot is None:
+            return 0
+        return int(self._weights[slot] or 0)
+
+    def sorted_edge_keys(self) -> list[str]:
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(str(key) for key in self._edge_keys)
+        return self._sorted_keys
+
+    def imbalance(self) -> int:
+        return int(self._max_negative)
+
+    def most_negative_pair(self) -> tuple[str, str] | None:
+        if self._max_negative <= 0:
+            return None
+        best_slot = None
+        best_score = 0
+        for slot, key in enumerate(self._edge_keys):
+            if not isinstance(key, str) or "|" not in key:
+                continue
+            score = self._weights[slot]
+            if score is not None and score < best_score:
+                best_slot, best_score = slot, score
+                if -score == self._max_negative:
+                    break
+        if best_slot is None:
+            return None
+        left, right = self._edge_keys[best_slot].split("|", 1)
+        return left, right
+
+    def neighbours(self, faction_id: str) -> dict[str, int]:
+        node = self._node_index.get(str(faction_id))
+        if node is None:
+            return {}
+        names = {index: name for name, index in self._node_index.items()}
+        return {names[other]: int(self._weights[slot] or 0) for other, slot in self._adjacency[node].items()}
+
+    def _rebuild(self, edges: dict) -> None:
+        self.__init__()
+        for key, raw_score in edges.items():
+            slot = self._add_edge(key)
+            self._set_slot(slot, self._coerce(raw_score))
+
+    def _add_edge(self, key) -> int:
+        slot = len(self._edge_keys)
+        self._edge_keys.append(key)
+        self._weights.append(None)
+        self._edge_slots[key] = slot
+        self._sorted_keys = None
+        if isinstance(key, str) and "|" in key:
+            left, right = key.split("|", 1)
+            left_node = self._node(left)
+            right_node = self._node(right)
+            self._adjacency[left_node][right_node] = slot
+            self._adjacency[right_node][left_node] = slot
+        return slot
+
+    def _node(self, name: str) -> int:
+        node = self._node_index.get(name)
+        if node is None:
+            node = len(self._adjacency)
+            self._node_index[name] = node
+            self._adjacency.append({})
+        return node
+
+    def _set_slot(self, slot: int, score: int | None) -> None:
+        previous = self._weights[slot]
+        if previous is not None and previous < 0:
+            magnitude = -previous
+            remaining = self._negative_counts.get(magnitude, 0) - 1
+            if remaining > 0:
+                self._negative_counts[magnitude] = remaining
+            else:
+                self._negative_counts.pop(magnitude, None)
+                if magnitude == self._max_negative:
+                    self._max_negative = max(self._negative_counts, default=0)
+        self._weights[slot] = score
+        if score is not None and score < 0:
+            magnitude = -score
+            self._negative_counts[magnitude] = self._negative_counts.get(magnitude, 0) + 1
+            if magnitude > self._max_negative:
+                self._max_negative = magnitude
+
+    @staticmethod
+    def _coerce(raw_score) -> int | None:
+        try:
+            return int(raw_score)
+        except Exception:
+            return None
+
+
+class WindowedRowPressure:
+    """Running per-turn totals for an append-only, front-trimmed flags list.
+
+    Only rows appended since the last ``sync`` are weighed; rows trimmed from the
+    front are subtracted. Any other mutation (list replaced, rows reordered)
+    falls back to a rebuild from the current list.  ``total`` keeps a running sum
+    of the buckets at or above its last lower bound, so a window that slides one
+    turn per tick only retires the buckets it passed.
+    """
+
+    __slots__ = ("_weigh", "_source", "_mirror", "_buckets", "_floor", "_window_total")
+
+    def __init__(self, weigh: Callable[[dict], int]) -> None:
+        self._weigh = weigh
+        self._source: list | None = None
+        self._mirror: Deque[tuple[object, int, int]] = deque()
+        self._buckets: dict[int, int] = {}
+        self._floor: int | None = None
+        self._window_total = 0
+
+    def sync(self, rows: list) -> None:
+        if rows is not self._source or not self._mirror:
+            self._rebuild(rows)
+            return
+
+        last_seen = self._mirror[-1][0]
+        appended = 0
+        for index in range(len(rows) - 1, -1, -1):
+            if rows[index] is last_seen:
+                break
+            appended += 1
+        else:
+            self._rebuild(rows)
+            return
+
+        trimmed = len(self._mirror) + appended - len(rows)
+        if trimmed < 0 or trimmed > len(self._mirror):
+            self._rebuild(rows)
+            return
+        if trimmed < len(self._mirror) and rows[0] is not self._mirror[trimmed][0]:
+            self._rebuild(rows)
+            return
+
+        for _ in range(trimmed):
+            _, turn, weight = self._mirror.popleft()
+            self._add(turn, -weight)
+        for row in rows[len(rows) - appended :]:
+            self._ingest(row)
+
+    def total(self, lower_bound: int) -> int:
+        bound = int(lower_bound)
+        floor = self._floor
+        if floor is None or bound < floor or bound - floor > len(self._buckets):
+            self._window_total = sum(weight for turn, weight in self._buckets.items() if turn >= bound)
+        else:
+            buckets = self._buckets
+            for turn in range(floor, bound):
+                self._window_total -= buckets.get(turn, 0)
+        self._floor = bound
+        return self._window_total
+
+    def _rebuild(self, rows: list) -> None:
+        self._source = rows
+        self._mirror.clear()
+        self._buckets.clear()
+        self._floor = None
+        self._window_total = 0
+        for row in rows:
+            self._ingest(row)
+
+    def _ingest(self, row) -> None:
+        if isinstance(row, dict):
+            turn = int(row.get("turn", -10_000))
+            weight = int(self._weigh(row))
+        else:
+            turn, weight = -10_000, 0
+        self._mirror.append((row, turn, weight))
+        self._add(turn, weight)
+
+    def _add(self, turn: int, weight: int) -> None:
+        if weight == 0:
+            return
+        if self._floor is not None and turn >= self._floor:
+            self._window_total += weight
+        total = self._buckets.get(turn, 0) + weight
+        if total:
+            self._buckets[turn] = total
+        else:
+            self._buckets.pop(turn, None)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import random
 
 from rpg.application.services.event_bus import EventBus
+from rpg.application.services.narrative_relationship_graph import FactionRelationshipGraph, WindowedRowPressure
 from rpg.application.services.seed_policy import derive_seed
 from rpg.domain.events import TickAdvanced
 from rpg.domain.repositories import WorldRepository
@@ -32,6 +33,8 @@ class StoryDirector:
         self.world_repo = world_repo
         self.event_bus = event_bus
         self.cadence_turns = max(1, int(cadence_turns))
+        self._tension_indexes: dict[int, _WorldTensionIndex] = {}
+        self._tick_index: _WorldTensionIndex | None = None
 
     def register_handlers(self) -> None:
         self.event_bus.subscribe(TickAdvanced, self.on_tick_advanced, priority=60)
@@ -42,6 +45,15 @@ class StoryDirector:
             return
 
         narrative = self._world_narrative_state(world)
+        # Mirror the flags once; the director's own edge writes below go through the index too.
+        self._tick_index = self._tension_index(world)
+        try:
+            self._advance_narrative(world, narrative, event)
+        finally:
+            self._tick_index = None
+        self.world_repo.save(world)
+
+    def _advance_narrative(self, world, narrative: dict, event: TickAdvanced) -> None:
         tension_before = int(narrative.get("tension_level", 0))
         tension_after = self._calculate_tension(world, tension_before)
         narrative["tension_level"] = tension_after
@@ -67,8 +79,6 @@ class StoryDirector:
 
         self._check_cataclysm_threshold(world, narrative=narrative, turn_after=int(event.turn_after), tension=tension_after)
 
-        self.world_repo.save(world)
-
     def _check_cataclysm_threshold(self, world, *, narrative: dict, turn_after: int, tension: int) -> None:
         if not isinstance(getattr(world, "flags", None), dict):
             world.flags = {}
@@ -156,50 +166,49 @@ class StoryDirector:
             world.flags["narrative"] = state
         return state
 
-    @staticmethod
-    def _recent_consequence_count(world, turn_after: int, window: int = 3) -> int:
-        rows = world.flags.get("consequences", []) if isinstance(getattr(world, "flags", None), dict) else []
-        if not isinstance(rows, list):
-            return 0
-        lower_bound = int(turn_after) - int(window)
-        count = 0
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            row_turn = int(row.get("turn", -10_000))
-            if row_turn >= lower_bound:
-                count += 1
-        return count
-
-    @staticmethod
-    def _recent_flashpoint_pressure(world, turn_after: int, window: int = 4) -> int:
-        if not isinstance(getattr(world, "flags", None), dict):
-            return 0
-        narrative = world.flags.get("narrative", {})
+    def _tension_index(self, world) -> _WorldTensionIndex:
+        """Index mirrored from the world flags; during a tick, the one synced when the tick began."""
+        if self._tick_index is not None:
+            return self._tick_index
+        world_id = int(getattr(world, "id", 0) or 0)
+        index = self._tension_indexes.get(world_id)
+        if index is None:
+            index = _WorldTensionIndex()
+            self._tension_indexes[world_id] = index
+
+        flags = world.flags if isinstance(getattr(world, "flags", None), dict) else {}
+        consequences = flags.get("consequences", [])
+        index.consequences.sync(consequences if isinstance(consequences, list) else [])
+
+        narrative = flags.get("narrative", {})
         if not isinstance(narrative, dict):
-            return 0
-        rows = narrative.get("flashpoint_echoes", [])
-        if not isinstance(rows, list):
-            return 0
+            narrative = {}
+        echoes = narrative.get("flashpoint_echoes", [])
+        index.flashpoints.sync(echoes if isinstance(echoes, list) else [])
 
-        lower_bound = int(turn_after) - int(window)
-        score = 0
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            row_turn = int(row.get("turn", -10_000))
-            if row_turn < lower_bound:
-                continue
-            band = str(row.get("severity_band", "moderate"))
-            if band == "critical":
-                score += 4
-            elif band == "high":
-                score += 3
-            elif band == "moderate":
-                score += 2
-            else:
-                score += 1
-        return min(12, int(score))
+        graph = narrative.get("relationship_graph", {})
+        edges = graph.get("faction_edges", {}) if isinstance(graph, dict) else {}
+        index.graph.sync(edges if isinstance(edges, dict) else {})
+        return index
+
+    def _recent_consequence_count(self, world, turn_after: int, window: int = 3) -> int:
+        index = self._tension_index(world)
+        return index.consequences.total(int(turn_after) - int(window))
+
+    def _recent_flashpoint_pressure(self, world, turn_after: int, window: int = 4) -> int:
+        index = self._tension_index(world)
+        return min(12, int(index.flashpoints.total(int(turn_after) - int(window))))
+
+    @staticmethod
+    def _flashpoint_band_weight(row: dict) -> int:
+        band = str(row.get("severity_band", "moderate"))
+        if band == "critical":
+            return 4
+        if band == "high":
+            return 3
+        if band == "moderate":
+            return 2
+        return 1
 
     def _calculate_tension(self, world, tension_before: int) -> int:
         turn_after = int(getattr(world, "current_turn", 0))
@@ -334,7 +343,7 @@ class StoryDirector:
             del seeds[:-self._STORY_SEED_MAX]
 
     def _select_injection_kind(self, world, *, narrative: dict, turn_after: int, tension: int) -> str:
-        imbalance = self._faction_imbalance(narrative)
+        imbalance = self._faction_imbalance(world)
         recent_tags = self._recent_story_tags(narrative, limit=4)
 
         story_weight = 55
@@ -389,23 +398,8 @@ class StoryDirector:
         rng = random.Random(int(guard_seed) + 17)
         return alternatives[rng.randrange(len(alternatives))]
 
-    @staticmethod
-    def _faction_imbalance(narrative: dict) -> int:
-        graph = narrative.get("relationship_graph", {}) if isinstance(narrative, dict) else {}
-        if not isinstance(graph, dict):
-            return 0
-        edges = graph.get("faction_edges", {})
-        if not isinstance(edges, dict) or not edges:
-            return 0
-        negative_scores: list[int] = []
-        for raw_score in edges.values():
-            try:
-                score = int(raw_score)
-            except Exception:
-                continue
-            if score < 0:
-                negative_scores.append(abs(score))
-        return max(negative_scores) if negative_scores else 0
+    def _faction_imbalance(self, world) -> int:
+        return self._tension_index(world).graph.imbalance()
 
     @staticmethod
     def _recent_story_tags(narrative: dict, *, limit: int) -> list[str]:
@@ -446,25 +440,9 @@ class StoryDirector:
         return "simmering"
 
     def _pick_faction_for_seed(self, world, *, seed: int) -> str:
-        narrative = self._world_narrative_state(world)
-        graph = self._world_relationship_graph(narrative)
-        edges = graph.get("faction_edges", {}) if isinstance(graph, dict) else {}
-        if isinstance(edges, dict) and edges:
-            most_negative = None
-            most_negative_score = 0
-            for key, raw_score in edges.items():
-                if not isinstance(key, str) or "|" not in key:
-                    continue
-                try:
-                    score = int(raw_score)
-                except Exception:
-                    continue
-                if score < most_negative_score:
-                    most_negative_score = score
-                    left, right = key.split("|", 1)
-                    most_negative = (left, right)
-            if most_negative:
-                return sorted(list(most_negative))[0]
+        most_negative = self._tension_index(world).graph.most_negative_pair()
+        if most_negative:
+            return sorted(list(most_negative))[0]
 
         factions = sorted(self._DEFAULT_FACTIONS)
         rng = random.Random(seed)
@@ -477,9 +455,12 @@ class StoryDirector:
             edges = {}
             graph["faction_edges"] = edges
 
+        index_graph = self._tension_index(world).graph
         for left, right in self._default_faction_pairs():
             key = self._edge_key(left, right)
-            edges.setdefault(key, 0)
+            if key not in edges:
+                edges[key] = 0
+                index_graph.set_weight(key, 0)
 
         affinity = graph.setdefault("npc_faction_affinity", {})
         if not isinstance(affinity, dict):
@@ -492,7 +473,7 @@ class StoryDirector:
         if turn_after % 2 != 0:
             return
 
-        edge_keys = sorted(str(key) for key in edges.keys())
+        edge_keys = index_graph.sorted_edge_keys()
         if not edge_keys:
             return
 
@@ -516,6 +497,7 @@ class StoryDirector:
         previous = int(edges.get(edge_key, 0))
         updated = max(-100, min(100, previous + delta))
         edges[edge_key] = updated
+        index_graph.set_weight(edge_key, updated)
 
         history = graph.setdefault("history", [])
         if not isinstance(history, list):
@@ -556,6 +538,15 @@ class StoryDirector:
         return f"{ordered[0]}|{ordered[1]}"
 
 
+class _WorldTensionIndex:
+    __slots__ = ("graph", "consequences", "flashpoints")
+
+    def __init__(self) -> None:
+        self.graph = FactionRelationshipGraph()
+        self.consequences = WindowedRowPressure(lambda row: 1)
+        self.flashpoints = WindowedRowPressure(StoryDirector._flashpoint_band_weight)
+
+
 def register_story_director_handlers(
     event_bus: EventBus,
     world_repo: WorldRepository,
@@ -370,6 +370,16 @@ class WorldProgression:
         cls._REFERENCE_WORLD_DATASET_CACHE[cache_key] = dataset
         return dataset
 
+    @classmethod
+    def _clear_reference_world_dataset_cache(cls) -> None:
+        """Drop cached datasets and release the artifacts they keep mapped."""
+        cached = list(cls._REFERENCE_WORLD_DATASET_CACHE.values())
+        cls._REFERENCE_WORLD_DATASET_CACHE.clear()
+        for dataset in cached:
+            close = getattr(dataset, "close", None)
+            if close is not None:
+                close()
+
     @staticmethod
     def _world_cataclysm_focus_biome_slug(world: World) -> str:
         if not isinstance(getattr(world, "flags", None), dict):
@@ -0,0 +1,235 @@
+"""Compiled spell catalog shared by combat, spell menus and character creation.
+
+Combat used to re-query the spell repository, re-parse component strings and
+re-derive base levels on every cast, and character creation re-scanned the
+whole ``data/spells/unified_spells.json`` payload for each class.  A
+``SpellCatalog`` merges the three sources into immutable ``SpellRecord`` rows:
+
+* ``SPELL_DEFINITIONS`` supplies the combat resolution, dice and concentration;
+* the spell repository (when one is wired) supplies level, components, range
+  and ritual data, looked up once per slug and memoised, misses included;
+* the unified reference file supplies class lists and reference levels, loaded
+  and indexed by slug and class once per process.
+
+Repository data keeps precedence over the reference file wherever combat or the
+spell menu read it, so a catalog answers exactly what the per-call code did.
+``shared_spell_catalog(spell_repo)`` returns the process-wide catalog for a
+repository; ``invalidate_spell_catalogs`` drops them after reference data edits.
+Catalogs are shared by every thread resolving fights, so the memo, the
+reference index and the catalog registry are filled under locks.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from rpg.application.spells.spell_definitions import SPELL_DEFINITIONS, SpellDefinition, is_healing_spell_slug
+from rpg.domain.models.spell import Spell
+from rpg.domain.repositories import SpellRepository
+from rpg.domain.services.dice import DiceExpression, compile_dice_expression
+
+UNIFIED_SPELLS_PATH = Path(__file__).resolve().parents[4] / "data" / "spells" / "unified_spells.json"
+
+_CANTRIP_FALLBACK_SLUGS = frozenset({"fire-bolt", "ray-of-frost", "sacred-flame", "eldritch-blast", "vicious-mockery"})
+
+
+def parse_spell_components(components: str | None) -> tuple[bool, bool, bool, str]:
+    """Return ``(verbal, somatic, material, material_text)`` for a components string."""
+    raw = str(components or "")
+    token = raw.upper()
+    material_text = ""
+    if "(" in raw and ")" in raw:
+        material_text = raw[raw.find("(") + 1 : raw.rfind(")")].strip()
+    return "V" in token, "S" in token, "M" in token, material_text
+
+
+def combat_base_level(spell: Optional[Spell], slug: str) -> int:
+    """Repository level when known; otherwise a handful of cantrips are level 0 and the rest level 1."""
+    if spell is not None:
+        try:
+            return max(0, int(getattr(spell, "level_int", 0) or 0))
+        except Exception:
+            return 0
+    return 0 if str(slug or "").strip().lower() in _CANTRIP_FALLBACK_SLUGS else 1
+
+
+def _parse_classes(raw: object) -> FrozenSet[str]:
+    if isinstance(raw, (list, tuple)):
+        parts = [str(part or "") for part in raw]
+    else:
+        parts = str(raw or "").replace(";", ",").split(",")
+    return frozenset(part.strip().lower() for part in parts if part.strip())
+
+
+@dataclass(frozen=True)
+class ReferenceSpell:
+    slug: str
+    name: str
+    level_int: int
+    classes: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class SpellRecord:
+    slug: str
+    name: str
+    spell: Optional[Spell]
+    definition: Optional[SpellDefinition]
+    reference: Optional[ReferenceSpell]
+    level_int: int
+    combat_level: int
+    range_text: str
+    components: str
+    has_verbal: bool
+    has_somatic: bool
+    has_material: bool
+    material_text: str
+    ritual: bool
+    concentration: bool
+    healing: bool
+    damage_dice: Optional[DiceExpression]
+    classes: FrozenSet[str]
+
+
+_REFERENCE: Optional[Tuple[Tuple[ReferenceSpell, ...], Dict[str, ReferenceSpell], Dict[str, Tuple[ReferenceSpell, ...]]]] = None
+_REFERENCE_LOCK = threading.Lock()
+
+
+def _load_reference() -> Tuple[Tuple[ReferenceSpell, ...], Dict[str, ReferenceSpell], Dict[str, Tuple[ReferenceSpell, ...]]]:
+    reference = _REFERENCE
+    if reference is not None:
+        return reference
+    with _REFERENCE_LOCK:
+        if _REFERENCE is None:
+            _build_reference()
+        return _REFERENCE
+
+
+def _build_reference() -> None:
+    global _REFERENCE
+    rows: list[ReferenceSpell] = []
+    try:
+        payload = json.loads(UNIFIED_SPELLS_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        payload = {}
+    spells = payload.get("spells") if isinstance(payload, dict) else []
+    for row in spells if isinstance(spells, list) else []:
+        if not isinstance(row, dict):
+            continue
+        try:
+            level = int(row.get("level_int", 0) or 0)
+        except Exception:
+            level = 0
+        rows.append(
+            ReferenceSpell(
+                slug=str(row.get("slug", "") or "").strip().lower(),
+                name=str(row.get("name", "") or "").strip(),
+                level_int=level,
+                classes=_parse_classes(str(row.get("classes", "") or "")),
+            )
+        )
+    by_slug: Dict[str, ReferenceSpell] = {}
+    by_class: Dict[str, list[ReferenceSpell]] = {}
+    for row in rows:
+        if row.slug:
+            by_slug.setdefault(row.slug, row)
+        for class_name in row.classes:
+            by_class.setdefault(class_name, []).append(row)
+    _REFERENCE = (tuple(rows), by_slug, {key: tuple(value) for key, value in by_class.items()})
+
+
+class SpellCatalog:
+    """Spell records for one repository (or none), built lazily per slug and then reused."""
+
+    def __init__(self, spell_repo: Optional[SpellRepository] = None) -> None:
+        self.spell_repo = spell_repo
+        self._records: Dict[str, SpellRecord] = {}
+        self._lock = threading.Lock()
+
+    def get(self, slug: str) -> SpellRecord:
+        key = str(slug)
+        record = self._records.get(key)
+        if record is None:
+            record = self._compile(key)
+            with self._lock:
+                record = self._records.setdefault(key, record)
+        return record
+
+    def _compile(self, slug: str) -> SpellRecord:
+        normalized = slug.strip().lower()
+        spell = self.spell_repo.get_by_slug(slug) if self.spell_repo else None
+        definition = SPELL_DEFINITIONS.get(normalized)
+        reference = _load_reference()[1].get(normalized)
+        components = str(getattr(spell, "components", "") or "") if spell is not None else ""
+        has_verbal, has_somatic, has_material, material_text = parse_spell_components(components)
+        name = str(getattr(spell, "name", "") or "").strip() or slug.replace("-", " ").title()
+        dice_expr = getattr(definition, "damage_dice", None)
+        if spell is not None and getattr(spell, "classes", None):
+            classes = _parse_classes(spell.classes)
+        else:
+            classes = reference.classes if reference is not None else frozenset()
+        return SpellRecord(
+            slug=slug,
+            name=name,
+            spell=spell,
+            definition=definition,
+            reference=reference,
+            level_int=int(spell.level_int or 0) if spell is not None else 0,
+            combat_level=combat_base_level(spell, slug),
+            range_text=str(spell.range_text or "") if spell is not None else "",
+            components=components,
+            has_verbal=has_verbal,
+            has_somatic=has_somatic,
+            has_material=has_material,
+            material_text=material_text,
+            ritual=bool(getattr(spell, "ritual", False)) if spell is not None else False,
+            concentration=bool(getattr(definition, "concentration", False)),
+            healing=is_healing_spell_slug(normalized),
+            damage_dice=compile_dice_expression(dice_expr) if dice_expr else None,
+            classes=classes,
+        )
+
+    @staticmethod
+    def reference_spells() -> Tuple[ReferenceSpell, ...]:
+        return _load_reference()[0]
+
+    @staticmethod
+    def reference_for_class(class_name: str) -> Tuple[ReferenceSpell, ...]:
+        """Reference spells listing ``class_name``, in reference-file order."""
+        return _load_reference()[2].get(str(class_name or "").strip().lower(), ())
+
+
+_CATALOGS: "weakref.WeakKeyDictionary[SpellRepository, SpellCatalog]" = weakref.WeakKeyDictionary()
+_REPOLESS_CATALOG: Optional[SpellCatalog] = None
+_CATALOGS_LOCK = threading.Lock()
+
+
+def shared_spell_catalog(spell_repo: Optional[SpellRepository] = None) -> SpellCatalog:
+    global _REPOLESS_CATALOG
+    with _CATALOGS_LOCK:
+        if spell_repo is None:
+            if _REPOLESS_CATALOG is None:
+                _REPOLESS_CATALOG = SpellCatalog()
+            return _REPOLESS_CATALOG
+        try:
+            catalog = _CATALOGS.get(spell_repo)
+            if catalog is None:
+                catalog = SpellCatalog(spell_repo)
+                _CATALOGS[spell_repo] = catalog
+            return catalog
+        except TypeError:
+            # Repositories that cannot be weakly referenced get a catalog of their own per call.
+            return SpellCatalog(spell_repo)
+
+
+def invalidate_spell_catalogs() -> None:
+    global _REFERENCE, _REPOLESS_CATALOG
+    with _REFERENCE_LOCK, _CATALOGS_LOCK:
+        _REFERENCE = None
+        _REPOLESS_CATALOG = None
+        _CATALOGS.clear()
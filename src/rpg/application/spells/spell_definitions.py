@@ -4,6 +4,14 @@ from typing import Literal, Optional
 Resolution = Literal["spell_attack", "save", "auto"]
 
 
+def slugify_spell_name(name: str) -> str:
+    return (
+        "".join(ch if ch.isalnum() or ch == " " else "-" for ch in name.lower())
+        .replace(" ", "-")
+        .replace("--", "-")
+    )
+
+
 @dataclass(frozen=True)
 class SpellDefinition:
     slug: str
@@ -33,3 +41,8 @@ SPELL_DEFINITIONS: dict[str, SpellDefinition] = {
         notes="Mark target; your hits deal +1d6 (not yet implemented fully).",
     ),
 }
+
+
+def is_healing_spell_slug(slug: str) -> bool:
+    definition = SPELL_DEFINITIONS.get(str(slug or "").strip().lower())
+    return bool(definition and str(getattr(definition, "damage_type", "")).lower() == "healing")
@@ -24,6 +24,7 @@ from rpg.infrastructure.inmemory.inmemory_world_repo import InMemoryWorldReposit
 from rpg.infrastructure.inmemory.atomic_persistence import create_inmemory_atomic_persistor
 from rpg.infrastructure.content_provider_factory import create_content_client_factory
 from rpg.infrastructure.datamuse_client import DatamuseClient
+from rpg.infrastructure.http_client_pool import HttpClientPool
 from rpg.infrastructure.name_generation import DnDCorpusNameGenerator
 
 _NAME_GENERATOR_CACHE: dict[int, DnDCorpusNameGenerator] = {}
@@ -86,17 +87,27 @@ def _looks_like_local_mysql_unreachable(database_url: str) -> bool:
         return True
 
 
-def _build_encounter_intro_builder():
+def _flavour_lexical_client(http_pool: HttpClientPool | None = None) -> DatamuseClient:
+    # With a pool, both flavour enrichers share one Datamuse connection.
+    timeout = _safe_float_env("RPG_FLAVOUR_TIMEOUT_S", 0.4, minimum=0.05)
+    retries = _safe_int_env("RPG_FLAVOUR_RETRIES", 0, minimum=0)
+    backoff_seconds = _safe_float_env("RPG_FLAVOUR_BACKOFF_S", 0.1, minimum=0.0)
+    return DatamuseClient(
+        timeout=timeout,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        http_client=http_pool.client_for(DatamuseClient.BASE_URL, timeout=timeout) if http_pool is not None else None,
+    )
+
+
+def _build_encounter_intro_builder(http_pool: HttpClientPool | None = None):
     enabled = os.getenv("RPG_FLAVOUR_DATAMUSE_ENABLED", "0").strip().lower() in {"1", "true", "yes"}
     if not enabled:
         return EncounterIntroEnricher(enabled=False).build_intro
 
-    timeout = _safe_float_env("RPG_FLAVOUR_TIMEOUT_S", 0.4, minimum=0.05)
-    retries = _safe_int_env("RPG_FLAVOUR_RETRIES", 0, minimum=0)
-    backoff_seconds = _safe_float_env("RPG_FLAVOUR_BACKOFF_S", 0.1, minimum=0.0)
     max_lines = _safe_int_env("RPG_FLAVOUR_MAX_LINES", 1, minimum=0)
 
-    lexical = DatamuseClient(timeout=timeout, retries=retries, backoff_seconds=backoff_seconds)
+    lexical = _flavour_lexical_client(http_pool)
     enricher = EncounterIntroEnricher(
         lexical_client=lexical,
         enabled=True,
@@ -105,17 +116,14 @@ def _build_encounter_intro_builder():
     return enricher.build_intro
 
 
-def _build_mechanical_flavour_builder():
+def _build_mechanical_flavour_builder(http_pool: HttpClientPool | None = None):
     enabled = os.getenv("RPG_MECHANICAL_FLAVOUR_DATAMUSE_ENABLED", "0").strip().lower() in {"1", "true", "yes"}
     if not enabled:
         return None
 
-    timeout = _safe_float_env("RPG_FLAVOUR_TIMEOUT_S", 0.4, minimum=0.05)
-    retries = _safe_int_env("RPG_FLAVOUR_RETRIES", 0, minimum=0)
-    backoff_seconds = _safe_float_env("RPG_FLAVOUR_BACKOFF_S", 0.1, minimum=0.0)
     max_words = _safe_int_env("RPG_FLAVOUR_MAX_WORDS", 8, minimum=1)
 
-    lexical = DatamuseClient(timeout=timeout, retries=retries, backoff_seconds=backoff_seconds)
+    lexical = _flavour_lexical_client(http_pool)
     enricher = MechanicalFlavourEnricher(lexical_client=lexical, enabled=True, max_words=max_words)
 
     def _build(**kwargs) -> str:
@@ -140,7 +148,8 @@ def _build_mechanical_flavour_builder():
 def _build_inmemory_game_service() -> GameService:
     verbosity = os.getenv("RPG_VERBOSITY", "compact").lower()
     use_external_creation_content = os.getenv("RPG_CREATION_EXTERNAL_CONTENT", "0").strip().lower() in {"1", "true", "yes"}
-    content_client_factory = create_content_client_factory() if use_external_creation_content else None
+    http_pool = HttpClientPool()
+    content_client_factory = create_content_client_factory(http_pool) if use_external_creation_content else None
     char_repo = InMemoryCharacterRepository()
     loc_repo = InMemoryLocationRepository()
     cls_repo = InMemoryClassRepository()
@@ -184,8 +193,8 @@ def _build_inmemory_game_service() -> GameService:
     atomic_persistor = create_inmemory_atomic_persistor(char_repo, world_repo)
     event_bus = EventBus()
     progression = WorldProgression(world_repo, entity_repo, event_bus)
-    encounter_intro_builder = _build_encounter_intro_builder()
-    mechanical_flavour_builder = _build_mechanical_flavour_builder()
+    encounter_intro_builder = _build_encounter_intro_builder(http_pool)
+    mechanical_flavour_builder = _build_mechanical_flavour_builder(http_pool)
     register_faction_influence_handlers(event_bus, faction_repo=faction_repo, entity_repo=entity_repo, character_repo=char_repo)
     register_quest_handlers(
         event_bus,
@@ -210,6 +219,7 @@ def _build_inmemory_game_service() -> GameService:
         name_generator=name_generator,
         encounter_intro_builder=encounter_intro_builder,
         mechanical_flavour_builder=mechanical_flavour_builder,
+        shutdown_hooks=[http_pool.close],
     )
 
 
@@ -242,9 +252,10 @@ def _build_mysql_game_service():
     world_repo = MysqlWorldRepository()
     name_generator = _get_name_generator()
     use_external_creation_content = os.getenv("RPG_CREATION_EXTERNAL_CONTENT", "0").strip().lower() in {"1", "true", "yes"}
-    content_client_factory = create_content_client_factory() if use_external_creation_content else None
-    encounter_intro_builder = _build_encounter_intro_builder()
-    mechanical_flavour_builder = _build_mechanical_flavour_builder()
+    http_pool = HttpClientPool()
+    content_client_factory = create_content_client_factory(http_pool) if use_external_creation_content else None
+    encounter_intro_builder = _build_encounter_intro_builder(http_pool)
+    mechanical_flavour_builder = _build_mechanical_flavour_builder(http_pool)
     spell_repo = MysqlSpellRepository()
 
     event_bus = EventBus()
@@ -262,6 +273,7 @@ def _build_mysql_game_service():
     try:
         world_repo.load_default()
     except Exception as exc:
+        http_pool.close()
         raise RuntimeError(f"MySQL bootstrap probe failed: {exc}") from exc
 
     return GameService(
@@ -282,6 +294,7 @@ def _build_mysql_game_service():
         name_generator=name_generator,
         encounter_intro_builder=encounter_intro_builder,
         mechanical_flavour_builder=mechanical_flavour_builder,
+        shutdown_hooks=[http_pool.close],
     )
 
 
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from rpg.domain.models.stats import CombatStats
+from rpg.domain.models.stats import CombatStats, CombatStatsView
 
 
 @dataclass
@@ -46,8 +46,30 @@ class Entity:
             tags=list(self.tags),
         )
 
+    @property
+    def stats_view(self) -> CombatStatsView:
+        """Return a cached immutable stats snapshot, rebuilt whenever a combat stat changes."""
+
+        key = (
+            self.hp,
+            self.attack_min,
+            self.attack_max,
+            self.armor,
+            self.armour_class,
+            self.attack_bonus,
+            self.damage_die,
+            tuple(self.tags),
+        )
+        cached = self.__dict__.get("_stats_view")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        view = CombatStatsView(*key)
+        # Kept outside the dataclass fields so equality, repr and asdict are unaffected.
+        self.__dict__["_stats_view"] = (key, view)
+        return view
+
     @property
     def threat_rating(self) -> float:
         """Expose the combat threat rating for encounter planning."""
 
-        return self.combat_stats.threat_rating
+        return self.stats_view.threat_rating
@@ -99,6 +99,49 @@ def derive_combat_stats(*, scores: AbilityScores, base_armour_class: int = 10, a
     )
 
 
+def threat_rating_for(
+    *, hp: int, attack_min: int, attack_max: int, armor: int = 0, armour_class: int = 10, attack_bonus: int = 0
+) -> float:
+    """Danger score shared by ``CombatStats`` and ``CombatStatsView``.
+
+    The formula intentionally favours survivability slightly more than burst
+    damage so that "tanky" enemies don't overwhelm low-level parties.
+    """
+
+    avg_damage = (attack_min + attack_max) / 2
+    mitigation = armor + (armour_class - 10) * 0.2
+    return max(hp / 2 + avg_damage + mitigation + attack_bonus * 0.5, 1.0)
+
+
+@dataclass(frozen=True, slots=True)
+class CombatStatsView:
+    """Compact read-only snapshot of combat stats with its threat rating computed once."""
+
+    hp: int
+    attack_min: int
+    attack_max: int
+    armor: int = 0
+    armour_class: int = 10
+    attack_bonus: int = 0
+    damage_die: str = "d4"
+    tags: tuple[str, ...] = ()
+    threat_rating: float = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "threat_rating",
+            threat_rating_for(
+                hp=self.hp,
+                attack_min=self.attack_min,
+                attack_max=self.attack_max,
+                armor=self.armor,
+                armour_class=self.armour_class,
+                attack_bonus=self.attack_bonus,
+            ),
+        )
+
+
 @dataclass
 class CombatStats:
     """Immutable container describing combat-relevant stats.
@@ -120,15 +163,16 @@ class CombatStats:
 
     @property
     def threat_rating(self) -> float:
-        """Return a lightweight danger score used by encounter planners.
+        """Return a lightweight danger score used by encounter planners."""
 
-        The formula intentionally favours survivability slightly more than burst
-        damage so that "tanky" enemies don't overwhelm low-level parties.
-        """
-
-        avg_damage = (self.attack_min + self.attack_max) / 2
-        mitigation = self.armor + (self.armour_class - 10) * 0.2
-        return max(self.hp / 2 + avg_damage + mitigation + self.attack_bonus * 0.5, 1.0)
+        return threat_rating_for(
+            hp=self.hp,
+            attack_min=self.attack_min,
+            attack_max=self.attack_max,
+            armor=self.armor,
+            armour_class=self.armour_class,
+            attack_bonus=self.attack_bonus,
+        )
 
     def with_bonus(self, hp_bonus: int = 0, damage_bonus: int = 0) -> "CombatStats":
         """Return a shallow copy with additional bonuses applied."""
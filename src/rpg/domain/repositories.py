@@ -11,6 +11,7 @@ from rpg.domain.models.spell import Spell
 from rpg.domain.models.feature import Feature
 from rpg.domain.models.world import World
 from rpg.domain.models.character_class import CharacterClass
+from rpg.domain.services.location_spatial_index import within_radius
 
 
 class CharacterRepository(ABC):
@@ -66,6 +67,9 @@ class WorldRepository(ABC):
 
 
 class EntityRepository(ABC):
+    # Bumped by writes (imports, location attachments) so read-side caches can invalidate.
+    revision: int = 0
+
     @abstractmethod
     def get(self, entity_id: int) -> Optional[Entity]:
         raise NotImplementedError
@@ -102,6 +106,10 @@ class LocationRepository(ABC):
     def get_starting_location(self) -> Optional[Location]:
         raise NotImplementedError
 
+    def list_within_radius(self, x: float, y: float, radius: float) -> List[Location]:
+        """Optional helper; default falls back to a linear scan of list_all."""
+        return [location for location in self.list_all() if within_radius(x, y, location, radius)]
+
 
 class ClassRepository(ABC):
     @abstractmethod
@@ -110,6 +118,8 @@ class ClassRepository(ABC):
 
 
 class EncounterDefinitionRepository(ABC):
+    revision: int = 0
+
     @abstractmethod
     def list_for_location(self, location_id: int) -> List[EncounterDefinition]:
         raise NotImplementedError
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+from typing import NamedTuple
+
+
+_CACHE_LIMIT = 4096
+
+
+class DiceExpression(NamedTuple):
+    """Compiled ``NdX+M`` expression; ``extra_dice`` holds any further ``(count, sides)`` groups."""
+
+    count: int
+    sides: int
+    modifier: int
+    uses_mod: bool
+    extra_dice: tuple[tuple[int, int], ...] = ()
+
+    @property
+    def dice(self) -> tuple[tuple[int, int], ...]:
+        if self.count <= 0:
+            return self.extra_dice
+        return ((self.count, self.sides), *self.extra_dice)
+
+
+EMPTY_DICE_EXPRESSION = DiceExpression(0, 0, 0, False)
+
+_EXPRESSION_CACHE: dict[str, DiceExpression] = {}
+_DIE_CACHE: dict[str, int] = {}
+
+
+def _remember(cache: dict, key: str, value):
+    if len(cache) >= _CACHE_LIMIT:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def compile_dice_expression(expr: str) -> DiceExpression:
+    """Parse ``"3d4+3"``/``"1d8+MOD"`` once; malformed parts are ignored like the legacy roller."""
+    key = expr if isinstance(expr, str) else ""
+    cached = _EXPRESSION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    if not key:
+        return EMPTY_DICE_EXPRESSION
+
+    groups: list[tuple[int, int]] = []
+    modifier = 0
+    uses_mod = False
+    for part in key.lower().replace(" ", "").split("+"):
+        if part == "mod":
+            uses_mod = True
+        elif "d" in part:
+            try:
+                num_str, die_str = part.split("d", 1)
+                num = int(num_str) if num_str else 1
+                sides = int(die_str) if die_str else 6
+            except ValueError:
+                continue
+            groups.append((max(num, 1), max(2, sides)))
+        else:
+            try:
+                modifier += int(part)
+            except ValueError:
+                continue
+
+    if groups:
+        (count, sides), extra = groups[0], tuple(groups[1:])
+    else:
+        count, sides, extra = 0, 0, ()
+    return _remember(_EXPRESSION_CACHE, key, DiceExpression(count, sides, modifier, uses_mod, extra))
+
+
+def compile_die(spec: str) -> int:
+    """Return the side count for ``"d8"``/``"8"``; ``0`` marks a spec that always rolls 1."""
+    cached = _DIE_CACHE.get(spec) if isinstance(spec, str) else 0
+    if cached is not None:
+        return cached
+    if not spec:
+        return 0
+    try:
+        sides = max(2, int(spec[1:] if spec.startswith("d") else spec))
+    except ValueError:
+        sides = 0
+    return _remember(_DIE_CACHE, spec, sides)
+
+
+def roll_dice_batch(count: int, sides: int, rng: random.Random | None = None) -> list[int]:
+    """Draw ``count`` dice in one pass; the values match ``count`` separate ``randint(1, sides)`` calls."""
+    randint = (rng or random).randint
+    return [randint(1, sides) for _ in range(max(0, int(count)))]
+
+
+def roll_dice_total(count: int, sides: int, rng: random.Random | None = None) -> int:
+    return sum(roll_dice_batch(count, sides, rng))
+
+
+def roll_compiled(expression: DiceExpression, ability_mod: int = 0, rng: random.Random | None = None) -> int:
+    # The legacy roller read "+MOD" as a malformed die and dropped it, so ``ability_mod`` is not added.
+    total = expression.modifier + sum(roll_dice_batch(expression.count, expression.sides, rng))
+    for count, sides in expression.extra_dice:
+        total += sum(roll_dice_batch(count, sides, rng))
+    return max(total, 0)
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import random
+import sys
 from typing import Iterable, List, Optional, Sequence
 
 from rpg.domain.models.encounter_definition import EncounterDefinition, EncounterSlot
 from rpg.domain.models.entity import Entity
 from rpg.domain.repositories import EntityRepository
+from rpg.domain.services.weighted_sampling import ALIAS, LEGACY, weighted_choice
+
+# ``sum()`` over floats uses Neumaier compensation from Python 3.12 on.  The
+# planner's running threat tally mirrors it so budgets cut off exactly where
+# re-summing the planned list did, keeping seeded encounters unchanged.
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+
+def _add_threat(total: float, compensation: float, value: float) -> tuple[float, float]:
+    result = total + value
+    if _COMPENSATED_SUM:
+        if abs(total) >= abs(value):
+            compensation += (total - result) + value
+        else:
+            compensation += (value - result) + total
+    return result, compensation
 
 
 class EncounterPlanner:
@@ -45,11 +62,12 @@ class EncounterPlanner:
         player_level: int,
         faction_bias: Optional[str],
         rng: random.Random,
+        sampling_mode: str = LEGACY,
     ) -> Optional[EncounterDefinition]:
         if not definitions:
             return None
         weights = [self._score_definition(defn, player_level, faction_bias) for defn in definitions]
-        return rng.choices(list(definitions), weights=weights, k=1)[0]
+        return weighted_choice(list(definitions), weights, rng, sampling_mode)
 
     def _pick_count(self, slot: EncounterSlot, rng: random.Random) -> int:
         if slot.min_count >= slot.max_count:
@@ -62,23 +80,29 @@ class EncounterPlanner:
         entity_lookup: dict[int, Entity],
         rng: random.Random,
         target_threat: float,
+        slots: Optional[Iterable[EncounterSlot]] = None,
+        threat: Optional[dict[int, float]] = None,
     ) -> List[Entity]:
         planned: list[Entity] = []
+        threat_total, threat_compensation = 0.0, 0.0
         budget = target_threat * 1.1  # small leeway to keep encounters varied
-        slots: Iterable[EncounterSlot] = definition.weighted_slots() or definition.slots
+        if slots is None:
+            slots = definition.weighted_slots() or definition.slots
 
         for slot in slots:
             entity = entity_lookup.get(slot.entity_id)
             if entity is None:
                 continue
 
+            entity_threat = threat[entity.id] if threat is not None else entity.threat_rating
             count = self._pick_count(slot, rng)
             for _ in range(count):
                 if planned:
-                    accumulated_threat = sum(e.threat_rating for e in planned)
+                    accumulated_threat = threat_total + threat_compensation if threat_compensation else threat_total
                     if accumulated_threat >= budget:
                         break
                 planned.append(entity)
+                threat_total, threat_compensation = _add_threat(threat_total, threat_compensation, entity_threat)
 
         if planned:
             return planned
@@ -95,6 +119,7 @@ class EncounterPlanner:
         seed: int,
         faction_bias: Optional[str] = None,
         max_enemies: int = 3,
+        sampling_mode: str = LEGACY,
     ) -> tuple[Optional[EncounterDefinition], List[Entity]]:
         """Select a deterministic set of entities matching the provided constraints."""
 
@@ -110,7 +135,7 @@ class EncounterPlanner:
             return None, []
 
         entity_lookup = self._load_entities(applicable)
-        chosen = self._pick_definition(applicable, player_level, faction_bias, rng)
+        chosen = self._pick_definition(applicable, player_level, faction_bias, rng, sampling_mode)
         if not chosen:
             return None, []
 
@@ -118,6 +143,24 @@ class EncounterPlanner:
         enemies = self._assemble_for_definition(chosen, entity_lookup, rng, threat_budget)
         return chosen, enemies[:max_enemies]
 
+    def plan_from_table(
+        self, table, seed: int, max_enemies: int = 3, sampling_mode: str = LEGACY
+    ) -> tuple[Optional[EncounterDefinition], List[Entity]]:
+        """Same draw as ``plan_encounter`` against a ``CompiledEncounterTable`` for this context."""
+        rng = random.Random(seed)
+        if not table.definitions:
+            return None, []
+        if sampling_mode == ALIAS:
+            index = table.alias.draw(rng)
+        else:
+            index = rng.choices(range(len(table.definitions)), cum_weights=table.cum_weights, k=1)[0]
+        chosen = table.definitions[index]
+        threat_budget = max(table.player_level * 7, 5)
+        enemies = self._assemble_for_definition(
+            chosen, table.entity_lookup, rng, threat_budget, slots=table.slots[index], threat=table.threat
+        )
+        return chosen, enemies[:max_enemies]
+
 
 _BIOME_HAZARDS: dict[str, tuple[str, ...]] = {
     "tundra": ("Extreme Cold", "Whiteout Winds", "Thin Ice"),
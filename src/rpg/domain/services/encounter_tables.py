@@ -0,0 +1,134 @@
+"""Encounter tables compiled once per (location, player level, faction bias).
+
+``EncounterService.generate_plan`` used to re-list definitions, reload their
+entities with ``get_many``, re-score every definition and re-query the location
+and level-band fallback pools on every explore step.  A ``CompiledEncounterTable``
+holds all of that for one planning context: the applicable definitions with
+cumulative ``_score_definition`` weights, expanded slot lists, the entity lookup
+with precomputed threat ratings, and both band-filtered fallback pools.
+Planning is then a seeded draw against the table.
+
+Legacy draws use cumulative weights with ``Random.choices``, which consumes
+the RNG exactly as the per-call weights did, so existing seeded encounters are
+unchanged; worlds on the ``alias`` sampling mode draw from the table's prebuilt
+alias table instead.  Tables are dropped when either repository's ``revision`` moves
+(entity imports, location attachments) or on ``invalidate``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Dict, Optional, Tuple
+
+from rpg.domain.models.encounter_definition import EncounterDefinition, EncounterSlot
+from rpg.domain.models.entity import Entity
+from rpg.domain.repositories import EncounterDefinitionRepository, EntityRepository
+from rpg.domain.services.encounter_planner import EncounterPlanner
+from rpg.domain.services.weighted_sampling import AliasTable, alias_table
+
+_MAX_TABLES = 1024
+
+TableKey = Tuple[int, int, Optional[str]]
+
+
+@dataclass(frozen=True)
+class CompiledEncounterTable:
+    location_id: int
+    player_level: int
+    faction_bias: Optional[str]
+    definitions: Tuple[EncounterDefinition, ...] = ()
+    cum_weights: Tuple[float, ...] = ()
+    alias: Optional[AliasTable] = None
+    slots: Tuple[Tuple[EncounterSlot, ...], ...] = ()
+    entity_lookup: Dict[int, Entity] = field(default_factory=dict)
+    threat: Dict[int, float] = field(default_factory=dict)
+    location_pool: Tuple[Entity, ...] = ()
+    level_band_pool: Tuple[Entity, ...] = ()
+
+
+class EncounterTableCompiler:
+    def __init__(self, planner: EncounterPlanner) -> None:
+        self.planner = planner
+        self._tables: Dict[TableKey, CompiledEncounterTable] = {}
+        self._entity_repo: EntityRepository | None = None
+        self._definition_repo: EncounterDefinitionRepository | None = None
+        self._revisions: tuple = ()
+        self.compiled = 0
+
+    def invalidate(self, location_id: int | None = None) -> None:
+        if location_id is None:
+            self._tables.clear()
+            return
+        for key in [key for key in self._tables if key[0] == int(location_id)]:
+            del self._tables[key]
+
+    def table_for(
+        self,
+        *,
+        entity_repo: EntityRepository,
+        definition_repo: EncounterDefinitionRepository | None,
+        location_id: int,
+        player_level: int,
+        faction_bias: Optional[str],
+        level_bounds: Tuple[int, int],
+    ) -> CompiledEncounterTable:
+        revisions = (getattr(entity_repo, "revision", 0), getattr(definition_repo, "revision", 0))
+        if self._entity_repo is not entity_repo or self._definition_repo is not definition_repo or self._revisions != revisions:
+            self._tables.clear()
+            self._entity_repo, self._definition_repo, self._revisions = entity_repo, definition_repo, revisions
+        key = (int(location_id), int(player_level), faction_bias)
+        table = self._tables.get(key)
+        if table is None:
+            if len(self._tables) >= _MAX_TABLES:
+                self._tables.clear()
+            table = self._compile(entity_repo, definition_repo, key, level_bounds)
+            self._tables[key] = table
+        return table
+
+    def _compile(
+        self,
+        entity_repo: EntityRepository,
+        definition_repo: EncounterDefinitionRepository | None,
+        key: TableKey,
+        level_bounds: Tuple[int, int],
+    ) -> CompiledEncounterTable:
+        location_id, player_level, faction_bias = key
+        self.compiled += 1
+        level_min, level_max = level_bounds
+
+        def _in_band(rows) -> Tuple[Entity, ...]:
+            return tuple(entity for entity in rows if level_min <= int(getattr(entity, "level", 1) or 1) <= level_max)
+
+        applicable: list[EncounterDefinition] = []
+        if definition_repo is not None:
+            definitions = definition_repo.list_for_location(location_id)
+            if not definitions:
+                definitions = definition_repo.list_global()
+            applicable = [
+                definition
+                for definition in definitions
+                if definition.matches_level(player_level) and definition.applies_to_location(location_id)
+            ]
+        entity_lookup = self.planner._load_entities(applicable) if applicable else {}
+        weights = [self.planner._score_definition(definition, player_level, faction_bias) for definition in applicable]
+
+        by_location = entity_repo.list_by_location(location_id)
+        if callable(getattr(entity_repo, "list_by_level_band", None)):
+            band = entity_repo.list_by_level_band(level_min, level_max)
+        else:
+            mid = (level_min + level_max) // 2
+            band = entity_repo.list_for_level(mid, tolerance=level_max - mid)
+        return CompiledEncounterTable(
+            location_id=location_id,
+            player_level=player_level,
+            faction_bias=faction_bias,
+            definitions=tuple(applicable),
+            cum_weights=tuple(accumulate(weights)),
+            alias=alias_table(weights) if weights else None,
+            slots=tuple(tuple(definition.weighted_slots() or definition.slots) for definition in applicable),
+            entity_lookup=entity_lookup,
+            threat={entity_id: entity.threat_rating for entity_id, entity in entity_lookup.items()},
+            location_pool=_in_band(by_location or ()),
+            level_band_pool=tuple(band or ()),
+        )
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+from rpg.domain.models.location import Location
+
+
+DEFAULT_CELL_SIZE = 150.0
+
+
+def location_coordinates(location: Location) -> tuple[float, float]:
+    return (
+        float(getattr(location, "x", 0.0) or 0.0),
+        float(getattr(location, "y", 0.0) or 0.0),
+    )
+
+
+def within_radius(x: float, y: float, location: Location, radius: float) -> bool:
+    loc_x, loc_y = location_coordinates(location)
+    return math.sqrt((loc_x - float(x)) ** 2 + (loc_y - float(y)) ** 2) <= float(radius)
+
+
+class LocationSpatialIndex:
+    """Uniform grid over location coordinates for radius lookups.
+
+    Results keep the order in which locations were first indexed, so callers
+    that previously filtered ``list_all()`` see the same sequence.
+    """
+
+    __slots__ = ("_cell_size", "_cells", "_entries", "_next_order")
+
+    def __init__(self, locations: Iterable[Location] = (), cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        size = float(cell_size)
+        if size <= 0.0 or not math.isfinite(size):
+            raise ValueError("cell_size must be a positive finite number")
+        self._cell_size = size
+        self._cells: dict[tuple[int, int], dict[int, None]] = {}
+        self._entries: dict[int, tuple[int, tuple[int, int], Location]] = {}
+        self._next_order = 0
+        for location in locations:
+            self.add(location)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, location_id: object) -> bool:
+        return location_id in self._entries
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self._cell_size), math.floor(y / self._cell_size))
+
+    def add(self, location: Location) -> None:
+        """Insert or re-position a location; re-adding keeps its original order."""
+        location_id = int(location.id)
+        cell = self._cell_of(*location_coordinates(location))
+        existing = self._entries.get(location_id)
+        if existing is not None:
+            order, old_cell, _ = existing
+            if old_cell != cell:
+                self._discard_from_cell(old_cell, location_id)
+        else:
+            order = self._next_order
+            self._next_order += 1
+        self._cells.setdefault(cell, {})[location_id] = None
+        self._entries[location_id] = (order, cell, location)
+
+    def remove(self, location_id: int) -> None:
+        existing = self._entries.pop(int(location_id), None)
+        if existing is not None:
+            self._discard_from_cell(existing[1], int(location_id))
+
+    def rebuild(self, locations: Iterable[Location]) -> None:
+        self._cells.clear()
+        self._entries.clear()
+        self._next_order = 0
+        for location in locations:
+            self.add(location)
+
+    def _discard_from_cell(self, cell: tuple[int, int], location_id: int) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            return
+        bucket.pop(location_id, None)
+        if not bucket:
+            del self._cells[cell]
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[Location]:
+        """Return locations whose distance to ``(x, y)`` is at most ``radius``."""
+        radius = float(radius)
+        if radius < 0.0 or not self._entries:
+            return []
+        x = float(x)
+        y = float(y)
+        min_cx, min_cy = self._cell_of(x - radius, y - radius)
+        max_cx, max_cy = self._cell_of(x + radius, y + radius)
+        span = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+        entries = self._entries
+        hits: list[tuple[int, Location]] = []
+        if span >= len(self._cells):
+            candidate_ids: Iterable[int] = entries.keys()
+        else:
+            candidate_ids = [
+                location_id
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)
+                for location_id in self._cells.get((cx, cy), ())
+            ]
+        for location_id in candidate_ids:
+            order, _, location = entries[location_id]
+            if within_radius(x, y, location, radius):
+                hits.append((order, location))
+        hits.sort(key=lambda row: row[0])
+        return [location for _, location in hits]
@@ -0,0 +1,118 @@
+"""Weighted sampling shared by encounter planning and monster picks.
+
+Two modes exist.  ``legacy`` is ``Random.choices`` over freshly built weight
+lists, which every seeded save so far was generated with.  ``alias`` draws from
+prebuilt Vose alias tables in O(1) per pick and samples without replacement
+with Efraimidis-Spirakis keys in a single pass.  ``sample_without_replacement``
+exists only for ``alias``; legacy multi-picks stay in
+``EncounterService._weighted_pick``, whose draws saves were made with.  A world opts in by storing
+``flags["sampling_mode"] = "alias"``; worlds without the flag stay on
+``legacy`` and replay exactly as before.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+from typing import Mapping, Sequence, TypeVar
+
+T = TypeVar("T")
+
+SAMPLING_MODE_FLAG = "sampling_mode"
+LEGACY = "legacy"
+ALIAS = "alias"
+SAMPLING_MODES = (LEGACY, ALIAS)
+
+_MAX_ALIAS_TABLES = 4096
+_ALIAS_TABLES: dict[tuple[float, ...], "AliasTable"] = {}
+
+
+def sampling_mode_for(flags: Mapping[str, object] | None) -> str:
+    """Return the sampling mode stored in world ``flags``; unknown or missing values mean ``legacy``."""
+    if not isinstance(flags, Mapping):
+        return LEGACY
+    mode = str(flags.get(SAMPLING_MODE_FLAG, LEGACY) or LEGACY).strip().lower()
+    return mode if mode in SAMPLING_MODES else LEGACY
+
+
+class AliasTable:
+    """Vose alias table over non-negative weights; ``draw`` costs one ``rng.random()``."""
+
+    __slots__ = ("size", "_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        cleaned = [max(0.0, float(weight)) for weight in weights]
+        total = sum(cleaned)
+        if not cleaned or total <= 0.0:
+            raise ValueError("alias table needs at least one positive weight")
+        size = len(cleaned)
+        scaled = [weight * size / total for weight in cleaned]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+        self.size = size
+        self._prob = prob
+        self._alias = alias
+
+    def draw(self, rng: random.Random) -> int:
+        roll = rng.random() * self.size
+        index = min(int(roll), self.size - 1)
+        if roll - index < self._prob[index]:
+            return index
+        return self._alias[index]
+
+
+def alias_table(weights: Sequence[float]) -> AliasTable:
+    """Return a shared ``AliasTable`` for ``weights``, built once per distinct weight vector."""
+    key = tuple(float(weight) for weight in weights)
+    table = _ALIAS_TABLES.get(key)
+    if table is None:
+        if len(_ALIAS_TABLES) >= _MAX_ALIAS_TABLES:
+            _ALIAS_TABLES.clear()
+        table = AliasTable(key)
+        _ALIAS_TABLES[key] = table
+    return table
+
+
+def weighted_index(weights: Sequence[float], rng: random.Random, mode: str = LEGACY) -> int:
+    if mode == ALIAS:
+        return alias_table(weights).draw(rng)
+    return rng.choices(range(len(weights)), weights=weights, k=1)[0]
+
+
+def weighted_choice(items: Sequence[T], weights: Sequence[float], rng: random.Random, mode: str = LEGACY) -> T:
+    """Pick one item; ``legacy`` matches ``rng.choices(items, weights=weights, k=1)[0]`` draw for draw."""
+    return items[weighted_index(weights, rng, mode)]
+
+
+def sample_without_replacement(
+    items: Sequence[T],
+    weights: Sequence[float],
+    k: int,
+    rng: random.Random,
+) -> list[T]:
+    """Pick up to ``k`` distinct positions of ``items`` with probability proportional to weight.
+
+    Draws one key per item and keeps the ``k`` largest, O(n log k) overall;
+    items with a non-positive weight are never returned.
+    """
+    count = min(max(0, int(k)), len(items))
+    if count == 0:
+        return []
+    keys = [
+        rng.random() ** (1.0 / float(weight)) if float(weight) > 0.0 else -1.0
+        for weight in weights
+    ]
+    order = heapq.nlargest(count, range(len(items)), key=keys.__getitem__)
+    return [items[index] for index in order if keys[index] >= 0.0]
@@ -1,7 +1,11 @@
 import json
 import os
 import shutil
+import sqlite3
+import threading
 import time
+import zlib
+from collections import OrderedDict
 from hashlib import sha1
 from pathlib import Path
 from typing import Any
@@ -9,9 +13,24 @@ from typing import Any
 
 DEFAULT_CONTENT_DATA_VERSION = "0.1.0"
 _MANIFEST_FILENAME = "manifest.json"
+_SQLITE_FILENAME = "content.sqlite3"
+CONTENT_CACHE_BACKENDS = ("file", "sqlite")
+DEFAULT_MEMORY_CACHE_BYTES = 8 * 1024 * 1024
 
 
-class FileContentCache:
+def _is_fresh(stored_at: Any, *, ttl_seconds: int | None, allow_stale: bool, now: int | None = None) -> bool:
+    if allow_stale or ttl_seconds is None:
+        return True
+    try:
+        age_seconds = int(time.time() if now is None else now) - int(stored_at)
+    except Exception:
+        return False
+    return age_seconds <= max(0, int(ttl_seconds))
+
+
+class _VersionedCacheRoot:
+    """Cache directory guarded by a ``manifest.json`` data_version; a mismatch wipes the directory."""
+
     def __init__(self, root_dir: str | Path, *, data_version: str | None = None) -> None:
         self.root_dir = Path(root_dir)
         configured_version = str(data_version or os.getenv("RPG_CONTENT_DATA_VERSION", DEFAULT_CONTENT_DATA_VERSION)).strip()
@@ -50,6 +69,8 @@ class FileContentCache:
         tmp_path.write_text(json.dumps(envelope, ensure_ascii=False), encoding="utf-8")
         os.replace(tmp_path, self._manifest_path)
 
+
+class FileContentCache(_VersionedCacheRoot):
     def _path_for_key(self, cache_key: str) -> Path:
         key_hash = sha1(cache_key.encode("utf-8")).hexdigest()
         return self.root_dir / f"{key_hash}.json"
@@ -94,13 +115,8 @@ class FileContentCache:
 
         return removed
 
-    def get(
-        self,
-        cache_key: str,
-        *,
-        ttl_seconds: int | None,
-        allow_stale: bool = False,
-    ) -> dict[str, Any] | None:
+    def get_entry(self, cache_key: str) -> tuple[int | None, dict[str, Any]] | None:
+        """Raw ``(stored_at, payload)`` for ``cache_key`` regardless of age."""
         path = self._path_for_key(cache_key)
         if not path.exists():
             return None
@@ -110,18 +126,274 @@ class FileContentCache:
             return None
         if not isinstance(envelope, dict):
             return None
-        stored_at = envelope.get("stored_at")
         payload = envelope.get("payload")
         if not isinstance(payload, dict):
             return None
-        if allow_stale:
-            return payload
-        if ttl_seconds is None:
+        return envelope.get("stored_at"), payload
+
+    def get(
+        self,
+        cache_key: str,
+        *,
+        ttl_seconds: int | None,
+        allow_stale: bool = False,
+    ) -> dict[str, Any] | None:
+        entry = self.get_entry(cache_key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if _is_fresh(stored_at, ttl_seconds=ttl_seconds, allow_stale=allow_stale):
             return payload
+        return None
+
+
+class SqliteContentCache(_VersionedCacheRoot):
+    """Content cache in a single SQLite file next to the manifest.
+
+    Payloads are stored zlib-compressed, keyed by cache key, with an index on
+    ``stored_at`` so ``sweep_expired`` is a single indexed DELETE.  Each thread
+    gets its own connection; the database runs in WAL mode so concurrent
+    prewarm workers can read while another writes.
+    """
+
+    def __init__(self, root_dir: str | Path, *, data_version: str | None = None) -> None:
+        super().__init__(root_dir, data_version=data_version)
+        self.db_path = self.root_dir / _SQLITE_FILENAME
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS content_entries ("
+                "cache_key TEXT PRIMARY KEY, stored_at INTEGER NOT NULL, payload BLOB NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS content_entries_stored_at ON content_entries (stored_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @staticmethod
+    def _encode(payload: dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def set(self, cache_key: str, payload: dict[str, Any]) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO content_entries (cache_key, stored_at, payload) VALUES (?, ?, ?)",
+                (cache_key, int(time.time()), self._encode(payload)),
+            )
+
+    def sweep_expired(self, *, max_age_seconds: int) -> int:
+        cutoff = int(time.time()) - max(0, int(max_age_seconds))
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute("DELETE FROM content_entries WHERE stored_at < ?", (cutoff,))
+        return max(0, int(cursor.rowcount))
+
+    def get_entry(self, cache_key: str) -> tuple[int | None, dict[str, Any]] | None:
+        """Raw ``(stored_at, payload)`` for ``cache_key`` regardless of age."""
+        row = self._connection().execute(
+            "SELECT stored_at, payload FROM content_entries WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None:
+            return None
+        stored_at, blob = row
         try:
-            age_seconds = int(time.time()) - int(stored_at)
+            payload = self._decode(blob)
         except Exception:
             return None
-        if age_seconds <= max(0, int(ttl_seconds)):
+        if not isinstance(payload, dict):
+            return None
+        return stored_at, payload
+
+    def get(
+        self,
+        cache_key: str,
+        *,
+        ttl_seconds: int | None,
+        allow_stale: bool = False,
+    ) -> dict[str, Any] | None:
+        entry = self.get_entry(cache_key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if _is_fresh(stored_at, ttl_seconds=ttl_seconds, allow_stale=allow_stale):
             return payload
         return None
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+
+class TieredContentCache:
+    """Bounded in-memory LRU in front of a disk content cache.
+
+    Entries are kept as their JSON text, so the byte budget is exact and every
+    hit hands the caller a fresh dict just like a disk read.  ``get`` answers
+    from memory while the entry's original ``stored_at`` is within the TTL,
+    otherwise it falls through to the disk tier and promotes what it finds.
+    ``set`` writes through to disk.  Hit/miss counters are kept per tier and
+    evictions for the memory tier; see ``stats``.
+    """
+
+    def __init__(self, backing, *, max_bytes: int = DEFAULT_MEMORY_CACHE_BYTES) -> None:
+        self.backing = backing
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[str, tuple[int | None, str]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.memory_evictions = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    @property
+    def root_dir(self) -> Path:
+        return self.backing.root_dir
+
+    @property
+    def data_version(self) -> str:
+        return self.backing.data_version
+
+    def _remember(self, cache_key: str, stored_at: int | None, payload: dict[str, Any]) -> None:
+        try:
+            encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        except Exception:
+            return
+        size = len(encoded)
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= len(previous[1])
+            if size > self.max_bytes:
+                return
+            self._entries[cache_key] = (stored_at, encoded)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.memory_evictions += 1
+
+    def set(self, cache_key: str, payload: dict[str, Any]) -> None:
+        self.backing.set(cache_key, payload)
+        self._remember(cache_key, int(time.time()), payload)
+
+    def get(
+        self,
+        cache_key: str,
+        *,
+        ttl_seconds: int | None,
+        allow_stale: bool = False,
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and _is_fresh(entry[0], ttl_seconds=ttl_seconds, allow_stale=allow_stale):
+                self._entries.move_to_end(cache_key)
+                self.memory_hits += 1
+            else:
+                entry = None
+                self.memory_misses += 1
+        if entry is not None:
+            return json.loads(entry[1])
+
+        disk_entry = self.backing.get_entry(cache_key)
+        if disk_entry is None:
+            with self._lock:
+                self.disk_misses += 1
+            return None
+        stored_at, payload = disk_entry
+        self._remember(cache_key, stored_at, payload)
+        if not _is_fresh(stored_at, ttl_seconds=ttl_seconds, allow_stale=allow_stale):
+            with self._lock:
+                self.disk_misses += 1
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        return payload
+
+    def get_entry(self, cache_key: str) -> tuple[int | None, dict[str, Any]] | None:
+        return self.backing.get_entry(cache_key)
+
+    def sweep_expired(self, *, max_age_seconds: int) -> int:
+        now = int(time.time())
+        with self._lock:
+            for cache_key, (stored_at, encoded) in list(self._entries.items()):
+                if not _is_fresh(stored_at, ttl_seconds=max_age_seconds, allow_stale=False, now=now):
+                    del self._entries[cache_key]
+                    self._bytes -= len(encoded)
+        return self.backing.sweep_expired(max_age_seconds=max_age_seconds)
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                "memory": {
+                    "hits": self.memory_hits,
+                    "misses": self.memory_misses,
+                    "evictions": self.memory_evictions,
+                    "entries": len(self._entries),
+                    "bytes": self._bytes,
+                    "max_bytes": self.max_bytes,
+                },
+                "disk": {"hits": self.disk_hits, "misses": self.disk_misses},
+            }
+
+    def close(self) -> None:
+        self.clear_memory()
+        close = getattr(self.backing, "close", None)
+        if callable(close):
+            close()
+
+
+def create_content_cache(
+    root_dir: str | Path,
+    *,
+    backend: str | None = None,
+    data_version: str | None = None,
+    memory_bytes: int | None = None,
+) -> FileContentCache | SqliteContentCache | TieredContentCache:
+    """Build the content cache for ``backend`` (``RPG_CONTENT_CACHE_BACKEND``, default ``file``).
+
+    Unless ``memory_bytes`` (``RPG_CONTENT_MEMORY_CACHE_BYTES``) is 0 the disk
+    cache is fronted by a ``TieredContentCache`` of that many bytes.
+    """
+    selected = str(backend or os.getenv("RPG_CONTENT_CACHE_BACKEND", "file")).strip().lower() or "file"
+    if selected not in CONTENT_CACHE_BACKENDS:
+        raise ValueError(f"Unsupported content cache backend '{selected}'. Choose from: {', '.join(CONTENT_CACHE_BACKENDS)}")
+    if selected == "sqlite":
+        disk_cache = SqliteContentCache(root_dir, data_version=data_version)
+    else:
+        disk_cache = FileContentCache(root_dir, data_version=data_version)
+    if memory_bytes is None:
+        memory_bytes = int(os.getenv("RPG_CONTENT_MEMORY_CACHE_BYTES", str(DEFAULT_MEMORY_CACHE_BYTES)))
+    if memory_bytes <= 0:
+        return disk_cache
+    return TieredContentCache(disk_cache, max_bytes=memory_bytes)
@@ -1,7 +1,48 @@
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, Callable
 
+from rpg.infrastructure.resilient_http import circuit_is_open
+
+
+class _InFlightFetch:
+    """Outcome of one provider fetch shared with callers that asked for the same key meanwhile."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.payload: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """A fresh instance of ``error`` so each waiting caller raises (and tracebacks) its own."""
+    try:
+        return copy.copy(error)
+    except Exception:
+        # Exceptions with keyword-only constructor arguments (httpx's) cannot be
+        # rebuilt from ``args``; copy their attributes onto a bare instance instead.
+        clone = type(error).__new__(type(error))
+        clone.__dict__.update(getattr(error, "__dict__", {}))
+        clone.args = error.args
+        return clone
+
+
+def _provider_circuit_open(provider) -> bool:
+    http_client = getattr(provider, "client", None)
+    return http_client is not None and circuit_is_open(http_client)
+
 
 class FallbackContentClient:
+    """Cache-first content client that walks its providers in order.
+
+    With ``stale_while_revalidate`` an expired cache entry is returned at once
+    and refreshed on a small background pool (``refresh_workers`` threads, at
+    most ``max_pending_refreshes`` keys queued, one refresh per key).  Refreshes
+    skip providers whose HTTP circuit breaker is open and are not scheduled at
+    all while every provider's circuit is open.
+    """
+
     def __init__(
         self,
         cache,
@@ -9,9 +50,16 @@ class FallbackContentClient:
         fallback_client=None,
         cache_ttl_seconds: int = 86400,
         providers: list[object] | None = None,
+        *,
+        stale_while_revalidate: bool = False,
+        refresh_workers: int = 2,
+        max_pending_refreshes: int = 64,
     ) -> None:
         self.cache = cache
         self.cache_ttl_seconds = cache_ttl_seconds
+        self.stale_while_revalidate = bool(stale_while_revalidate)
+        self.refresh_workers = max(1, int(refresh_workers))
+        self.max_pending_refreshes = max(1, int(max_pending_refreshes))
         if providers is not None:
             self.providers = list(providers)
         else:
@@ -25,6 +73,16 @@ class FallbackContentClient:
         if not self.providers:
             raise ValueError("FallbackContentClient requires at least one provider")
 
+        self._in_flight: dict[str, _InFlightFetch] = {}
+        self._in_flight_lock = threading.Lock()
+        self.coalesced_requests = 0
+        self._refresh_pool: ThreadPoolExecutor | None = None
+        self._refreshing: dict[str, Future] = {}
+        self._refresh_lock = threading.Lock()
+        self.refreshes_scheduled = 0
+        self.refreshes_skipped = 0
+        self.refreshes_failed = 0
+
     def _cache_key(self, method_name: str, **kwargs: Any) -> str:
         bits = [method_name]
         for key in sorted(kwargs.keys()):
@@ -54,6 +112,83 @@ class FallbackContentClient:
         if cached is not None:
             return cached
 
+        if self.stale_while_revalidate:
+            stale_payload = self._read_stale_cache(cache_key)
+            if stale_payload is not None:
+                self._schedule_refresh(method_name, cache_key, kwargs)
+                return stale_payload
+
+        # Coalesce concurrent misses: the first caller fetches, the rest wait for
+        # its outcome and get their own copy of the payload or error.
+        with self._in_flight_lock:
+            flight = self._in_flight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = _InFlightFetch()
+                self._in_flight[cache_key] = flight
+            else:
+                self.coalesced_requests += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise _copy_error(flight.error) from flight.error
+            return copy.deepcopy(flight.payload)
+
+        try:
+            flight.payload = self._fetch_and_store(method_name, cache_key, kwargs)
+            return flight.payload
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(cache_key, None)
+            flight.done.set()
+
+    def _schedule_refresh(self, method_name: str, cache_key: str, kwargs: dict[str, Any]) -> None:
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            if len(self._refreshing) >= self.max_pending_refreshes or all(
+                _provider_circuit_open(provider) for provider in self.providers
+            ):
+                self.refreshes_skipped += 1
+                return
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers, thread_name_prefix="content-refresh"
+                )
+            self.refreshes_scheduled += 1
+            future = self._refresh_pool.submit(self._refresh, method_name, cache_key, dict(kwargs))
+            self._refreshing[cache_key] = future
+        future.add_done_callback(lambda _future: self._refresh_finished(cache_key))
+
+    def _refresh_finished(self, cache_key: str) -> None:
+        with self._refresh_lock:
+            self._refreshing.pop(cache_key, None)
+
+    def _refresh(self, method_name: str, cache_key: str, kwargs: dict[str, Any]) -> None:
+        for provider in self.providers:
+            if _provider_circuit_open(provider):
+                continue
+            try:
+                payload = getattr(provider, method_name)(**kwargs)
+            except Exception:
+                continue
+            if isinstance(payload, dict):
+                self._write_cache(cache_key, payload)
+                return
+        with self._refresh_lock:
+            self.refreshes_failed += 1
+
+    def wait_for_refreshes(self, timeout: float | None = None) -> bool:
+        """Block until scheduled background refreshes finish; ``False`` on timeout."""
+        with self._refresh_lock:
+            pending = list(self._refreshing.values())
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def _fetch_and_store(self, method_name: str, cache_key: str, kwargs: dict[str, Any]) -> dict[str, Any]:
         fetchers: list[Callable[[], dict[str, Any]]] = []
         for provider in self.providers:
             fetchers.append(lambda provider=provider: getattr(provider, method_name)(**kwargs))
@@ -110,6 +245,10 @@ class FallbackContentClient:
         )
 
     def close(self) -> None:
+        with self._refresh_lock:
+            pool, self._refresh_pool = self._refresh_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
         for client in self.providers:
             try:
                 client.close()
@@ -1,8 +1,15 @@
 import os
-
-from rpg.infrastructure.content_cache import FileContentCache
+from functools import partial
+
+from rpg.infrastructure.content_cache import (
+    FileContentCache,
+    SqliteContentCache,
+    TieredContentCache,
+    create_content_cache,
+)
 from rpg.infrastructure.content_provider_client import FallbackContentClient
 from rpg.infrastructure.dnd5e_client import DnD5eClient
+from rpg.infrastructure.http_client_pool import HttpClientPool
 from rpg.infrastructure.local_srd_provider import LocalSrdProvider
 from rpg.infrastructure.open5e_client import Open5eClient
 
@@ -12,7 +19,7 @@ def _is_truthy(value: str | None, *, default: str = "0") -> bool:
     return normalized in {"1", "true", "yes"}
 
 
-def _base_clients() -> tuple[LocalSrdProvider, DnD5eClient, Open5eClient, FileContentCache, int]:
+def _base_clients(pool: HttpClientPool | None = None) -> tuple[LocalSrdProvider, DnD5eClient, Open5eClient, FileContentCache | SqliteContentCache | TieredContentCache, int]:
     timeout = float(os.getenv("RPG_CONTENT_TIMEOUT_S", "10"))
     retries = int(os.getenv("RPG_CONTENT_RETRIES", "2"))
     backoff_seconds = float(os.getenv("RPG_CONTENT_BACKOFF_S", "0.2"))
@@ -21,15 +28,26 @@ def _base_clients() -> tuple[LocalSrdProvider, DnD5eClient, Open5eClient, FileCo
     local_dir = os.getenv("RPG_LOCAL_SRD_DIR", "data/srd/2014")
     local_page_size = int(os.getenv("RPG_LOCAL_SRD_PAGE_SIZE", "50"))
 
-    cache = FileContentCache(cache_dir)
+    cache = create_content_cache(cache_dir)
     local = LocalSrdProvider(root_dir=local_dir, page_size=local_page_size)
-    dnd5e = DnD5eClient(timeout=timeout, retries=retries, backoff_seconds=backoff_seconds)
-    open5e = Open5eClient(timeout=timeout, retries=retries, backoff_seconds=backoff_seconds)
+    # Without a pool each provider opens (and closes) its own client.
+    dnd5e = DnD5eClient(
+        timeout=timeout,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        http_client=pool.client_for(DnD5eClient.BASE_URL, timeout=timeout) if pool is not None else None,
+    )
+    open5e = Open5eClient(
+        timeout=timeout,
+        retries=retries,
+        backoff_seconds=backoff_seconds,
+        http_client=pool.client_for(Open5eClient.BASE_URL, timeout=timeout) if pool is not None else None,
+    )
     return local, dnd5e, open5e, cache, cache_ttl_seconds
 
 
-def create_runtime_content_client() -> FallbackContentClient:
-    local, dnd5e, open5e, cache, cache_ttl_seconds = _base_clients()
+def create_runtime_content_client(pool: HttpClientPool | None = None) -> FallbackContentClient:
+    local, dnd5e, open5e, cache, cache_ttl_seconds = _base_clients(pool)
     local_enabled = _is_truthy(os.getenv("RPG_LOCAL_SRD_ENABLED"), default="1")
     runtime_remote_enabled = _is_truthy(os.getenv("RPG_CONTENT_RUNTIME_REMOTE_ENABLED"), default="0")
 
@@ -45,11 +63,13 @@ def create_runtime_content_client() -> FallbackContentClient:
         providers=providers,
         cache=cache,
         cache_ttl_seconds=cache_ttl_seconds,
+        stale_while_revalidate=_is_truthy(os.getenv("RPG_CONTENT_STALE_WHILE_REVALIDATE"), default="0"),
+        refresh_workers=int(os.getenv("RPG_CONTENT_REFRESH_WORKERS", "2")),
     )
 
 
-def create_import_content_client() -> FallbackContentClient:
-    local, dnd5e, open5e, cache, cache_ttl_seconds = _base_clients()
+def create_import_content_client(pool: HttpClientPool | None = None) -> FallbackContentClient:
+    local, dnd5e, open5e, cache, cache_ttl_seconds = _base_clients(pool)
     include_local = _is_truthy(os.getenv("RPG_IMPORT_INCLUDE_LOCAL_SRD"), default="1")
     providers = [dnd5e, open5e]
     if include_local:
@@ -66,5 +86,7 @@ def create_content_client() -> FallbackContentClient:
     return create_runtime_content_client()
 
 
-def create_content_client_factory():
-    return create_runtime_content_client
+def create_content_client_factory(pool: HttpClientPool | None = None):
+    if pool is None:
+        return create_runtime_content_client
+    return partial(create_runtime_content_client, pool)
@@ -0,0 +1,45 @@
+"""Build the compact local SRD artifact read by ``LocalSrdProvider``.
+
+Usage:
+    python -m rpg.infrastructure.data_tools.build_compiled_srd
+    python -m rpg.infrastructure.data_tools.build_compiled_srd --srd-dir data/srd/2014 --output .rpg_cache/srd.compiled.pickle
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from rpg.infrastructure.local_srd_provider import SRD_KINDS, compile_local_srd_dataset
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compile local SRD JSON files into a memory-mappable artifact")
+    parser.add_argument(
+        "--srd-dir",
+        default=os.getenv("RPG_LOCAL_SRD_DIR", "data/srd/2014"),
+        help="Directory containing <kind>.json SRD files",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Artifact path (defaults to srd.compiled.pickle inside --srd-dir)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    srd_dir = Path(args.srd_dir)
+    output = compile_local_srd_dataset(srd_dir, args.output)
+    kinds = [kind for kind in SRD_KINDS if (srd_dir / f"{kind}.json").exists()]
+    print(f"Compiled SRD written to {output}")
+    print(f"Kinds: {', '.join(kinds) if kinds else 'none'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
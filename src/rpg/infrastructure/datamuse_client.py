@@ -21,6 +21,7 @@ class DatamuseClient:
     ) -> None:
         self._retries = retries
         self._backoff_seconds = backoff_seconds
+        self._owns_client = http_client is None
         self.client = http_client or httpx.Client(base_url=base_url, timeout=timeout)
 
     def related_adjectives(self, noun: str, max_words: int = 8) -> list[str]:
@@ -47,4 +48,5 @@ class DatamuseClient:
         return words
 
     def close(self) -> None:
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
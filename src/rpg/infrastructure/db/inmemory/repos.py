@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 from rpg.domain.models.character import Character
 from rpg.domain.models.character_class import CharacterClass
 from rpg.domain.services.class_progression_catalog import ClassProgressionRow, progression_rows_for_class
+from rpg.domain.services.location_spatial_index import LocationSpatialIndex
 from rpg.domain.models.entity import Entity
 from rpg.domain.models.location import Location
 from rpg.domain.models.world import World
@@ -255,6 +256,7 @@ class InMemoryEntityRepository(EntityRepository):
 
     def set_location_entities(self, location_id: int, entity_ids: List[int]) -> None:
         self._by_location[location_id] = entity_ids
+        self.revision += 1
 
     def list_by_level_band(self, level_min: int, level_max: int) -> List[Entity]:
         return [e for e in self._entities if level_min <= e.level <= level_max]
@@ -263,6 +265,7 @@ class InMemoryEntityRepository(EntityRepository):
 class InMemoryLocationRepository(LocationRepository):
     def __init__(self, locations: Dict[int, Location]) -> None:
         self._locations = dict(locations)
+        self._spatial_index = LocationSpatialIndex(self._locations.values())
 
     def get(self, location_id: int) -> Location | None:
         return self._locations.get(location_id)
@@ -270,6 +273,9 @@ class InMemoryLocationRepository(LocationRepository):
     def list_all(self) -> List[Location]:
         return list(self._locations.values())
 
+    def list_within_radius(self, x: float, y: float, radius: float) -> List[Location]:
+        return self._spatial_index.query_radius(x, y, radius)
+
     def get_starting_location(self) -> Optional[Location]:
         if not self._locations:
             return None
@@ -15,6 +15,7 @@ from rpg.domain.models.location import HazardProfile, Location
 from rpg.domain.models.quest import QuestObjective, QuestObjectiveKind, QuestState, QuestTemplate
 from rpg.domain.models.world import World
 from rpg.domain.models.spell import Spell
+from rpg.domain.services.location_spatial_index import within_radius
 from rpg.domain.repositories import (
     CharacterRepository,
     LocationStateRepository,
@@ -1219,6 +1220,7 @@ class MysqlEntityRepository(EntityRepository):
                     attached_now = self._attach_location(session, entity_id, location_id)
                     attached += 1 if attached_now else 0
 
+        self.revision += 1
         return UpsertResult(created=created, updated=updated, attached=attached)
 
     @staticmethod
@@ -2665,36 +2667,58 @@ class MysqlLocationRepository(LocationRepository):
             )
 
     def list_all(self) -> List[Location]:
+        return self._query_locations()
+
+    def list_within_radius(self, x: float, y: float, radius: float) -> List[Location]:
+        radius = float(radius)
+        if radius < 0:
+            return []
+        candidates = self._query_locations(
+            "WHERE COALESCE(l.x, 0) BETWEEN :min_x AND :max_x AND COALESCE(l.y, 0) BETWEEN :min_y AND :max_y",
+            {
+                "min_x": float(x) - radius,
+                "max_x": float(x) + radius,
+                "min_y": float(y) - radius,
+                "max_y": float(y) + radius,
+            },
+        )
+        return [location for location in candidates if within_radius(x, y, location, radius)]
+
+    def _query_locations(self, where_sql: str = "", params: Optional[dict] = None) -> List[Location]:
         with SessionLocal() as session:
             try:
                 rows = session.execute(
                     text(
-                        """
+                        f"""
                         SELECT l.location_id, l.x, l.y, p.name AS place_name,
                                COALESCE(l.biome_key, 'wilderness') AS biome_key,
                                COALESCE(l.hazard_profile_key, 'standard') AS hazard_profile_key,
                                l.environmental_flags
                         FROM location l
                         INNER JOIN place p ON p.place_id = l.place_id
+                        {where_sql}
                         ORDER BY l.location_id
                         """
-                    )
+                    ),
+                    dict(params or {}),
                 ).all()
             except ProgrammingError as exc:
                 if not self._is_missing_column_error(exc):
                     raise
                 rows = session.execute(
                     text(
-                        """
+                        f"""
                         SELECT l.location_id, l.x, l.y, p.name AS place_name,
                                'wilderness' AS biome_key,
                                'standard' AS hazard_profile_key,
                                NULL AS environmental_flags
                         FROM location l
                         INNER JOIN place p ON p.place_id = l.place_id
+                        {where_sql}
                         ORDER BY l.location_id
                         """
-                    )
+                    ),
+                    dict(params or {}),
                 ).all()
             locations: list[Location] = []
             for row in rows:
@@ -43,6 +43,7 @@ class DnD5eClient:
     ) -> None:
         self._retries = retries
         self._backoff_seconds = backoff_seconds
+        self._owns_client = http_client is None
         self.client = http_client or httpx.Client(base_url=base_url, timeout=timeout)
 
     @classmethod
@@ -155,4 +156,5 @@ class DnD5eClient:
         )
 
     def close(self) -> None:
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
@@ -0,0 +1,144 @@
+"""Shared ``httpx.Client`` instances for the HTTP content and flavour providers.
+
+Each game service (and each prewarm run) owns one ``HttpClientPool``.  Providers
+built through the content factory and bootstrap borrow one client per base URL
+(and timeout) from it instead of opening their own, so keep-alive connections
+and TLS sessions survive across providers, imports and enrichers, and closing
+the owner's pool never reaches into another service's connections.  Connection limits come from
+``RPG_HTTP_MAX_CONNECTIONS``, ``RPG_HTTP_MAX_KEEPALIVE`` and
+``RPG_HTTP_KEEPALIVE_EXPIRY_S``; ``RPG_HTTP2_ENABLED=1`` negotiates HTTP/2 when
+the optional ``h2`` package is installed.  Every response is timed into a
+per-host latency histogram.
+
+Ownership: the Open5e, D&D 5e and Datamuse providers close their HTTP client
+only when they created it.  A client passed in as ``http_client`` (normally
+borrowed from a pool) stays open when the provider closes and is closed by
+``HttpClientPool.close``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import threading
+import time
+from bisect import bisect_left
+
+import httpx
+
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+_STARTED_AT_EXTENSION = "rpg.started_at"
+
+
+def _is_truthy(value: str | None, *, default: str) -> bool:
+    normalized = str(value if value is not None else default).strip().lower()
+    return normalized in {"1", "true", "yes"}
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class LatencyHistogram:
+    """Counts of response latencies per ``LATENCY_BUCKETS_MS`` upper bound, plus an overflow bucket."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict[str, object]:
+        count = self.count
+        labels = [f"<={int(bound)}ms" for bound in LATENCY_BUCKETS_MS] + [f">{int(LATENCY_BUCKETS_MS[-1])}ms"]
+        return {
+            "count": count,
+            "mean_ms": round(self.total_ms / count, 3) if count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class HttpClientPool:
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry_seconds: float | None = None,
+        http2: bool | None = None,
+    ) -> None:
+        self.max_connections = max(1, int(max_connections if max_connections is not None else os.getenv("RPG_HTTP_MAX_CONNECTIONS", "10")))
+        self.max_keepalive_connections = max(
+            0,
+            int(max_keepalive_connections if max_keepalive_connections is not None else os.getenv("RPG_HTTP_MAX_KEEPALIVE", "5")),
+        )
+        self.keepalive_expiry_seconds = max(
+            0.0,
+            float(keepalive_expiry_seconds if keepalive_expiry_seconds is not None else os.getenv("RPG_HTTP_KEEPALIVE_EXPIRY_S", "30")),
+        )
+        wants_http2 = _is_truthy(os.getenv("RPG_HTTP2_ENABLED"), default="0") if http2 is None else bool(http2)
+        self.http2 = wants_http2 and http2_available()
+        self._clients: dict[tuple[str, float], httpx.Client] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_base_url(base_url: str) -> str:
+        return str(base_url).strip().rstrip("/")
+
+    def _on_request(self, request: httpx.Request) -> None:
+        request.extensions[_STARTED_AT_EXTENSION] = time.perf_counter()
+
+    def _on_response(self, response: httpx.Response) -> None:
+        started_at = response.request.extensions.get(_STARTED_AT_EXTENSION)
+        if started_at is None:
+            return
+        host = response.request.url.netloc.decode("ascii", "replace")
+        elapsed_ms = (time.perf_counter() - started_at) * 1000.0
+        with self._lock:
+            self._histograms.setdefault(host, LatencyHistogram()).observe(elapsed_ms)
+
+    def client_for(self, base_url: str, *, timeout: float = 10.0) -> httpx.Client:
+        """Shared client for ``base_url``; callers with a different timeout get their own."""
+        key = (self._normalize_base_url(base_url), float(timeout))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    base_url=key[0],
+                    timeout=key[1],
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry_seconds,
+                    ),
+                    event_hooks={"request": [self._on_request], "response": [self._on_response]},
+                )
+                self._clients[key] = client
+            return client
+
+    def latency_histograms(self) -> dict[str, dict[str, object]]:
+        """Latency snapshot per host, sorted by host; reported by the prewarm tool."""
+        with self._lock:
+            return {host: histogram.snapshot() for host, histogram in sorted(self._histograms.items())}
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
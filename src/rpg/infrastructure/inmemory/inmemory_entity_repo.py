@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Set
 
 from rpg.domain.models.entity import Entity
 from rpg.domain.repositories import EntityRepository
@@ -43,6 +44,45 @@ class InMemoryEntityRepository(EntityRepository):
         ]
         self._by_location: Dict[int, List[int]] = {1: [1, 2]}
         self._apply_generated_names(name_generator)
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        # Results keep insertion order, so every index stores positions into ``_entities``.
+        self._position: Dict[int, int] = {}
+        self._by_name: Dict[str, Entity] = {}
+        self._level_buckets: Dict[int, List[int]] = {}
+        self._levels: List[int] = []
+        self._location_members: Dict[int, Set[int]] = {
+            location_id: set(entity_ids) for location_id, entity_ids in self._by_location.items()
+        }
+        for position, entity in enumerate(self._entities):
+            self._index_entity(entity, position)
+
+    def _index_entity(self, entity: Entity, position: int) -> None:
+        self._position.setdefault(entity.id, position)
+        self._by_name.setdefault(entity.name.lower(), entity)
+        self._add_to_level_bucket(int(entity.level), position)
+
+    def _add_to_level_bucket(self, level: int, position: int) -> None:
+        bucket = self._level_buckets.get(level)
+        if bucket is None:
+            bucket = self._level_buckets[level] = []
+            insort(self._levels, level)
+        insort(bucket, position)
+
+    def _remove_from_level_bucket(self, level: int, position: int) -> None:
+        bucket = self._level_buckets.get(level)
+        if not bucket:
+            return
+        index = bisect_left(bucket, position)
+        if index < len(bucket) and bucket[index] == position:
+            del bucket[index]
+        if not bucket:
+            del self._level_buckets[level]
+            del self._levels[bisect_left(self._levels, level)]
+
+    def _entities_at(self, positions) -> List[Entity]:
+        return [self._entities[position] for position in sorted(positions)]
 
     def _apply_generated_names(self, name_generator) -> None:
         if name_generator is None:
@@ -64,28 +104,34 @@ class InMemoryEntityRepository(EntityRepository):
                 entity.name = generated.strip()
 
     def get(self, entity_id: int) -> Entity | None:
-        for entity in self._entities:
-            if entity.id == entity_id:
-                return entity
-        return None
+        position = self._position.get(entity_id)
+        return self._entities[position] if position is not None else None
 
     def get_many(self, entity_ids: List[int]) -> List[Entity]:
         if not entity_ids:
             return []
-        ids = set(entity_ids)
-        return [entity for entity in self._entities if entity.id in ids]
+        return self._entities_at({self._position[entity_id] for entity_id in set(entity_ids) if entity_id in self._position})
 
     def list_for_level(self, target_level: int, tolerance: int = 2) -> List[Entity]:
-        lower = target_level - tolerance
-        upper = target_level + tolerance
-        return [entity for entity in self._entities if lower <= entity.level <= upper]
+        return self.list_by_level_band(target_level - tolerance, target_level + tolerance)
 
     def list_by_location(self, location_id: int) -> List[Entity]:
-        ids = self._by_location.get(location_id, [])
-        return [entity for entity in self._entities if entity.id in ids]
+        members = self._location_members.get(location_id)
+        if not members:
+            return []
+        return self._entities_at(self._position[entity_id] for entity_id in members if entity_id in self._position)
 
     def list_by_level_band(self, level_min: int, level_max: int) -> List[Entity]:
-        return [entity for entity in self._entities if level_min <= entity.level <= level_max]
+        start = bisect_left(self._levels, level_min)
+        stop = bisect_right(self._levels, level_max)
+        if start >= stop:
+            return []
+        if stop - start == 1:
+            return [self._entities[position] for position in self._level_buckets[self._levels[start]]]
+        positions: List[int] = []
+        for level in self._levels[start:stop]:
+            positions.extend(self._level_buckets[level])
+        return self._entities_at(positions)
 
     def upsert_entities(self, entities: List[Entity], location_id: int | None = None) -> UpsertResult:
         next_id = max((entity.id for entity in self._entities), default=0) + 1
@@ -94,8 +140,12 @@ class InMemoryEntityRepository(EntityRepository):
         attached = 0
 
         for entity in entities:
-            existing = next((e for e in self._entities if e.name.lower() == entity.name.lower()), None)
+            existing = self._by_name.get(entity.name.lower())
             if existing:
+                if int(existing.level) != int(entity.level):
+                    position = self._position[existing.id]
+                    self._remove_from_level_bucket(int(existing.level), position)
+                    self._add_to_level_bucket(int(entity.level), position)
                 existing.level = entity.level
                 existing.armour_class = entity.armour_class
                 existing.attack_bonus = entity.attack_bonus
@@ -111,15 +161,18 @@ class InMemoryEntityRepository(EntityRepository):
                 entity.id = next_id
                 next_id += 1
                 self._entities.append(entity)
+                self._index_entity(entity, len(self._entities) - 1)
                 created += 1
                 entity_id = entity.id
 
             if location_id is not None:
-                self._by_location.setdefault(location_id, [])
-                if entity_id not in self._by_location[location_id]:
-                    self._by_location[location_id].append(entity_id)
+                members = self._location_members.setdefault(location_id, set())
+                if entity_id not in members:
+                    members.add(entity_id)
+                    self._by_location.setdefault(location_id, []).append(entity_id)
                     attached += 1
 
+        self.revision += 1
         return UpsertResult(created=created, updated=updated, attached=attached)
 
     def get_default_location_id(self) -> int | None:
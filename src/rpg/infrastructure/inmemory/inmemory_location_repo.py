@@ -2,6 +2,7 @@ from typing import Dict, List, Optional
 
 from rpg.domain.models.location import Location
 from rpg.domain.repositories import LocationRepository
+from rpg.domain.services.location_spatial_index import LocationSpatialIndex
 
 try:
     from rpg.infrastructure.inmemory.generated_taklamakan_locations import GENERATED_LOCATIONS
@@ -13,15 +14,13 @@ class InMemoryLocationRepository(LocationRepository):
     def __init__(self, locations: Optional[Dict[int, Location]] = None):
         if locations is not None:
             self._locations = dict(locations)
-            return
-
-        if GENERATED_LOCATIONS:
+        elif GENERATED_LOCATIONS:
             self._locations = dict(GENERATED_LOCATIONS)
-            return
-
-        self._locations = {
-            1: Location(id=1, name="Starting Town", biome="village", base_level=1, recommended_level=1)
-        }
+        else:
+            self._locations = {
+                1: Location(id=1, name="Starting Town", biome="village", base_level=1, recommended_level=1)
+            }
+        self._spatial_index = LocationSpatialIndex(self._locations.values())
 
     def get(self, location_id: int) -> Optional[Location]:
         return self._locations.get(location_id)
@@ -29,6 +28,9 @@ class InMemoryLocationRepository(LocationRepository):
     def list_all(self) -> List[Location]:
         return list(self._locations.values())
 
+    def list_within_radius(self, x: float, y: float, radius: float) -> List[Location]:
+        return self._spatial_index.query_radius(x, y, radius)
+
     def get_starting_location(self) -> Optional[Location]:
         if 1 in self._locations and self._is_town_like(self._locations[1]):
             return self._locations[1]
@@ -1,86 +1,397 @@
+"""Local SRD content provider backed by ``<kind>.json`` files.
+
+Each kind is loaded on first use together with a slug index and the filter
+columns (challenge rating, spell level, classes) used by ``list_filtered``.
+``compile_local_srd_dataset`` writes a compact ``srd.compiled.pickle`` next to
+the JSON files: one offset table per kind plus every row pickled on its own.
+The provider maps that artifact and only unpickles the rows a page, lookup or
+filter actually returns; a kind whose JSON changed since compilation falls back
+to the JSON file.
+"""
+
+from __future__ import annotations
+
 import json
+import mmap
+import os
+import pickle
+import struct
+from fractions import Fraction
 from pathlib import Path
+from typing import Callable
+
+
+COMPILED_SRD_FILENAME = "srd.compiled.pickle"
+SRD_KINDS: tuple[str, ...] = ("monsters", "spells", "classes", "races", "magicitems", "equipment")
+_COMPILED_MAGIC = b"RPGSRD01"
+_COMPILED_FORMAT_VERSION = 1
+_COMPILED_HEADER_LENGTH = struct.Struct("<I")
+
+
+def _slugify(value: str) -> str:
+    return "-".join(value.strip().lower().split())
+
+
+def _row_slug(row: dict) -> str:
+    return str(row.get("slug") or row.get("index") or _slugify(str(row.get("name", "")))).strip().lower()
+
+
+def _parse_cr(value: object) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(Fraction(str(value).strip()))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _row_cr(row: dict) -> float | None:
+    return _parse_cr(row.get("cr", row.get("challenge_rating")))
+
+
+def _row_level(row: dict) -> int | None:
+    for key in ("level_int", "spell_level", "level"):
+        value = row.get(key)
+        if value is None or isinstance(value, bool):
+            continue
+        if isinstance(value, int):
+            return value
+        text = str(value).strip().lower()
+        if text.startswith("cantrip"):
+            return 0
+        digits = ""
+        for char in text:
+            if not char.isdigit():
+                break
+            digits += char
+        if digits:
+            return int(digits)
+    return None
+
+
+def _row_classes(row: dict) -> tuple[str, ...]:
+    names: list[str] = []
+    for key in ("classes", "spell_lists", "dnd_class"):
+        value = row.get(key)
+        if isinstance(value, str):
+            names.extend(part for part in value.split(","))
+        elif isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, dict):
+                    names.append(str(entry.get("index") or entry.get("slug") or entry.get("name") or ""))
+                else:
+                    names.append(str(entry))
+    slugs: list[str] = []
+    for name in names:
+        slug = _slugify(name)
+        if slug and slug not in slugs:
+            slugs.append(slug)
+    return tuple(slugs)
+
+
+def _build_index(rows: list[dict]) -> tuple[dict[str, int], dict[str, list]]:
+    slugs: dict[str, int] = {}
+    for position, row in enumerate(rows):
+        slugs.setdefault(_row_slug(row), position)
+    columns = {
+        "cr": [_row_cr(row) for row in rows],
+        "level": [_row_level(row) for row in rows],
+        "classes": [_row_classes(row) for row in rows],
+    }
+    return slugs, columns
+
+
+def _read_json_rows(path: Path) -> list[dict]:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(raw, dict):
+        rows = raw.get("results") or raw.get("items") or []
+    elif isinstance(raw, list):
+        rows = raw
+    else:
+        rows = []
+    return [row for row in rows if isinstance(row, dict)]
+
+
+def _source_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [int(stat.st_size), int(stat.st_mtime_ns)]
+
+
+class _SrdKind:
+    """Rows of one kind plus its slug index and filter columns."""
+
+    def __init__(
+        self,
+        count: int,
+        slugs: dict[str, int],
+        columns: dict[str, list],
+        row_loader: Callable[[int], dict],
+    ) -> None:
+        self.count = count
+        self.slugs = slugs
+        self.columns = columns
+        self._row_loader = row_loader
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "_SrdKind":
+        slugs, columns = _build_index(rows)
+        return cls(len(rows), slugs, columns, rows.__getitem__)
+
+    def row(self, position: int) -> dict:
+        return self._row_loader(position)
+
+    def rows(self, positions) -> list[dict]:
+        return [self._row_loader(position) for position in positions]
+
+
+class _CompiledSrdArtifact:
+    """Mapped ``srd.compiled.pickle``; kinds are indexed on first use and rows unpickled on demand."""
+
+    def __init__(self, handle, mapped: mmap.mmap, base_offset: int, kinds: dict[str, dict]) -> None:
+        self._handle = handle
+        self._mapped = mapped
+        self._base_offset = int(base_offset)
+        self._kinds = kinds
+
+    @classmethod
+    def open(cls, path: Path) -> "_CompiledSrdArtifact | None":
+        handle = None
+        mapped = None
+        try:
+            handle = Path(path).open("rb")
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            offset = len(_COMPILED_MAGIC)
+            if mapped[:offset] != _COMPILED_MAGIC:
+                raise ValueError("not a compiled SRD artifact")
+            (header_length,) = _COMPILED_HEADER_LENGTH.unpack_from(mapped, offset)
+            offset += _COMPILED_HEADER_LENGTH.size
+            header = json.loads(mapped[offset : offset + header_length].decode("utf-8"))
+            offset += header_length
+            if not isinstance(header, dict) or int(header.get("format", 0) or 0) != _COMPILED_FORMAT_VERSION:
+                raise ValueError("unsupported compiled SRD format")
+            kinds = header.get("kinds")
+            if not isinstance(kinds, dict):
+                raise ValueError("compiled SRD artifact has no kinds")
+            return cls(handle, mapped, offset, kinds)
+        except (OSError, ValueError, struct.error):
+            if mapped is not None:
+                mapped.close()
+            if handle is not None:
+                handle.close()
+            return None
+
+    def _load(self, start: int, length: int) -> object:
+        start = self._base_offset + int(start)
+        with memoryview(self._mapped) as view:
+            return pickle.loads(view[start : start + int(length)])
+
+    def kind(self, kind: str, source_path: Path) -> _SrdKind | None:
+        entry = self._kinds.get(kind)
+        if not isinstance(entry, dict):
+            return None
+        signature = _source_signature(source_path)
+        if signature is not None and signature != entry.get("source"):
+            return None
+        try:
+            index = self._load(*entry["index"])
+            rows_start = int(entry["rows"][0])
+        except (KeyError, TypeError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+        offsets = index["offsets"]
+        return _SrdKind(
+            len(offsets),
+            index["slugs"],
+            index["columns"],
+            lambda position: self._load(rows_start + offsets[position][0], offsets[position][1]),
+        )
+
+    def close(self) -> None:
+        try:
+            self._mapped.close()
+        finally:
+            self._handle.close()
+
+
+def compile_local_srd_dataset(root_dir: str | Path, output: str | Path | None = None) -> Path:
+    """Write the compact artifact for every ``<kind>.json`` present in ``root_dir``."""
+    source_dir = Path(root_dir)
+    blobs: list[bytes] = []
+    kinds: dict[str, dict] = {}
+    position = 0
+    for kind in SRD_KINDS:
+        path = source_dir / f"{kind}.json"
+        if not path.exists():
+            continue
+        rows = _read_json_rows(path)
+        row_blobs = [pickle.dumps(row, protocol=pickle.HIGHEST_PROTOCOL) for row in rows]
+        offsets: list[tuple[int, int]] = []
+        rows_length = 0
+        for blob in row_blobs:
+            offsets.append((rows_length, len(blob)))
+            rows_length += len(blob)
+        slugs, columns = _build_index(rows)
+        index_blob = pickle.dumps(
+            {"slugs": slugs, "columns": columns, "offsets": offsets},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        kinds[kind] = {
+            "source": _source_signature(path),
+            "index": [position, len(index_blob)],
+            "rows": [position + len(index_blob), rows_length],
+        }
+        blobs.append(index_blob)
+        blobs.extend(row_blobs)
+        position += len(index_blob) + rows_length
+
+    header = json.dumps({"format": _COMPILED_FORMAT_VERSION, "kinds": kinds}, sort_keys=True).encode("utf-8")
+    target = Path(output) if output is not None else source_dir / COMPILED_SRD_FILENAME
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_COMPILED_MAGIC)
+        handle.write(_COMPILED_HEADER_LENGTH.pack(len(header)))
+        handle.write(header)
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(tmp_path, target)
+    return target
 
 
 class LocalSrdProvider:
-    def __init__(self, root_dir: str | Path, page_size: int = 50) -> None:
+    def __init__(
+        self,
+        root_dir: str | Path,
+        page_size: int = 50,
+        *,
+        compiled_path: str | Path | None = None,
+        use_compiled: bool = True,
+    ) -> None:
         self.root_dir = Path(root_dir)
         self.page_size = max(1, int(page_size))
-        self._dataset_cache: dict[str, list[dict]] = {}
+        self.compiled_path = Path(compiled_path) if compiled_path is not None else self.root_dir / COMPILED_SRD_FILENAME
+        self.use_compiled = bool(use_compiled)
+        self._kinds: dict[str, _SrdKind] = {}
+        self._compiled: _CompiledSrdArtifact | None = None
+        self._compiled_checked = False
 
     def _dataset_path(self, kind: str) -> Path:
         return self.root_dir / f"{kind}.json"
 
-    def _load_rows(self, kind: str) -> list[dict]:
-        if kind in self._dataset_cache:
-            return self._dataset_cache[kind]
-
-        path = self._dataset_path(kind)
-        if not path.exists():
-            raise FileNotFoundError(f"Local SRD dataset not found: {path}")
+    def _compiled_artifact(self) -> _CompiledSrdArtifact | None:
+        if not self._compiled_checked:
+            self._compiled_checked = True
+            if self.use_compiled and self.compiled_path.exists():
+                self._compiled = _CompiledSrdArtifact.open(self.compiled_path)
+        return self._compiled
 
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        if isinstance(raw, dict):
-            rows = raw.get("results") or raw.get("items") or []
-        elif isinstance(raw, list):
-            rows = raw
-        else:
-            rows = []
+    def _kind(self, kind: str) -> _SrdKind:
+        loaded = self._kinds.get(kind)
+        if loaded is not None:
+            return loaded
 
-        normalized = [row for row in rows if isinstance(row, dict)]
-        self._dataset_cache[kind] = normalized
-        return normalized
+        path = self._dataset_path(kind)
+        artifact = self._compiled_artifact()
+        loaded = artifact.kind(kind, path) if artifact is not None else None
+        if loaded is None:
+            if not path.exists():
+                raise FileNotFoundError(f"Local SRD dataset not found: {path}")
+            loaded = _SrdKind.from_rows(_read_json_rows(path))
+        self._kinds[kind] = loaded
+        return loaded
 
-    def _paginate(self, rows: list[dict], page: int = 1) -> dict:
+    def _paginate_positions(self, dataset: _SrdKind, positions: list[int] | range, page: int = 1) -> dict:
         page_num = max(1, int(page))
         start = (page_num - 1) * self.page_size
         end = start + self.page_size
-        sliced = rows[start:end]
-        has_next = end < len(rows)
+        has_next = end < len(positions)
         return {
-            "count": len(rows),
+            "count": len(positions),
             "next": f"local://{page_num + 1}" if has_next else None,
             "previous": f"local://{page_num - 1}" if page_num > 1 else None,
-            "results": sliced,
+            "results": dataset.rows(positions[start:end]),
         }
 
+    def _paginate_kind(self, kind: str, page: int = 1) -> dict:
+        dataset = self._kind(kind)
+        return self._paginate_positions(dataset, range(dataset.count), page=page)
+
     @staticmethod
     def _slugify(value: str) -> str:
-        return "-".join(value.strip().lower().split())
+        return _slugify(value)
 
     def _get_by_slug(self, kind: str, slug: str) -> dict:
-        normalized_slug = self._slugify(slug)
-        rows = self._load_rows(kind)
-        for row in rows:
-            row_slug = row.get("slug") or row.get("index") or self._slugify(str(row.get("name", "")))
-            if str(row_slug).strip().lower() == normalized_slug:
-                return row
-        raise KeyError(f"No {kind} entry for slug={slug}")
+        dataset = self._kind(kind)
+        position = dataset.slugs.get(self._slugify(slug))
+        if position is None:
+            raise KeyError(f"No {kind} entry for slug={slug}")
+        return dataset.row(position)
+
+    def list_filtered(
+        self,
+        kind: str,
+        page: int = 1,
+        *,
+        cr_min: float | None = None,
+        cr_max: float | None = None,
+        level: int | None = None,
+        class_name: str | None = None,
+    ) -> dict:
+        """Page through ``kind`` rows matching every given filter.
+
+        Filters read the kind's precomputed columns, so only the rows on the
+        returned page are materialized.  Rows without a value for a filtered
+        column never match.
+        """
+        dataset = self._kind(kind)
+        crs = dataset.columns["cr"]
+        levels = dataset.columns["level"]
+        classes = dataset.columns["classes"]
+        class_slug = self._slugify(class_name) if class_name else None
+        positions: list[int] = []
+        for position in range(dataset.count):
+            if cr_min is not None or cr_max is not None:
+                cr = crs[position]
+                if cr is None or (cr_min is not None and cr < cr_min) or (cr_max is not None and cr > cr_max):
+                    continue
+            if level is not None and levels[position] != level:
+                continue
+            if class_slug is not None and class_slug not in classes[position]:
+                continue
+            positions.append(position)
+        return self._paginate_positions(dataset, positions, page=page)
 
     def list_monsters(self, page: int = 1) -> dict:
-        return self._paginate(self._load_rows("monsters"), page=page)
+        return self._paginate_kind("monsters", page=page)
 
     def get_monster(self, slug: str) -> dict:
         return self._get_by_slug("monsters", slug)
 
     def list_spells(self, page: int = 1) -> dict:
-        return self._paginate(self._load_rows("spells"), page=page)
+        return self._paginate_kind("spells", page=page)
 
     def list_classes(self, page: int = 1) -> dict:
-        return self._paginate(self._load_rows("classes"), page=page)
+        return self._paginate_kind("classes", page=page)
 
     def list_magicitems(self, page: int = 1) -> dict:
         try:
-            rows = self._load_rows("magicitems")
+            return self._paginate_kind("magicitems", page=page)
         except FileNotFoundError:
-            rows = self._load_rows("equipment")
-        return self._paginate(rows, page=page)
+            return self._paginate_kind("equipment", page=page)
 
     def list_races(self, page: int = 1) -> dict:
-        return self._paginate(self._load_rows("races"), page=page)
+        return self._paginate_kind("races", page=page)
 
     def get_race(self, slug: str) -> dict:
         return self._get_by_slug("races", slug)
 
     def close(self) -> None:
-        return None
+        compiled, self._compiled = self._compiled, None
+        self._compiled_checked = False
+        self._kinds.clear()
+        if compiled is not None:
+            compiled.close()
@@ -18,6 +18,7 @@ class Open5eClient:
     ) -> None:
         self._retries = retries
         self._backoff_seconds = backoff_seconds
+        self._owns_client = http_client is None
         self.client = http_client or httpx.Client(base_url=base_url, timeout=timeout)
 
     def list_monsters(self, page: int = 1) -> dict:
@@ -82,4 +83,5 @@ class Open5eClient:
         )
 
     def close(self) -> None:
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
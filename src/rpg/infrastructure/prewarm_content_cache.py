@@ -1,20 +1,37 @@
 """Prewarm content cache via configured providers.
 
+Calls run on a thread pool against the same provider client the game uses, so
+every fetched page lands in the content cache exactly as a serial prewarm
+would.  Each provider of the client is wrapped for the run so that every
+request it makes, fallthrough requests included, holds a slot for that
+provider's own host and first takes a token from a shared token bucket; cache
+hits take neither.  With ``--follow-next`` a page whose payload carries a
+``next`` link schedules the following page of that target.
+Progress and throughput are reported as calls complete, and a per-host latency
+summary from the run's HTTP client pool is printed at the end.
+
 Usage examples:
     python -m rpg.infrastructure.prewarm_content_cache --mode dry-run
     python -m rpg.infrastructure.prewarm_content_cache --mode execute --targets races classes --pages 2
     python -m rpg.infrastructure.prewarm_content_cache --mode execute --strategy import --targets all --pages 1
+    python -m rpg.infrastructure.prewarm_content_cache --mode execute --strategy import --follow-next --workers 8 --rate 5
 """
 
 from __future__ import annotations
 
 import argparse
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlsplit
 
 from rpg.infrastructure.content_provider_factory import (
     create_import_content_client,
     create_runtime_content_client,
 )
+from rpg.infrastructure.http_client_pool import HttpClientPool
 
 
 TARGET_METHODS = {
@@ -38,6 +55,61 @@ class PrewarmSummary:
     executed: int
     succeeded: int
     failed: int
+    discovered: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def calls_per_second(self) -> float:
+        return self.executed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class PrewarmProgress:
+    call: PrewarmCall
+    ok: bool
+    completed: int
+    scheduled: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def calls_per_second(self) -> float:
+        return self.completed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available and returns the wait."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate = float(rate_per_second)
+        self.capacity = max(1.0, float(capacity if capacity is not None else rate_per_second))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve immediately so concurrent callers queue behind each other.
+            self._tokens -= tokens
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_seconds > 0:
+            self._sleep(wait_seconds)
+        return wait_seconds
 
 
 def normalize_targets(targets: list[str]) -> list[str]:
@@ -69,31 +141,164 @@ def build_prewarm_plan(targets: list[str], pages: int, start_page: int = 1) -> l
     return plan
 
 
-def execute_prewarm_plan(client, plan: list[PrewarmCall], dry_run: bool) -> PrewarmSummary:
+def provider_host(provider) -> str:
+    """Host ``provider`` sends its requests to, or ``local`` for file-backed providers."""
+    http_client = getattr(provider, "client", None)
+    base_url = getattr(http_client, "base_url", None)
+    if base_url is None:
+        return "local"
+    return urlsplit(str(base_url)).netloc or str(base_url)
+
+
+class _HostLimitedProvider:
+    """Proxy that runs each content call of one provider inside its host's slot."""
+
+    def __init__(self, provider, slots: threading.BoundedSemaphore, rate_limiter: TokenBucket | None) -> None:
+        self._provider = provider
+        self._slots = slots
+        self._rate_limiter = rate_limiter
+
+    def __getattr__(self, name: str):
+        value = getattr(self._provider, name)
+        if not name.startswith(("list_", "get_")) or not callable(value):
+            return value
+
+        def limited(*args, **kwargs):
+            with self._slots:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                return value(*args, **kwargs)
+
+        return limited
+
+
+def _call_succeeded(client, call: PrewarmCall) -> tuple[bool, dict | None]:
+    try:
+        payload = getattr(client, call.method_name)(page=call.page)
+    except Exception:
+        return False, None
+    if isinstance(payload, dict):
+        return True, payload
+    return False, None
+
+
+def execute_prewarm_plan(
+    client,
+    plan: list[PrewarmCall],
+    dry_run: bool,
+    *,
+    workers: int = 1,
+    per_host_limit: int | None = None,
+    rate_limiter: TokenBucket | None = None,
+    follow_next: bool = False,
+    max_pages_per_target: int = 100,
+    progress: Callable[[PrewarmProgress], None] | None = None,
+) -> PrewarmSummary:
     if dry_run:
         return PrewarmSummary(planned=len(plan), executed=0, succeeded=0, failed=0)
 
-    executed = 0
-    succeeded = 0
-    failed = 0
+    worker_count = max(1, int(workers))
+    host_limit = max(1, int(per_host_limit)) if per_host_limit else worker_count
+    host_slots: dict[str, threading.BoundedSemaphore] = {}
+
+    def _limited(provider) -> _HostLimitedProvider:
+        slots = host_slots.setdefault(provider_host(provider), threading.BoundedSemaphore(host_limit))
+        return _HostLimitedProvider(provider, slots, rate_limiter)
+
+    original_providers = getattr(client, "providers", None)
+    if original_providers is not None:
+        client.providers = [_limited(provider) for provider in original_providers]
+        target = client
+    else:
+        target = _limited(client)
+    try:
+        return _execute_calls(target, plan, worker_count, follow_next, max_pages_per_target, progress)
+    finally:
+        if original_providers is not None:
+            client.providers = original_providers
+
+
+def _execute_calls(
+    client,
+    plan: list[PrewarmCall],
+    worker_count: int,
+    follow_next: bool,
+    max_pages_per_target: int,
+    progress: Callable[[PrewarmProgress], None] | None,
+) -> PrewarmSummary:
+    def _run(call: PrewarmCall) -> tuple[bool, dict | None]:
+        return _call_succeeded(client, call)
+
+    scheduled = {(call.method_name, call.page) for call in plan}
+    pages_per_target: dict[str, int] = {}
     for call in plan:
-        executed += 1
-        try:
-            method = getattr(client, call.method_name)
-            payload = method(page=call.page)
-            if isinstance(payload, dict):
-                succeeded += 1
-            else:
-                failed += 1
-        except Exception:
-            failed += 1
-    return PrewarmSummary(planned=len(plan), executed=executed, succeeded=succeeded, failed=failed)
+        pages_per_target[call.target] = pages_per_target.get(call.target, 0) + 1
+    executed = succeeded = failed = discovered = 0
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="prewarm") as pool:
+        pending = {pool.submit(_run, call): call for call in plan}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                call = pending.pop(future)
+                ok, payload = future.result()
+                executed += 1
+                if ok:
+                    succeeded += 1
+                else:
+                    failed += 1
+                if follow_next and ok and payload.get("next") and pages_per_target.get(call.target, 0) < max_pages_per_target:
+                    next_call = PrewarmCall(target=call.target, page=call.page + 1, method_name=call.method_name)
+                    if (next_call.method_name, next_call.page) not in scheduled:
+                        scheduled.add((next_call.method_name, next_call.page))
+                        pages_per_target[call.target] = pages_per_target.get(call.target, 0) + 1
+                        discovered += 1
+                        pending[pool.submit(_run, next_call)] = next_call
+                if progress is not None:
+                    progress(
+                        PrewarmProgress(
+                            call=call,
+                            ok=ok,
+                            completed=executed,
+                            scheduled=len(scheduled),
+                            succeeded=succeeded,
+                            failed=failed,
+                            elapsed_seconds=time.perf_counter() - started,
+                        )
+                    )
 
+    return PrewarmSummary(
+        planned=len(plan),
+        executed=executed,
+        succeeded=succeeded,
+        failed=failed,
+        discovered=discovered,
+        elapsed_seconds=time.perf_counter() - started,
+    )
 
-def _build_client(strategy: str):
+
+def _build_client(strategy: str, pool: HttpClientPool):
     if strategy == "import":
-        return create_import_content_client()
-    return create_runtime_content_client()
+        return create_import_content_client(pool)
+    return create_runtime_content_client(pool)
+
+
+def _print_progress(update: PrewarmProgress) -> None:
+    status = "ok" if update.ok else "failed"
+    print(
+        f"  [{update.completed}/{update.scheduled}] {update.call.target} page {update.call.page} {status} "
+        f"({update.calls_per_second:.1f} calls/s)"
+    )
+
+
+def _print_latency(histograms: dict[str, dict[str, object]]) -> None:
+    for host, snapshot in histograms.items():
+        busiest = [f"{label}: {count}" for label, count in snapshot["buckets"].items() if count]
+        print(
+            f"  {host}: {snapshot['count']} responses, mean {snapshot['mean_ms']}ms, "
+            f"max {snapshot['max_ms']}ms ({', '.join(busiest)})"
+        )
 
 
 def main() -> None:
@@ -108,6 +313,12 @@ def main() -> None:
     )
     parser.add_argument("--pages", type=int, default=1, help="Number of pages per target to prewarm")
     parser.add_argument("--start-page", type=int, default=1, help="First page index to prewarm")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent fetch workers")
+    parser.add_argument("--per-host", type=int, default=2, help="Maximum concurrent requests to any one provider host")
+    parser.add_argument("--rate", type=float, default=0.0, help="Requests per second across all hosts (0 = unlimited)")
+    parser.add_argument("--burst", type=float, default=None, help="Token bucket capacity (defaults to --rate)")
+    parser.add_argument("--follow-next", action="store_true", help="Keep fetching pages while payloads carry a next link")
+    parser.add_argument("--max-pages", type=int, default=100, help="Page cap per target when following next links")
     args = parser.parse_args()
 
     plan = build_prewarm_plan(args.targets, pages=args.pages, start_page=args.start_page)
@@ -122,19 +333,36 @@ def main() -> None:
         print("Dry run complete. No provider calls executed.")
         return
 
-    client = _build_client(args.strategy)
+    pool = HttpClientPool()
+    client = _build_client(args.strategy, pool)
     try:
-        summary = execute_prewarm_plan(client, plan, dry_run=False)
+        summary = execute_prewarm_plan(
+            client,
+            plan,
+            dry_run=False,
+            workers=args.workers,
+            per_host_limit=args.per_host,
+            rate_limiter=TokenBucket(args.rate, args.burst) if args.rate > 0 else None,
+            follow_next=args.follow_next,
+            max_pages_per_target=args.max_pages,
+            progress=_print_progress,
+        )
     finally:
         try:
             client.close()
         except Exception:
             pass
+        pool.close()
 
     print(
         f"Prewarm complete: executed={summary.executed}, "
-        f"succeeded={summary.succeeded}, failed={summary.failed}."
+        f"succeeded={summary.succeeded}, failed={summary.failed}, "
+        f"discovered={summary.discovered}, {summary.calls_per_second:.1f} calls/s."
     )
+    histograms = pool.latency_histograms()
+    if histograms:
+        print("HTTP latency by host:")
+        _print_latency(histograms)
 
 
 if __name__ == "__main__":
@@ -77,6 +77,14 @@ def _record_failure(client: httpx.Client) -> None:
         state.opened_until_epoch = time.time() + _reset_seconds()
 
 
+def circuit_is_open(client: httpx.Client) -> bool:
+    """Whether calls through ``client`` would currently fail fast with ``CircuitOpenError``."""
+    if not _circuit_enabled():
+        return False
+    state = _CIRCUIT_STATES.get(_circuit_key(client))
+    return state is not None and state.opened_until_epoch > time.time()
+
+
 def reset_circuit_breakers() -> None:
     _CIRCUIT_STATES.clear()
 
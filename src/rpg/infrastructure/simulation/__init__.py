@@ -0,0 +1 @@
+"""Headless simulation hosts for running many worlds without a game session."""
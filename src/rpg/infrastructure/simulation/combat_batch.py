@@ -0,0 +1,80 @@
+"""Resolve many independent AI-driven party fights, optionally across processes.
+
+Each ``CombatEncounter`` carries its own seed and is resolved inside
+``CombatService.seeded``, so a fight's outcome depends only on the encounter
+and never on which worker ran it or in what order.  ``resolve_encounters``
+therefore returns the same results for ``workers=0`` (in-process) and any pool
+size, in input order.  Inputs are never mutated.
+"""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Optional, Sequence
+
+from rpg.application.services.combat_ai_policy import CombatAiPolicy
+from rpg.application.services.combat_service import CombatService, PartyCombatResult
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+
+
+@dataclass(frozen=True)
+class CombatEncounter:
+    allies: tuple[Character, ...]
+    enemies: tuple[Entity, ...]
+    seed: int
+    scene: Optional[dict] = None
+
+
+def resolve_encounter(combat: CombatService, encounter: CombatEncounter) -> PartyCombatResult:
+    """Resolve one encounter on ``combat`` with a per-fight RNG; safe to call from several threads."""
+    with combat.seeded(int(encounter.seed)):
+        return combat.fight_party_turn_based(
+            allies=list(encounter.allies),
+            enemies=[replace(enemy, tags=list(enemy.tags)) for enemy in encounter.enemies],
+            choose_action=None,
+            scene=copy.deepcopy(encounter.scene) if isinstance(encounter.scene, dict) else None,
+        )
+
+
+def _resolve_chunk(
+    encounters: Sequence[CombatEncounter],
+    verbosity: str,
+    ai_policy: CombatAiPolicy | None = None,
+) -> list[PartyCombatResult]:
+    combat = CombatService(verbosity=verbosity, ai_policy=ai_policy, publish_feature_events=False)
+    return [resolve_encounter(combat, encounter) for encounter in encounters]
+
+
+def resolve_encounters(
+    encounters: Sequence[CombatEncounter],
+    *,
+    workers: int = 0,
+    verbosity: str = "compact",
+    chunk_size: int | None = None,
+    start_method: str | None = None,
+    ai_policy: CombatAiPolicy | None = None,
+) -> list[PartyCombatResult]:
+    """Resolve ``encounters`` and return their results in input order.
+
+    ``workers=0`` runs in-process; any positive value fans chunks out over a
+    process pool with identical results.  ``ai_policy`` must be picklable when
+    workers are used.
+    """
+    rows = list(encounters)
+    workers = max(0, int(workers))
+    if workers == 0 or len(rows) <= 1:
+        return _resolve_chunk(rows, verbosity, ai_policy)
+
+    size = max(1, int(chunk_size) if chunk_size else -(-len(rows) // (workers * 4)))
+    chunks = [rows[offset : offset + size] for offset in range(0, len(rows), size)]
+    context = multiprocessing.get_context(start_method)
+    results: list[PartyCombatResult] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(_resolve_chunk, chunk, verbosity, ai_policy) for chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+    return results
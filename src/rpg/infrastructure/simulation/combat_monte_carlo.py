@@ -0,0 +1,321 @@
+"""Monte Carlo outcome estimates for party encounters using the real combat engine.
+
+Every trial calls ``CombatService.fight_party_turn_based`` with the built-in AI
+driving both sides. Trial seeds are derived from the base seed and the trial
+index, so a report only depends on its inputs and never on the worker count.
+
+Usage examples:
+    python -m rpg.infrastructure.simulation.combat_monte_carlo --trials 2000 --workers 4
+    python -m rpg.infrastructure.simulation.combat_monte_carlo --scenario scenario.json --trials 500 --workers 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import multiprocessing
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Sequence
+
+from rpg.application.dtos import EncounterPlan
+from rpg.application.services.balance_tables import difficulty_profile_for_slug
+from rpg.application.services.combat_ai_policy import CombatAiPolicy
+from rpg.application.services.combat_service import CombatService
+from rpg.application.services.seed_policy import derive_seed
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.domain.services.spellcasting import normalize_slot_ledger
+
+
+TRIAL_SEED_NAMESPACE = "combat.monte_carlo.trial"
+
+
+@dataclass(frozen=True)
+class CombatTrialOutcome:
+    trial: int
+    seed: int
+    allies_won: bool
+    fled: bool
+    rounds: int
+    ally_hp_remaining: tuple[int, ...]
+    ally_hp_max: tuple[int, ...]
+    enemy_hp_remaining: tuple[int, ...]
+    spell_slots_spent: int
+
+    @property
+    def timed_out(self) -> bool:
+        return not self.allies_won and not self.fled and any(hp > 0 for hp in self.ally_hp_remaining)
+
+    @property
+    def ally_hp_fraction(self) -> float:
+        total_max = sum(self.ally_hp_max)
+        return sum(self.ally_hp_remaining) / total_max if total_max > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class CombatSimulationReport:
+    trials: int
+    seed: int
+    wins: int
+    losses: int
+    fled: int
+    timeouts: int
+    rounds_histogram: dict[int, int] = field(default_factory=dict)
+    rounds_mean: float = 0.0
+    rounds_p50: int = 0
+    rounds_p90: int = 0
+    ally_hp_fraction_mean: float = 0.0
+    ally_hp_fraction_on_win_mean: float = 0.0
+    ally_hp_remaining_mean: tuple[float, ...] = ()
+    spell_slots_spent_mean: float = 0.0
+    spell_slots_spent_max: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trials if self.trials > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "trials": int(self.trials),
+            "seed": int(self.seed),
+            "wins": int(self.wins),
+            "losses": int(self.losses),
+            "fled": int(self.fled),
+            "timeouts": int(self.timeouts),
+            "win_rate": round(self.win_rate, 4),
+            "rounds_histogram": {str(key): int(value) for key, value in sorted(self.rounds_histogram.items())},
+            "rounds_mean": round(self.rounds_mean, 3),
+            "rounds_p50": int(self.rounds_p50),
+            "rounds_p90": int(self.rounds_p90),
+            "ally_hp_fraction_mean": round(self.ally_hp_fraction_mean, 4),
+            "ally_hp_fraction_on_win_mean": round(self.ally_hp_fraction_on_win_mean, 4),
+            "ally_hp_remaining_mean": [round(value, 3) for value in self.ally_hp_remaining_mean],
+            "spell_slots_spent_mean": round(self.spell_slots_spent_mean, 4),
+            "spell_slots_spent_max": int(self.spell_slots_spent_max),
+        }
+
+
+def trial_seed(base_seed: int, trial: int) -> int:
+    return derive_seed(namespace=TRIAL_SEED_NAMESPACE, context={"seed": int(base_seed), "trial": int(trial)})
+
+
+def _slots_remaining(actor: Character) -> int:
+    _, current = normalize_slot_ledger(actor)
+    return sum(int(value) for value in current.values())
+
+
+def _apply_difficulty(allies: Sequence[Character], difficulty: str | None) -> list[Character]:
+    """Scale ally HP by the tier's ``hp_multiplier``, as character creation does.
+
+    The tier's damage multipliers are left alone because the party combat engine
+    does not read them.
+    """
+    if difficulty is None:
+        return list(allies)
+    profile = difficulty_profile_for_slug(difficulty)
+    hp_multiplier = float(profile.get("hp_multiplier", 1.0) or 1.0)
+    rows: list[Character] = []
+    for ally in allies:
+        hp_max = max(1, int(int(ally.hp_max) * hp_multiplier))
+        rows.append(
+            replace(
+                ally,
+                difficulty=str(difficulty),
+                hp_max=hp_max,
+                hp_current=max(1, min(hp_max, int(int(ally.hp_current) * hp_multiplier))),
+            )
+        )
+    return rows
+
+
+def run_combat_trial(
+    combat: CombatService,
+    allies: Sequence[Character],
+    enemies: Sequence[Entity],
+    *,
+    seed: int,
+    trial: int = 0,
+    scene: dict | None = None,
+) -> CombatTrialOutcome:
+    """Resolve one AI-vs-AI party fight; inputs are never mutated."""
+    slots_before = sum(_slots_remaining(copy.deepcopy(ally)) for ally in allies)
+    with combat.seeded(int(seed)):
+        result = combat.fight_party_turn_based(
+            allies=list(allies),
+            enemies=[replace(enemy, tags=list(enemy.tags)) for enemy in enemies],
+            choose_action=None,
+            scene=copy.deepcopy(scene) if isinstance(scene, dict) else None,
+        )
+    slots_after = sum(_slots_remaining(ally) for ally in result.allies)
+    return CombatTrialOutcome(
+        trial=int(trial),
+        seed=int(seed),
+        allies_won=bool(result.allies_won),
+        fled=bool(result.fled),
+        rounds=int(result.rounds),
+        ally_hp_remaining=tuple(max(0, int(ally.hp_current)) for ally in result.allies),
+        ally_hp_max=tuple(max(1, int(ally.hp_max)) for ally in result.allies),
+        enemy_hp_remaining=tuple(max(0, int(enemy.hp_current)) for enemy in result.enemies),
+        spell_slots_spent=max(0, int(slots_before) - int(slots_after)),
+    )
+
+
+def _run_trial_chunk(
+    allies: Sequence[Character],
+    enemies: Sequence[Entity],
+    scene: dict | None,
+    base_seed: int,
+    trial_indexes: Sequence[int],
+    ai_policy: CombatAiPolicy | None = None,
+) -> list[CombatTrialOutcome]:
+    combat = CombatService(verbosity="compact", ai_policy=ai_policy, publish_feature_events=False)
+    return [
+        run_combat_trial(combat, allies, enemies, seed=trial_seed(base_seed, index), trial=index, scene=scene)
+        for index in trial_indexes
+    ]
+
+
+def _percentile(sorted_values: Sequence[int], fraction: float) -> int:
+    if not sorted_values:
+        return 0
+    position = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return int(sorted_values[position])
+
+
+def summarize_outcomes(outcomes: Sequence[CombatTrialOutcome], *, seed: int = 0) -> CombatSimulationReport:
+    rows = sorted(outcomes, key=lambda row: row.trial)
+    if not rows:
+        return CombatSimulationReport(trials=0, seed=int(seed), wins=0, losses=0, fled=0, timeouts=0)
+    rounds = sorted(row.rounds for row in rows)
+    histogram: dict[int, int] = {}
+    for value in rounds:
+        histogram[value] = histogram.get(value, 0) + 1
+    wins = [row for row in rows if row.allies_won]
+    ally_count = max(len(row.ally_hp_remaining) for row in rows)
+    hp_means = tuple(
+        statistics.fmean(row.ally_hp_remaining[index] if index < len(row.ally_hp_remaining) else 0 for row in rows)
+        for index in range(ally_count)
+    )
+    return CombatSimulationReport(
+        trials=len(rows),
+        seed=int(seed),
+        wins=len(wins),
+        losses=sum(1 for row in rows if not row.allies_won and not row.fled and not row.timed_out),
+        fled=sum(1 for row in rows if row.fled),
+        timeouts=sum(1 for row in rows if row.timed_out),
+        rounds_histogram=histogram,
+        rounds_mean=statistics.fmean(rounds),
+        rounds_p50=_percentile(rounds, 0.5),
+        rounds_p90=_percentile(rounds, 0.9),
+        ally_hp_fraction_mean=statistics.fmean(row.ally_hp_fraction for row in rows),
+        ally_hp_fraction_on_win_mean=statistics.fmean(row.ally_hp_fraction for row in wins) if wins else 0.0,
+        ally_hp_remaining_mean=hp_means,
+        spell_slots_spent_mean=statistics.fmean(row.spell_slots_spent for row in rows),
+        spell_slots_spent_max=max(row.spell_slots_spent for row in rows),
+    )
+
+
+def simulate_encounter(
+    allies: Sequence[Character],
+    enemies: Sequence[Entity] | EncounterPlan,
+    *,
+    trials: int = 1000,
+    seed: int = 0,
+    workers: int = 0,
+    scene: dict | None = None,
+    difficulty: str | None = None,
+    chunk_size: int | None = None,
+    start_method: str | None = None,
+    ai_policy: CombatAiPolicy | None = None,
+) -> CombatSimulationReport:
+    """Run ``trials`` seeded fights and aggregate the outcomes.
+
+    ``workers=0`` runs in-process, which is what calibration tests use; any
+    positive value fans trial chunks out over a process pool. ``ai_policy``
+    swaps in alternate combat AI for both sides; it must be picklable when
+    workers are used.
+    """
+    enemy_rows = list(enemies.enemies if isinstance(enemies, EncounterPlan) else enemies)
+    ally_rows = _apply_difficulty(allies, difficulty)
+    total = max(0, int(trials))
+    indexes = list(range(total))
+    workers = max(0, int(workers))
+    if workers == 0 or total <= 1:
+        outcomes = _run_trial_chunk(ally_rows, enemy_rows, scene, int(seed), indexes, ai_policy)
+        return summarize_outcomes(outcomes, seed=int(seed))
+
+    size = max(1, int(chunk_size) if chunk_size else -(-total // (workers * 4)))
+    chunks = [indexes[offset : offset + size] for offset in range(0, total, size)]
+    context = multiprocessing.get_context(start_method)
+    outcomes: list[CombatTrialOutcome] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(_run_trial_chunk, ally_rows, enemy_rows, scene, int(seed), chunk, ai_policy) for chunk in chunks]
+        for future in futures:
+            outcomes.extend(future.result())
+    return summarize_outcomes(outcomes, seed=int(seed))
+
+
+def _default_scenario() -> dict:
+    return {
+        "allies": [
+            {
+                "id": 1,
+                "name": "Rogue",
+                "level": 3,
+                "class_name": "rogue",
+                "hp_max": 21,
+                "hp_current": 21,
+                "attack_bonus": 5,
+                "damage_die": "d6",
+                "armour_class": 14,
+                "attributes": {"strength": 10, "dexterity": 16, "constitution": 12},
+            }
+        ],
+        "enemies": [
+            {"id": 101, "name": "Goblin", "level": 1, "hp": 7, "armour_class": 13, "attack_bonus": 4, "damage_die": "d6", "kind": "humanoid"},
+            {"id": 102, "name": "Goblin Archer", "level": 1, "hp": 7, "armour_class": 13, "attack_bonus": 4, "damage_die": "d6", "kind": "humanoid"},
+        ],
+        "scene": {"distance": "engaged", "terrain": "open"},
+    }
+
+
+def load_scenario(path: str | Path | None) -> tuple[list[Character], list[Entity], dict | None]:
+    payload = _default_scenario() if path is None else json.loads(Path(path).read_text(encoding="utf-8"))
+    allies = [Character(**dict(row)) for row in list(payload.get("allies", []) or [])]
+    enemies = [Entity(**dict(row)) for row in list(payload.get("enemies", []) or [])]
+    scene = payload.get("scene")
+    return allies, enemies, dict(scene) if isinstance(scene, dict) else None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Estimate encounter outcomes with seeded AI-vs-AI combat trials")
+    parser.add_argument("--scenario", default=None, help="JSON file with allies, enemies and optional scene")
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0, help="Process pool size; 0 runs in-process")
+    parser.add_argument("--difficulty", default=None, help="Scale ally HP by a difficulty tier's hp_multiplier")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    allies, enemies, scene = load_scenario(args.scenario)
+    report = simulate_encounter(
+        allies,
+        enemies,
+        trials=int(args.trials),
+        seed=int(args.seed),
+        workers=int(args.workers),
+        scene=scene,
+        difficulty=args.difficulty,
+    )
+    print(json.dumps(report.to_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
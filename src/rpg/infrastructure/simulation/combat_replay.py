@@ -0,0 +1,248 @@
+"""Compact binary replays of seeded combats.
+
+A replay stores the combat seed, the recording verbosity, every answer the
+``choose_action`` callback gave and the structured event stream from the
+combat log.  Re-running the same fight with the same combatants, seed and
+recorded answers reproduces the event stream exactly, which
+``verify_replay`` checks.  Text is only rendered when ``CombatReplay.render``
+is asked for it.
+
+Encoding (little-endian varints, signed values zigzag-encoded)::
+
+    b"RPGR" | version | zigzag seed | verbosity rank
+    | string count, (length, utf-8 bytes)*
+    | choice count, (kind, action index, target index)*
+    | event count, (code, level, name count, name index*, value count, zigzag value*)*
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from rpg.application.services.combat_events import VERBOSITY_RANK, CombatLogEntry, entry_from_event, render_log
+
+MAGIC = b"RPGR"
+FORMAT_VERSION = 1
+
+_CHOICE_TEXT = 0
+_CHOICE_PAIR = 1
+_CHOICE_PAIR_NO_TARGET = 2
+
+CombatEvent = Tuple[int, int, Tuple[str, ...], Tuple[int, ...]]
+RecordedChoice = object  # ``str`` or ``(action, target-or-None)`` exactly as returned by choose_action
+FightRunner = Callable[[object, Optional[Callable]], object]
+
+
+class ReplayFormatError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CombatReplay:
+    seed: int
+    verbosity: str
+    choices: Tuple[RecordedChoice, ...]
+    events: Tuple[CombatEvent, ...]
+
+    def entries(self) -> List[CombatLogEntry]:
+        return [entry_from_event(*event) for event in self.events]
+
+    def render(self, verbosity: Optional[str] = None) -> List[str]:
+        return render_log(self.entries(), verbosity or self.verbosity)
+
+    def to_bytes(self) -> bytes:
+        strings: dict[str, int] = {}
+
+        def intern(value: Optional[str]) -> int:
+            if value is None:
+                return 0
+            index = strings.get(value)
+            if index is None:
+                index = len(strings) + 1
+                strings[value] = index
+            return index
+
+        body = bytearray()
+        _write_uvarint(body, len(self.choices))
+        for choice in self.choices:
+            if isinstance(choice, tuple):
+                action, target = choice
+                body.append(_CHOICE_PAIR if target is not None else _CHOICE_PAIR_NO_TARGET)
+                _write_uvarint(body, intern(str(action)))
+                _write_uvarint(body, intern(None if target is None else str(target)))
+            else:
+                body.append(_CHOICE_TEXT)
+                _write_uvarint(body, intern(str(choice)))
+                _write_uvarint(body, 0)
+        _write_uvarint(body, len(self.events))
+        for code, level, names, values in self.events:
+            _write_uvarint(body, code)
+            body.append(level)
+            _write_uvarint(body, len(names))
+            for name in names:
+                _write_uvarint(body, intern(name))
+            _write_uvarint(body, len(values))
+            for value in values:
+                _write_uvarint(body, _zigzag(value))
+
+        out = bytearray(MAGIC)
+        out.append(FORMAT_VERSION)
+        _write_uvarint(out, _zigzag(self.seed))
+        out.append(VERBOSITY_RANK.get(self.verbosity, 0))
+        _write_uvarint(out, len(strings))
+        for value in strings:
+            encoded = value.encode("utf-8")
+            _write_uvarint(out, len(encoded))
+            out += encoded
+        out += body
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CombatReplay":
+        if data[:4] != MAGIC:
+            raise ReplayFormatError("Not a combat replay.")
+        if len(data) < 5 or data[4] != FORMAT_VERSION:
+            raise ReplayFormatError("Unsupported combat replay version.")
+        reader = _Reader(data, 5)
+        seed = _unzigzag(reader.uvarint())
+        rank = reader.byte()
+        verbosity = next((name for name, value in VERBOSITY_RANK.items() if value == rank), "compact")
+        strings: list[Optional[str]] = [None]
+        for _ in range(reader.uvarint()):
+            strings.append(reader.take(reader.uvarint()).decode("utf-8"))
+
+        choices: list[RecordedChoice] = []
+        for _ in range(reader.uvarint()):
+            kind = reader.byte()
+            action = strings[reader.uvarint()]
+            target = strings[reader.uvarint()]
+            if kind == _CHOICE_TEXT:
+                choices.append(action)
+            elif kind == _CHOICE_PAIR:
+                choices.append((action, target))
+            elif kind == _CHOICE_PAIR_NO_TARGET:
+                choices.append((action, None))
+            else:
+                raise ReplayFormatError(f"Unknown choice kind {kind}.")
+
+        events: list[CombatEvent] = []
+        for _ in range(reader.uvarint()):
+            code = reader.uvarint()
+            level = reader.byte()
+            names = tuple(strings[reader.uvarint()] or "" for _ in range(reader.uvarint()))
+            values = tuple(_unzigzag(reader.uvarint()) for _ in range(reader.uvarint()))
+            events.append((code, level, names, values))
+        if not reader.at_end():
+            raise ReplayFormatError("Trailing bytes after combat replay.")
+        return cls(seed=seed, verbosity=verbosity, choices=tuple(choices), events=tuple(events))
+
+
+def events_from_log(log: Sequence[CombatLogEntry]) -> Tuple[CombatEvent, ...]:
+    return tuple(entry.event() for entry in log)
+
+
+def record_combat(
+    service,
+    seed: int,
+    run: FightRunner,
+    choose_action: Optional[Callable] = None,
+) -> tuple[object, CombatReplay]:
+    """Run ``run(service, choose_action)`` under ``seed`` and capture a replay of it.
+
+    ``run`` starts the fight, e.g. ``lambda svc, choose: svc.fight_turn_based(hero, goblin, choose)``.
+    """
+    choices: list[RecordedChoice] = []
+    recording = None
+    if choose_action is not None:
+
+        def recording(*args, **kwargs):
+            choice = choose_action(*args, **kwargs)
+            choices.append(tuple(choice) if isinstance(choice, (tuple, list)) else choice)
+            return choice
+
+    with service.seeded(seed):
+        result = run(service, recording)
+    replay = CombatReplay(
+        seed=int(seed),
+        verbosity=str(service.verbosity),
+        choices=tuple(choices),
+        events=events_from_log(result.log),
+    )
+    return result, replay
+
+
+def replay_combat(service, replay: CombatReplay, run: FightRunner) -> object:
+    """Re-run a recorded fight, answering ``choose_action`` from the replay."""
+    pending: Iterator[RecordedChoice] = iter(replay.choices)
+
+    def replaying(*_args, **_kwargs):
+        try:
+            return next(pending)
+        except StopIteration:
+            raise ReplayFormatError("Replay ran out of recorded choices.") from None
+
+    previous_verbosity = service.verbosity
+    service.verbosity = replay.verbosity
+    try:
+        with service.seeded(replay.seed):
+            return run(service, replaying if replay.choices else None)
+    finally:
+        service.verbosity = previous_verbosity
+
+
+def verify_replay(service, replay: CombatReplay, run: FightRunner) -> bool:
+    result = replay_combat(service, replay, run)
+    return events_from_log(result.log) == replay.events
+
+
+def _zigzag(value: int) -> int:
+    value = int(value)
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes, pos: int) -> None:
+        self.data = data
+        self.pos = pos
+
+    def byte(self) -> int:
+        if self.pos >= len(self.data):
+            raise ReplayFormatError("Truncated combat replay.")
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def uvarint(self) -> int:
+        shift = 0
+        value = 0
+        while True:
+            byte = self.byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def take(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            raise ReplayFormatError("Truncated combat replay.")
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def at_end(self) -> bool:
+        return self.pos == len(self.data)
@@ -0,0 +1,394 @@
+"""Headless host that keeps many worlds resident and advances them in shards.
+
+Usage examples:
+    python -m rpg.infrastructure.simulation.world_host --worlds 2000 --workers 4 --rounds 20
+    python -m rpg.infrastructure.simulation.world_host --worlds 64 --workers 0 --rounds 5 --print-json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from rpg.application.services.event_bus import EventBus
+from rpg.application.services.quest_service import register_quest_handlers
+from rpg.application.services.story_director import StoryDirector, register_story_director_handlers
+from rpg.application.services.world_progression import WorldProgression
+from rpg.infrastructure.db.inmemory.repos import (
+    InMemoryCharacterRepository,
+    InMemoryEntityRepository,
+    InMemoryWorldRepository,
+)
+
+
+SUPPORTED_INTENTS = ("advance", "set_threat", "cataclysm_pushback")
+
+
+def _coerce_intent(intent: str, payload: dict) -> dict:
+    """Payload with the fields ``_advance`` reads already coerced; raises ``ValueError`` for bad values."""
+    try:
+        if intent == "advance":
+            return {"ticks": max(0, int(payload.get("ticks", 1) or 0))}
+        if intent == "set_threat":
+            return {"threat_level": max(0, int(payload.get("threat_level", 0) or 0))}
+        if intent == "cataclysm_pushback":
+            return {
+                "action_id": str(payload.get("action_id", "")),
+                "strength": int(payload.get("strength", 1) or 1),
+            }
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid payload for world intent '{intent}': {exc}") from None
+    return dict(payload)
+
+
+@dataclass
+class _ResidentWorld:
+    world_key: int
+    world_repo: InMemoryWorldRepository
+    progression: WorldProgression
+    director: StoryDirector
+    pending_intents: list[tuple[str, dict]] = field(default_factory=list)
+
+
+class WorldShard:
+    """Resident worlds owned by one worker; also used directly when ``workers=0``."""
+
+    def __init__(self, shard_index: int = 0, *, cadence_turns: int = 3) -> None:
+        self.shard_index = int(shard_index)
+        self.cadence_turns = max(1, int(cadence_turns))
+        self._worlds: dict[int, _ResidentWorld] = {}
+        self._entity_repo = InMemoryEntityRepository([])
+        self._world_ticks = 0
+        self._busy_seconds = 0.0
+
+    def add_world(self, world_key: int, seed: int, threat_level: int = 0) -> None:
+        key = int(world_key)
+        if key in self._worlds:
+            raise ValueError(f"World {key} is already resident on shard {self.shard_index}.")
+        event_bus = EventBus()
+        world_repo = InMemoryWorldRepository(seed=int(seed))
+        world = world_repo.load_default()
+        world.threat_level = max(0, int(threat_level))
+        world_repo.save(world)
+        progression = WorldProgression(world_repo, self._entity_repo, event_bus)
+        register_quest_handlers(event_bus, world_repo=world_repo, character_repo=InMemoryCharacterRepository({}))
+        director = register_story_director_handlers(
+            event_bus=event_bus,
+            world_repo=world_repo,
+            cadence_turns=self.cadence_turns,
+        )
+        self._worlds[key] = _ResidentWorld(
+            world_key=key,
+            world_repo=world_repo,
+            progression=progression,
+            director=director,
+        )
+
+    def remove_world(self, world_key: int) -> bool:
+        return self._worlds.pop(int(world_key), None) is not None
+
+    def submit_intent(self, world_key: int, intent: str, payload: dict | None = None) -> None:
+        resident = self._worlds.get(int(world_key))
+        if resident is None:
+            raise KeyError(f"World {int(world_key)} is not resident on shard {self.shard_index}.")
+        name = str(intent)
+        resident.pending_intents.append((name, _coerce_intent(name, dict(payload or {}))))
+
+    def step(self, ticks: int = 1) -> dict:
+        started = time.perf_counter()
+        world_ticks = 0
+        for key in sorted(self._worlds):
+            world_ticks += self._advance(self._worlds[key], ticks=max(0, int(ticks)))
+        elapsed = time.perf_counter() - started
+        self._world_ticks += world_ticks
+        self._busy_seconds += elapsed
+        return {
+            "shard": self.shard_index,
+            "worlds": len(self._worlds),
+            "world_ticks": int(world_ticks),
+            "elapsed_s": round(elapsed, 6),
+            "ticks_per_second": round(world_ticks / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+
+    def snapshot(self, world_key: int) -> dict:
+        resident = self._worlds.get(int(world_key))
+        if resident is None:
+            raise KeyError(f"World {int(world_key)} is not resident on shard {self.shard_index}.")
+        world = resident.world_repo.load_default()
+        flags = world.flags if isinstance(world.flags, dict) else {}
+        narrative = flags.get("narrative", {}) if isinstance(flags.get("narrative", {}), dict) else {}
+        cataclysm = flags.get("cataclysm_state", {}) if isinstance(flags.get("cataclysm_state", {}), dict) else {}
+        injections = narrative.get("injections", [])
+        return {
+            "world_key": int(resident.world_key),
+            "shard": self.shard_index,
+            "seed": int(getattr(world, "rng_seed", 0) or 0),
+            "turn": int(getattr(world, "current_turn", 0) or 0),
+            "threat_level": int(getattr(world, "threat_level", 0) or 0),
+            "tension_level": int(narrative.get("tension_level", 0) or 0),
+            "injection_count": len(injections) if isinstance(injections, list) else 0,
+            "cataclysm_active": bool(cataclysm.get("active", False)),
+            "cataclysm_kind": str(cataclysm.get("kind", "") or ""),
+            "pending_intents": len(resident.pending_intents),
+        }
+
+    def stats(self) -> dict:
+        busy = float(self._busy_seconds)
+        return {
+            "shard": self.shard_index,
+            "worlds": len(self._worlds),
+            "world_ticks": int(self._world_ticks),
+            "busy_s": round(busy, 6),
+            "ticks_per_second": round(self._world_ticks / busy, 2) if busy > 0 else 0.0,
+        }
+
+    def handle(self, command: str, args: tuple):
+        handler = getattr(self, command, None)
+        if command.startswith("_") or not callable(handler):
+            raise ValueError(f"Unknown shard command: {command}")
+        return handler(*args)
+
+    def _advance(self, resident: _ResidentWorld, *, ticks: int) -> int:
+        extra_ticks = 0
+        intents, resident.pending_intents = resident.pending_intents, []
+        for intent, payload in intents:
+            if intent == "advance":
+                extra_ticks += payload["ticks"]
+            elif intent == "set_threat":
+                world = resident.world_repo.load_default()
+                world.threat_level = payload["threat_level"]
+                resident.world_repo.save(world)
+            elif intent == "cataclysm_pushback":
+                resident.director.submit_cataclysm_pushback(
+                    action_id=payload["action_id"],
+                    strength=payload["strength"],
+                )
+
+        total = int(ticks) + int(extra_ticks)
+        for _ in range(total):
+            resident.progression.tick(resident.world_repo.load_default(), ticks=1)
+        return total
+
+
+def _shard_worker_main(connection, shard_index: int, cadence_turns: int) -> None:
+    shard = WorldShard(shard_index, cadence_turns=cadence_turns)
+    while True:
+        try:
+            command, args = connection.recv()
+        except EOFError:
+            return
+        if command == "stop":
+            connection.send(("ok", None))
+            return
+        try:
+            connection.send(("ok", shard.handle(command, args)))
+        except Exception as exc:
+            connection.send(("error", exc))
+
+
+class _ProcessShardClient:
+    def __init__(self, context, shard_index: int, cadence_turns: int) -> None:
+        self.shard_index = int(shard_index)
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_shard_worker_main,
+            args=(child_connection, self.shard_index, int(cadence_turns)),
+            name=f"world-shard-{self.shard_index}",
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+
+    def send(self, command: str, *args) -> None:
+        self._connection.send((command, args))
+
+    def receive(self):
+        status, value = self._connection.recv()
+        if status == "error":
+            raise value
+        return value
+
+    def call(self, command: str, *args):
+        self.send(command, *args)
+        return self.receive()
+
+    def close(self) -> None:
+        if self._process.is_alive():
+            try:
+                self.call("stop")
+            except (EOFError, OSError):
+                pass
+        self._process.join(timeout=5)
+        self._connection.close()
+
+
+class _LocalShardClient:
+    def __init__(self, shard_index: int, cadence_turns: int) -> None:
+        self.shard_index = int(shard_index)
+        self._shard = WorldShard(shard_index, cadence_turns=cadence_turns)
+        self._pending: list[tuple[str, tuple]] = []
+
+    def send(self, command: str, *args) -> None:
+        self._pending.append((command, args))
+
+    def receive(self):
+        command, args = self._pending.pop(0)
+        return self._shard.handle(command, args)
+
+    def call(self, command: str, *args):
+        return self._shard.handle(command, args)
+
+    def close(self) -> None:
+        self._pending.clear()
+
+
+class WorldSimulationHost:
+    """Keeps worlds resident across shard workers and advances them on a schedule.
+
+    ``workers=0`` runs a single in-process shard, which is useful for tests and
+    debugging. World evolution only depends on the world seed and submitted
+    intents, so results are identical for any worker count.
+    """
+
+    def __init__(self, workers: int = 0, *, cadence_turns: int = 3, start_method: str | None = None) -> None:
+        self.workers = max(0, int(workers))
+        if self.workers == 0:
+            self._shards = [_LocalShardClient(0, cadence_turns)]
+        else:
+            context = multiprocessing.get_context(start_method)
+            self._shards = [_ProcessShardClient(context, index, cadence_turns) for index in range(self.workers)]
+        self._world_shards: dict[int, int] = {}
+        self._rounds = 0
+
+    def __enter__(self) -> WorldSimulationHost:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def world_keys(self) -> list[int]:
+        return sorted(self._world_shards)
+
+    def add_world(self, world_key: int, *, seed: int, threat_level: int = 0) -> None:
+        key = int(world_key)
+        if key in self._world_shards:
+            raise ValueError(f"World {key} is already resident.")
+        shard_index = key % len(self._shards)
+        self._shards[shard_index].call("add_world", key, int(seed), int(threat_level))
+        self._world_shards[key] = shard_index
+
+    def add_worlds(self, seeds: Sequence[int], *, threat_level: int = 0, first_key: int = 1) -> list[int]:
+        keys = [int(first_key) + offset for offset in range(len(seeds))]
+        for key, seed in zip(keys, seeds):
+            self.add_world(key, seed=int(seed), threat_level=threat_level)
+        return keys
+
+    def remove_world(self, world_key: int) -> bool:
+        shard_index = self._world_shards.pop(int(world_key), None)
+        if shard_index is None:
+            return False
+        return bool(self._shards[shard_index].call("remove_world", int(world_key)))
+
+    def submit_intent(self, world_key: int, intent: str, **payload) -> None:
+        name = str(intent or "").strip().lower()
+        if name not in SUPPORTED_INTENTS:
+            raise ValueError(f"Unsupported world intent '{name}'. Choose one of: {', '.join(SUPPORTED_INTENTS)}.")
+        self._shard_for(world_key).call("submit_intent", int(world_key), name, dict(payload))
+
+    def step(self, ticks: int = 1) -> dict:
+        started = time.perf_counter()
+        for shard in self._shards:
+            shard.send("step", int(ticks))
+        # Drain every shard's reply before raising so no pipe is left holding a stale "step" answer.
+        shard_rows: list[dict] = []
+        first_error: Exception | None = None
+        for shard in self._shards:
+            try:
+                shard_rows.append(shard.receive())
+            except Exception as exc:
+                if first_error is None:
+                    first_error = exc
+        if first_error is not None:
+            raise first_error
+        elapsed = time.perf_counter() - started
+        self._rounds += 1
+        world_ticks = sum(int(row.get("world_ticks", 0)) for row in shard_rows)
+        return {
+            "round": int(self._rounds),
+            "worlds": len(self._world_shards),
+            "world_ticks": int(world_ticks),
+            "elapsed_s": round(elapsed, 6),
+            "ticks_per_second": round(world_ticks / elapsed, 2) if elapsed > 0 else 0.0,
+            "shards": shard_rows,
+        }
+
+    def run(self, rounds: int, *, ticks_per_round: int = 1, interval_seconds: float = 0.0) -> list[dict]:
+        reports: list[dict] = []
+        interval = max(0.0, float(interval_seconds))
+        for index in range(max(0, int(rounds))):
+            round_started = time.perf_counter()
+            reports.append(self.step(ticks=ticks_per_round))
+            remaining = interval - (time.perf_counter() - round_started)
+            if remaining > 0 and index + 1 < int(rounds):
+                time.sleep(remaining)
+        return reports
+
+    def snapshot(self, world_key: int) -> dict:
+        return self._shard_for(world_key).call("snapshot", int(world_key))
+
+    def snapshots(self) -> list[dict]:
+        return [self.snapshot(key) for key in self.world_keys]
+
+    def worker_stats(self) -> list[dict]:
+        return [shard.call("stats") for shard in self._shards]
+
+    def close(self) -> None:
+        for shard in self._shards:
+            shard.close()
+
+    def _shard_for(self, world_key: int):
+        shard_index = self._world_shards.get(int(world_key))
+        if shard_index is None:
+            raise KeyError(f"World {int(world_key)} is not resident.")
+        return self._shards[shard_index]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Advance many resident worlds headlessly and report throughput")
+    parser.add_argument("--worlds", type=int, default=256, help="Number of resident worlds")
+    parser.add_argument("--workers", type=int, default=max(1, (multiprocessing.cpu_count() or 2) - 1), help="Shard worker processes; 0 runs in-process")
+    parser.add_argument("--rounds", type=int, default=10, help="Scheduled rounds to run")
+    parser.add_argument("--ticks-per-round", type=int, default=1, help="World ticks applied to every world each round")
+    parser.add_argument("--interval", type=float, default=0.0, help="Seconds between round starts")
+    parser.add_argument("--seed-base", type=int, default=1000, help="Seed of the first world; later worlds increment it")
+    parser.add_argument("--threat", type=int, default=3, help="Initial threat level for every world")
+    parser.add_argument("--print-json", action="store_true", help="Print per-round and per-worker reports as JSON")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    seeds = [int(args.seed_base) + index for index in range(max(0, int(args.worlds)))]
+    with WorldSimulationHost(workers=int(args.workers)) as host:
+        host.add_worlds(seeds, threat_level=int(args.threat))
+        reports = host.run(int(args.rounds), ticks_per_round=int(args.ticks_per_round), interval_seconds=float(args.interval))
+        stats = host.worker_stats()
+
+    total_ticks = sum(int(row.get("world_ticks", 0)) for row in reports)
+    total_elapsed = sum(float(row.get("elapsed_s", 0.0)) for row in reports)
+    print(f"Worlds={len(seeds)} Workers={int(args.workers)} Rounds={len(reports)} WorldTicks={total_ticks}")
+    print(f"Aggregate ticks/s={round(total_ticks / total_elapsed, 2) if total_elapsed > 0 else 0.0}")
+    for row in stats:
+        print(f"  shard {row['shard']}: worlds={row['worlds']} ticks={row['world_ticks']} ticks/s={row['ticks_per_second']}")
+    if args.print_json:
+        print(json.dumps({"rounds": reports, "workers": stats}, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,17 +3,20 @@
 Usage:
     python -m rpg.infrastructure.world_import.build_unified_reference_world
     python -m rpg.infrastructure.world_import.build_unified_reference_world --output data/reference_world/unified_reference_world.json
+    python -m rpg.infrastructure.world_import.build_unified_reference_world --emit-compiled
 """
 
 from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 
-from rpg.infrastructure.world_import.reference_dataset_loader import load_reference_world_dataset
+from rpg.infrastructure.world_import.reference_dataset_loader import (
+    compile_reference_world_dataset,
+    load_reference_world_dataset,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -28,12 +31,17 @@ def build_parser() -> argparse.ArgumentParser:
         default="data/reference_world/unified_reference_world.json",
         help="Output JSON file path",
     )
+    parser.add_argument(
+        "--emit-compiled",
+        action="store_true",
+        help="Also write the precompiled binary dataset next to the JSON output",
+    )
     return parser
 
 
 def build_payload(reference_dir: Path) -> dict[str, object]:
-    dataset = load_reference_world_dataset(reference_dir)
-    model = asdict(dataset)
+    dataset = load_reference_world_dataset(reference_dir, use_compiled_cache=False)
+    model = dataset.to_dict()
     return {
         "generated_at": datetime.now(UTC).isoformat(),
         "reference_dir": str(reference_dir),
@@ -82,6 +90,9 @@ def main(argv: list[str] | None = None) -> int:
         f"rivers={counts.get('river_rows', 0)} "
         f"routes={counts.get('route_rows', 0)}"
     )
+    if args.emit_compiled:
+        compiled = compile_reference_world_dataset(output.parent)
+        print(f"Compiled reference world written to {compiled}")
     return 0
 
 
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import hashlib
 import json
-from dataclasses import dataclass
+import mmap
+import os
+import pickle
+import struct
+import weakref
 from pathlib import Path
+from typing import Callable
 
 
 _REFERENCE_FILE_PREFIXES: dict[str, str] = {
@@ -19,21 +26,104 @@ _REFERENCE_FILE_PREFIXES: dict[str, str] = {
     "states": "Pres States ",
 }
 
+UNIFIED_REFERENCE_FILENAME = "unified_reference_world.json"
+COMPILED_REFERENCE_FILENAME = "unified_reference_world.compiled.pickle"
+COMPILED_CACHE_ENABLED_ENV = "RPG_REFERENCE_WORLD_COMPILED_CACHE"
+COMPILED_CACHE_DIR_ENV = "RPG_REFERENCE_WORLD_CACHE_DIR"
+_COMPILED_MAGIC = b"RPGREFW1"
+_COMPILED_FORMAT_VERSION = 2
+_COMPILED_HEADER_LENGTH = struct.Struct("<I")
+
+
+REFERENCE_SECTIONS: tuple[str, ...] = (
+    "source_files",
+    "states_by_slug",
+    "provinces_by_state_slug",
+    "military_by_state_slug",
+    "relations_matrix",
+    "biome_rows",
+    "biome_severity_index",
+    "burg_rows",
+    "marker_rows",
+    "religion_rows",
+    "river_rows",
+    "route_rows",
+)
+
 
-@dataclass(frozen=True)
 class ReferenceWorldDataset:
-    source_files: dict[str, str]
-    states_by_slug: dict[str, dict[str, object]]
-    provinces_by_state_slug: dict[str, list[dict[str, object]]]
-    military_by_state_slug: dict[str, dict[str, object]]
-    relations_matrix: dict[str, dict[str, str]]
-    biome_rows: list[dict[str, object]]
-    biome_severity_index: dict[str, int]
-    burg_rows: list[dict[str, object]]
-    marker_rows: list[dict[str, object]]
-    religion_rows: list[dict[str, object]]
-    river_rows: list[dict[str, object]]
-    route_rows: list[dict[str, object]]
+    """Reference world sections, each materialized on first attribute access.
+
+    Sections passed to the constructor are kept as-is; the rest are produced by
+    ``section_loader`` the first time they are read.
+    """
+
+    __slots__ = ("_sections", "_section_loader")
+
+    def __init__(self, *, section_loader: Callable[[str], object] | None = None, **sections) -> None:
+        unknown = sorted(set(sections) - set(REFERENCE_SECTIONS))
+        if unknown:
+            raise TypeError(f"Unknown reference world sections: {', '.join(unknown)}")
+        missing = [name for name in REFERENCE_SECTIONS if name not in sections]
+        if missing and section_loader is None:
+            raise TypeError(f"Missing reference world sections: {', '.join(missing)}")
+        object.__setattr__(self, "_sections", dict(sections))
+        object.__setattr__(self, "_section_loader", section_loader)
+
+    def __getattr__(self, name: str):
+        if name not in REFERENCE_SECTIONS:
+            raise AttributeError(name)
+        sections = object.__getattribute__(self, "_sections")
+        if name not in sections:
+            section_loader = object.__getattribute__(self, "_section_loader")
+            if section_loader is None:
+                raise ValueError(f"Reference world section '{name}' was not loaded before the dataset was closed")
+            sections[name] = section_loader(name)
+            if len(sections) == len(REFERENCE_SECTIONS):
+                object.__setattr__(self, "_section_loader", None)
+        return sections[name]
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ReferenceWorldDataset):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(loaded_sections={list(self.loaded_sections)!r})"
+
+    def __reduce__(self):
+        return (_restore_reference_world_dataset, (self.to_dict(),))
+
+    @property
+    def loaded_sections(self) -> tuple[str, ...]:
+        sections = object.__getattribute__(self, "_sections")
+        return tuple(name for name in REFERENCE_SECTIONS if name in sections)
+
+    def to_dict(self) -> dict[str, object]:
+        return {name: getattr(self, name) for name in REFERENCE_SECTIONS}
+
+    def close(self) -> None:
+        """Release the backing artifact; sections not loaded yet can no longer be read."""
+        section_loader = object.__getattribute__(self, "_section_loader")
+        object.__setattr__(self, "_section_loader", None)
+        close = getattr(section_loader, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "ReferenceWorldDataset":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _restore_reference_world_dataset(sections: dict[str, object]) -> ReferenceWorldDataset:
+    return ReferenceWorldDataset(**sections)
 
 
 def _slugify(value: str) -> str:
@@ -74,11 +164,15 @@ def _read_csv_rows(csv_path: Path) -> list[dict[str, str]]:
 
 def discover_reference_files(reference_dir: Path) -> dict[str, Path]:
     resolved = Path(reference_dir)
+    try:
+        names = sorted(entry.name for entry in os.scandir(resolved) if entry.name.endswith(".csv"))
+    except OSError:
+        return {}
     files: dict[str, Path] = {}
     for key, prefix in _REFERENCE_FILE_PREFIXES.items():
-        candidates = sorted(resolved.glob(f"{prefix}*.csv"), key=lambda row: row.name)
+        candidates = [name for name in names if name.startswith(prefix)]
         if candidates:
-            files[key] = candidates[-1]
+            files[key] = resolved / candidates[-1]
     return files
 
 
@@ -303,6 +397,11 @@ def _load_routes(route_rows: list[dict[str, str]]) -> list[dict[str, object]]:
     return rows
 
 
+_UNIFIED_SECTION_TYPES: dict[str, type] = {
+    name: (list if name.endswith("_rows") else dict) for name in REFERENCE_SECTIONS
+}
+
+
 def _load_from_unified_json(unified_json_path: Path) -> ReferenceWorldDataset | None:
     try:
         payload = json.loads(unified_json_path.read_text(encoding="utf-8"))
@@ -311,20 +410,12 @@ def _load_from_unified_json(unified_json_path: Path) -> ReferenceWorldDataset |
     dataset = payload.get("dataset") if isinstance(payload, dict) else None
     if not isinstance(dataset, dict):
         return None
-    return ReferenceWorldDataset(
-        source_files=dict(dataset.get("source_files", {}) or {}),
-        states_by_slug=dict(dataset.get("states_by_slug", {}) or {}),
-        provinces_by_state_slug=dict(dataset.get("provinces_by_state_slug", {}) or {}),
-        military_by_state_slug=dict(dataset.get("military_by_state_slug", {}) or {}),
-        relations_matrix=dict(dataset.get("relations_matrix", {}) or {}),
-        biome_rows=list(dataset.get("biome_rows", []) or []),
-        biome_severity_index=dict(dataset.get("biome_severity_index", {}) or {}),
-        burg_rows=list(dataset.get("burg_rows", []) or []),
-        marker_rows=list(dataset.get("marker_rows", []) or []),
-        religion_rows=list(dataset.get("religion_rows", []) or []),
-        river_rows=list(dataset.get("river_rows", []) or []),
-        route_rows=list(dataset.get("route_rows", []) or []),
-    )
+
+    def _section(name: str) -> object:
+        section_type = _UNIFIED_SECTION_TYPES[name]
+        return section_type(dataset.get(name, section_type()) or section_type())
+
+    return ReferenceWorldDataset(source_files=_section("source_files"), section_loader=_section)
 
 
 def _build_biome_severity_index(biome_rows: list[dict[str, object]]) -> dict[str, int]:
@@ -348,44 +439,227 @@ def _build_biome_severity_index(biome_rows: list[dict[str, object]]) -> dict[str
     return index
 
 
-def load_reference_world_dataset(reference_dir: Path | None = None) -> ReferenceWorldDataset:
-    resolved_reference_dir = (
-        Path(reference_dir)
-        if reference_dir is not None
-        else Path(__file__).resolve().parents[4] / "data" / "reference_world"
+def _default_reference_dir() -> Path:
+    return Path(__file__).resolve().parents[4] / "data" / "reference_world"
+
+
+def reference_source_paths(reference_dir: Path) -> list[Path]:
+    files = discover_reference_files(Path(reference_dir))
+    if files:
+        return [files[key] for key in sorted(files)]
+    unified_path = Path(reference_dir) / UNIFIED_REFERENCE_FILENAME
+    return [unified_path] if unified_path.exists() else []
+
+
+def reference_source_fingerprint(reference_dir: Path, *, source_paths: list[Path] | None = None) -> str:
+    paths = reference_source_paths(reference_dir) if source_paths is None else source_paths
+    digest = hashlib.sha256(f"format:{_COMPILED_FORMAT_VERSION}".encode("utf-8"))
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _source_stat_signature(source_paths: list[Path]) -> list[list[object]]:
+    signature: list[list[object]] = []
+    for path in source_paths:
+        stat = path.stat()
+        signature.append([str(path.resolve()), int(stat.st_size), int(stat.st_mtime_ns)])
+    return signature
+
+
+def compiled_reference_path(reference_dir: Path) -> Path:
+    cache_dir = str(os.getenv(COMPILED_CACHE_DIR_ENV, "") or "").strip()
+    if cache_dir:
+        return Path(cache_dir) / COMPILED_REFERENCE_FILENAME
+    return Path(reference_dir) / COMPILED_REFERENCE_FILENAME
+
+
+def _compiled_cache_enabled() -> bool:
+    raw = str(os.getenv(COMPILED_CACHE_ENABLED_ENV, "1") or "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+class _CompiledSectionReader:
+    """Unpickles sections from a mapped compiled artifact using its offset table."""
+
+    def __init__(self, handle, mapped: mmap.mmap, base_offset: int, offsets: dict[str, list[int]]) -> None:
+        self._handle = handle
+        self._mapped = mapped
+        self._base_offset = int(base_offset)
+        self._offsets = offsets
+        _OPEN_SECTION_READERS.add(self)
+
+    def __call__(self, name: str) -> object:
+        start, length = self._offsets[name]
+        start = self._base_offset + int(start)
+        with memoryview(self._mapped) as view:
+            return pickle.loads(view[start : start + int(length)])
+
+    @property
+    def closed(self) -> bool:
+        return self._mapped.closed
+
+    def close(self) -> None:
+        _OPEN_SECTION_READERS.discard(self)
+        try:
+            self._mapped.close()
+        finally:
+            self._handle.close()
+
+    def __enter__(self) -> "_CompiledSectionReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_OPEN_SECTION_READERS: "weakref.WeakSet[_CompiledSectionReader]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_section_readers() -> None:
+    for reader in list(_OPEN_SECTION_READERS):
+        reader.close()
+
+
+def read_compiled_reference_dataset(path: Path, *, source_paths: list[Path]) -> ReferenceWorldDataset | None:
+    """Open a compiled artifact if it still matches ``source_paths``.
+
+    Matching size/mtime is trusted as-is; otherwise the sources are re-hashed so a
+    touched-but-unchanged checkout keeps using the artifact. The artifact stays
+    mapped until the dataset is closed and sections are unpickled on first access.
+    """
+    handle = None
+    mapped = None
+    reader = None
+    try:
+        handle = Path(path).open("rb")
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = len(_COMPILED_MAGIC)
+        if mapped[:offset] != _COMPILED_MAGIC:
+            raise ValueError("not a compiled reference world artifact")
+        (header_length,) = _COMPILED_HEADER_LENGTH.unpack_from(mapped, offset)
+        offset += _COMPILED_HEADER_LENGTH.size
+        header = json.loads(mapped[offset : offset + header_length].decode("utf-8"))
+        offset += header_length
+        if not isinstance(header, dict) or int(header.get("format", 0) or 0) != _COMPILED_FORMAT_VERSION:
+            raise ValueError("unsupported compiled reference world format")
+        if header.get("sources") != _source_stat_signature(source_paths):
+            fingerprint = reference_source_fingerprint(Path(path).parent, source_paths=source_paths)
+            if header.get("sha256") != fingerprint:
+                raise ValueError("compiled reference world artifact is stale")
+        offsets = header.get("sections")
+        if not isinstance(offsets, dict) or any(name not in offsets for name in REFERENCE_SECTIONS):
+            raise ValueError("compiled reference world artifact is missing sections")
+        reader = _CompiledSectionReader(handle, mapped, offset, offsets)
+        return ReferenceWorldDataset(source_files=reader("source_files"), section_loader=reader)
+    except (OSError, ValueError, EOFError, struct.error, pickle.UnpicklingError, AttributeError, ImportError):
+        if reader is not None:
+            reader.close()
+        elif mapped is not None:
+            mapped.close()
+        if handle is not None:
+            handle.close()
+        return None
+
+
+def write_compiled_reference_dataset(dataset: ReferenceWorldDataset, path: Path, *, source_paths: list[Path]) -> Path:
+    blobs: list[bytes] = []
+    offsets: dict[str, list[int]] = {}
+    position = 0
+    for name in REFERENCE_SECTIONS:
+        blob = pickle.dumps(getattr(dataset, name), protocol=pickle.HIGHEST_PROTOCOL)
+        offsets[name] = [position, len(blob)]
+        position += len(blob)
+        blobs.append(blob)
+    header = json.dumps(
+        {
+            "format": _COMPILED_FORMAT_VERSION,
+            "sources": _source_stat_signature(source_paths),
+            "sha256": reference_source_fingerprint(Path(path).parent, source_paths=source_paths),
+            "sections": offsets,
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(_COMPILED_MAGIC)
+        handle.write(_COMPILED_HEADER_LENGTH.pack(len(header)))
+        handle.write(header)
+        for blob in blobs:
+            handle.write(blob)
+    os.replace(tmp_path, target)
+    return target
+
+
+def compile_reference_world_dataset(reference_dir: Path | None = None, output: Path | None = None) -> Path:
+    resolved_reference_dir = Path(reference_dir) if reference_dir is not None else _default_reference_dir()
+    dataset = _load_reference_world_dataset_from_sources(resolved_reference_dir)
+    target = Path(output) if output is not None else compiled_reference_path(resolved_reference_dir)
+    return write_compiled_reference_dataset(
+        dataset,
+        target,
+        source_paths=reference_source_paths(resolved_reference_dir),
     )
+
+
+def load_reference_world_dataset(
+    reference_dir: Path | None = None,
+    *,
+    use_compiled_cache: bool | None = None,
+) -> ReferenceWorldDataset:
+    resolved_reference_dir = Path(reference_dir) if reference_dir is not None else _default_reference_dir()
+    use_cache = _compiled_cache_enabled() if use_compiled_cache is None else bool(use_compiled_cache)
+    source_paths = reference_source_paths(resolved_reference_dir) if use_cache else []
+    if not source_paths:
+        return _load_reference_world_dataset_from_sources(resolved_reference_dir)
+
+    cache_path = compiled_reference_path(resolved_reference_dir)
+    cached = read_compiled_reference_dataset(cache_path, source_paths=source_paths)
+    if cached is not None:
+        return cached
+
+    dataset = _load_reference_world_dataset_from_sources(resolved_reference_dir)
+    if dataset.source_files:
+        try:
+            write_compiled_reference_dataset(dataset, cache_path, source_paths=source_paths)
+        except OSError:
+            pass
+    return dataset
+
+
+def _load_reference_world_dataset_from_sources(resolved_reference_dir: Path) -> ReferenceWorldDataset:
     files = discover_reference_files(resolved_reference_dir)
 
     if not files:
-        unified_path = resolved_reference_dir / "unified_reference_world.json"
+        unified_path = resolved_reference_dir / UNIFIED_REFERENCE_FILENAME
         loaded = _load_from_unified_json(unified_path)
         if loaded is not None:
             return loaded
 
-    states = _load_states(_read_csv_rows(files["states"])) if "states" in files else {}
-    provinces = _load_provinces(_read_csv_rows(files["provinces"])) if "provinces" in files else {}
-    military = _load_military(_read_csv_rows(files["military"])) if "military" in files else {}
-    relations = _load_relations_matrix(files["relations"]) if "relations" in files else {}
-    biome_rows = _load_biomes(_read_csv_rows(files["biomes"])) if "biomes" in files else []
-    biome_severity = _build_biome_severity_index(biome_rows)
-    burg_rows = _load_burgs(_read_csv_rows(files["burgs"])) if "burgs" in files else []
-    marker_rows = _load_markers(_read_csv_rows(files["markers"])) if "markers" in files else []
-    religion_rows = _load_religions(_read_csv_rows(files["religions"])) if "religions" in files else []
-    river_rows = _load_rivers(_read_csv_rows(files["rivers"])) if "rivers" in files else []
-    route_rows = _load_routes(_read_csv_rows(files["routes"])) if "routes" in files else []
+    csv_sections: dict[str, tuple[str, Callable[[list[dict[str, str]]], object], object]] = {
+        "states_by_slug": ("states", _load_states, {}),
+        "provinces_by_state_slug": ("provinces", _load_provinces, {}),
+        "military_by_state_slug": ("military", _load_military, {}),
+        "biome_rows": ("biomes", _load_biomes, []),
+        "burg_rows": ("burgs", _load_burgs, []),
+        "marker_rows": ("markers", _load_markers, []),
+        "religion_rows": ("religions", _load_religions, []),
+        "river_rows": ("rivers", _load_rivers, []),
+        "route_rows": ("routes", _load_routes, []),
+    }
+
+    def _section(name: str) -> object:
+        if name == "relations_matrix":
+            return _load_relations_matrix(files["relations"]) if "relations" in files else {}
+        if name == "biome_severity_index":
+            return _build_biome_severity_index(dataset.biome_rows)
+        file_key, parser, empty = csv_sections[name]
+        return parser(_read_csv_rows(files[file_key])) if file_key in files else type(empty)()
 
     source_files = {key: str(path) for key, path in files.items()}
-    return ReferenceWorldDataset(
-        source_files=source_files,
-        states_by_slug=states,
-        provinces_by_state_slug=provinces,
-        military_by_state_slug=military,
-        relations_matrix=relations,
-        biome_rows=biome_rows,
-        biome_severity_index=biome_severity,
-        burg_rows=burg_rows,
-        marker_rows=marker_rows,
-        religion_rows=religion_rows,
-        river_rows=river_rows,
-        route_rows=route_rows,
-    )
+    dataset = ReferenceWorldDataset(source_files=source_files, section_loader=_section)
+    return dataset
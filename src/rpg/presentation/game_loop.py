@@ -516,6 +516,13 @@ def _render_social_result_header(outcome) -> None:
     print("=== Social Result ===")
 
 
+def _character_sheet_combat_line(sheet) -> str:
+    armor_class = int(getattr(sheet, "armor_class", 0) or 0)
+    attack_bonus = int(getattr(sheet, "attack_bonus", 0) or 0)
+    spell_attack_bonus = int(getattr(sheet, "spell_attack_bonus", 0) or 0)
+    return f"AC {armor_class} | Attack {attack_bonus:+d} | Spell {spell_attack_bonus:+d}"
+
+
 def _render_character_sheet(sheet) -> None:
     clear_screen()
     if _CONSOLE is not None and Panel is not None and Table is not None:
@@ -534,6 +541,8 @@ def _render_character_sheet(sheet) -> None:
         table.add_row("XP", f"{sheet.xp}/{sheet.next_level_xp}")
         table.add_row("To Next", str(sheet.xp_to_next_level))
         table.add_row("HP", f"{sheet.hp_current}/{sheet.hp_max}")
+        if int(getattr(sheet, "armor_class", 0) or 0) > 0:
+            table.add_row("Combat", _character_sheet_combat_line(sheet))
         table.add_row("Difficulty", str(sheet.difficulty).title())
         if getattr(sheet, "pressure_summary", ""):
             table.add_row("Pressure", str(sheet.pressure_summary))
@@ -560,6 +569,8 @@ def _render_character_sheet(sheet) -> None:
     print(f"Level: {sheet.level}")
     print(f"XP: {sheet.xp}/{sheet.next_level_xp} (to next: {sheet.xp_to_next_level})")
     print(f"HP: {sheet.hp_current}/{sheet.hp_max}")
+    if int(getattr(sheet, "armor_class", 0) or 0) > 0:
+        print(f"Combat: {_character_sheet_combat_line(sheet)}")
     print(f"Difficulty: {str(sheet.difficulty).title()}")
     if getattr(sheet, "pressure_summary", ""):
         print(f"Pressure: {sheet.pressure_summary}")
@@ -0,0 +1,129 @@
+"""Local stand-in for the remote content list endpoints.
+
+Serves Open5e-style paginated JSON (``count``/``next``/``previous``/``results``)
+from an in-memory ``{path: rows}`` mapping on 127.0.0.1, so HTTP content
+clients and the prewarm tool can be exercised offline.  Optional latency and
+per-path failure counts make concurrency limits and retries observable.
+
+Usage:
+    with ContentStubServer({"/monsters/": rows}, page_size=20) as server:
+        client = Open5eClient(base_url=server.base_url)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class ContentStubServer:
+    def __init__(
+        self,
+        resources: dict[str, list[dict]],
+        *,
+        page_size: int = 50,
+        latency_seconds: float = 0.0,
+        fail_first: dict[str, int] | None = None,
+        fail_status: int = 503,
+    ) -> None:
+        self.resources = {self._normalize_path(path): list(rows) for path, rows in resources.items()}
+        self.page_size = max(1, int(page_size))
+        self.latency_seconds = max(0.0, float(latency_seconds))
+        self.fail_status = int(fail_status)
+        self._failures_left = {self._normalize_path(path): int(count) for path, count in (fail_first or {}).items()}
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[tuple[str, int]] = []
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        return "/" + str(path).strip("/") + "/"
+
+    @property
+    def base_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("ContentStubServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ContentStubServer":
+        if self._server is not None:
+            return self
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="content-stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "ContentStubServer":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+    def _respond(self, raw_path: str) -> tuple[int, dict]:
+        parts = urlsplit(raw_path)
+        path = self._normalize_path(parts.path)
+        try:
+            page = max(1, int(parse_qs(parts.query).get("page", ["1"])[0]))
+        except ValueError:
+            page = 1
+        with self._lock:
+            self.requests.append((path, page))
+            if self._failures_left.get(path, 0) > 0:
+                self._failures_left[path] -= 1
+                return self.fail_status, {"detail": "stand-in failure"}
+        rows = self.resources.get(path)
+        if rows is None:
+            return 404, {"detail": "Not found."}
+        start = (page - 1) * self.page_size
+        end = start + self.page_size
+        return 200, {
+            "count": len(rows),
+            "next": f"{self.base_url}{path}?page={page + 1}" if end < len(rows) else None,
+            "previous": f"{self.base_url}{path}?page={page - 1}" if page > 1 else None,
+            "results": rows[start:end],
+        }
+
+    def _handler_class(self):
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with stub._lock:
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+                try:
+                    if stub.latency_seconds:
+                        # Event.wait rather than time.sleep so patched sleeps in tests keep the latency real.
+                        threading.Event().wait(stub.latency_seconds)
+                    status, payload = stub._respond(self.path)
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                return
+
+        return _Handler
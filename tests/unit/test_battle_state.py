@@ -0,0 +1,75 @@
+import random
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.battle_state import BattleState
+from rpg.application.services.combat_service import CombatService
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+
+
+def _roster(seed: int) -> tuple[list[Character], list[Entity]]:
+    rng = random.Random(seed)
+    allies = [
+        Character(index + 1, f"Hero {index}", class_name=rng.choice(["fighter", "wizard", "bard", "cleric"]), hp_max=20, hp_current=rng.randint(0, 20))
+        for index in range(rng.randint(1, 6))
+    ]
+    enemies = []
+    for index in range(rng.randint(1, 30)):
+        enemy = Entity(100 + index, rng.choice(["Goblin", "Orc Archer", "Cult Shaman", "Wolf"]), 1, hp=12)
+        enemy.hp_max = rng.choice([8, 12])
+        enemy.hp_current = rng.randint(0, 3)
+        if rng.random() < 0.3:
+            enemy.tags = [rng.choice(["lane:vanguard", "lane:rearguard"])]
+        enemies.append(enemy)
+    return allies, enemies
+
+
+class BattleStateTests(unittest.TestCase):
+    def test_picks_match_the_per_actor_helpers(self) -> None:
+        service = CombatService()
+        for seed in range(60):
+            allies, enemies = _roster(seed)
+            battle = BattleState(allies, enemies, service._combat_lane)
+            living_enemies = [row for row in enemies if row.hp_current > 0]
+            living_allies = [row for row in allies if row.hp_current > 0]
+
+            self.assertEqual(living_enemies, battle.enemies.living())
+            for attacker in allies:
+                for action in ("Attack", "Cast Spell"):
+                    self.assertEqual(
+                        service._combat_target_pool(attacker=attacker, opponents=living_enemies, action=action),
+                        battle.target_pool(attacker=attacker, opponents=living_enemies, action=action),
+                    )
+            if living_enemies:
+                self.assertIs(service._lowest_hp_target(living_enemies), battle.lowest_hp(living_enemies))
+            expected_vanguard = [row for row in living_allies + living_enemies if service._combat_lane(row) == "vanguard"]
+            self.assertEqual(expected_vanguard, battle.living_vanguard())
+
+    def test_lowest_hp_reads_current_hit_points(self) -> None:
+        service = CombatService()
+        allies, enemies = _roster(3)
+        enemies[0].hp_current, enemies[-1].hp_current = 1, 1
+        battle = BattleState(allies, enemies, service._combat_lane)
+
+        enemies[0].hp_current = 5
+
+        self.assertIs(service._lowest_hp_target([enemies[0], enemies[-1]]), battle.lowest_hp([enemies[0], enemies[-1]]))
+
+    def test_mass_battle_is_repeatable_for_a_seed(self) -> None:
+        def run() -> list[str]:
+            service = CombatService(verbosity="debug")
+            service.set_seed(17)
+            allies = [Character(index + 1, f"Hero {index}", level=4, class_name="fighter", hp_max=30, hp_current=30, attack_bonus=5, damage_die="d8") for index in range(6)]
+            enemies = [Entity(100 + index, "Orc Archer" if index % 4 == 0 else "Orc", 2, hp=9, armour_class=11, attack_bonus=3, damage_die="d6") for index in range(40)]
+            result = service.fight_party_turn_based(allies, enemies, None, scene={"terrain": "volcano"})
+            return [entry.text for entry in result.log]
+
+        self.assertEqual(run(), run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import pickle
+import sys
+from pathlib import Path
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.combat_ai_policy import CAN_GRAPPLE, COVERED_RETREAT, CombatAiPolicy
+from rpg.application.services.combat_service import CombatService
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.simulation.combat_monte_carlo import simulate_encounter
+
+
+class _CountingPolicy(CombatAiPolicy):
+    def __init__(self, grapple_roll: int = 35) -> None:
+        super().__init__()
+        self.grapple_roll = grapple_roll
+        self.classified = 0
+
+    def classify(self, actor):
+        self.classified += 1
+        return super().classify(actor)
+
+    def build_tactical_table(self, intent):
+        return ((COVERED_RETREAT, 100, "disengage"), (CAN_GRAPPLE, self.grapple_roll, "grapple"))
+
+
+class CombatAiPolicyTests(unittest.TestCase):
+    def test_profiles_are_classified_once_per_combatant_signature(self) -> None:
+        policy = _CountingPolicy()
+        first = Entity(1, "Orc Archer", 3, hp=20, kind="humanoid")
+        twin = Entity(2, "Orc Archer", 3, hp=20, kind="humanoid")
+        boss = Entity(3, "Bandit Lord", 4, hp=30, kind="humanoid", tags=["lane:rearguard"])
+
+        profile = policy.profile(first)
+
+        self.assertIs(profile, policy.profile(twin))
+        self.assertEqual(("cautious", "rearguard", False), (profile.intent, profile.lane, profile.is_boss))
+        self.assertTrue(policy.profile(boss).is_boss)
+        self.assertEqual(0.1, profile.terrain_bias("difficult"))
+        self.assertEqual(2, policy.classified)
+
+        cleric = Character(4, "Ilse", class_name="cleric", known_spells=["Cure Wounds"])
+        self.assertEqual("cure-wounds", policy.profile(cleric).healing_spell)
+        self.assertEqual("vanguard", policy.profile(cleric).lane)
+
+    def test_tactical_tables_follow_intent_rule_order(self) -> None:
+        policy = CombatAiPolicy()
+
+        self.assertEqual(["disengage", "disengage", "hide"], [row[2] for row in policy.tactical_table("ambusher")])
+        self.assertEqual(["disengage", "disengage", "shove", "hide"], [row[2] for row in policy.tactical_table("cautious")])
+        self.assertIs(policy.tactical_table("brute"), policy.tactical_table("brute"))
+        self.assertEqual("grapple", policy.select_tactical_action("brute", 35, lambda condition: condition == CAN_GRAPPLE))
+        self.assertIsNone(policy.select_tactical_action("brute", 36, lambda condition: condition == CAN_GRAPPLE))
+
+    def test_service_and_simulator_accept_an_alternate_policy(self) -> None:
+        policy = _CountingPolicy(grapple_roll=100)
+        service = CombatService(ai_policy=policy)
+        hero = Character(id=5, name="Vera", class_name="fighter", hp_current=22, hp_max=22)
+        brute = Entity(id=6, name="Brute", kind="construct", level=2, hp=22, armour_class=12, damage_die="d4")
+
+        with mock.patch.object(service.rng, "randint", return_value=90):
+            action = service._select_enemy_tactical_action(
+                intent="brute", actor=brute, target=hero, terrain="open", distance="engaged", default_action="attack"
+            )
+
+        self.assertEqual("grapple", action)
+        restored = pickle.loads(pickle.dumps(policy))
+        self.assertEqual(100, restored.grapple_roll)
+
+        ally = Character(7, "Rook", level=3, class_name="fighter", hp_max=30, hp_current=30, attack_bonus=5, damage_die="d8")
+        baseline = simulate_encounter([ally], [brute], trials=12, seed=3)
+        varied = simulate_encounter([ally], [brute], trials=12, seed=3, ai_policy=_CountingPolicy(grapple_roll=100))
+        self.assertEqual(12, varied.trials)
+        self.assertEqual(baseline, simulate_encounter([ally], [brute], trials=12, seed=3, ai_policy=CombatAiPolicy()))
+
+
+if __name__ == "__main__":
+    unittest.main()
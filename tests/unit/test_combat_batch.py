@@ -0,0 +1,96 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.combat_ai_policy import CombatAiPolicy
+from rpg.application.services.combat_service import CombatService
+from rpg.application.services.derived_stats_cache import DerivedStatsCache
+from rpg.application.spells.spell_catalog import invalidate_spell_catalogs
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.simulation.combat_batch import CombatEncounter, resolve_encounter, resolve_encounters
+
+
+def _encounters(count: int) -> list[CombatEncounter]:
+    hero = Character(id=1, name="Rook", level=3, class_name="fighter", hp_max=28, hp_current=28, attack_bonus=5, damage_die="d8")
+    mage = Character(id=2, name="Iri", level=3, class_name="wizard", hp_max=16, hp_current=16, known_spells=["Fire Bolt"])
+    return [
+        CombatEncounter(
+            allies=(hero, mage),
+            enemies=(
+                Entity(id=10, name="Goblin", level=1, hp=9, armour_class=12, damage_die="d6", kind="humanoid"),
+                Entity(id=11, name="Orc Archer", level=2, hp=14, armour_class=13, damage_die="d8", kind="humanoid"),
+            ),
+            seed=1000 + index,
+            scene={"distance": "engaged", "terrain": "open"},
+        )
+        for index in range(count)
+    ]
+
+
+def _summary(result) -> tuple:
+    return (
+        result.allies_won,
+        result.rounds,
+        tuple(int(row.hp_current) for row in result.allies + result.enemies),
+        tuple(entry.text for entry in result.log),
+    )
+
+
+class CombatBatchTests(unittest.TestCase):
+    def test_process_pool_matches_serial_resolution(self) -> None:
+        encounters = _encounters(6)
+
+        serial = resolve_encounters(encounters, workers=0)
+        pooled = resolve_encounters(encounters, workers=2, chunk_size=2)
+
+        self.assertEqual([_summary(row) for row in serial], [_summary(row) for row in pooled])
+        self.assertEqual(28, encounters[0].allies[0].hp_current)
+
+    def test_one_service_resolves_fights_concurrently_on_threads(self) -> None:
+        encounters = _encounters(8)
+        service = CombatService(verbosity="compact")
+        expected = [_summary(resolve_encounter(CombatService(verbosity="compact"), row)) for row in encounters]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(lambda row: _summary(resolve_encounter(service, row)), encounters))
+
+        self.assertEqual(expected, threaded)
+
+    def test_thread_pool_with_cold_shared_caches_matches_serial_runs(self) -> None:
+        encounters = _encounters(6) * 4
+
+        def service() -> CombatService:
+            return CombatService(verbosity="debug", derived_stats_cache=DerivedStatsCache(), ai_policy=CombatAiPolicy())
+
+        invalidate_spell_catalogs()
+        serial_service = service()
+        serial = [_summary(resolve_encounter(serial_service, row)) for row in encounters]
+        invalidate_spell_catalogs()
+        shared = service()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            threaded = list(pool.map(lambda row: _summary(resolve_encounter(shared, row)), encounters))
+
+        self.assertEqual(serial, threaded)
+        cache, serial_cache = shared.derived_stats_cache, serial_service.derived_stats_cache
+        self.assertEqual(serial_cache.hits + serial_cache.misses, cache.hits + cache.misses)
+
+    def test_seeded_fight_leaves_the_thread_rng_untouched(self) -> None:
+        service = CombatService()
+        service.set_seed(42)
+        before = service.rng.getstate()
+
+        with service.seeded(7) as fight_rng:
+            self.assertIs(fight_rng, service.rng)
+            first_roll = service.rng.randint(1, 20)
+
+        self.assertEqual(before, service.rng.getstate())
+        with service.seeded(7):
+            self.assertEqual(first_roll, service.rng.randint(1, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
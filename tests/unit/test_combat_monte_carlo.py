@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.dtos import EncounterPlan
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.simulation.combat_monte_carlo import simulate_encounter
+
+
+def _fighter() -> Character:
+    return Character(
+        id=1,
+        name="Vera",
+        level=3,
+        class_name="fighter",
+        hp_max=28,
+        hp_current=28,
+        attack_bonus=5,
+        damage_die="d8",
+        armour_class=16,
+        attributes={"strength": 16, "dexterity": 12, "constitution": 14},
+    )
+
+
+def _brutes(count: int) -> list[Entity]:
+    return [
+        Entity(id=200 + index, name=f"Brute {index}", level=2, hp=14, armour_class=12, attack_bonus=4, damage_die="d8", kind="humanoid")
+        for index in range(count)
+    ]
+
+
+class CombatMonteCarloTests(unittest.TestCase):
+    def test_reports_are_deterministic_per_seed_and_leave_inputs_untouched(self) -> None:
+        allies = [_fighter()]
+        enemies = _brutes(2)
+
+        first = simulate_encounter(allies, enemies, trials=40, seed=11)
+        second = simulate_encounter(allies, EncounterPlan(enemies=enemies), trials=40, seed=11)
+
+        self.assertEqual(first, second)
+        self.assertEqual(40, first.wins + first.losses + first.fled + first.timeouts)
+        self.assertEqual(40, sum(first.rounds_histogram.values()))
+        self.assertEqual(28, allies[0].hp_current)
+        self.assertEqual(14, enemies[0].hp_current)
+
+    def test_process_pool_matches_in_process_run(self) -> None:
+        allies = [_fighter()]
+        enemies = _brutes(2)
+
+        serial = simulate_encounter(allies, enemies, trials=24, seed=5, workers=0)
+        pooled = simulate_encounter(allies, enemies, trials=24, seed=5, workers=2, chunk_size=5)
+
+        self.assertEqual(serial, pooled)
+
+    def test_balance_table_difficulty_tiers_order_win_rates(self) -> None:
+        allies = [_fighter()]
+        enemies = _brutes(3)
+
+        easy = simulate_encounter(allies, enemies, trials=60, seed=3, difficulty="easy")
+        nightmare = simulate_encounter(allies, enemies, trials=60, seed=3, difficulty="nightmare")
+
+        self.assertGreater(easy.win_rate, nightmare.win_rate)
+        self.assertGreater(easy.ally_hp_fraction_mean, nightmare.ally_hp_fraction_mean)
+
+    def test_healer_spell_slot_usage_is_reported(self) -> None:
+        cleric = Character(
+            id=2,
+            name="Oren",
+            level=3,
+            class_name="cleric",
+            hp_max=20,
+            hp_current=20,
+            armour_class=15,
+            spell_slots_max=4,
+            spell_slots_current=4,
+            known_spells=["Cure Wounds"],
+            attributes={"wisdom": 16, "strength": 12},
+        )
+
+        report = simulate_encounter([_fighter(), cleric], _brutes(3), trials=30, seed=3)
+
+        self.assertGreater(report.spell_slots_spent_mean, 0.0)
+        self.assertLessEqual(report.spell_slots_spent_max, 4)
+        self.assertEqual(2, len(report.ally_hp_remaining_mean))
+
+
+if __name__ == "__main__":
+    unittest.main()
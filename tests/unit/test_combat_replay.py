@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.combat_events import CombatEventCode, CombatLogEntry, render_log
+from rpg.application.services.combat_service import CombatService
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.simulation.combat_replay import CombatReplay, ReplayFormatError, record_combat, replay_combat, verify_replay
+
+
+def _hero() -> Character:
+    return Character(1, "Vera", level=3, class_name="fighter", hp_max=30, hp_current=30, attack_bonus=5, damage_die="d8")
+
+
+def _goblin(entity_id: int = 9) -> Entity:
+    return Entity(entity_id, "Goblin", 1, hp=14, armour_class=12, attack_bonus=3, damage_die="d6")
+
+
+class CombatEventTests(unittest.TestCase):
+    def test_structured_entries_render_lazily_and_compare_by_text(self) -> None:
+        entry = CombatLogEntry(code=CombatEventCode.ATTACK_HIT, names=("Vera", "Goblin"), values=(5, 2, 7), level=0)
+
+        self.assertIsNone(entry._text)
+        self.assertEqual("Vera hits Goblin for 5 damage (2/7).", entry.text)
+        self.assertEqual(CombatLogEntry(text="Vera hits Goblin for 5 damage (2/7)."), entry)
+        self.assertEqual(["-- Round 2 --"], render_log([CombatLogEntry(code=CombatEventCode.ROUND_START, values=(2,), level=2)], "debug"))
+        self.assertEqual([], render_log([CombatLogEntry(code=CombatEventCode.ROUND_START, values=(2,), level=2)], "normal"))
+
+    def test_filtered_verbosity_records_no_debug_events(self) -> None:
+        service = CombatService(verbosity="compact")
+        service.set_seed(3)
+
+        result = service.fight_party_turn_based([_hero()], [_goblin()], None)
+
+        self.assertTrue(all(entry.level == 0 for entry in result.log))
+        self.assertFalse(any(entry.code == CombatEventCode.ATTACK_ROLL for entry in result.log))
+
+
+class CombatReplayTests(unittest.TestCase):
+    def test_single_fight_replay_round_trips_and_reproduces_events(self) -> None:
+        def choose(options, player, enemy, round_no, scene):
+            return "Attack"
+
+        def run(service, choose_action):
+            return service.fight_turn_based(_hero(), _goblin(), choose_action)
+
+        result, replay = record_combat(CombatService(verbosity="debug"), 21, run, choose)
+        decoded = CombatReplay.from_bytes(replay.to_bytes())
+
+        self.assertEqual(replay, decoded)
+        self.assertTrue(replay.choices)
+        self.assertEqual([entry.text for entry in result.log], decoded.render())
+        self.assertTrue(verify_replay(CombatService(), decoded, run))
+        self.assertLess(len(replay.to_bytes()), sum(len(entry.text) for entry in result.log))
+
+    def test_party_fight_replay_matches_and_detects_a_different_seed(self) -> None:
+        def run(service, choose_action):
+            return service.fight_party_turn_based([_hero()], [_goblin(9), _goblin(10)], choose_action)
+
+        result, replay = record_combat(CombatService(verbosity="normal"), 8, run)
+        replayed = replay_combat(CombatService(), CombatReplay.from_bytes(replay.to_bytes()), run)
+
+        self.assertEqual([entry.text for entry in result.log], [entry.text for entry in replayed.log])
+        self.assertEqual(result.allies_won, replayed.allies_won)
+        tampered = CombatReplay(seed=replay.seed + 1, verbosity=replay.verbosity, choices=replay.choices, events=replay.events)
+        self.assertFalse(verify_replay(CombatService(), tampered, run))
+
+    def test_replay_restores_the_callers_verbosity(self) -> None:
+        def run(service, choose_action):
+            return service.fight_turn_based(_hero(), _goblin(), choose_action)
+
+        _result, replay = record_combat(CombatService(verbosity="debug"), 5, run, lambda *_args: "Attack")
+        service = CombatService(verbosity="compact")
+
+        self.assertTrue(verify_replay(service, replay, run))
+        self.assertEqual("compact", service.verbosity)
+
+    def test_rejects_foreign_or_truncated_payloads(self) -> None:
+        replay = CombatReplay(seed=-4, verbosity="debug", choices=(("Cast Spell", "fire-bolt"), "Dodge"), events=((0, 1, ("Hello",), ()),))
+        data = replay.to_bytes()
+
+        self.assertEqual(replay, CombatReplay.from_bytes(data))
+        with self.assertRaises(ReplayFormatError):
+            CombatReplay.from_bytes(b"JUNK" + data[4:])
+        with self.assertRaises(ReplayFormatError):
+            CombatReplay.from_bytes(data[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
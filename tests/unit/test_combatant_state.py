@@ -0,0 +1,119 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.combat_service import CombatLogEntry, CombatService
+from rpg.application.services.combatant_state import (
+    STATE_ATTR,
+    combatant_state,
+    publish_combatant_state,
+    release_combatant_state,
+    status_key,
+    status_slot,
+)
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+
+
+class CombatantStateTests(unittest.TestCase):
+    def test_state_is_built_from_legacy_flags_and_merges_duplicate_rows(self) -> None:
+        hero = Character(1, "Vera")
+        hero.flags = {
+            "combat_statuses": [
+                {"id": "Poisoned", "rounds": 1, "potency": 1},
+                {"id": "poisoned", "rounds": 3, "potency": 2},
+                {"id": "stunned", "rounds": 0, "potency": 1},
+                {"id": "silenced", "rounds": 2},
+            ],
+            "combat_tactical_tags": {"Cover": 2, "exposed": 0},
+        }
+        service = CombatService()
+
+        self.assertTrue(service._has_status(hero, "poisoned"))
+        self.assertEqual(2, service._status_potency(hero, "POISONED"))
+        self.assertFalse(service._has_status(hero, "stunned"))
+        self.assertTrue(service._has_status(hero, "silenced"))
+        self.assertTrue(service._has_tactical_tag(hero, "cover"))
+        self.assertFalse(service._has_tactical_tag(hero, "exposed"))
+        self.assertIs(combatant_state(hero), combatant_state(hero))
+
+    def test_ticks_update_state_in_place_and_publish_legacy_rows(self) -> None:
+        service = CombatService(verbosity="normal")
+        raider = Entity(7, "Raider", 1)
+        log: list[CombatLogEntry] = []
+
+        service._apply_status(actor=raider, status_id="restrained", rounds=2, log=log, source_actor=raider, source_spell="Web")
+        service._apply_status(actor=raider, status_id="prone", rounds=1, log=log)
+        service._add_tactical_tag(raider, tag="hidden_strike", rounds=1)
+        state = combatant_state(raider)
+        rounds = state.rounds
+
+        service._tick_actor_statuses_end_turn(raider, log)
+        service._tick_actor_tactical_tags_end_turn(raider)
+
+        self.assertIs(rounds, state.rounds)
+        self.assertTrue(service._movement_blocked(raider))
+        self.assertFalse(service._has_status(raider, "prone"))
+        self.assertTrue(any("no longer Prone" in row.text for row in log))
+        self.assertFalse(hasattr(raider, "_combat_statuses"))
+
+        publish_combatant_state(raider)
+        self.assertEqual(
+            [{"id": "restrained", "rounds": 1, "potency": 1, "source_id": 7, "source_name": "Raider", "source_spell": ""}],
+            raider._combat_statuses,
+        )
+        self.assertEqual({}, raider._combat_tactical_tags)
+
+        release_combatant_state(raider)
+        self.assertFalse(hasattr(raider, STATE_ATTR))
+        self.assertTrue(service._has_status(raider, "restrained"))
+
+    def test_ticked_statuses_drop_their_source_spell_like_the_legacy_rows(self) -> None:
+        service = CombatService()
+        caster = Character(3, "Mira")
+        target = Entity(4, "Bandit", 1)
+        log: list[CombatLogEntry] = []
+        service._apply_status(actor=target, status_id="poisoned", rounds=3, log=log, source_actor=caster, source_spell="ray-of-sickness")
+
+        service._tick_actor_statuses_end_turn(target, log)
+        removed = service._remove_concentration_statuses(target=target, source_actor=caster, spell_slug="ray-of-sickness")
+
+        self.assertEqual([], removed)
+        self.assertTrue(service._has_status(target, "poisoned"))
+
+    def test_party_fight_releases_runtime_state(self) -> None:
+        service = CombatService()
+        service.set_seed(5)
+        ally = Character(1, "Vera", level=3, class_name="fighter", hp_max=30, hp_current=30, attack_bonus=5, damage_die="d8")
+        ally.flags = {"combat_statuses": [{"id": "poisoned", "rounds": 2, "potency": 1}]}
+        enemy = Entity(9, "Goblin", 1, hp=6, armour_class=10, attack_bonus=2, damage_die="d4")
+
+        result = service.fight_party_turn_based([ally], [enemy], None)
+
+        for actor in [*result.allies, *result.enemies]:
+            self.assertFalse(hasattr(actor, STATE_ATTR))
+        self.assertNotIn("combat_statuses", result.allies[0].flags)
+        self.assertFalse(hasattr(ally, STATE_ATTR))
+
+
+    def test_concurrent_registration_gives_each_status_its_own_slot(self) -> None:
+        names = [f"test-concurrent-status-{index}" for index in range(64)]
+        barrier = threading.Barrier(8)
+
+        def _register(offset: int) -> list[int]:
+            barrier.wait()
+            return [status_slot(name) for name in names[offset::8]]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            slots = [slot for rows in pool.map(_register, range(8)) for slot in rows]
+
+        self.assertEqual(len(names), len(set(slots)))
+        self.assertEqual(sorted(names), sorted(status_key(slot) for slot in slots))
+
+
+if __name__ == "__main__":
+    unittest.main()
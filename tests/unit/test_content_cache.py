@@ -1,12 +1,20 @@
 import json
+import sqlite3
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import unittest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-from rpg.infrastructure.content_cache import FileContentCache
+from rpg.infrastructure.content_cache import (
+    FileContentCache,
+    SqliteContentCache,
+    TieredContentCache,
+    create_content_cache,
+)
 
 
 class FileContentCacheTests(unittest.TestCase):
@@ -60,5 +68,110 @@ class FileContentCacheTests(unittest.TestCase):
             self.assertEqual("9.9.9", manifest.get("data_version"))
 
 
+
+class SqliteContentCacheTests(unittest.TestCase):
+    def test_round_trips_compressed_payloads_in_one_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SqliteContentCache(tmp, data_version="1.0.0")
+            payload = {"results": [{"name": "Goblin", "hit_points": 7}] * 50}
+            cache.set("content:list_monsters|page=1", payload)
+
+            self.assertEqual(payload, cache.get("content:list_monsters|page=1", ttl_seconds=3600))
+            self.assertIsNone(cache.get("content:missing", ttl_seconds=None))
+            stored = sqlite3.connect(str(cache.db_path)).execute("SELECT payload FROM content_entries").fetchone()[0]
+            self.assertLess(len(stored), len(json.dumps(payload)))
+            self.assertEqual({"content.sqlite3", "manifest.json"}, {path.name for path in Path(tmp).glob("*") if "-wal" not in path.name and "-shm" not in path.name})
+            cache.close()
+
+    def test_version_mismatch_invalidates_existing_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            first_cache = SqliteContentCache(tmp, data_version="1.0.0")
+            first_cache.set("content:key", {"name": "old"})
+            first_cache.close()
+
+            second_cache = SqliteContentCache(tmp, data_version="2.0.0")
+            self.assertIsNone(second_cache.get("content:key", ttl_seconds=3600, allow_stale=True))
+            manifest = json.loads((Path(tmp) / "manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual("2.0.0", manifest.get("data_version"))
+            second_cache.close()
+
+    def test_ttl_and_sweep_use_stored_at(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SqliteContentCache(tmp, data_version="1.0.0")
+            cache.set("fresh:key", {"kind": "fresh"})
+            cache.set("stale:key", {"kind": "stale"})
+            with cache._connection() as connection:
+                connection.execute("UPDATE content_entries SET stored_at = 0 WHERE cache_key = 'stale:key'")
+
+            self.assertIsNone(cache.get("stale:key", ttl_seconds=60))
+            self.assertEqual({"kind": "stale"}, cache.get("stale:key", ttl_seconds=60, allow_stale=True))
+            self.assertEqual(1, cache.sweep_expired(max_age_seconds=60))
+            self.assertEqual({"kind": "fresh"}, cache.get("fresh:key", ttl_seconds=None))
+            self.assertIsNone(cache.get("stale:key", ttl_seconds=None, allow_stale=True))
+            cache.close()
+
+    def test_concurrent_writers_share_the_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = create_content_cache(tmp, backend="sqlite", data_version="1.0.0")
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda index: cache.set(f"content:page={index}", {"page": index}), range(40)))
+
+            self.assertEqual([{"page": index} for index in range(40)], [cache.get(f"content:page={index}", ttl_seconds=None) for index in range(40)])
+            cache.close()
+            self.assertIsInstance(create_content_cache(tmp, backend="file", data_version="1.0.0", memory_bytes=0), FileContentCache)
+            with self.assertRaises(ValueError):
+                create_content_cache(tmp, backend="lmdb")
+
+
+
+class TieredContentCacheTests(unittest.TestCase):
+    def test_memory_tier_serves_repeat_reads_and_counts_per_tier(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            disk = FileContentCache(tmp, data_version="1.0.0")
+            disk.set("content:list_races|page=1", {"results": [{"name": "Elf"}]})
+            cache = TieredContentCache(disk)
+
+            first = cache.get("content:list_races|page=1", ttl_seconds=3600)
+            first["results"].append({"name": "mutated"})
+            second = cache.get("content:list_races|page=1", ttl_seconds=3600)
+
+            self.assertEqual({"results": [{"name": "Elf"}]}, second)
+            self.assertIsNone(cache.get("content:missing", ttl_seconds=3600))
+            stats = cache.stats()
+            self.assertEqual((1, 2), (stats["memory"]["hits"], stats["memory"]["misses"]))
+            self.assertEqual((1, 1), (stats["disk"]["hits"], stats["disk"]["misses"]))
+            self.assertEqual(1, stats["memory"]["entries"])
+
+    def test_evicts_least_recently_used_entries_by_bytes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = TieredContentCache(FileContentCache(tmp, data_version="1.0.0"), max_bytes=60)
+            for name in ("a", "b", "c"):
+                cache.set(f"content:{name}", {"name": name * 10})
+            cache.get("content:b", ttl_seconds=None)
+            cache.set("content:d", {"name": "d" * 10})
+
+            stats = cache.stats()
+            self.assertLessEqual(stats["memory"]["bytes"], 60)
+            self.assertEqual(2, stats["memory"]["evictions"])
+            self.assertEqual(["content:b", "content:d"], list(cache._entries))
+            self.assertEqual({"name": "aaaaaaaaaa"}, cache.get("content:a", ttl_seconds=None))
+            self.assertEqual(1, cache.stats()["disk"]["hits"])
+
+    def test_memory_entries_honour_the_original_stored_at(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            disk = FileContentCache(tmp, data_version="1.0.0")
+            disk.set("content:key", {"name": "old"})
+            path = disk._path_for_key("content:key")
+            path.write_text(json.dumps({"stored_at": int(time.time()) - 120, "payload": {"name": "old"}}), encoding="utf-8")
+            cache = TieredContentCache(disk)
+
+            self.assertIsNone(cache.get("content:key", ttl_seconds=60))
+            self.assertIsNone(cache.get("content:key", ttl_seconds=60))
+            self.assertEqual({"name": "old"}, cache.get("content:key", ttl_seconds=60, allow_stale=True))
+            self.assertEqual(1, cache.sweep_expired(max_age_seconds=60))
+            self.assertEqual(0, cache.stats()["memory"]["entries"])
+            self.assertIsInstance(create_content_cache(tmp, data_version="1.0.0"), TieredContentCache)
+
+
 if __name__ == "__main__":
     unittest.main()
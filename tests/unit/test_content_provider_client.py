@@ -3,12 +3,17 @@ from pathlib import Path
 import tempfile
 import time
 import json
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-from rpg.infrastructure.content_cache import FileContentCache
+from rpg.infrastructure.content_cache import FileContentCache, TieredContentCache
 from rpg.infrastructure.content_provider_client import FallbackContentClient
+from tests.content_stub_server import ContentStubServer
+from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.resilient_http import reset_circuit_breakers
 
 
 class _FakeProvider:
@@ -39,6 +44,23 @@ class _UnavailableProvider:
         return None
 
 
+class _SlowProvider:
+    def __init__(self, error: Exception | None = None):
+        self.calls = 0
+        self.release = threading.Event()
+        self.error = error
+
+    def list_races(self, page: int = 1) -> dict:
+        self.calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return {"results": [{"name": f"Elf {page}"}]}
+
+    def close(self) -> None:
+        return None
+
+
 class FallbackContentClientTests(unittest.TestCase):
     def test_prefers_cache_before_network(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -120,5 +142,106 @@ class FallbackContentClientTests(unittest.TestCase):
             self.assertEqual(1, fallback.calls)
 
 
+    def test_concurrent_misses_share_one_provider_fetch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            provider = _SlowProvider()
+            client = FallbackContentClient(
+                providers=[provider],
+                cache=TieredContentCache(FileContentCache(tmp)),
+                cache_ttl_seconds=3600,
+            )
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                futures = [pool.submit(client.list_races, 1) for _ in range(6)]
+                while client.coalesced_requests < 5:
+                    threading.Event().wait(0.01)
+                provider.release.set()
+                payloads = [future.result(timeout=5) for future in futures]
+
+            self.assertEqual(1, provider.calls)
+            self.assertEqual(5, client.coalesced_requests)
+            self.assertTrue(all(payload["results"][0]["name"] == "Elf 1" for payload in payloads))
+            self.assertEqual(6, len({id(payload) for payload in payloads}))
+            payloads[0]["results"].clear()
+            self.assertTrue(all(payload["results"] for payload in payloads[1:]))
+            self.assertEqual("Elf 1", client.list_races(page=1)["results"][0]["name"])
+            self.assertEqual(1, client.cache.stats()["memory"]["hits"])
+
+    def test_coalesced_callers_each_raise_their_own_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            provider = _SlowProvider(error=RuntimeError("provider unavailable"))
+            client = FallbackContentClient(providers=[provider], cache=FileContentCache(tmp))
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(client.list_races, 1) for _ in range(4)]
+                while client.coalesced_requests < 3:
+                    threading.Event().wait(0.01)
+                provider.release.set()
+                errors = [future.exception(timeout=5) for future in futures]
+
+            self.assertEqual(1, provider.calls)
+            self.assertTrue(all(isinstance(error, RuntimeError) and str(error) == "provider unavailable" for error in errors))
+            self.assertEqual(4, len({id(error) for error in errors}))
+
+
+def _expire(cache: FileContentCache, cache_key: str) -> None:
+    path = cache._path_for_key(cache_key)
+    envelope = json.loads(path.read_text(encoding="utf-8"))
+    envelope["stored_at"] = 0
+    path.write_text(json.dumps(envelope, ensure_ascii=False), encoding="utf-8")
+
+
+class StaleWhileRevalidateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+
+    def test_returns_stale_payload_and_refreshes_in_background(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FileContentCache(tmp)
+            cache.set("content:list_races|page=1", {"results": [{"name": "Stale Elf"}]})
+            _expire(cache, "content:list_races|page=1")
+            provider = _SlowProvider()
+            client = FallbackContentClient(
+                providers=[provider],
+                cache=cache,
+                cache_ttl_seconds=3600,
+                stale_while_revalidate=True,
+            )
+
+            first = client.list_races(page=1)
+            second = client.list_races(page=1)
+            self.assertEqual("Stale Elf", first["results"][0]["name"])
+            self.assertEqual("Stale Elf", second["results"][0]["name"])
+            self.assertEqual(1, client.refreshes_scheduled)
+
+            provider.release.set()
+            self.assertTrue(client.wait_for_refreshes(timeout=5))
+            self.assertEqual("Elf 1", client.list_races(page=1)["results"][0]["name"])
+            self.assertEqual(1, provider.calls)
+            client.close()
+
+    def test_refresh_is_skipped_while_every_circuit_is_open(self) -> None:
+        with ContentStubServer({"/races/": []}, fail_first={"/races/": 10}) as server, tempfile.TemporaryDirectory() as tmp:
+            cache = FileContentCache(tmp)
+            cache.set("content:list_races|page=1", {"results": [{"name": "Stale Elf"}]})
+            _expire(cache, "content:list_races|page=1")
+            remote = Open5eClient(base_url=server.base_url, retries=2, backoff_seconds=0)
+            client = FallbackContentClient(
+                providers=[remote],
+                cache=cache,
+                cache_ttl_seconds=3600,
+                stale_while_revalidate=True,
+            )
+
+            self.assertEqual("Stale Elf", client.list_races(page=1)["results"][0]["name"])
+            self.assertTrue(client.wait_for_refreshes(timeout=5))
+            self.assertEqual(1, client.refreshes_failed)
+            requests_after_refresh = len(server.requests)
+
+            self.assertEqual("Stale Elf", client.list_races(page=1)["results"][0]["name"])
+            self.assertEqual((1, 1), (client.refreshes_scheduled, client.refreshes_skipped))
+            self.assertEqual(requests_after_refresh, len(server.requests))
+            client.close()
+
+
 if __name__ == "__main__":
     unittest.main()
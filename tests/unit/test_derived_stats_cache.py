@@ -0,0 +1,111 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.combat_service import CombatService
+from rpg.application.services.event_bus import EventBus
+from rpg.application.services.game_service import GameService
+from rpg.application.services.world_progression import WorldProgression
+from rpg.domain.models.character import Character
+from rpg.domain.models.feature import Feature
+from rpg.domain.models.location import Location
+from rpg.infrastructure.db.inmemory.repos import (
+    InMemoryCharacterRepository,
+    InMemoryEntityRepository,
+    InMemoryLocationRepository,
+    InMemoryWorldRepository,
+)
+from rpg.infrastructure.inmemory.inmemory_feature_repo import InMemoryFeatureRepository
+
+
+class _CountingFeatureRepository(InMemoryFeatureRepository):
+    def __init__(self, features) -> None:
+        super().__init__(features)
+        self.calls = 0
+
+    def list_for_character(self, character_id: int):
+        self.calls += 1
+        return super().list_for_character(character_id)
+
+
+def _fighter() -> Character:
+    return Character(
+        id=41,
+        name="Rook",
+        level=3,
+        class_name="fighter",
+        attributes={"strength": 16, "dexterity": 14},
+        inventory=["Longsword", "Chain Mail", "Shield"],
+    )
+
+
+class DerivedStatsCacheTests(unittest.TestCase):
+    def test_stats_are_reused_until_the_fingerprint_changes(self) -> None:
+        service = CombatService()
+        hero = _fighter()
+        hero.flags = {"equipment": {"weapon": "Longsword", "armor": "Chain Mail"}}
+
+        first = service.derive_player_stats(hero)
+        first["ac"] = 99
+        second = service.derive_player_stats(hero)
+
+        self.assertEqual(16, second["ac"])
+        self.assertEqual(1, service.derived_stats_cache.hits)
+
+        hero.flags["temp_ac_bonus"] = 5
+        self.assertEqual(21, service.derive_player_stats(hero)["ac"])
+        hero.flags["equipment"]["armor"] = "Leather Armor"
+        hero.flags.pop("temp_ac_bonus")
+        self.assertEqual(13, service.derive_player_stats(hero)["ac"])
+        hero.level = 5
+        self.assertEqual(3, service.derive_player_stats(hero)["proficiency"])
+        self.assertEqual(service._compute_player_stats(hero), service.derive_player_stats(hero))
+
+    def test_features_are_loaded_once_per_level_and_on_invalidation(self) -> None:
+        repo = _CountingFeatureRepository(
+            {"feature.martial_precision": Feature(id=1, slug="feature.martial_precision", name="Martial Precision", trigger_key="on_attack_roll", effect_kind="attack_bonus", effect_value=1)}
+        )
+        repo.grant_feature_by_slug(41, "feature.martial_precision")
+        service = CombatService(feature_repo=repo)
+        hero = _fighter()
+
+        self.assertEqual(["feature.martial_precision"], [row.slug for row in service._character_features(hero)])
+        service._character_features(hero)
+        self.assertEqual(1, repo.calls)
+
+        hero.level = 4
+        service._character_features(hero)
+        self.assertEqual(2, repo.calls)
+
+        service.invalidate_derived_stats(41)
+        service._character_features(hero)
+        self.assertEqual(3, repo.calls)
+
+    def test_equipment_changes_refresh_character_sheet_combat_stats(self) -> None:
+        hero = _fighter()
+        hero.location_id = 1
+        character_repo = InMemoryCharacterRepository({hero.id: hero})
+        entity_repo = InMemoryEntityRepository([])
+        world_repo = InMemoryWorldRepository(seed=5)
+        service = GameService(
+            character_repo=character_repo,
+            entity_repo=entity_repo,
+            location_repo=InMemoryLocationRepository({1: Location(id=1, name="Town")}),
+            world_repo=world_repo,
+            progression=WorldProgression(world_repo, entity_repo, EventBus()),
+        )
+
+        before = service.get_character_sheet_intent(hero.id)
+        service.equip_inventory_item_intent(hero.id, "Chain Mail")
+        after = service.get_character_sheet_intent(hero.id)
+
+        self.assertEqual(18, before.armor_class)
+        self.assertEqual(16, after.armor_class)
+        self.assertEqual(5, after.attack_bonus)
+        self.assertEqual(service.combat_player_stats_intent(character_repo.get(hero.id))["ac"], after.armor_class)
+
+
+if __name__ == "__main__":
+    unittest.main()
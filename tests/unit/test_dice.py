@@ -0,0 +1,55 @@
+import random
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.combat_service import _roll_dice_expr, roll_die
+from rpg.domain.services.dice import (
+    DiceExpression,
+    compile_dice_expression,
+    compile_die,
+    roll_dice_batch,
+)
+
+
+class DiceExpressionTests(unittest.TestCase):
+    def test_expressions_compile_to_compact_interned_structures(self) -> None:
+        compiled = compile_dice_expression("3d4+3")
+
+        self.assertEqual(DiceExpression(3, 4, 3, False), compiled)
+        self.assertIs(compiled, compile_dice_expression("3d4+3"))
+        self.assertEqual(DiceExpression(1, 8, 0, True), compile_dice_expression("1d8+MOD"))
+        self.assertEqual(((2, 6), (1, 4)), compile_dice_expression("2d6+1d4+2").dice)
+        self.assertEqual((), compile_dice_expression("garbage").dice)
+
+    def test_die_specs_compile_to_side_counts(self) -> None:
+        self.assertEqual(8, compile_die("d8"))
+        self.assertEqual(12, compile_die("12"))
+        self.assertEqual(2, compile_die("d1"))
+        self.assertEqual(0, compile_die("2d6"))
+        self.assertEqual(0, compile_die(""))
+
+    def test_rolls_consume_the_same_rng_sequence_as_single_draws(self) -> None:
+        batched_rng = random.Random(42)
+        single_rng = random.Random(42)
+        self.assertEqual([single_rng.randint(1, 8) for _ in range(6)], roll_dice_batch(6, 8, rng=batched_rng))
+
+        crit_rng = random.Random(7)
+        expected_rng = random.Random(7)
+        self.assertEqual(
+            expected_rng.randint(1, 10) + expected_rng.randint(1, 10),
+            roll_die("d10", rng=crit_rng, count=2),
+        )
+        self.assertEqual(1, roll_die("not-a-die", rng=crit_rng))
+
+    def test_mod_token_is_ignored_like_the_legacy_roller(self) -> None:
+        self.assertEqual(
+            _roll_dice_expr("1d8", rng=random.Random(3)),
+            _roll_dice_expr("1d8+MOD", ability_mod=4, rng=random.Random(3)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
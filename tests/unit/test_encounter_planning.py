@@ -50,6 +50,22 @@ class CombatStatsTests(unittest.TestCase):
         self.assertGreater(base_rating, 10)
         self.assertGreater(amplified, base_rating)
 
+    def test_entity_threat_rating_is_cached_until_stats_change(self):
+        entity = Entity(id=7, name="Ogre", level=3, hp=30, armour_class=11, attack_min=2, attack_max=8, tags=["brute"])
+        view = entity.stats_view
+
+        self.assertIs(view, entity.stats_view)
+        self.assertEqual(entity.combat_stats.threat_rating, entity.threat_rating)
+        self.assertEqual(("brute",), view.tags)
+        with self.assertRaises(Exception):
+            view.hp = 1
+
+        entity.hp = 40
+        self.assertIsNot(view, entity.stats_view)
+        self.assertEqual(entity.combat_stats.threat_rating, entity.threat_rating)
+        self.assertGreater(entity.threat_rating, view.threat_rating)
+        self.assertEqual(Entity(id=7, name="Ogre", level=3, hp=40, hp_max=30, armour_class=11, attack_min=2, attack_max=8, tags=["brute"]), entity)
+
 
 class EncounterPlannerTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.encounter_service import EncounterService
+from rpg.domain.models.encounter_definition import EncounterDefinition, EncounterSlot
+from rpg.domain.models.entity import Entity
+from rpg.domain.repositories import EncounterDefinitionRepository, EntityRepository
+
+
+class _CountingEntityRepository(EntityRepository):
+    def __init__(self, entities: list[Entity]) -> None:
+        self._by_id = {entity.id: entity for entity in entities}
+        self.calls = 0
+
+    def get(self, entity_id: int):
+        return self._by_id.get(entity_id)
+
+    def get_many(self, entity_ids: list[int]):
+        self.calls += 1
+        return [self._by_id[eid] for eid in entity_ids if eid in self._by_id]
+
+    def list_for_level(self, target_level: int, tolerance: int = 2):
+        self.calls += 1
+        return [row for row in self._by_id.values() if target_level - tolerance <= row.level <= target_level + tolerance]
+
+    def list_by_location(self, location_id: int):
+        self.calls += 1
+        return []
+
+    def add(self, entity: Entity) -> None:
+        self._by_id[entity.id] = entity
+        self.revision += 1
+
+
+class _DefinitionRepository(EncounterDefinitionRepository):
+    def __init__(self, definitions: list[EncounterDefinition]) -> None:
+        self._definitions = definitions
+
+    def list_for_location(self, location_id: int):
+        return [row for row in self._definitions if row.applies_to_location(location_id)]
+
+    def list_global(self):
+        return list(self._definitions)
+
+
+def _service() -> tuple[EncounterService, _CountingEntityRepository]:
+    repo = _CountingEntityRepository(
+        [
+            Entity(id=1, name="Goblin", level=1, hp=8, faction_id="wild"),
+            Entity(id=2, name="Wolf", level=2, hp=10),
+            Entity(id=3, name="Bandit", level=2, hp=12, faction_id="wild"),
+        ]
+    )
+    definitions = _DefinitionRepository(
+        [
+            EncounterDefinition(
+                id="goblin_pack",
+                name="Goblin Pack",
+                level_min=1,
+                level_max=3,
+                location_ids=[1],
+                faction_id="wild",
+                slots=[EncounterSlot(entity_id=1, min_count=1, max_count=3), EncounterSlot(entity_id=3, weight=2)],
+            ),
+            EncounterDefinition(
+                id="wolf_den",
+                name="Wolf Den",
+                level_min=1,
+                level_max=4,
+                base_threat=2.0,
+                slots=[EncounterSlot(entity_id=2, min_count=1, max_count=2)],
+            ),
+        ]
+    )
+    return EncounterService(repo, definition_repo=definitions), repo
+
+
+class EncounterTableTests(unittest.TestCase):
+    def test_table_is_compiled_once_per_context(self) -> None:
+        service, repo = _service()
+
+        for turn in range(20):
+            service.generate_plan(location_id=1, player_level=2, world_turn=turn, max_enemies=3)
+        calls = repo.calls
+        for turn in range(20, 40):
+            service.generate_plan(location_id=1, player_level=2, world_turn=turn, max_enemies=3)
+
+        self.assertEqual(1, service.tables.compiled)
+        self.assertEqual(calls, repo.calls)
+
+    def test_table_draws_match_uncompiled_planner(self) -> None:
+        service, _ = _service()
+        definitions = service.definition_repo.list_for_location(1)
+
+        for seed in range(200):
+            for bias in (None, "wild"):
+                table = service.encounter_table(1, 2, bias)
+                expected = service.planner.plan_encounter(
+                    definitions=definitions, player_level=2, location_id=1, seed=seed, faction_bias=bias, max_enemies=3
+                )
+                actual = service.planner.plan_from_table(table, seed=seed, max_enemies=3)
+                self.assertEqual(expected[0].id, actual[0].id)
+                self.assertEqual([row.id for row in expected[1]], [row.id for row in actual[1]])
+
+    def test_repository_revision_invalidates_tables(self) -> None:
+        service, repo = _service()
+        service.generate_plan(location_id=1, player_level=2, world_turn=0)
+
+        repo.add(Entity(id=4, name="Ogre", level=3, hp=30))
+        service.generate_plan(location_id=1, player_level=2, world_turn=0)
+        self.assertEqual(2, service.tables.compiled)
+
+        service.invalidate_encounter_tables(location_id=1)
+        service.generate_plan(location_id=1, player_level=2, world_turn=0)
+        self.assertEqual(3, service.tables.compiled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -247,8 +247,7 @@ class WorldProgressionTests(unittest.TestCase):
             },
         )()
 
-        progression_high._REFERENCE_WORLD_DATASET_CACHE.clear()
-        progression_low._REFERENCE_WORLD_DATASET_CACHE.clear()
+        WorldProgression._clear_reference_world_dataset_cache()
 
         with mock.patch.object(WorldProgression, "_load_reference_world_dataset_cached", return_value=dataset):
             progression_high.tick(high_repo.world, ticks=12)
@@ -54,6 +54,31 @@ class FeaturePipelineTests(unittest.TestCase):
         self.assertEqual("on_attack_hit", trigger.trigger_key)
         self.assertEqual("bonus_damage", trigger.effect_kind)
 
+    def test_feature_dispatch_groups_by_trigger_and_batch_mode_skips_events(self) -> None:
+        features = [
+            Feature(id=1, slug="feature.quick", name="Quick", trigger_key="on_initiative", effect_kind="initiative_bonus", effect_value=3),
+            Feature(id=2, slug="feature.flavour", name="Flavour", trigger_key="on_attack_hit", effect_kind="lore_only", effect_value=1),
+            Feature(id=3, slug="feature.smite", name="Smite", trigger_key="on_attack_hit", effect_kind="bonus_damage", effect_value=4),
+        ]
+        service = CombatService(event_publisher=lambda _evt: None)
+        dispatch = service.feature_effect_registry.build_dispatch(features)
+
+        self.assertEqual(("on_initiative", "on_attack_hit"), dispatch.trigger_keys())
+        self.assertEqual(["feature.smite"], [row[0].slug for row in dispatch.for_trigger("on_attack_hit")])
+        self.assertEqual((), dispatch.for_trigger("on_attack_roll"))
+
+        hero = Character(id=13, name="Shade", class_name="rogue", hp_current=12, hp_max=12)
+        enemy = Entity(id=14, name="Guard", level=1, hp=8)
+        published: list[object] = []
+        for publish, expected in ((True, 1), (False, 0)):
+            published.clear()
+            service = CombatService(event_publisher=published.append, publish_feature_events=publish)
+            totals = service._resolve_feature_trigger(
+                features=dispatch, trigger_key="on_attack_hit", player=hero, enemy=enemy, round_number=1
+            )
+            self.assertEqual((0, 0, 4), totals)
+            self.assertEqual(expected, len(published))
+
     def test_character_creation_grants_race_feature_from_db_backed_repo(self) -> None:
         feature_repo = InMemoryFeatureRepository(
             {
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.game_service import GameService
+from rpg.infrastructure.content_provider_factory import create_content_client_factory
+from tests.content_stub_server import ContentStubServer
+from rpg.infrastructure.http_client_pool import HttpClientPool
+from rpg.infrastructure.inmemory.inmemory_character_repo import InMemoryCharacterRepository
+from rpg.infrastructure.open5e_client import Open5eClient
+from rpg.infrastructure.resilient_http import reset_circuit_breakers
+
+
+class HttpClientPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+
+    def test_providers_share_one_client_per_base_url_and_leave_it_open(self) -> None:
+        pool = HttpClientPool(max_connections=4, max_keepalive_connections=2, http2=False)
+        rows = [{"slug": f"race-{index}"} for index in range(3)]
+        with ContentStubServer({"/races/": rows}, page_size=2) as server:
+            shared = pool.client_for(server.base_url + "/", timeout=5.0)
+            first = Open5eClient(http_client=pool.client_for(server.base_url, timeout=5.0), retries=0)
+            second = Open5eClient(http_client=pool.client_for(server.base_url, timeout=5.0), retries=0)
+
+            self.assertIs(shared, first.client)
+            self.assertIs(shared, second.client)
+            self.assertIsNot(shared, pool.client_for(server.base_url, timeout=1.0))
+            self.assertEqual(2, len(first.list_races(page=1)["results"]))
+            first.close()
+            self.assertFalse(shared.is_closed)
+            self.assertEqual(1, len(second.list_races(page=2)["results"]))
+
+            histograms = pool.latency_histograms()
+            host = server.base_url.split("//")[1]
+            self.assertEqual([host], list(histograms))
+            self.assertEqual(2, histograms[host]["count"])
+            self.assertEqual(2, sum(histograms[host]["buckets"].values()))
+
+        pool.close()
+        self.assertTrue(shared.is_closed)
+        self.assertFalse(pool.client_for("http://127.0.0.1:1", timeout=1.0).is_closed)
+        pool.close()
+
+    def test_closing_one_services_pool_leaves_another_pools_clients_open(self) -> None:
+        first, second = HttpClientPool(http2=False), HttpClientPool(http2=False)
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(
+            os.environ, {"RPG_CONTENT_RUNTIME_REMOTE_ENABLED": "1", "RPG_CONTENT_CACHE_DIR": tmp}
+        ):
+            clients = [create_content_client_factory(first)(), create_content_client_factory(second)()]
+            open5e = [next(row for row in client.providers if isinstance(row, Open5eClient)) for client in clients]
+
+            first.close()
+            clients[1].close()
+
+            self.assertTrue(open5e[0].client.is_closed)
+            self.assertFalse(open5e[1].client.is_closed)
+            second.close()
+            self.assertTrue(open5e[1].client.is_closed)
+            clients[0].close()
+
+    def test_game_service_close_runs_shutdown_hooks_once(self) -> None:
+        calls = []
+        service = GameService(InMemoryCharacterRepository(), shutdown_hooks=[lambda: calls.append("pool")])
+
+        service.close()
+        service.close()
+
+        self.assertEqual(["pool"], calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
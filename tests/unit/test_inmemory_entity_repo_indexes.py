@@ -0,0 +1,60 @@
+import random
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.inmemory.inmemory_entity_repo import InMemoryEntityRepository
+
+
+class InMemoryEntityIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = InMemoryEntityRepository()
+        rng = random.Random(3)
+        for batch in range(6):
+            rows = [
+                Entity(id=0, name=f"Beast {rng.randint(0, 40)}", level=rng.randint(1, 8), hp=10)
+                for _ in range(25)
+            ]
+            self.repo.upsert_entities(rows, location_id=batch % 3 + 1)
+
+    def _scan(self):
+        return list(self.repo._entities)
+
+    def test_lookups_match_linear_scans_in_insertion_order(self) -> None:
+        rows = self._scan()
+        for entity in rows:
+            self.assertIs(entity, self.repo.get(entity.id))
+        self.assertIsNone(self.repo.get(999_999))
+
+        wanted = [rows[5].id, rows[1].id, rows[5].id, 999_999]
+        self.assertEqual([row for row in rows if row.id in set(wanted)], self.repo.get_many(wanted))
+
+        for level_min in range(0, 10):
+            for level_max in range(level_min, 10):
+                expected = [row for row in rows if level_min <= row.level <= level_max]
+                self.assertEqual(expected, self.repo.list_by_level_band(level_min, level_max))
+        self.assertEqual([row for row in rows if 2 <= row.level <= 6], self.repo.list_for_level(4, tolerance=2))
+
+        for location_id, ids in self.repo._by_location.items():
+            self.assertEqual(len(ids), len(set(ids)))
+            self.assertEqual([row for row in rows if row.id in ids], self.repo.list_by_location(location_id))
+        self.assertEqual([], self.repo.list_by_location(404))
+
+    def test_upsert_updates_name_and_level_indexes(self) -> None:
+        before = len(self._scan())
+        result = self.repo.upsert_entities([Entity(id=0, name="GOBLIN", level=7, hp=20)], location_id=9)
+
+        self.assertEqual((0, 1, 1), (result.created, result.updated, result.attached))
+        self.assertEqual(before, len(self._scan()))
+        goblin = self.repo.get(1)
+        self.assertEqual(7, goblin.level)
+        self.assertIn(goblin, self.repo.list_by_level_band(7, 7))
+        self.assertNotIn(goblin, self.repo.list_by_level_band(1, 1))
+        self.assertEqual([goblin], self.repo.list_by_location(9))
+
+
+if __name__ == "__main__":
+    unittest.main()
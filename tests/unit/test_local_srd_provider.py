@@ -6,7 +6,7 @@ import unittest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-from rpg.infrastructure.local_srd_provider import LocalSrdProvider
+from rpg.infrastructure.local_srd_provider import COMPILED_SRD_FILENAME, LocalSrdProvider, compile_local_srd_dataset
 
 
 class LocalSrdProviderTests(unittest.TestCase):
@@ -57,5 +57,49 @@ class LocalSrdProviderTests(unittest.TestCase):
             self.assertEqual("Wood Elf", wood["name"])
 
 
+    def test_compiled_artifact_serves_lookups_and_filtered_listing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            monsters = [
+                {"name": "Goblin", "slug": "goblin", "challenge_rating": "1/4"},
+                {"name": "Ogre", "slug": "ogre", "challenge_rating": "2"},
+                {"name": "Young Dragon", "cr": 10},
+            ]
+            spells = [
+                {"name": "Fire Bolt", "level": "Cantrip", "dnd_class": "Sorcerer, Wizard"},
+                {"name": "Cure Wounds", "level_int": 1, "classes": [{"index": "cleric"}, {"index": "bard"}]},
+                {"name": "Magic Missile", "level_int": 1, "dnd_class": "Sorcerer, Wizard"},
+            ]
+            (Path(tmp) / "monsters.json").write_text(json.dumps({"results": monsters}), encoding="utf-8")
+            (Path(tmp) / "spells.json").write_text(json.dumps(spells), encoding="utf-8")
+            artifact = compile_local_srd_dataset(tmp)
+            self.assertEqual(COMPILED_SRD_FILENAME, artifact.name)
+
+            provider = LocalSrdProvider(root_dir=tmp, page_size=10)
+            self.assertEqual("Young Dragon", provider.get_monster("young dragon")["name"])
+            self.assertIsNotNone(provider._compiled)
+            self.assertNotIn("spells", provider._kinds)
+            low = provider.list_filtered("monsters", cr_max=2)
+            self.assertEqual(["Goblin", "Ogre"], [row["name"] for row in low["results"]])
+            wizard_first = provider.list_filtered("spells", level=1, class_name="Wizard")
+            self.assertEqual(["Magic Missile"], [row["name"] for row in wizard_first["results"]])
+            self.assertEqual(["Fire Bolt"], [row["name"] for row in provider.list_filtered("spells", level=0)["results"]])
+            self.assertEqual(3, provider.list_spells()["count"])
+            provider.close()
+
+    def test_edited_json_takes_precedence_over_a_stale_artifact(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "races.json"
+            path.write_text(json.dumps([{"name": "Dwarf", "slug": "dwarf"}]), encoding="utf-8")
+            compile_local_srd_dataset(tmp)
+            path.write_text(json.dumps([{"name": "Halfling", "slug": "halfling"}, {"name": "Dwarf", "slug": "dwarf"}]), encoding="utf-8")
+
+            provider = LocalSrdProvider(root_dir=tmp)
+            self.assertEqual(2, provider.list_races()["count"])
+            self.assertEqual("Halfling", provider.get_race("halfling")["name"])
+            with self.assertRaises(KeyError):
+                provider.get_race("gnome")
+            provider.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,79 @@
+import random
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.domain.models.location import Location
+from rpg.domain.repositories import LocationRepository
+from rpg.domain.services.location_spatial_index import LocationSpatialIndex, within_radius
+from rpg.infrastructure.db.inmemory.repos import InMemoryLocationRepository
+
+
+class _LinearLocationRepository(LocationRepository):
+    def __init__(self, locations: list[Location]) -> None:
+        self._locations = list(locations)
+
+    def get(self, location_id: int):
+        return next((row for row in self._locations if row.id == location_id), None)
+
+    def list_all(self) -> list[Location]:
+        return list(self._locations)
+
+    def get_starting_location(self):
+        return self._locations[0] if self._locations else None
+
+
+def _scatter(count: int, seed: int) -> list[Location]:
+    rng = random.Random(seed)
+    return [
+        Location(id=index, name=f"Site {index}", biome="wilderness", x=rng.uniform(-900, 900), y=rng.uniform(-900, 900))
+        for index in range(1, count + 1)
+    ]
+
+
+class LocationSpatialIndexTests(unittest.TestCase):
+    def test_radius_query_matches_linear_scan_in_list_order(self) -> None:
+        locations = _scatter(600, seed=3)
+        index = LocationSpatialIndex(locations, cell_size=75.0)
+        rng = random.Random(9)
+
+        for _ in range(40):
+            x, y, radius = rng.uniform(-1000, 1000), rng.uniform(-1000, 1000), rng.choice([0.0, 40.0, 150.0, 2000.0])
+            expected = [row.id for row in locations if within_radius(x, y, row, radius)]
+            self.assertEqual(expected, [row.id for row in index.query_radius(x, y, radius)])
+
+    def test_boundary_distance_is_inclusive(self) -> None:
+        index = LocationSpatialIndex([Location(id=1, name="Edge", biome="plains", x=150.0, y=0.0)])
+
+        self.assertEqual([1], [row.id for row in index.query_radius(0.0, 0.0, 150.0)])
+        self.assertEqual([], index.query_radius(0.0, 0.0, 149.999))
+
+    def test_moved_and_removed_locations_update_cells(self) -> None:
+        first = Location(id=1, name="A", biome="plains", x=0.0, y=0.0)
+        second = Location(id=2, name="B", biome="plains", x=10.0, y=0.0)
+        index = LocationSpatialIndex([first, second], cell_size=50.0)
+
+        index.add(Location(id=1, name="A", biome="plains", x=500.0, y=500.0))
+        self.assertEqual([2], [row.id for row in index.query_radius(0.0, 0.0, 60.0)])
+        self.assertEqual([1], [row.id for row in index.query_radius(500.0, 500.0, 5.0)])
+
+        index.remove(2)
+        self.assertEqual([], index.query_radius(0.0, 0.0, 60.0))
+        self.assertEqual(1, len(index))
+
+    def test_repositories_agree_with_default_linear_fallback(self) -> None:
+        locations = _scatter(300, seed=5)
+        indexed = InMemoryLocationRepository({row.id: row for row in locations})
+        linear = _LinearLocationRepository(locations)
+
+        for x, y in ((0.0, 0.0), (800.0, -800.0), (-450.0, 120.0)):
+            self.assertEqual(
+                [row.id for row in linear.list_within_radius(x, y, 150.0)],
+                [row.id for row in indexed.list_within_radius(x, y, 150.0)],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,60 @@
 import sys
+import tempfile
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 import unittest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
+from rpg.infrastructure.content_cache import FileContentCache
+from rpg.infrastructure.content_provider_client import FallbackContentClient
+from tests.content_stub_server import ContentStubServer
+from rpg.infrastructure.open5e_client import Open5eClient
 from rpg.infrastructure.prewarm_content_cache import (
+    TokenBucket,
     build_prewarm_plan,
     execute_prewarm_plan,
     normalize_targets,
+    provider_host,
 )
+from rpg.infrastructure.resilient_http import reset_circuit_breakers
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight: dict[str, int] = {}
+        self.max_per_host: dict[str, int] = {}
+        self.max_total = 0
+
+    def enter(self, host: str) -> None:
+        with self._lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.max_per_host[host] = max(self.max_per_host.get(host, 0), self.in_flight[host])
+            self.max_total = max(self.max_total, sum(self.in_flight.values()))
+
+    def leave(self, host: str) -> None:
+        with self._lock:
+            self.in_flight[host] -= 1
+
+
+class _SlowHostProvider:
+    def __init__(self, host: str, tracker: _ConcurrencyTracker, *, fails: bool):
+        self.client = SimpleNamespace(base_url=f"http://{host}")
+        self.host = host
+        self.tracker = tracker
+        self.fails = fails
+
+    def list_races(self, page: int = 1):
+        self.tracker.enter(self.host)
+        try:
+            threading.Event().wait(0.05)
+        finally:
+            self.tracker.leave(self.host)
+        if self.fails:
+            raise RuntimeError("primary down")
+        return {"results": [{"slug": f"race-{page}"}]}
 
 
 class _FakeClient:
@@ -72,5 +118,98 @@ class PrewarmContentCacheTests(unittest.TestCase):
         self.assertEqual(1, summary.failed)
 
 
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class PrewarmEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_token_bucket_spaces_calls_after_the_burst(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(10.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual([0.0, 0.0], waits[:2])
+        self.assertAlmostEqual(0.1, waits[2])
+        self.assertAlmostEqual(0.1, waits[3])
+        self.assertAlmostEqual(0.2, clock.now)
+
+    def test_follows_next_links_concurrently_against_stand_in_server(self) -> None:
+        monsters = [{"slug": f"monster-{index}", "name": f"Monster {index}"} for index in range(7)]
+        races = [{"slug": f"race-{index}", "name": f"Race {index}"} for index in range(3)]
+        with ContentStubServer({"/monsters/": monsters, "/races/": races}, page_size=2, latency_seconds=0.2) as server:
+            remote = Open5eClient(base_url=server.base_url, retries=0, backoff_seconds=0)
+            client = FallbackContentClient(providers=[remote], cache=FileContentCache(self._tmp.name))
+            updates = []
+            try:
+                summary = execute_prewarm_plan(
+                    client,
+                    build_prewarm_plan(["races", "monsters"], pages=1),
+                    dry_run=False,
+                    workers=4,
+                    per_host_limit=2,
+                    follow_next=True,
+                    progress=updates.append,
+                )
+            finally:
+                client.close()
+
+            self.assertEqual((6, 6, 0, 4), (summary.executed, summary.succeeded, summary.failed, summary.discovered))
+            self.assertEqual(2, server.max_in_flight)
+            self.assertEqual(
+                sorted([("/races/", 1), ("/races/", 2)] + [("/monsters/", page) for page in range(1, 5)]),
+                sorted(server.requests),
+            )
+            self.assertEqual(server.base_url.split("//")[1], provider_host(remote))
+            self.assertEqual([remote], client.providers)
+        self.assertEqual(6, len(updates))
+        self.assertEqual(6, updates[-1].completed)
+        cached = client.cache.get(client._cache_key("list_monsters", page=4), ttl_seconds=None)
+        self.assertEqual(["monster-6"], [row["slug"] for row in cached["results"]])
+
+    def test_per_host_limit_applies_to_each_provider_host_including_fallthrough(self) -> None:
+        tracker = _ConcurrencyTracker()
+        primary = _SlowHostProvider("primary.test", tracker, fails=True)
+        fallback = _SlowHostProvider("fallback.test", tracker, fails=False)
+        client = FallbackContentClient(providers=[primary, fallback], cache=FileContentCache(self._tmp.name))
+
+        summary = execute_prewarm_plan(
+            client, build_prewarm_plan(["races"], pages=6), dry_run=False, workers=4, per_host_limit=1
+        )
+
+        self.assertEqual((6, 6, 0), (summary.executed, summary.succeeded, summary.failed))
+        self.assertEqual({"primary.test": 1, "fallback.test": 1}, tracker.max_per_host)
+        self.assertEqual(2, tracker.max_total)
+        self.assertEqual([primary, fallback], client.providers)
+
+    def test_failed_pages_stop_discovery_for_that_target(self) -> None:
+        rows = [{"slug": f"spell-{index}"} for index in range(6)]
+        with ContentStubServer({"/spells/": rows}, page_size=2, fail_first={"/spells/": 1}) as server:
+            remote = Open5eClient(base_url=server.base_url, retries=0, backoff_seconds=0)
+            client = FallbackContentClient(providers=[remote], cache=FileContentCache(self._tmp.name))
+            try:
+                summary = execute_prewarm_plan(
+                    client, build_prewarm_plan(["spells"], pages=1), dry_run=False, follow_next=True
+                )
+            finally:
+                client.close()
+
+        self.assertEqual((1, 0, 1, 0), (summary.executed, summary.succeeded, summary.failed, summary.discovered))
+
+
 if __name__ == "__main__":
     unittest.main()
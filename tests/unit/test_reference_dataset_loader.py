@@ -8,7 +8,9 @@ from unittest import mock
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from rpg.application.services.game_service import GameService
+from rpg.infrastructure.world_import import reference_dataset_loader
 from rpg.infrastructure.world_import.reference_dataset_loader import (
+    COMPILED_REFERENCE_FILENAME,
     _load_provinces,
     _load_states,
     discover_reference_files,
@@ -134,6 +136,94 @@ class ReferenceDatasetLoaderTests(unittest.TestCase):
         self.assertTrue(bool(dataset.river_rows))
         self.assertTrue(bool(dataset.route_rows))
 
+    def test_compiled_artifact_is_reused_and_rebuilt_when_sources_change(self) -> None:
+        reference_dir = Path(__file__).resolve().parents[2] / "data" / "reference_world"
+        source_payload = json.loads((reference_dir / "unified_reference_world.json").read_text(encoding="utf-8"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            isolated = Path(temp_dir)
+            unified_path = isolated / "unified_reference_world.json"
+            unified_path.write_text(json.dumps(source_payload), encoding="utf-8")
+
+            first = load_reference_world_dataset(isolated)
+            self.assertTrue((isolated / COMPILED_REFERENCE_FILENAME).exists())
+
+            with mock.patch.object(
+                reference_dataset_loader,
+                "_load_reference_world_dataset_from_sources",
+                side_effect=AssertionError("compiled artifact should be used"),
+            ):
+                cached = load_reference_world_dataset(isolated)
+            self.assertEqual(first, cached)
+
+            source_payload["dataset"]["biome_severity_index"] = {"obsidian_wastes": 91}
+            unified_path.write_text(json.dumps(source_payload), encoding="utf-8")
+            rebuilt = load_reference_world_dataset(isolated)
+
+        self.assertEqual({"obsidian_wastes": 91}, rebuilt.biome_severity_index)
+
+    def test_compiled_artifact_can_be_disabled(self) -> None:
+        reference_dir = Path(__file__).resolve().parents[2] / "data" / "reference_world"
+        source_payload = json.loads((reference_dir / "unified_reference_world.json").read_text(encoding="utf-8"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            isolated = Path(temp_dir)
+            (isolated / "unified_reference_world.json").write_text(json.dumps(source_payload), encoding="utf-8")
+            with mock.patch.dict("os.environ", {"RPG_REFERENCE_WORLD_COMPILED_CACHE": "0"}):
+                dataset = load_reference_world_dataset(isolated)
+            self.assertFalse((isolated / COMPILED_REFERENCE_FILENAME).exists())
+
+        self.assertTrue(bool(dataset.biome_severity_index))
+
+    def test_compiled_dataset_loads_sections_on_first_access(self) -> None:
+        reference_dir = Path(__file__).resolve().parents[2] / "data" / "reference_world"
+        source_payload = json.loads((reference_dir / "unified_reference_world.json").read_text(encoding="utf-8"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            isolated = Path(temp_dir)
+            (isolated / "unified_reference_world.json").write_text(json.dumps(source_payload), encoding="utf-8")
+            eager = load_reference_world_dataset(isolated).to_dict()
+
+            dataset = load_reference_world_dataset(isolated)
+            self.assertNotIn("biome_severity_index", dataset.loaded_sections)
+            self.assertTrue(bool(dataset.biome_severity_index))
+            self.assertIn("biome_severity_index", dataset.loaded_sections)
+            self.assertNotIn("burg_rows", dataset.loaded_sections)
+            self.assertEqual(eager, dataset.to_dict())
+
+        with self.assertRaises(AttributeError):
+            dataset.burg_rows = ()
+
+    def test_closing_a_compiled_dataset_releases_the_mapped_artifact(self) -> None:
+        reference_dir = Path(__file__).resolve().parents[2] / "data" / "reference_world"
+        source_payload = json.loads((reference_dir / "unified_reference_world.json").read_text(encoding="utf-8"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            isolated = Path(temp_dir)
+            (isolated / "unified_reference_world.json").write_text(json.dumps(source_payload), encoding="utf-8")
+            load_reference_world_dataset(isolated)
+
+            with load_reference_world_dataset(isolated) as dataset:
+                reader = object.__getattribute__(dataset, "_section_loader")
+                self.assertFalse(reader.closed)
+                biome_rows = dataset.biome_rows
+
+            self.assertTrue(reader.closed)
+            self.assertNotIn(reader, reference_dataset_loader._OPEN_SECTION_READERS)
+            self.assertIs(biome_rows, dataset.biome_rows)
+            with self.assertRaises(ValueError):
+                dataset.burg_rows
+            dataset.close()
+
+    def test_clearing_the_dataset_cache_closes_cached_datasets(self) -> None:
+        dataset = mock.Mock()
+        GameService._REFERENCE_WORLD_DATASET_CACHE["closing-test"] = dataset
+
+        GameService._clear_reference_world_dataset_cache()
+
+        dataset.close.assert_called_once_with()
+        self.assertEqual({}, GameService._REFERENCE_WORLD_DATASET_CACHE)
+
 
 if __name__ == "__main__":
     unittest.main()
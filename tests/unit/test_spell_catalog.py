@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.character_creation_service import CharacterCreationService
+from rpg.application.services.combat_service import CombatService
+from rpg.application.spells.spell_catalog import SpellCatalog, shared_spell_catalog
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+from rpg.domain.models.spell import Spell
+from rpg.domain.repositories import SpellRepository
+
+
+class _CountingSpellRepository(SpellRepository):
+    def __init__(self, spells: dict[str, Spell]) -> None:
+        self._spells = dict(spells)
+        self.lookups = 0
+
+    def get_by_slug(self, slug: str):
+        self.lookups += 1
+        return self._spells.get(str(slug))
+
+    def list_by_class(self, class_slug: str, max_level: int):
+        return []
+
+
+class SpellCatalogTests(unittest.TestCase):
+    def test_records_merge_definitions_repository_and_reference_data(self) -> None:
+        repo = _CountingSpellRepository(
+            {
+                "hex": Spell(slug="hex", name="Hex", level_int=1, components="V, S, M (the petrified eye of a newt)"),
+            }
+        )
+        catalog = shared_spell_catalog(repo)
+
+        record = catalog.get("hex")
+
+        self.assertIs(catalog, shared_spell_catalog(repo))
+        self.assertIs(record, catalog.get("hex"))
+        self.assertEqual((1, 1), (record.level_int, record.combat_level))
+        self.assertEqual((True, True, True), (record.has_verbal, record.has_somatic, record.has_material))
+        self.assertEqual("the petrified eye of a newt", record.material_text)
+        self.assertTrue(record.concentration)
+        self.assertIn("warlock", record.classes)
+
+        cure = catalog.get("cure-wounds")
+        self.assertTrue(cure.healing)
+        self.assertIsNone(cure.spell)
+        self.assertEqual(1, cure.combat_level)
+        self.assertEqual(0, catalog.get("fire-bolt").combat_level)
+        self.assertEqual((1, 10), (catalog.get("fire-bolt").damage_dice.count, catalog.get("fire-bolt").damage_dice.sides))
+        catalog.get("cure-wounds")
+        self.assertEqual(3, repo.lookups)
+
+    def test_combat_casts_query_the_repository_once_per_spell(self) -> None:
+        repo = _CountingSpellRepository({"fire-bolt": Spell(slug="fire-bolt", name="Fire Bolt", level_int=0, components="V, S")})
+        service = CombatService(spell_repo=repo)
+        service.set_seed(5)
+        caster = Character(id=1, name="Ari", class_name="wizard", known_spells=["Fire Bolt"], hp_max=12, hp_current=12)
+
+        for _ in range(4):
+            target = Entity(id=2, name="Goblin", level=1, hp=40, armour_class=10)
+            log = []
+            service._resolve_spell_cast_party(
+                caster=caster, target=target, spell_slug="fire-bolt", prof=2, spell_mod=3, attack_roll_shift=0, log=log
+            )
+            self.assertTrue(log)
+
+        self.assertEqual(1, repo.lookups)
+
+    def test_class_index_feeds_starting_spell_pools(self) -> None:
+        wizard_rows = SpellCatalog.reference_for_class("Wizard")
+        self.assertTrue(wizard_rows)
+        self.assertTrue(all("wizard" in row.classes for row in wizard_rows))
+
+        options = CharacterCreationService.__new__(CharacterCreationService).list_starting_spell_options("wizard")
+
+        self.assertIn("Fire Bolt", options["cantrip_pool"])
+        self.assertIn("Magic Missile", options["spell_pool"])
+        self.assertEqual(sorted(options["cantrip_pool"]), options["cantrip_pool"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ import unittest
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from rpg.application.services.event_bus import EventBus
+from rpg.application.services.narrative_relationship_graph import WindowedRowPressure
 from rpg.application.services.story_director import register_story_director_handlers
 from rpg.application.services.world_progression import WorldProgression
 from rpg.infrastructure.db.inmemory.repos import InMemoryEntityRepository, InMemoryWorldRepository
@@ -149,6 +150,50 @@ class StoryDirectorTests(unittest.TestCase):
         graph_b = repo_b.load_default().flags.get("narrative", {}).get("relationship_graph", {})
         self.assertEqual(graph_a, graph_b)
 
+    def test_faction_imbalance_tracks_external_edge_writes(self):
+        world_repo, progression, director = self._build_with_director(seed=52)
+        progression.tick(world_repo.load_default(), ticks=1)
+
+        world = world_repo.load_default()
+        edges = world.flags["narrative"]["relationship_graph"]["faction_edges"]
+        edges.update({"undead|wardens": -37, "rival|wardens": -12})
+        self.assertEqual(37, director._faction_imbalance(world))
+        self.assertEqual("undead", director._pick_faction_for_seed(world, seed=1))
+
+        edges["undead|wardens"] = 4
+        self.assertEqual(12, director._faction_imbalance(world))
+        self.assertEqual("rival", director._pick_faction_for_seed(world, seed=1))
+
+    def test_windowed_pressure_drops_trimmed_and_replaced_rows(self):
+        world_repo, _progression, director = self._build_with_director(seed=53)
+        world = world_repo.load_default()
+        world.current_turn = 10
+        rows = world.flags.setdefault("consequences", [])
+        rows.extend({"turn": turn, "kind": "test"} for turn in (2, 8, 9, 10))
+        self.assertEqual(3, director._recent_consequence_count(world, turn_after=10, window=3))
+
+        rows.append({"turn": 10, "kind": "test"})
+        del rows[:-2]
+        self.assertEqual(2, director._recent_consequence_count(world, turn_after=10, window=3))
+
+        world.flags["narrative"] = {"flashpoint_echoes": [{"turn": 10, "severity_band": "critical"}] * 4}
+        self.assertEqual(12, director._recent_flashpoint_pressure(world, turn_after=10, window=4))
+        world.flags["narrative"]["flashpoint_echoes"] = [{"turn": 5, "severity_band": "high"}]
+        self.assertEqual(0, director._recent_flashpoint_pressure(world, turn_after=10, window=4))
+
+    def test_windowed_pressure_running_total_matches_a_full_rescan(self):
+        rows = [{"turn": turn, "weight": turn % 3 + 1} for turn in range(0, 40, 2)]
+        pressure = WindowedRowPressure(lambda row: row["weight"])
+        pressure.sync(rows)
+
+        for bound in (5, 6, 7, 12, 9, 30, 200, -50):
+            if bound == 12:
+                rows.append({"turn": 13, "weight": 5})
+                del rows[:2]
+                pressure.sync(rows)
+            expected = sum(row["weight"] for row in rows if row["turn"] >= bound)
+            self.assertEqual(expected, pressure.total(bound))
+
     def test_story_seed_schema_is_created_on_injection(self):
         world_repo, progression = self._build(seed=63)
         world = world_repo.load_default()
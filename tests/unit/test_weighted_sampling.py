@@ -0,0 +1,90 @@
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.application.services.encounter_service import EncounterService
+from rpg.domain.models.entity import Entity
+from rpg.domain.repositories import EntityRepository
+from rpg.domain.services.weighted_sampling import (
+    ALIAS,
+    LEGACY,
+    AliasTable,
+    sample_without_replacement,
+    sampling_mode_for,
+    weighted_choice,
+)
+
+
+class _PoolRepository(EntityRepository):
+    def __init__(self, entities: list[Entity]) -> None:
+        self._entities = entities
+
+    def get(self, entity_id: int):
+        return next((row for row in self._entities if row.id == entity_id), None)
+
+    def get_many(self, entity_ids: list[int]):
+        return [row for row in self._entities if row.id in entity_ids]
+
+    def list_for_level(self, target_level: int, tolerance: int = 2):
+        return list(self._entities)
+
+    def list_by_location(self, location_id: int):
+        return list(self._entities)
+
+
+class WeightedSamplingTests(unittest.TestCase):
+    def test_legacy_mode_matches_random_choices(self) -> None:
+        items = ["a", "b", "c", "d"]
+        weights = [1.0, 3.5, 0.25, 2.0]
+        for seed in range(200):
+            expected = random.Random(seed).choices(items, weights=weights, k=1)[0]
+            self.assertEqual(expected, weighted_choice(items, weights, random.Random(seed), LEGACY))
+
+    def test_alias_table_follows_weights(self) -> None:
+        weights = [1.0, 3.0, 0.0, 6.0]
+        table = AliasTable(weights)
+        rng = random.Random(11)
+        counts = Counter(table.draw(rng) for _ in range(40000))
+
+        self.assertEqual(0, counts[2])
+        for index, weight in enumerate(weights):
+            self.assertAlmostEqual(weight / 10.0, counts[index] / 40000, delta=0.015)
+
+    def test_alias_sampling_without_replacement_is_distinct(self) -> None:
+        items = list(range(10))
+        weights = [0.0] + [float(value) for value in range(1, 10)]
+        rng = random.Random(5)
+        first_pick = Counter()
+        for _ in range(3000):
+            picks = sample_without_replacement(items, weights, 4, rng)
+            self.assertEqual(4, len(set(picks)))
+            self.assertNotIn(0, picks)
+            first_pick[picks[0]] += 1
+
+        self.assertGreater(first_pick[9], first_pick[1])
+
+    def test_worlds_without_the_flag_stay_on_legacy_plans(self) -> None:
+        self.assertEqual(LEGACY, sampling_mode_for({}))
+        self.assertEqual(LEGACY, sampling_mode_for({"sampling_mode": "unknown"}))
+        self.assertEqual(ALIAS, sampling_mode_for({"sampling_mode": "Alias"}))
+
+        pool = [Entity(id=index, name=f"Foe {index}", level=2, hp=8, faction_id="wild" if index % 2 else None) for index in range(1, 9)]
+        service = EncounterService(_PoolRepository(pool))
+        for turn in range(30):
+            default = service.generate(location_id=1, player_level=2, world_turn=turn, faction_bias="wild", max_enemies=3)
+            legacy = service.generate(
+                location_id=1, player_level=2, world_turn=turn, faction_bias="wild", max_enemies=3, sampling_mode=LEGACY
+            )
+            alias = service.generate(
+                location_id=1, player_level=2, world_turn=turn, faction_bias="wild", max_enemies=3, sampling_mode=ALIAS
+            )
+            self.assertEqual([row.id for row in default], [row.id for row in legacy])
+            self.assertEqual(3, len({row.id for row in alias}))
+
+
+if __name__ == "__main__":
+    unittest.main()
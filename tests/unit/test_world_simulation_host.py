@@ -0,0 +1,120 @@
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from rpg.infrastructure.simulation.world_host import WorldSimulationHost
+
+
+class _FailOnceShard:
+    """Wraps a shard client so its next reply is read and then reported as a failure."""
+
+    def __init__(self, shard):
+        self._shard = shard
+        self.fail_next = True
+
+    def __getattr__(self, name):
+        return getattr(self._shard, name)
+
+    def receive(self):
+        value = self._shard.receive()
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("shard step failed")
+        return value
+
+
+class WorldSimulationHostTests(unittest.TestCase):
+    SEEDS = (11, 22, 33, 44)
+
+    def _run_host(self, workers: int) -> list[dict]:
+        with WorldSimulationHost(workers=workers) as host:
+            host.add_worlds(self.SEEDS, threat_level=5)
+            host.submit_intent(2, "advance", ticks=3)
+            host.submit_intent(3, "set_threat", threat_level=9)
+            host.run(4)
+            rows = host.snapshots()
+        for row in rows:
+            row.pop("shard", None)
+        return rows
+
+    def test_in_process_host_advances_every_resident_world(self):
+        with WorldSimulationHost(workers=0) as host:
+            keys = host.add_worlds(self.SEEDS, threat_level=5)
+            report = host.step(ticks=2)
+
+            self.assertEqual([1, 2, 3, 4], keys)
+            self.assertEqual(4, report["worlds"])
+            self.assertEqual(8, report["world_ticks"])
+            self.assertEqual([2, 2, 2, 2], [row["turn"] for row in host.snapshots()])
+
+            stats = host.worker_stats()
+            self.assertEqual(1, len(stats))
+            self.assertEqual(8, stats[0]["world_ticks"])
+
+    def test_intents_apply_on_next_scheduled_step(self):
+        with WorldSimulationHost(workers=0) as host:
+            host.add_world(7, seed=70, threat_level=1)
+            host.submit_intent(7, "advance", ticks=2)
+            host.submit_intent(7, "set_threat", threat_level=6)
+            self.assertEqual(2, host.snapshot(7)["pending_intents"])
+
+            host.step()
+            snapshot = host.snapshot(7)
+
+        self.assertEqual(3, snapshot["turn"])
+        self.assertGreaterEqual(snapshot["threat_level"], 6)
+        self.assertEqual(0, snapshot["pending_intents"])
+
+    def test_unknown_intent_and_world_are_rejected(self):
+        with WorldSimulationHost(workers=0) as host:
+            host.add_world(1, seed=5)
+            with self.assertRaises(ValueError):
+                host.submit_intent(1, "teleport")
+            with self.assertRaises(KeyError):
+                host.submit_intent(99, "advance")
+            with self.assertRaises(ValueError):
+                host.add_world(1, seed=6)
+
+    def test_sharded_workers_match_in_process_results(self):
+        self.assertEqual(self._run_host(workers=0), self._run_host(workers=2))
+
+
+    def test_failing_shard_does_not_desync_the_other_shards(self):
+        with WorldSimulationHost(workers=2) as host:
+            host.add_worlds((11, 22), threat_level=1)
+            # Shard 0's reply is read before shard 1's.
+            host._shards[0] = _FailOnceShard(host._shards[0])
+            with self.assertRaises(RuntimeError):
+                host.step()
+
+            stats = host.worker_stats()
+            self.assertEqual([0, 1], [row["shard"] for row in stats])
+            self.assertEqual(1, host.snapshot(1)["turn"])
+            report = host.step()
+
+        self.assertEqual(2, report["world_ticks"])
+        self.assertEqual(1, report["round"])
+
+    def test_bad_intent_payload_is_rejected_on_submit_and_keeps_the_queue(self):
+        with WorldSimulationHost(workers=2) as host:
+            host.add_worlds((11, 22), threat_level=1)
+            host.submit_intent(2, "advance", ticks=2)
+            for intent, payload in (
+                ("set_threat", {"threat_level": "not-a-number"}),
+                ("advance", {"ticks": "soon"}),
+                ("cataclysm_pushback", {"strength": object()}),
+            ):
+                with self.assertRaises(ValueError):
+                    host.submit_intent(2, intent, **payload)
+
+            self.assertEqual(1, host.snapshot(2)["pending_intents"])
+            host.step()
+            rows = host.snapshots()
+
+        self.assertEqual([1, 3], [row["turn"] for row in rows])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Compare per-turn combat AI decision cost with cold and cached policy profiles.
+
+The cold run gives every turn a fresh ``CombatAiPolicy``, so each decision
+re-classifies the combatant and rebuilds its tactical table the way the
+per-turn code used to; the cached run reuses one policy for the whole battle.
+
+Usage:
+    python tools/benchmarks/combat_ai_decisions.py
+    python tools/benchmarks/combat_ai_decisions.py --combatants 60 --turns 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SRC = _ROOT / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from rpg.application.services.combat_ai_policy import CombatAiPolicy
+from rpg.application.services.combat_service import CombatService
+from rpg.domain.models.character import Character
+from rpg.domain.models.entity import Entity
+
+_ENEMY_NAMES = ("Goblin", "Orc Archer", "Cult Shaman", "Bandit Lord", "Skeleton", "Wolf", "Acolyte")
+_KINDS = ("beast", "undead", "humanoid", "fiend", "construct", "dragon")
+
+
+def _battle(combatants: int, seed: int) -> tuple[list[Character], list[Entity]]:
+    rng = random.Random(seed)
+    allies = [
+        Character(
+            id=index + 1,
+            name=f"Hero {index}",
+            class_name=rng.choice(["fighter", "wizard", "cleric", "bard"]),
+            hp_max=30,
+            hp_current=rng.randint(1, 30),
+            known_spells=rng.sample(["Magic Missile", "Cure Wounds", "Bless", "Sleep"], 2),
+            spell_slots_max=2,
+            spell_slots_current=2,
+        )
+        for index in range(max(1, combatants // 5))
+    ]
+    enemies = [
+        Entity(
+            id=100 + index,
+            name=rng.choice(_ENEMY_NAMES),
+            level=rng.randint(1, 12),
+            hp=rng.randint(6, 90),
+            kind=rng.choice(_KINDS),
+        )
+        for index in range(max(1, combatants - len(allies)))
+    ]
+    return allies, enemies
+
+
+def _decide(service: CombatService, actor, allies: list, enemies: list, target, round_no: int) -> object:
+    if isinstance(actor, Character):
+        return service._evaluate_ai_action(actor, allies, enemies, round_no, {})
+    intent = service._intent_for_enemy(actor)
+    service._is_boss_enemy(actor)
+    action = service._evaluate_ai_action(actor, enemies, allies, round_no, {})
+    return service._select_enemy_tactical_action(
+        intent=intent,
+        actor=actor,
+        target=target,
+        terrain="forest",
+        distance="engaged",
+        default_action=str(action),
+        allies=enemies,
+    )
+
+
+def _run(turns: int, allies: list, enemies: list, *, cold: bool, seed: int) -> tuple[float, list]:
+    service = CombatService(ai_policy=CombatAiPolicy())
+    service.set_seed(seed)
+    actors = allies + enemies
+    decisions = []
+    started = time.perf_counter()
+    for turn in range(turns):
+        if cold:
+            service.ai_policy = CombatAiPolicy()
+        actor = actors[turn % len(actors)]
+        target = allies[turn % len(allies)] if not isinstance(actor, Character) else enemies[turn % len(enemies)]
+        decisions.append(_decide(service, actor, allies, enemies, target, 1 + turn // len(actors)))
+    return (time.perf_counter() - started) * 1000.0, decisions
+
+
+def run_benchmark(combatants: int, turns: int, seed: int) -> dict:
+    allies, enemies = _battle(combatants, seed)
+    cold_ms, cold_decisions = _run(turns, allies, enemies, cold=True, seed=seed)
+    cached_ms, cached_decisions = _run(turns, allies, enemies, cold=False, seed=seed)
+    if cold_decisions != cached_decisions:
+        raise AssertionError("cached policy decisions differ from cold decisions")
+    return {
+        "combatants": len(allies) + len(enemies),
+        "turns": int(turns),
+        "cold_us_per_turn": round(cold_ms * 1000.0 / max(1, turns), 2),
+        "cached_us_per_turn": round(cached_ms * 1000.0 / max(1, turns), 2),
+        "speedup": round(cold_ms / cached_ms, 2) if cached_ms > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark combat AI decision cost per turn")
+    parser.add_argument("--combatants", type=int, default=40)
+    parser.add_argument("--turns", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    report = run_benchmark(max(2, int(args.combatants)), max(1, int(args.turns)), int(args.seed))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
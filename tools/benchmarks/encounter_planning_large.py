@@ -0,0 +1,133 @@
+"""Benchmark planning encounters from large definitions with many slots.
+
+Times ``EncounterPlanner.plan_encounter`` (cached entity threat ratings and a
+running threat tally) against the previous assembly loop, which re-summed
+``threat_rating`` over every planned entity, rebuilding ``CombatStats`` for
+each one, before every append.  Both must plan the same encounters.
+
+Usage:
+    python tools/benchmarks/encounter_planning_large.py
+    python tools/benchmarks/encounter_planning_large.py --slots 400 --plans 200 --player-level 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SRC = _ROOT / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from rpg.domain.models.encounter_definition import EncounterDefinition, EncounterSlot
+from rpg.domain.models.entity import Entity
+from rpg.domain.services.encounter_planner import EncounterPlanner
+
+
+class _Repository:
+    def __init__(self, entities: list[Entity]) -> None:
+        self._by_id = {entity.id: entity for entity in entities}
+
+    def get_many(self, entity_ids: list[int]) -> list[Entity]:
+        return [self._by_id[entity_id] for entity_id in entity_ids if entity_id in self._by_id]
+
+
+class _PreviousPlanner(EncounterPlanner):
+    """The assembly loop as it was before threat ratings were cached."""
+
+    def _assemble_for_definition(self, definition, entity_lookup, rng, target_threat, slots=None, threat=None):
+        planned: list[Entity] = []
+        budget = target_threat * 1.1
+        for slot in definition.weighted_slots() or definition.slots:
+            entity = entity_lookup.get(slot.entity_id)
+            if entity is None:
+                continue
+            count = self._pick_count(slot, rng)
+            for _ in range(count):
+                if planned:
+                    accumulated_threat = sum(row.combat_stats.threat_rating for row in planned)
+                    if accumulated_threat >= budget:
+                        break
+                planned.append(entity)
+        if planned:
+            return planned
+        entity = entity_lookup.get(definition.slots[0].entity_id) if definition.slots else None
+        return [entity] if entity else []
+
+
+def _fixture(slots: int, seed: int) -> tuple[list[Entity], list[EncounterDefinition]]:
+    rng = random.Random(seed)
+    entities = [
+        Entity(id=index, name=f"Minion {index}", level=1, hp=rng.randint(1, 4), attack_min=0, attack_max=1, armour_class=8)
+        for index in range(1, 61)
+    ]
+    definitions = [
+        EncounterDefinition(
+            id=f"horde_{index}",
+            name=f"Horde {index}",
+            level_min=1,
+            level_max=30,
+            base_threat=rng.uniform(0.5, 2.0),
+            slots=[
+                EncounterSlot(entity_id=rng.randint(1, 60), min_count=1, max_count=rng.randint(1, 6), weight=rng.randint(1, 3))
+                for _ in range(slots)
+            ],
+        )
+        for index in range(4)
+    ]
+    return entities, definitions
+
+
+def _time_plans(planner: EncounterPlanner, definitions, plans: int, player_level: int) -> tuple[float, list]:
+    results = []
+    started = time.perf_counter()
+    for seed in range(plans):
+        chosen, enemies = planner.plan_encounter(
+            definitions, player_level=player_level, location_id=1, seed=seed, max_enemies=10_000
+        )
+        results.append((chosen.id if chosen else None, [enemy.id for enemy in enemies]))
+    return (time.perf_counter() - started) * 1000.0, results
+
+
+def run_benchmark(slots: int, plans: int, player_level: int, seed: int) -> dict:
+    entities, definitions = _fixture(slots, seed)
+    repo = _Repository(entities)
+    previous_ms, previous = _time_plans(_PreviousPlanner(repo), definitions, plans, player_level)
+    current_ms, current = _time_plans(EncounterPlanner(repo), definitions, plans, player_level)
+    if previous != current:
+        raise AssertionError("cached threat planning diverged from the previous assembly loop")
+    return {
+        "slots_per_definition": int(slots),
+        "plans": int(plans),
+        "player_level": int(player_level),
+        "mean_enemies_per_plan": round(sum(len(row[1]) for row in current) / max(1, plans), 2),
+        "previous_ms_per_plan": round(previous_ms / max(1, plans), 3),
+        "current_ms_per_plan": round(current_ms / max(1, plans), 3),
+        "speedup": round(previous_ms / current_ms, 2) if current_ms > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark planning encounters from large definitions")
+    parser.add_argument("--slots", type=int, default=200)
+    parser.add_argument("--plans", type=int, default=100)
+    parser.add_argument("--player-level", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    report = run_benchmark(
+        max(1, int(args.slots)),
+        max(1, int(args.plans)),
+        max(1, int(args.player_level)),
+        int(args.seed),
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
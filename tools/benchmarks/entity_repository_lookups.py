@@ -0,0 +1,127 @@
+"""Compare indexed in-memory entity lookups against the old linear scans.
+
+Loads ``--entities`` synthetic monsters through ``upsert_entities`` (spread over
+``--locations`` locations) and times ``get``, ``list_by_location`` and
+``list_by_level_band`` against linear scans over the same rows.  The same
+queries also run against a repository a tenth of the size, so the reported
+growth factors show the scans growing linearly with repository size while
+indexed lookups only grow with the number of rows they return.
+
+Usage:
+    python tools/benchmarks/entity_repository_lookups.py
+    python tools/benchmarks/entity_repository_lookups.py --entities 10000 --queries 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SRC = _ROOT / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from rpg.domain.models.entity import Entity
+from rpg.infrastructure.inmemory.inmemory_entity_repo import InMemoryEntityRepository
+
+
+def _monsters(count: int, seed: int) -> list[Entity]:
+    rng = random.Random(seed)
+    return [
+        Entity(id=0, name=f"Monster {index}", level=rng.randint(1, 20), hp=rng.randint(5, 200), kind="beast")
+        for index in range(count)
+    ]
+
+
+def _load(entities: int, locations: int, seed: int) -> tuple[InMemoryEntityRepository, float]:
+    repo = InMemoryEntityRepository()
+    rows = _monsters(entities, seed)
+    batch = max(1, len(rows) // max(1, locations))
+    started = time.perf_counter()
+    for offset in range(0, len(rows), batch):
+        repo.upsert_entities(rows[offset : offset + batch], location_id=10 + offset // batch)
+    return repo, (time.perf_counter() - started) * 1000.0
+
+
+def _time_us(queries, fn) -> tuple[float, int]:
+    hits = 0
+    started = time.perf_counter()
+    for query in queries:
+        hits += fn(query)
+    return (time.perf_counter() - started) * 1_000_000.0 / max(1, len(queries)), hits
+
+
+def _measure(entities: int, locations: int, queries: int, seed: int) -> dict:
+    repo, load_ms = _load(entities, locations, seed)
+    rows = list(repo._entities)
+    members = {location_id: list(ids) for location_id, ids in repo._by_location.items()}
+    rng = random.Random(seed + 1)
+    ids = [rng.choice(rows).id for _ in range(queries)]
+    location_ids = [rng.choice(list(members)) for _ in range(queries)]
+    bands = [(level, level + 1) for level in (rng.randint(1, 19) for _ in range(queries))]
+
+    def _linear_get(entity_id: int) -> int:
+        return int(next((row for row in rows if row.id == entity_id), None) is not None)
+
+    def _linear_location(location_id: int) -> int:
+        wanted = members.get(location_id, [])
+        return len([row for row in rows if row.id in wanted])
+
+    def _linear_band(band: tuple[int, int]) -> int:
+        return len([row for row in rows if band[0] <= row.level <= band[1]])
+
+    report: dict = {"entities": len(rows), "load_ms": round(load_ms, 3)}
+    checks = (
+        ("get", ids, _linear_get, lambda entity_id: int(repo.get(entity_id) is not None)),
+        ("list_by_location", location_ids, _linear_location, lambda location_id: len(repo.list_by_location(location_id))),
+        ("list_by_level_band", bands, _linear_band, lambda band: len(repo.list_by_level_band(*band))),
+    )
+    for name, sample, linear, indexed in checks:
+        linear_us, linear_hits = _time_us(sample, linear)
+        indexed_us, indexed_hits = _time_us(sample, indexed)
+        if linear_hits != indexed_hits:
+            raise AssertionError(f"{name}: index returned {indexed_hits} rows, linear scan returned {linear_hits}")
+        report[name] = {
+            "linear_us_per_query": round(linear_us, 3),
+            "indexed_us_per_query": round(indexed_us, 3),
+            "speedup": round(linear_us / indexed_us, 2) if indexed_us > 0 else None,
+        }
+    return report
+
+
+def run_benchmark(entities: int, locations: int, queries: int, seed: int) -> dict:
+    small = _measure(max(1, entities // 10), max(1, locations // 10), queries, seed)
+    large = _measure(entities, locations, queries, seed)
+    growth = {}
+    for name in ("get", "list_by_location", "list_by_level_band"):
+        growth[name] = {
+            kind: round(large[name][kind] / small[name][kind], 2) if small[name][kind] > 0 else None
+            for kind in ("linear_us_per_query", "indexed_us_per_query")
+        }
+    return {"queries": int(queries), "small": small, "large": large, "growth_x10_entities": growth}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark indexed in-memory entity repository lookups")
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--locations", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    report = run_benchmark(
+        max(10, int(args.entities)),
+        max(1, int(args.locations)),
+        max(1, int(args.queries)),
+        int(args.seed),
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Compare travel-radius lookups with the location spatial index against a linear scan.
+
+Usage:
+    python tools/benchmarks/location_radius_query.py
+    python tools/benchmarks/location_radius_query.py --locations 10000 --queries 2000 --radius 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SRC = _ROOT / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from rpg.domain.models.location import Location
+from rpg.domain.services.location_spatial_index import LocationSpatialIndex, within_radius
+from rpg.infrastructure.db.inmemory.repos import InMemoryLocationRepository
+
+
+def _scatter(count: int, extent: float, seed: int) -> dict[int, Location]:
+    rng = random.Random(seed)
+    return {
+        index: Location(
+            id=index,
+            name=f"Site {index}",
+            biome="wilderness",
+            x=rng.uniform(0.0, extent),
+            y=rng.uniform(0.0, extent),
+        )
+        for index in range(1, count + 1)
+    }
+
+
+def run_benchmark(locations: int, queries: int, radius: float, extent: float, seed: int) -> dict:
+    rows = _scatter(locations, extent, seed)
+    started = time.perf_counter()
+    repo = InMemoryLocationRepository(rows)
+    build_ms = (time.perf_counter() - started) * 1000.0
+
+    rng = random.Random(seed + 1)
+    centres = [rows[rng.randint(1, locations)] for _ in range(queries)]
+
+    started = time.perf_counter()
+    linear_hits = 0
+    for centre in centres:
+        linear_hits += sum(1 for row in repo.list_all() if within_radius(centre.x, centre.y, row, radius))
+    linear_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    indexed_hits = 0
+    for centre in centres:
+        indexed_hits += len(repo.list_within_radius(centre.x, centre.y, radius))
+    indexed_ms = (time.perf_counter() - started) * 1000.0
+
+    if linear_hits != indexed_hits:
+        raise AssertionError(f"index returned {indexed_hits} hits, linear scan returned {linear_hits}")
+    return {
+        "locations": int(locations),
+        "queries": int(queries),
+        "radius": float(radius),
+        "extent": float(extent),
+        "cell_size": LocationSpatialIndex().cell_size,
+        "mean_hits_per_query": round(indexed_hits / max(1, queries), 2),
+        "index_build_ms": round(build_ms, 3),
+        "linear_us_per_query": round(linear_ms * 1000.0 / max(1, queries), 2),
+        "indexed_us_per_query": round(indexed_ms * 1000.0 / max(1, queries), 2),
+        "speedup": round(linear_ms / indexed_ms, 2) if indexed_ms > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark location radius queries")
+    parser.add_argument("--locations", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--radius", type=float, default=150.0)
+    parser.add_argument("--extent", type=float, default=10_000.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    report = run_benchmark(
+        max(1, int(args.locations)),
+        max(1, int(args.queries)),
+        float(args.radius),
+        float(args.extent),
+        int(args.seed),
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+"""Compare cold-start cost of the reference world dataset with and without the compiled cache.
+
+Each sample runs in a fresh interpreter so the in-process class caches never help.
+
+Usage:
+    python tools/benchmarks/reference_world_cold_start.py
+    python tools/benchmarks/reference_world_cold_start.py --samples 10 --reference-dir data/reference_world
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[2]
+_SRC = _ROOT / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from rpg.infrastructure.world_import.reference_dataset_loader import compile_reference_world_dataset
+
+_PROBE = """
+import sys, time
+sys.path.insert(0, {src!r})
+from pathlib import Path
+from rpg.infrastructure.world_import.reference_dataset_loader import load_reference_world_dataset
+started = time.perf_counter()
+dataset = load_reference_world_dataset(Path({reference_dir!r}), use_compiled_cache={use_cache!r})
+elapsed_ms = (time.perf_counter() - started) * 1000.0
+assert dataset.biome_severity_index
+print(elapsed_ms)
+"""
+
+
+def _sample(reference_dir: Path, *, use_cache: bool) -> float:
+    code = _PROBE.format(src=str(_SRC), reference_dir=str(reference_dir), use_cache=bool(use_cache))
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def run_benchmark(reference_dir: Path, samples: int) -> dict:
+    compiled_path = compile_reference_world_dataset(reference_dir)
+    source_ms = [_sample(reference_dir, use_cache=False) for _ in range(samples)]
+    compiled_ms = [_sample(reference_dir, use_cache=True) for _ in range(samples)]
+    source_median = statistics.median(source_ms)
+    compiled_median = statistics.median(compiled_ms)
+    return {
+        "reference_dir": str(reference_dir),
+        "compiled_artifact": str(compiled_path),
+        "compiled_artifact_bytes": compiled_path.stat().st_size,
+        "samples": int(samples),
+        "source_parse_ms_median": round(source_median, 3),
+        "compiled_load_ms_median": round(compiled_median, 3),
+        "speedup": round(source_median / compiled_median, 2) if compiled_median > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark reference world cold-start load cost")
+    parser.add_argument("--reference-dir", default=str(_ROOT / "data" / "reference_world"))
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args(argv)
+    report = run_benchmark(Path(args.reference_dir), max(1, int(args.samples)))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())